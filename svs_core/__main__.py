@@ -3,19 +3,27 @@
 import os
 import sys
 
-from importlib.metadata import version
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
-import django
 import typer
 
 from rich import print
-
-from svs_core.cli.lib import get_or_exit
-from svs_core.cli.state import is_current_user_admin, set_current_user, set_verbose_mode
+from typer import _click
+from typer.core import TyperOption
+
+from svs_core.cli.lazy import LazyGroup, LazySubcommand, setup_django
+from svs_core.cli.state import (
+    is_current_user_admin,
+    set_current_user,
+    set_current_user_loader,
+    set_verbose_mode,
+)
 from svs_core.shared.env_manager import EnvManager
 from svs_core.shared.logger import add_verbose_handler, get_logger
 
+if TYPE_CHECKING:
+    from svs_core.users.user import User
+
 # Early verbose mode detection before heavy imports trigger logging
 if "-v" in sys.argv or "--verbose" in sys.argv:
     set_verbose_mode(True)
@@ -26,30 +34,50 @@ os.environ["DJANGO_SETTINGS_MODULE"] = "svs_core.db.settings"
 if EnvManager.get_runtime_environment() != EnvManager.RuntimeEnvironment.TESTING:
     EnvManager.load_env_file()
 
-django.setup()
 
-if not EnvManager.get_database_url():
-    get_logger(__name__).warning(
-        "DATABASE_URL environment variable not set. Running detached from database."
-    )
+class SvsGroup(LazyGroup):
+    """The `svs` command, loading its subcommands on first use."""
+
+    subcommands = {
+        "init": LazySubcommand(
+            "svs_core.cli.init:init_cmd",
+            "Initialize the SVS environment.",
+            needs_django=False,
+        ),
+        "destroy": LazySubcommand(
+            "svs_core.cli.destroy:destroy_cmd",
+            "Destroy the SVS environment.",
+            needs_django=False,
+        ),
+        "user": LazySubcommand("svs_core.cli.user:app", "Manage users"),
+        "template": LazySubcommand("svs_core.cli.template:app", "Manage templates"),
+        "service": LazySubcommand("svs_core.cli.service:app", "Manage services"),
+        "utils": LazySubcommand("svs_core.cli.utils:app", "Utility commands"),
+        "web": LazySubcommand(
+            "svs_core.cli.web:app", "Manage the SVS web interface", needs_django=False
+        ),
+    }
+
+    def get_cached_command(self, name: str) -> _click.Command | None:
+        """Returns the subcommand from the completion cache when completing."""
+        if os.environ.get("_SVS_COMPLETE") is None:
+            return None
+
+        from svs_core.cli.completion import CompletionCache
 
-from svs_core.cli.destroy import destroy_cmd  # noqa: E402
-from svs_core.cli.init import init_cmd  # noqa: E402
-from svs_core.cli.service import app as service_app  # noqa: E402
-from svs_core.cli.template import app as template_app  # noqa: E402
-from svs_core.cli.user import app as user_app  # noqa: E402
-from svs_core.cli.utils import app as utils_app  # noqa: E402
-from svs_core.cli.web import app as web_app  # noqa: E402
+        return CompletionCache.get_command(name)
 
 
 def version_callback(value: bool) -> None:
     """Prints the SVS version and exits."""
     if value:
+        from importlib.metadata import version
+
         print(f"SVS version: {version('svs-core')}")
         raise typer.Exit()
 
 
-app = typer.Typer(help="SVS CLI", pretty_exceptions_enable=False)
+app = typer.Typer(help="SVS CLI", pretty_exceptions_enable=False, cls=SvsGroup)
 
 
 @app.callback()
@@ -70,8 +98,23 @@ def global_options(
     user_override: str | None = typer.Option(
         None, "--user", "-u", help="Override acting user by username (admin only)"
     ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print the time spent in commands, Docker and database calls on exit.",
+    ),
+    profile_output: str | None = typer.Option(
+        None,
+        "--profile-output",
+        help="Profile with cProfile and write the pstats dump to this path (implies --profile).",
+    ),
 ) -> None:
     """Global options for SVS CLI."""
+    if profile or profile_output:
+        from svs_core.shared.profiling import Profiler
+
+        Profiler.start(output=profile_output)
+
     if verbose:
         set_verbose_mode(True)
         add_verbose_handler()
@@ -82,7 +125,8 @@ def global_options(
             print("User overriding is admin only", file=sys.stderr)
             raise typer.Exit(1)
 
-        from svs_core.users.user import User  # noqa: E402
+        from svs_core.cli.lib import get_or_exit
+        from svs_core.users.user import User
 
         user_to_override = get_or_exit(User, name=user_override)
 
@@ -90,19 +134,93 @@ def global_options(
         set_current_user(user_to_override.name, user_to_override.is_admin())
 
 
-app.command(name="init")(init_cmd)
-app.command(name="destroy")(destroy_cmd)
+def runs_command(args: list[str]) -> bool:
+    """Returns whether the arguments run a subcommand.
+
+    Help, version and bare `svs` invocations do not, so they need neither
+    Django nor the acting user.
+
+    Args:
+        args (list[str]): The command line arguments, without the program name.
+
+    Returns:
+        bool: True if a subcommand is invoked.
+    """
+    if "--help" in args:
+        return False
+
+    group = typer.main.get_command(app)
+    takes_value = {
+        opt
+        for param in group.params
+        if isinstance(param, TyperOption) and not param.is_flag
+        for opt in param.opts
+    }
+
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+        elif arg == "--version":
+            return False
+        elif arg.startswith("-"):
+            skip_value = arg in takes_value
+        else:
+            return True
+
+    return False
 
-app.add_typer(user_app, name="user")
-app.add_typer(template_app, name="template")
-app.add_typer(service_app, name="service")
-app.add_typer(utils_app, name="utils")
-app.add_typer(web_app, name="web")
+
+def load_system_user() -> None:
+    """Sets the current user from the system user, for shell completion.
+
+    Also used by the background refresh of the completion cache.
+    """
+    from svs_core.users.system import SystemUserManager
+    from svs_core.users.user import User
+
+    setup_django()
+    user = User.objects.filter(name=SystemUserManager.get_system_username()).first()
+    if user:
+        set_current_user(user.name, user.is_admin())
 
 
 def main() -> None:  # noqa: D103
-    from svs_core.users.system import SystemUserManager  # noqa: E402
-    from svs_core.users.user import User  # noqa: E402
+    logger = get_logger(__name__)
+    is_completion = os.environ.get("_SVS_COMPLETE") is not None
+
+    if is_completion:
+        # Completing subcommand and option names needs no database, and
+        # arguments are completed from the cache when it is warm, so the user
+        # is only looked up once a completion function asks for it
+        set_current_user_loader(load_system_user)
+    elif runs_command(sys.argv[1:]):
+        _authenticate()
+
+    try:
+        app()
+    finally:
+        # Only modules a command imported can have anything to report
+        docker_base = sys.modules.get("svs_core.docker.base")
+        if docker_base is not None:
+            logger.debug(f"Docker API round-trips: {docker_base.get_api_call_count()}")
+
+        profiling = sys.modules.get("svs_core.shared.profiling")
+        if profiling is not None and profiling.Profiler.is_enabled():
+            profiling.Profiler.stop()
+            profiling.Profiler.report()
+
+
+def _authenticate() -> None:
+    """Sets the current user from the system user running the CLI.
+
+    Exits if the system user has no SVS account, or if SVS is run without
+    sudo in production.
+    """
+    from svs_core.users.system import SystemUserManager
+    from svs_core.users.user import User
+
+    setup_django()
 
     logger = get_logger(__name__)
     username = SystemUserManager.get_system_username()
@@ -116,26 +234,19 @@ def main() -> None:  # noqa: D103
 
         sys.exit(1)
 
-    is_completion = os.environ.get("_SVS_COMPLETE") is not None
-
     if (
-        not is_completion
-        and not os.environ.get("SUDO_USER")
+        not os.environ.get("SUDO_USER")
         and EnvManager.get_runtime_environment()
         == EnvManager.RuntimeEnvironment.PRODUCTION
     ):
         print("SVS CLI must be run with sudo privileges (e.g., using 'sudo svs ...').")
         sys.exit(1)
 
-    is_admin = cast(User, user).is_admin() if user else False
-    if user:
-        set_current_user(user.name, is_admin)
-
-    user_type = "admin" if (user and cast(User, user).is_admin()) else "standard user"
-    user_display = user.name if user else username
-    logger.debug(f"{user_display} ({user_type}) ran: {' '.join(sys.argv)}")
+    is_admin = cast("User", user).is_admin()
+    set_current_user(user.name, is_admin)
 
-    app()
+    user_type = "admin" if is_admin else "standard user"
+    logger.debug(f"{user.name} ({user_type}) ran: {' '.join(sys.argv)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,347 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+
+from typer import _click
+from typer.core import TyperArgument, TyperCommand, TyperGroup, TyperOption
+
+from svs_core.shared.completion_stamp import CompletionStamp
+
+
+class CompletionCache:
+    """Per-user on-disk cache of shell completion results.
+
+    Completing an argument normally imports the subcommand, sets up Django
+    and queries the database on every tab press. The cache instead stores,
+    for every subcommand, its parameters together with the values their
+    completions returned, so a warm cache answers without importing the
+    subcommand or touching the database.
+
+    The cache is rebuilt by a detached background process when it is missing
+    or older than `TTL_SECONDS`, stale results being served meanwhile. Caches
+    written before the `CompletionStamp` was last touched are discarded.
+    """
+
+    VERSION = 1
+    """Format of the cache file, caches of other versions are ignored."""
+
+    TTL_SECONDS = 300
+    """Age after which cached results are refreshed in the background."""
+
+    REFRESH_TIMEOUT = 60
+    """Age after which a refresh lock is considered abandoned, in seconds."""
+
+    @staticmethod
+    def get_command(name: str) -> _click.Command | None:
+        """Returns a subcommand rebuilt from the cache, for shell completion.
+
+        A missing or invalidated cache is rebuilt in the background, and an
+        expired one is served while being refreshed.
+
+        Args:
+            name (str): The name of the subcommand.
+
+        Returns:
+            _click.Command | None: The subcommand, or None if the cache is
+            missing, invalidated or does not contain it.
+        """
+        cache = CompletionCache.load()
+        if cache is None or CompletionCache.is_expired(cache):
+            CompletionCache.refresh_in_background()
+
+        if cache is None or name not in cache["commands"]:
+            return None
+
+        return _build_command(name, cache["commands"][name], cache["values"])
+
+    @staticmethod
+    def load() -> dict[str, Any] | None:
+        """Reads the cache of the current system user.
+
+        Returns:
+            dict[str, Any] | None: The cache, or None if it is missing,
+            unreadable, of another version or invalidated since it was written.
+        """
+        try:
+            with open(CompletionCache.path()) as file:
+                cache: dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cache, dict) or cache.get("version") != (
+            CompletionCache.VERSION
+        ):
+            return None
+
+        if cache.get("source") != _source_stamp():
+            return None
+
+        if cache.get("created_at", 0.0) <= CompletionStamp.invalidated_at():
+            return None
+
+        return cache
+
+    @staticmethod
+    def is_expired(cache: dict[str, Any]) -> bool:
+        """Returns whether a cache is older than `TTL_SECONDS`.
+
+        Args:
+            cache (dict[str, Any]): The cache, as returned by `load`.
+
+        Returns:
+            bool: True if the cache should be refreshed.
+        """
+        return bool(
+            time.time() - cache.get("created_at", 0.0) > CompletionCache.TTL_SECONDS
+        )
+
+    @staticmethod
+    def path() -> Path:
+        """Returns the cache file of the current system user.
+
+        Returns:
+            Path: The file, in `$XDG_CACHE_HOME/svs`, defaulting to `~/.cache/svs`.
+        """
+        from svs_core.users.system import SystemUserManager
+
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        username = SystemUserManager.get_system_username()
+        return Path(base) / "svs" / f"completion-{username}.json"
+
+    @staticmethod
+    def refresh_in_background() -> None:
+        """Starts a detached process rebuilding the cache, unless one is running."""
+        lock = CompletionCache.path().with_suffix(".lock")
+        try:
+            lock.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _acquire_lock(lock):
+                return
+
+            env = {
+                key: value
+                for key, value in os.environ.items()
+                if not key.startswith("_SVS_COMPLETE")
+            }
+            subprocess.Popen(
+                [sys.executable, "-m", "svs_core.cli.completion"],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except OSError:
+            lock.unlink(missing_ok=True)
+
+    @staticmethod
+    def refresh(group: TyperGroup) -> None:
+        """Rebuilds the cache from the subcommands of a group.
+
+        Every subcommand is loaded, so Django must be set up and the current
+        user set, as completions only return what the user may see.
+
+        Args:
+            group (TyperGroup): The root group of the CLI.
+        """
+        created_at = time.time()
+        ctx = _click.Context(group, resilient_parsing=True)
+        values: list[list[list[str]]] = []
+        commands = {}
+        for name in group.list_commands(ctx):
+            command = group.get_command(ctx, name)
+            if command is not None:
+                commands[name] = _describe_command(ctx, command, values)
+
+        cache = {
+            "version": CompletionCache.VERSION,
+            "created_at": created_at,
+            "source": _source_stamp(),
+            "commands": commands,
+            "values": values,
+        }
+
+        path = CompletionCache.path()
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as file:
+            json.dump(cache, file)
+        os.replace(file.name, path)
+
+
+def _source_stamp() -> int:
+    """Returns a stamp of the installed CLI, changing when SVS is upgraded."""
+    return Path(__file__).parent.stat().st_mtime_ns
+
+
+def _acquire_lock(lock: Path) -> bool:
+    """Creates the refresh lock, replacing it if it was abandoned."""
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime < CompletionCache.REFRESH_TIMEOUT:
+                    return False
+                lock.unlink()
+            except FileNotFoundError:
+                pass
+    return False
+
+
+def _describe_command(
+    ctx: _click.Context, command: _click.Command, values: list[list[list[str]]]
+) -> dict[str, Any]:
+    """Describes a command, its parameters and their completions as JSON.
+
+    Args:
+        ctx (_click.Context): The context of the parent command.
+        command (_click.Command): The command.
+        values (list[list[list[str]]]): Completion results shared by all
+            parameters, results of the parameter are appended if new.
+
+    Returns:
+        dict[str, Any]: The description of the command.
+    """
+    command_ctx = _click.Context(
+        command, parent=ctx, info_name=command.name, resilient_parsing=True
+    )
+    params = []
+    for param in command.params:
+        if not isinstance(param, (TyperOption, TyperArgument)):
+            continue
+
+        items = [
+            [item.value, item.help or ""]
+            for item in param.shell_complete(command_ctx, "")
+        ]
+        if items not in values:
+            values.append(items)
+
+        params.append(
+            {
+                "kind": param.param_type_name,
+                "name": param.name,
+                "opts": param.opts,
+                "secondary_opts": param.secondary_opts,
+                "is_flag": getattr(param, "is_flag", False),
+                "count": getattr(param, "count", False),
+                "multiple": param.multiple,
+                "nargs": param.nargs,
+                "required": param.required,
+                "hidden": getattr(param, "hidden", False),
+                "help": getattr(param, "help", None),
+                "values": values.index(items),
+            }
+        )
+
+    description: dict[str, Any] = {
+        "help": command.get_short_help_str(),
+        "hidden": command.hidden,
+        "params": params,
+    }
+    if isinstance(command, TyperGroup):
+        description["commands"] = {
+            name: _describe_command(command_ctx, subcommand, values)
+            for name, subcommand in command.commands.items()
+        }
+
+    return description
+
+
+def _build_command(
+    name: str, description: dict[str, Any], values: list[list[list[str]]]
+) -> _click.Command:
+    """Rebuilds a command described by `_describe_command`, for completion only.
+
+    Args:
+        name (str): The name of the command.
+        description (dict[str, Any]): The description of the command.
+        values (list[list[list[str]]]): The completion results of the cache.
+
+    Returns:
+        _click.Command: A command completing like the described one.
+    """
+    params: list[_click.Parameter] = []
+    for param in description["params"]:
+        complete = _complete_from(values[param["values"]])
+        built: _click.Parameter
+        if param["kind"] == "argument":
+            built = TyperArgument(
+                param_decls=[param["name"]],
+                nargs=param["nargs"],
+                required=param["required"],
+                autocompletion=complete,
+            )
+        else:
+            built = TyperOption(
+                param_decls=[param["name"], *param["opts"]],
+                is_flag=param["is_flag"] or None,
+                count=param["count"],
+                multiple=param["multiple"],
+                nargs=param["nargs"],
+                help=param["help"],
+                hidden=param["hidden"],
+                autocompletion=complete,
+            )
+            built.secondary_opts = param["secondary_opts"]
+        params.append(built)
+
+    if "commands" in description:
+        return TyperGroup(
+            name=name,
+            commands={
+                subname: _build_command(subname, subcommand, values)
+                for subname, subcommand in description["commands"].items()
+            },
+            params=params,
+            short_help=description["help"],
+            hidden=description["hidden"],
+        )
+
+    return TyperCommand(
+        name,
+        params=params,
+        short_help=description["help"],
+        hidden=description["hidden"],
+    )
+
+
+def _complete_from(
+    items: list[list[str]],
+) -> Callable[[_click.Context, list[str], str], list[tuple[str, str] | str]]:
+    """Returns an autocompletion callback answering from cached results."""
+
+    def complete(
+        ctx: _click.Context, args: list[str], incomplete: str
+    ) -> list[tuple[str, str] | str]:
+        # Typer keeps the results starting with the incomplete value
+        return [(value, help) if help else value for value, help in items]
+
+    return complete
+
+
+def _refresh() -> None:
+    """Rebuilds the cache of the current system user, run by `refresh_in_background`."""
+    import typer
+
+    from svs_core.__main__ import app, load_system_user
+    from svs_core.cli.lazy import setup_django
+
+    setup_django()
+    load_system_user()
+    CompletionCache.refresh(typer.main.get_group(app))
+
+    # A failed refresh keeps the lock, so it is only retried after REFRESH_TIMEOUT
+    CompletionCache.path().with_suffix(".lock").unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    _refresh()
@@ -38,21 +38,32 @@ SUDOERS_MARKER_END = "# --- SVS end ---"
 def _stop_user_services() -> None:
     """Stop and remove all Docker services managed by SVS."""
     from svs_core.db.models import ServiceModel
+    from svs_core.docker.fleet import FleetExecutor, FleetProgress
 
-    services = ServiceModel.objects.all()
+    services = [
+        service for service in ServiceModel.objects.all() if service.container_id
+    ]
     if not services:
         print(f"{INFO} No user services to stop.")
         return
 
+    def remove_container(service: ServiceModel) -> None:
+        subprocess.run(
+            ["docker", "rm", "-f", service.container_id],
+            capture_output=True,
+        )
+
+    def report(progress: FleetProgress) -> None:
+        if progress.error is None:
+            print(f"  - Removed container for service '{progress.service_name}'.")
+
     print(f"Stopping {len(services)} user service(s)...")
-    for service in services:
-        container_id = service.container_id
-        if container_id:
-            subprocess.run(
-                ["docker", "rm", "-f", container_id],
-                capture_output=True,
-            )
-            print(f"  - Removed container {container_id} for service '{service.name}'.")
+    result = FleetExecutor.run(services, remove_container, on_progress=report)
+
+    for failure in result.failed:
+        print(
+            f"{WARN} Failed to remove container for service '{failure.service_name}': {failure.error}"
+        )
     print(f"{OK} All user services stopped.")
 
 
@@ -118,6 +129,26 @@ def _remove_config_dirs() -> None:
             pass
 
 
+def _remove_completion_stamp() -> None:
+    """Remove the stamp invalidating the shell completion caches."""
+    from svs_core.shared.completion_stamp import CompletionStamp
+
+    try:
+        CompletionStamp.remove()
+    except OSError as e:
+        print(f"{WARN} Could not remove {CompletionStamp.PATH}: {e}")
+
+
+def _remove_port_lock() -> None:
+    """Remove the lock file serializing port allocations."""
+    from svs_core.shared.ports import SystemPortManager
+
+    try:
+        SystemPortManager.remove_lock()
+    except OSError as e:
+        print(f"{WARN} Could not remove {SystemPortManager.LOCK_PATH}: {e}")
+
+
 def _clean_sudoers() -> None:
     """Remove svs-related entries from /etc/sudoers."""
     sudoers_path = "/etc/sudoers"
@@ -249,6 +280,8 @@ def destroy_cmd(
         _remove_config_dirs()
     else:
         print(f"{INFO} Keeping config files (--keep-config).")
+    _remove_completion_stamp()
+    _remove_port_lock()
 
     _clean_sudoers()
     _remove_system_user()
@@ -372,6 +372,28 @@ def _create_admin_user(password: str | None, non_interactive: bool) -> None:
                 raise typer.Exit(code=1) from e
 
 
+def _create_completion_stamp() -> None:
+    """Create the stamp invalidating the shell completion caches of all users."""
+    from svs_core.shared.completion_stamp import CompletionStamp
+
+    try:
+        CompletionStamp.create()
+        print(f"{OK} {CompletionStamp.PATH} created.")
+    except (KeyError, OSError) as e:
+        print(f"{WARN} Could not create {CompletionStamp.PATH}: {e}")
+
+
+def _create_port_lock() -> None:
+    """Create the lock file serializing port allocations of all users."""
+    from svs_core.shared.ports import SystemPortManager
+
+    try:
+        SystemPortManager.create_lock()
+        print(f"{OK} {SystemPortManager.LOCK_PATH} created.")
+    except (KeyError, OSError) as e:
+        print(f"{WARN} Could not create {SystemPortManager.LOCK_PATH}: {e}")
+
+
 def _install_completions() -> None:
     """Install shell completions for the svs CLI."""
     completions_dir = Path("/usr/share/bash-completion/completions")
@@ -449,6 +471,8 @@ def init_cmd(
         print(f"{INFO} Template import skipped.")
 
     _create_admin_user(password, non_interactive)
+    _create_completion_stamp()
+    _create_port_lock()
 
     if not skip_completions:
         _install_completions()
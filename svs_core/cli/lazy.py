@@ -0,0 +1,124 @@
+import importlib
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+import typer
+
+from typer import _click
+from typer._click.shell_completion import CompletionItem
+from typer.core import TyperGroup
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A subcommand whose module is imported only when it is used."""
+
+    """Import path of the Typer app or command function, as `module:attribute`."""
+    target: str
+    """Short help, shown when completing the subcommand name."""
+    help: str
+    """Whether Django must be set up before the module is imported."""
+    needs_django: bool = True
+
+
+class LazyGroup(TyperGroup):
+    """Typer group importing its subcommands on first use.
+
+    Subclasses list their subcommands in `subcommands`. Resolving a
+    subcommand, e.g. to run it or to complete its arguments, imports only its
+    own module, and completing subcommand names imports none of them.
+    Subclasses can skip the import altogether by returning a stand-in from
+    `get_cached_command`.
+    """
+
+    subcommands: ClassVar[dict[str, LazySubcommand]] = {}
+
+    def list_commands(self, ctx: _click.Context) -> list[str]:  # noqa: D102
+        loaded = super().list_commands(ctx)
+        return loaded + [name for name in self.subcommands if name not in loaded]
+
+    def get_command(  # noqa: D102
+        self, ctx: _click.Context, cmd_name: str
+    ) -> _click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.subcommands:
+            command = self.get_cached_command(cmd_name) or self._load(cmd_name)
+            self.add_command(command, cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def get_cached_command(self, name: str) -> _click.Command | None:
+        """Returns a stand-in for a subcommand, to use instead of importing it.
+
+        Args:
+            name (str): The name of the subcommand.
+
+        Returns:
+            _click.Command | None: The stand-in, or None to import the subcommand.
+        """
+        return None
+
+    def shell_complete(  # noqa: D102
+        self, ctx: _click.Context, incomplete: str
+    ) -> list[CompletionItem]:
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+
+            command = self.commands.get(name)
+            if command is None:
+                results.append(CompletionItem(name, help=self.subcommands[name].help))
+            elif not command.hidden:
+                results.append(CompletionItem(name, help=command.get_short_help_str()))
+
+        # Options of the group itself, skipping TyperGroup's subcommand listing
+        results.extend(_click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def _load(self, name: str) -> _click.Command:
+        """Imports a subcommand and converts it to a click command.
+
+        Args:
+            name (str): The name of the subcommand.
+
+        Returns:
+            _click.Command: The subcommand.
+        """
+        subcommand = self.subcommands[name]
+        if subcommand.needs_django:
+            setup_django()
+
+        module_name, _, attribute = subcommand.target.partition(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        command: _click.Command
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            wrapper = typer.Typer(add_completion=False)
+            wrapper.command(name=name)(target)
+            command = typer.main.get_command(wrapper)
+
+        command.name = name
+        return command
+
+
+def setup_django() -> None:
+    """Sets up Django, once, for commands that use the database."""
+    import django
+
+    from django.apps import apps
+
+    if apps.ready:
+        return
+
+    from svs_core.shared.env_manager import EnvManager
+    from svs_core.shared.logger import get_logger
+
+    django.setup()
+
+    if not EnvManager.get_database_url():
+        get_logger(__name__).warning(
+            "DATABASE_URL environment variable not set. Running detached from database."
+        )
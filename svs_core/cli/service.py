@@ -2,12 +2,19 @@ import sys
 
 from pathlib import Path
 from subprocess import run as subprocess_run
+from typing import Callable
 
 import typer
 
 from pydantic import ValidationError as PydanticValidationError
 from rich import print
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+)
 from rich.table import Table
 
 from svs_core.cli.lib import (
@@ -17,8 +24,14 @@ from svs_core.cli.lib import (
     service_id_autocomplete,
     template_id_autocomplete,
 )
-from svs_core.cli.state import get_current_username, is_current_user_admin
+from svs_core.cli.state import (
+    get_current_username,
+    is_current_user_admin,
+    is_verbose,
+)
 from svs_core.db.models import ServiceStatus
+from svs_core.docker.build_progress import BuildEvent
+from svs_core.docker.fleet import FleetExecutor
 from svs_core.docker.json_properties import (
     EnvVariable,
     ExposedPort,
@@ -34,6 +47,7 @@ from svs_core.shared.exceptions import (
     ValidationException,
 )
 from svs_core.shared.git_source import GitSource
+from svs_core.shared.text import parse_since
 from svs_core.users.user import User
 
 
@@ -62,19 +76,25 @@ app = typer.Typer(help="Manage services")
 def list_services(
     inline: bool = typer.Option(
         False, "-i", "--inline", help="Display services in inline format"
-    )
+    ),
+    live: bool = typer.Option(
+        False,
+        "--live",
+        help="Query Docker for the current status instead of the recorded one",
+    ),
 ) -> None:
     """List all services."""
 
+    services = Service.objects.listing(detailed=inline)
     if not is_current_user_admin():
-        services = Service.objects.filter(user__name=get_current_username())
-    else:
-        services = Service.objects.all()
+        services = services.filter(user__name=get_current_username())
 
     if len(services) == 0:
         print("No services found.")
         return
 
+    services = Service.resolve_statuses(services, recorded=not live)
+
     if inline:
         print("\n".join(f"{s}" for s in services))
         raise typer.Exit(code=0)
@@ -253,13 +273,149 @@ def create_service(
         raise typer.Exit(code=1)
 
 
+def _is_fleet_request(
+    service_id: int | None,
+    all_services: bool,
+    user: str | None,
+    template_id: int | None,
+) -> bool:
+    """Validate the target options of a start/stop/restart command.
+
+    Args:
+        service_id: The ID of a single service, if given.
+        all_services: Whether --all was given.
+        user: The --user value, if given.
+        template_id: The --template value, if given.
+
+    Returns:
+        bool: True if the command targets many services, False for a single one.
+
+    Raises:
+        typer.Exit: If both or neither a service ID and fleet options are given.
+    """
+    is_fleet = all_services or user is not None or template_id is not None
+
+    if is_fleet and service_id is not None:
+        print(
+            "Specify either a service ID or --all/--user/--template, not both.",
+            file=sys.stderr,
+        )
+        raise typer.Exit(1)
+    if not is_fleet and service_id is None:
+        print(
+            "Specify a service ID or one of --all, --user, --template.",
+            file=sys.stderr,
+        )
+        raise typer.Exit(1)
+
+    return is_fleet
+
+
+def _select_fleet(user: str | None, template_id: int | None) -> list[Service]:
+    """Select the services a fleet command operates on.
+
+    Non-admin users are limited to their own services.
+
+    Args:
+        user: Only include services owned by this user.
+        template_id: Only include services created from this template.
+
+    Returns:
+        list[Service]: The selected services.
+
+    Raises:
+        typer.Exit: If a non-admin user targets services of another user.
+    """
+    services = Service.objects.select_related("user")
+
+    if not is_current_user_admin():
+        if user is not None and user != get_current_username():
+            print(
+                "You do not have permission to manage services of other users.",
+                file=sys.stderr,
+            )
+            raise typer.Exit(1)
+        services = services.filter(user__name=get_current_username())
+
+    if user is not None:
+        services = services.filter(user__name=user)
+    if template_id is not None:
+        services = services.filter(template_id=template_id)
+
+    return list(services)
+
+
+def _run_fleet(
+    services: list[Service],
+    operation: Callable[[Service], object],
+    action: str,
+    description: str,
+) -> None:
+    """Run an operation on many services concurrently with live progress.
+
+    Args:
+        services: The services to operate on.
+        operation: The operation to run for each service.
+        action: The action name used in messages (e.g. "start").
+        description: The progress bar description (e.g. "Starting services...").
+
+    Raises:
+        typer.Exit: If the operation failed for any service.
+    """
+    if not services:
+        print("No services found.")
+        return
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+    ) as progress:
+        task = progress.add_task(description=description, total=len(services))
+        result = FleetExecutor.run(
+            services,
+            operation,
+            on_progress=lambda _: progress.advance(task),
+        )
+
+    print(
+        f"{action.capitalize()} succeeded for {len(result.succeeded)} of {len(services)} service(s)."
+    )
+
+    for failure in result.failed:
+        print(
+            f"Error: failed to {action} service '{failure.service_name}': {failure.error}",
+            file=sys.stderr,
+        )
+
+    if not result.ok:
+        raise typer.Exit(code=1)
+
+
 @app.command("start")
 def start_service(
-    service_id: int = typer.Argument(
-        ..., help="ID of the service to start", autocompletion=service_id_autocomplete
-    )
+    service_id: int | None = typer.Argument(
+        None, help="ID of the service to start", autocompletion=service_id_autocomplete
+    ),
+    all_services: bool = typer.Option(False, "--all", help="Start all services"),
+    user: str | None = typer.Option(
+        None, "--user", help="Start all services owned by this user"
+    ),
+    template_id: int | None = typer.Option(
+        None, "--template", help="Start all services created from this template"
+    ),
 ) -> None:
-    """Start a service."""
+    """Start a service, or many services at once."""
+
+    if _is_fleet_request(service_id, all_services, user, template_id):
+        _run_fleet(
+            _select_fleet(user, template_id),
+            lambda service: service.start(),
+            "start",
+            "Starting services...",
+        )
+        return
 
     service = get_or_exit(Service, id=service_id)
 
@@ -275,11 +431,27 @@ def start_service(
 
 @app.command("stop")
 def stop_service(
-    service_id: int = typer.Argument(
-        ..., help="ID of the service to stop", autocompletion=service_id_autocomplete
-    )
+    service_id: int | None = typer.Argument(
+        None, help="ID of the service to stop", autocompletion=service_id_autocomplete
+    ),
+    all_services: bool = typer.Option(False, "--all", help="Stop all services"),
+    user: str | None = typer.Option(
+        None, "--user", help="Stop all services owned by this user"
+    ),
+    template_id: int | None = typer.Option(
+        None, "--template", help="Stop all services created from this template"
+    ),
 ) -> None:
-    """Stop a service."""
+    """Stop a service, or many services at once."""
+
+    if _is_fleet_request(service_id, all_services, user, template_id):
+        _run_fleet(
+            _select_fleet(user, template_id),
+            lambda service: service.stop(),
+            "stop",
+            "Stopping services...",
+        )
+        return
 
     service = get_or_exit(Service, id=service_id)
 
@@ -293,6 +465,44 @@ def stop_service(
         raise typer.Exit(code=1)
 
 
+@app.command("restart")
+def restart_service(
+    service_id: int | None = typer.Argument(
+        None,
+        help="ID of the service to restart",
+        autocompletion=service_id_autocomplete,
+    ),
+    all_services: bool = typer.Option(False, "--all", help="Restart all services"),
+    user: str | None = typer.Option(
+        None, "--user", help="Restart all services owned by this user"
+    ),
+    template_id: int | None = typer.Option(
+        None, "--template", help="Restart all services created from this template"
+    ),
+) -> None:
+    """Restart a service, or many services at once."""
+
+    if _is_fleet_request(service_id, all_services, user, template_id):
+        _run_fleet(
+            _select_fleet(user, template_id),
+            lambda service: service.restart(),
+            "restart",
+            "Restarting services...",
+        )
+        return
+
+    service = get_or_exit(Service, id=service_id)
+
+    check_service_permission(service, "restart")
+
+    try:
+        service.restart()
+        print(f"Service '{service.name}' restarted successfully.")
+    except ServiceOperationException as e:
+        print(f"Error restarting service: {e}", file=sys.stderr)
+        raise typer.Exit(code=1)
+
+
 @app.command("build")
 def build_service(
     service_id: int = typer.Argument(
@@ -301,6 +511,14 @@ def build_service(
     path: str = typer.Argument(
         ..., help="Path to the source code to build the service from"
     ),
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild even if nothing changed since the last build"
+    ),
+    blue_green: bool = typer.Option(
+        False,
+        "--blue-green",
+        help="Start the new container next to the running one and switch over once it is ready",
+    ),
 ) -> None:
     """Build a service's Docker image from source code."""
 
@@ -314,10 +532,42 @@ def build_service(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
     ) as progress:
-        progress.add_task(description="Building service...", total=None)
+        task = progress.add_task(description="Building service...", total=None)
+
+        def on_event(event: BuildEvent) -> None:
+            if event.kind == BuildEvent.STEP:
+                progress.update(
+                    task,
+                    description=f"Step {event.step}/{event.total_steps}: {event.message}",
+                )
+            elif event.kind == BuildEvent.ERROR:
+                progress.console.print(f"[red]{event.message}[/red]", markup=True)
+            elif is_verbose():
+                progress.console.print(event.message, markup=False, highlight=False)
+
+        result = service.build(
+            path_obj, on_event=on_event, force=force, blue_green=blue_green
+        )
+
+    if result.cached:
+        print(
+            f"Service '{service.name}' is up to date, build skipped. Use --force to rebuild."
+        )
+        return
 
-    service.build(path_obj)
-    print(f"Service '{service.name}' Docker image built successfully.")
+    print(
+        f"Service '{service.name}' Docker image built successfully in {result.duration_seconds:.1f}s."
+    )
+
+    if result.steps:
+        table = Table("Step", "Instruction", "Duration")
+        for timing in result.steps:
+            table.add_row(
+                str(timing.step),
+                timing.instruction,
+                f"{timing.duration_seconds:.1f}s",
+            )
+        print(table)
 
 
 @app.command("delete")
@@ -342,7 +592,18 @@ def view_service_logs(
         ...,
         help="ID of the service to view logs for",
         autocompletion=service_id_autocomplete,
-    )
+    ),
+    follow: bool = typer.Option(
+        False, "--follow", "-f", help="Keep printing new log lines as they arrive"
+    ),
+    since: str | None = typer.Option(
+        None,
+        "--since",
+        help="Only show logs since a duration ago (e.g. 10m), Unix timestamp or ISO 8601 datetime",
+    ),
+    tail: int = typer.Option(
+        1000, "--tail", "-n", help="Number of lines to show from the end of the logs"
+    ),
 ) -> None:
     """View logs for a service."""
 
@@ -350,8 +611,25 @@ def view_service_logs(
 
     check_service_permission(service, "view logs for")
 
-    logs = service.get_logs()
-    print(logs)
+    if not follow and since is None:
+        logs = service.get_logs(tail=tail)
+        print(logs)
+        return
+
+    try:
+        since_time = parse_since(since) if since is not None else None
+    except ValidationException as e:
+        print(f"Error: {e}", file=sys.stderr)
+        raise typer.Exit(code=1)
+
+    try:
+        for line in service.stream_logs(since=since_time, tail=tail, follow=follow):
+            typer.echo(line)
+    except ServiceOperationException as e:
+        print(f"Error streaming logs: {e}", file=sys.stderr)
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        pass
 
 
 @app.command("add-git-source")
@@ -1,7 +1,7 @@
 import sys
 
 from contextvars import ContextVar
-from typing import cast
+from typing import Callable, cast
 
 import typer
 
@@ -11,6 +11,10 @@ current_user: ContextVar[dict[str, bool | str] | None] = ContextVar(
     "current_user", default=None
 )
 
+current_user_loader: ContextVar[Callable[[], None] | None] = ContextVar(
+    "current_user_loader", default=None
+)
+
 verbose_mode: ContextVar[bool] = ContextVar("verbose_mode", default=False)
 
 
@@ -20,6 +24,28 @@ def set_current_user(username: str, is_admin: bool) -> None:
     current_user.set({"username": username, "is_admin": is_admin})
 
 
+def set_current_user_loader(loader: Callable[[], None] | None) -> None:
+    """Set a callback setting the current user when it is first needed.
+
+    Used by shell completion, where most requests never need the user.
+    """
+
+    current_user_loader.set(loader)
+
+
+def _get_current_user() -> dict[str, bool | str] | None:
+    """Return the current user, running the pending loader first if any."""
+
+    user = current_user.get()
+    loader = current_user_loader.get()
+    if user is None and loader is not None:
+        current_user_loader.set(None)
+        loader()
+        user = current_user.get()
+
+    return user
+
+
 def set_verbose_mode(value: bool) -> None:
     """Set the verbose mode in the context variable."""
     verbose_mode.set(value)
@@ -33,7 +59,7 @@ def is_verbose() -> bool:
 def reject_if_not_admin() -> None:
     """Exit the program if the current user is not an admin."""
 
-    user = current_user.get()
+    user = _get_current_user()
     if user is None or not user.get("is_admin", False):
         print("Admin privileges required.", file=sys.stderr)
         raise typer.Exit(code=1)
@@ -42,7 +68,7 @@ def reject_if_not_admin() -> None:
 def get_current_username() -> str | None:
     """Return the current username."""
 
-    user = current_user.get()
+    user = _get_current_user()
     if user is None:
         return None
 
@@ -52,7 +78,7 @@ def get_current_username() -> str | None:
 def is_current_user_admin() -> bool:
     """Return whether the current user is an admin."""
 
-    user = current_user.get()
+    user = _get_current_user()
     if user is None:
         return False
 
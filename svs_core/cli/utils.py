@@ -9,6 +9,7 @@ from django.core import management
 from rich import print as rprint
 
 from svs_core.cli.state import reject_if_not_admin
+from svs_core.docker.reconciler import ServiceStateReconciler
 from svs_core.migrations.migrator import Migrator, PackageVersion
 
 app = typer.Typer(help="Utility commands")
@@ -97,3 +98,39 @@ def migrate(
 
     Migrator.run(parsed_version)
     rprint("Migrations completed successfully.")
+
+
+@app.command("reconcile")
+def reconcile(
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep recording state changes from Docker events until interrupted.",
+    ),
+    interval: int = typer.Option(
+        ServiceStateReconciler.DEFAULT_INTERVAL_SECONDS,
+        "--interval",
+        min=1,
+        help="Seconds between full reconciliation passes in watch mode.",
+    ),
+) -> None:
+    """Records the container state of all services in the database."""
+
+    reject_if_not_admin()
+
+    if watch:
+        rprint("Watching container states, press Ctrl+C to stop.")
+        try:
+            ServiceStateReconciler.watch(interval)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        changed = ServiceStateReconciler.reconcile()
+    except Exception as e:
+        rprint(f"Error reconciling service states: {e}", file=sys.stderr)
+        raise typer.Exit(code=1)
+
+    rprint(f"Service states reconciled, {changed} changed.")
@@ -39,7 +39,25 @@ After=network.target
 [Service]
 User=root
 WorkingDirectory=${working_dir}
-ExecStart=${venv_python} -m gunicorn project.wsgi --bind 0.0.0.0:8000 --workers 3
+ExecStart=${venv_python} -m uvicorn project.asgi:application --host 0.0.0.0 --port 8000 --workers 3
+Restart=always
+
+[Install]
+WantedBy=multi-user.target
+""")
+
+WORKER_SYSTEMD_SERVICE_TEMPLATE = StrTemplate("""\
+[Unit]
+Description=SVS Web Job Worker
+After=network.target
+PartOf=svs-web.service
+
+[Service]
+User=root
+WorkingDirectory=${working_dir}
+ExecStart=${venv_python} manage.py run_jobs
+KillSignal=SIGTERM
+TimeoutStopSec=infinity
 Restart=always
 
 [Install]
@@ -143,11 +161,14 @@ def init(
     print()
     print(f"To {action} the service:")
     if not no_systemd:
-        print(f"  sudo systemctl enable svs-web")
-        print(f"  sudo systemctl start svs-web")
+        print(f"  sudo systemctl enable svs-web svs-web-worker")
+        print(f"  sudo systemctl start svs-web svs-web-worker")
     else:
         print(
-            f"  cd {install_path} && sudo {install_path / '.venv' / 'bin' / 'gunicorn'} project.wsgi --bind 0.0.0.0:8000"
+            f"  cd {install_path} && sudo {install_path / '.venv' / 'bin' / 'uvicorn'} project.asgi:application --host 0.0.0.0 --port 8000"
+        )
+        print(
+            f"  cd {install_path} && sudo {install_path / '.venv' / 'bin' / 'python'} manage.py run_jobs"
         )
     print()
     print("Access the web interface at http://<your-server-ip>:8000")
@@ -499,27 +520,33 @@ def _collect_static(install_path: Path) -> None:
 
 
 def _create_systemd_service(install_path: Path) -> None:
-    """Create a systemd service file for the web interface.
+    """Create the systemd service files for the web interface and its job worker.
 
     Args:
         install_path: The web app directory.
     """
-    service_path = Path("/etc/systemd/system/svs-web.service")
     venv_python = str(install_path / ".venv" / "bin" / "python")
-
-    if service_path.exists():
-        print(f"{INFO} {service_path} already exists.")
-        if not Confirm.ask("Overwrite?"):
-            print("Skipping systemd service creation.")
-            return
-
-    content = SYSTEMD_SERVICE_TEMPLATE.substitute(
-        working_dir=str(install_path),
-        venv_python=venv_python,
-    )
-    service_path.write_text(content)
-    service_path.chmod(0o644)
-    print(f"{OK} Created {service_path}.")
+    units = {
+        Path("/etc/systemd/system/svs-web.service"): SYSTEMD_SERVICE_TEMPLATE,
+        Path(
+            "/etc/systemd/system/svs-web-worker.service"
+        ): WORKER_SYSTEMD_SERVICE_TEMPLATE,
+    }
+
+    for service_path, template in units.items():
+        if service_path.exists():
+            print(f"{INFO} {service_path} already exists.")
+            if not Confirm.ask("Overwrite?"):
+                print(f"Skipping {service_path.name} creation.")
+                continue
+
+        content = template.substitute(
+            working_dir=str(install_path),
+            venv_python=venv_python,
+        )
+        service_path.write_text(content)
+        service_path.chmod(0o644)
+        print(f"{OK} Created {service_path}.")
 
     # Reload systemd
     subprocess.run(["systemctl", "daemon-reload"], capture_output=True)
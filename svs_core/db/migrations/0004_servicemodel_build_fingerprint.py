@@ -0,0 +1,18 @@
+# Generated migration for adding build_fingerprint field to ServiceModel
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("svs_core", "0003_templatemodel_docs_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicemodel",
+            name="build_fingerprint",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
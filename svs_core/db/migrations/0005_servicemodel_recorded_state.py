@@ -0,0 +1,56 @@
+# Generated migration for recording the container state of ServiceModel
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("svs_core", "0004_servicemodel_build_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="servicemodel",
+            name="last_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("created", "CREATED"),
+                    ("running", "RUNNING"),
+                    ("paused", "PAUSED"),
+                    ("restarting", "RESTARTING"),
+                    ("removing", "REMOVING"),
+                    ("exited", "EXITED"),
+                    ("dead", "DEAD"),
+                ],
+                max_length=32,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="servicemodel",
+            name="last_health",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name="servicemodel",
+            name="started_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="servicemodel",
+            name="exit_code",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="servicemodel",
+            name="restart_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="servicemodel",
+            name="state_checked_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
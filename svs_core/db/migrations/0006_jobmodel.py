@@ -0,0 +1,69 @@
+# Generated by Django 6.1 on 2026-10-17 01:43
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+import svs_core.db.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("svs_core", "0005_servicemodel_recorded_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobModel",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("kind", models.CharField(max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "QUEUED"),
+                            ("running", "RUNNING"),
+                            ("succeeded", "SUCCEEDED"),
+                            ("failed", "FAILED"),
+                        ],
+                        default=svs_core.db.models.JobStatus["QUEUED"],
+                        max_length=16,
+                    ),
+                ),
+                ("payload", models.JSONField(blank=True, default=dict)),
+                ("progress", models.JSONField(blank=True, default=dict)),
+                ("result", models.JSONField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "service",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="jobs",
+                        to="svs_core.servicemodel",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="jobs",
+                        to="svs_core.usermodel",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "jobs",
+                "indexes": [
+                    models.Index(fields=["status", "id"], name="jobs_status_4748b0_idx")
+                ],
+            },
+        ),
+    ]
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
 from django.db import models
 
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
     from svs_core.users.user import User
 
 
+_ParsedT = TypeVar("_ParsedT")
+
+
 class UserManager(models.Manager["UserModel"]):  # type: ignore[misc]
     """Typed manager for UserModel."""
 
@@ -31,11 +34,57 @@ class TemplateManager(models.Manager["TemplateModel"]):  # type: ignore[misc]
 class ServiceManager(models.Manager["ServiceModel"]):  # type: ignore[misc]
     """Typed manager for ServiceModel."""
 
+    LISTING_FIELDS = (
+        "name",
+        "container_id",
+        "image",
+        "domain",
+        "created_at",
+        "updated_at",
+        "last_status",
+        "last_health",
+        "state_checked_at",
+        "user__name",
+        "template__name",
+        "template__type",
+        "template__docs_url",
+    )
+    """Columns loaded by `listing` unless a detailed listing is requested."""
+
+    def listing(self, detailed: bool = False) -> models.QuerySet["ServiceModel"]:
+        """Get a queryset suited for listing many services.
+
+        Owners and templates are joined in the same query and git sources are
+        prefetched, so rendering a listing costs a constant number of queries
+        regardless of the number of services.
+
+        Args:
+            detailed (bool): Load every column, including the JSON configuration
+                blobs. Otherwise only `LISTING_FIELDS` are loaded.
+
+        Returns:
+            QuerySet: The listing queryset.
+        """
+        from svs_core.shared.git_source import GitSource
+
+        queryset = self.select_related("user", "template").prefetch_related(
+            models.Prefetch("git_sources", queryset=GitSource.objects.all())
+        )
+
+        if not detailed:
+            queryset = queryset.only(*self.LISTING_FIELDS)
+
+        return queryset
+
 
 class GitSourceManager(models.Manager["GitSourceModel"]):  # type: ignore[misc]
     """Typed manager for GitSourceModel."""
 
 
+class JobManager(models.Manager["JobModel"]):  # type: ignore[misc]
+    """Typed manager for JobModel."""
+
+
 class BaseModel(models.Model):  # type: ignore[misc]
     """Base model with common fields."""
 
@@ -211,7 +260,8 @@ class ServiceStatus(str, Enum):
         """Return choices for Django model field.
 
         Note:
-            Deprecated in favor of dynamically fetching status from Docker.
+            Only used for the recorded `last_status`; the authoritative status
+            is fetched from Docker.
         """
         return [(key.value, key.name) for key in cls]
 
@@ -246,6 +296,23 @@ class ServiceModel(BaseModel):
     """Command to execute in the container."""
     args = models.JSONField(null=True, blank=True, default=list)
     """Arguments for the command."""
+    build_fingerprint = models.CharField(max_length=64, null=True, blank=True)
+    """Fingerprint of the Dockerfile, build arguments and source tree of the last build."""
+
+    last_status = models.CharField(
+        max_length=32, null=True, blank=True, choices=ServiceStatus.choices()
+    )
+    """Last recorded container status, None if the container does not exist."""
+    last_health = models.CharField(max_length=32, null=True, blank=True)
+    """Last recorded health status, None without a healthcheck."""
+    started_at = models.DateTimeField(null=True, blank=True)
+    """When the container was last started."""
+    exit_code = models.IntegerField(null=True, blank=True)
+    """Exit code of the last container run."""
+    restart_count = models.IntegerField(default=0)
+    """Number of times Docker restarted the container under its restart policy."""
+    state_checked_at = models.DateTimeField(null=True, blank=True)
+    """When the recorded container state was last confirmed against Docker."""
 
     _env = models.JSONField(null=True, blank=True, default=list)
     """JSON-serialized environment variables."""
@@ -269,58 +336,135 @@ class ServiceModel(BaseModel):
     )
     """Reference to the user that owns this service."""
 
+    def _parsed(self, field: str, parse: Callable[[Any], _ParsedT]) -> _ParsedT:
+        """Return the parsed value of a JSON field, memoized per instance.
+
+        The cached value is reused for as long as the raw field holds the same
+        object, and is dropped by the property setters, `save` and
+        `refresh_from_db`. It must never be handed out itself, the properties
+        return copies, so changing a returned value cannot make the cache
+        disagree with the raw field.
+
+        Args:
+            field (str): Name of the raw JSON field.
+            parse (Callable[[Any], _ParsedT]): Deserializer applied to the raw value.
+
+        Returns:
+            _ParsedT: The parsed value.
+        """
+        cache: dict[str, tuple[Any, Any]] = self.__dict__.setdefault(
+            "_parsed_cache", {}
+        )
+        raw = getattr(self, field)
+
+        cached = cache.get(field)
+        if cached is not None and cached[0] is raw:
+            return cast(_ParsedT, cached[1])
+
+        value = parse(raw)
+        cache[field] = (raw, value)
+        return value
+
+    def _invalidate_parsed(self, field: str | None = None) -> None:
+        """Drop memoized JSON field values.
+
+        Args:
+            field (str | None): Raw field to invalidate, or None for all fields.
+        """
+        cache = self.__dict__.get("_parsed_cache")
+        if not cache:
+            return
+
+        if field is None:
+            cache.clear()
+        else:
+            cache.pop(field, None)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:  # noqa: D102
+        self._invalidate_parsed()
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args: Any, **kwargs: Any) -> None:  # noqa: D102
+        self._invalidate_parsed()
+        super().refresh_from_db(*args, **kwargs)
+
     @property
     def env(self) -> list[EnvVariable]:
         """Environment variables (deserialized from JSON)."""
-        return EnvVariable.from_dict_array(self._env or [])
+        return [
+            var.model_copy()
+            for var in self._parsed(
+                "_env", lambda raw: EnvVariable.from_dict_array(raw or [])
+            )
+        ]
 
     @env.setter
     def env(self, env_vars: list[EnvVariable]) -> None:
         """Set environment variables (serialized to JSON)."""
+        self._invalidate_parsed("_env")
         self._env = EnvVariable.to_dict_array(env_vars)
 
     @property
     def exposed_ports(self) -> list[ExposedPort]:
         """Exposed ports (deserialized from JSON)."""
-        return ExposedPort.from_dict_array(self._exposed_ports or [])
+        return [
+            port.model_copy()
+            for port in self._parsed(
+                "_exposed_ports", lambda raw: ExposedPort.from_dict_array(raw or [])
+            )
+        ]
 
     @exposed_ports.setter
     def exposed_ports(self, ports: list[ExposedPort]) -> None:
         """Set exposed ports (serialized to JSON)."""
+        self._invalidate_parsed("_exposed_ports")
         self._exposed_ports = ExposedPort.to_dict_array(ports)
 
     @property
     def volumes(self) -> list[Volume]:
         """Volumes (deserialized from JSON)."""
-        return Volume.from_dict_array(self._volumes or [])
+        return [
+            volume.model_copy()
+            for volume in self._parsed(
+                "_volumes", lambda raw: Volume.from_dict_array(raw or [])
+            )
+        ]
 
     @volumes.setter
     def volumes(self, volumes: list[Volume]) -> None:
         """Set volumes (serialized to JSON)."""
+        self._invalidate_parsed("_volumes")
         self._volumes = Volume.to_dict_array(volumes)
 
     @property
     def labels(self) -> list[Label]:
         """Labels (deserialized from JSON)."""
-        return Label.from_dict_array(self._labels or [])
+        return [
+            label.model_copy()
+            for label in self._parsed(
+                "_labels", lambda raw: Label.from_dict_array(raw or [])
+            )
+        ]
 
     @labels.setter
     def labels(self, labels: list[Label]) -> None:
         """Set labels (serialized to JSON)."""
+        self._invalidate_parsed("_labels")
         self._labels = Label.to_dict_array(labels)
 
     @property
     def healthcheck(self) -> Healthcheck | None:
         """Healthcheck configuration (deserialized from JSON)."""
-        return (
-            Healthcheck.from_dict(self._healthcheck)
-            if self._healthcheck is not None
-            else None
+        healthcheck = self._parsed(
+            "_healthcheck",
+            lambda raw: Healthcheck.from_dict(raw) if raw is not None else None,
         )
+        return healthcheck.model_copy(deep=True) if healthcheck is not None else None
 
     @healthcheck.setter
     def healthcheck(self, healthcheck: Healthcheck | None) -> None:
         """Set healthcheck configuration (serialized to JSON)."""
+        self._invalidate_parsed("_healthcheck")
         self._healthcheck = healthcheck.to_dict() if healthcheck is not None else None
 
     @property
@@ -352,9 +496,16 @@ class ServiceModel(BaseModel):
 
     @property
     def proxy_git_sources(self) -> models.QuerySet["GitSource"]:
-        """Get related GitSourceModel instances."""
+        """Get related GitSourceModel instances.
+
+        Reuses git sources prefetched by `ServiceManager.listing` when present.
+        """
         from svs_core.shared.git_source import GitSource
 
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get("git_sources")
+        if prefetched is not None:
+            return cast(models.QuerySet["GitSource"], prefetched)
+
         return GitSource.objects.filter(service_id=self.id)
 
 
@@ -413,6 +564,60 @@ class UserGroupModel(BaseModel):
         return User.objects.filter(groups__id=self.id)
 
 
+class JobStatus(str, Enum):
+    """Status of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @classmethod
+    def choices(cls) -> list[tuple[str, str]]:  # noqa: D102
+        return [(key.value, key.name) for key in cls]
+
+
+class JobModel(BaseModel):
+    """Background job model."""
+
+    objects = JobManager()
+    """Manager for JobModel queries."""
+
+    kind = models.CharField(max_length=64)
+    """Operation performed by the job, e.g. `service.build`."""
+    status = models.CharField(
+        max_length=16, choices=JobStatus.choices(), default=JobStatus.QUEUED
+    )
+    """Current status of the job."""
+    payload = models.JSONField(default=dict, blank=True)
+    """Arguments of the operation."""
+    progress = models.JSONField(default=dict, blank=True)
+    """Latest progress reported by the operation."""
+    result = models.JSONField(null=True, blank=True)
+    """Outcome of a successful operation."""
+    error = models.TextField(null=True, blank=True)
+    """Error message of a failed operation."""
+    started_at = models.DateTimeField(null=True, blank=True)
+    """When a worker picked the job up."""
+    finished_at = models.DateTimeField(null=True, blank=True)
+    """When the job succeeded or failed."""
+
+    user = models.ForeignKey(UserModel, on_delete=models.CASCADE, related_name="jobs")
+    """Reference to the user that enqueued the job."""
+    service = models.ForeignKey(
+        ServiceModel,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    """Reference to the service the job operates on, if any."""
+
+    class Meta:  # noqa: D106
+        db_table = "jobs"
+        indexes = [models.Index(fields=["status", "id"])]
+
+
 def miscelanous_str_injector(obj: BaseModel, indent: int = 1) -> str:
     """Generate miscelanous information string for a model instance.
 
@@ -1,10 +1,161 @@
+import os
+import re
+import threading
+
+from typing import Any
+
 import docker
 
+from requests import Response
+
+from svs_core.shared.env_manager import EnvManager
+from svs_core.shared.logger import get_logger
+
+_client: docker.DockerClient | None = None
+_client_pid: int | None = None
+_client_lock = threading.Lock()
+
+_api_call_count = 0
+_api_call_lock = threading.Lock()
+
+_API_VERSION = re.compile(r"^/v[0-9.]+(?=/)")
+_RESOURCE_ID = re.compile(
+    r"^/(containers|networks|volumes|exec|services|tasks|secrets|configs|nodes)"
+    r"/(?!json$|create$|prune$)[^/]+"
+)
+_IMAGE_NAME = re.compile(
+    r"^/images/(?!json$|create$|load$|prune$|search$|get$)"
+    r".+?(?=/(json|history|push|tag|get)$|$)"
+)
+
+
+def _count_api_call(response: Response, *args: Any, **kwargs: Any) -> Response:
+    """Response hook counting every round-trip made to the Docker daemon."""
+    global _api_call_count
+
+    with _api_call_lock:
+        _api_call_count += 1
+
+    from svs_core.shared.profiling import Profiler
+
+    if Profiler.is_enabled():
+        Profiler.record(
+            "docker",
+            f"{response.request.method} {endpoint_label(response.request.path_url)}",
+            response.elapsed.total_seconds(),
+            response.status_code >= 400,
+        )
+
+    return response
+
+
+def endpoint_label(path: str) -> str:
+    """Returns a Docker API path with the API version, IDs and query removed.
+
+    Used to aggregate requests by endpoint, e.g.
+    `/v1.47/containers/3f2a/json?size=1` becomes `/containers/{id}/json`.
+
+    Args:
+        path (str): The request path.
+
+    Returns:
+        str: The endpoint.
+    """
+    path = _API_VERSION.sub("", path.split("?", 1)[0])
+
+    match = _RESOURCE_ID.match(path)
+    if match:
+        return f"/{match.group(1)}/{{id}}{path[match.end():]}"
+
+    match = _IMAGE_NAME.match(path)
+    if match:
+        return f"/images/{{name}}{path[match.end():]}"
+
+    return path
+
 
 def get_docker_client() -> docker.DockerClient:
-    """Returns a Docker client instance.
+    """Returns the process-wide Docker client instance.
+
+    The client is created lazily on first use and reused afterwards, so all
+    managers share a single HTTP session and its connection pool. Pool size and
+    request timeout are read from the `DOCKER_MAX_POOL_SIZE` and
+    `DOCKER_TIMEOUT` environment variables.
+
+    A client inherited through `fork()` is never reused; the child process
+    builds its own one instead of sharing the parent's sockets.
 
     Returns:
         docker.DockerClient: A Docker client instance.
     """
-    return docker.from_env()
+    global _client, _client_pid
+
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+
+    with _client_lock:
+        if _client is None or _client_pid != pid:
+            client = docker.from_env(
+                max_pool_size=EnvManager.get_docker_max_pool_size(),
+                timeout=EnvManager.get_docker_timeout(),
+            )
+            client.api.hooks["response"].append(_count_api_call)
+
+            get_logger(__name__).debug(
+                f"Created Docker client (pid={pid}, max_pool_size={EnvManager.get_docker_max_pool_size()}, timeout={EnvManager.get_docker_timeout()}s)"
+            )
+
+            _client = client
+            _client_pid = pid
+
+        return _client
+
+
+def reset_docker_client() -> None:
+    """Closes and forgets the shared Docker client.
+
+    The next call to `get_docker_client` creates a fresh client.
+    """
+    global _client, _client_pid
+
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            try:
+                _client.close()
+            except Exception as e:
+                get_logger(__name__).debug(f"Failed to close Docker client: {str(e)}")
+
+        _client = None
+        _client_pid = None
+
+
+def get_api_call_count() -> int:
+    """Returns the number of Docker API round-trips made by this process.
+
+    Returns:
+        int: The number of requests sent to the Docker daemon.
+    """
+    return _api_call_count
+
+
+def reset_api_call_count() -> None:
+    """Resets the Docker API round-trip counter to zero."""
+    global _api_call_count
+
+    with _api_call_lock:
+        _api_call_count = 0
+
+
+def _after_fork_in_child() -> None:
+    """Drops the inherited client reference in forked children (e.g. web workers)."""
+    global _client, _client_pid, _client_lock, _api_call_count, _api_call_lock
+
+    _client_lock = threading.Lock()
+    _api_call_lock = threading.Lock()
+    _client = None
+    _client_pid = None
+    _api_call_count = 0
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
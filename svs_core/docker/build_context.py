@@ -0,0 +1,234 @@
+import hashlib
+import os
+import stat
+import tarfile
+
+from pathlib import Path
+from typing import Iterator
+
+from docker.utils.build import exclude_paths
+
+from svs_core.shared.logger import get_logger
+
+
+class DockerBuildContext:
+    """Generates Docker build contexts as streamed tar archives.
+
+    The archive is produced straight from the source tree while Docker reads
+    it, so the context is never copied to a temporary directory or held in
+    memory as a whole.
+    """
+
+    DOCKERFILE_NAME = "Dockerfile"
+    DOCKERIGNORE_NAME = ".dockerignore"
+
+    CHUNK_SIZE = 64 * 1024
+    """Size of the chunks handed to the Docker API."""
+
+    @staticmethod
+    def read_dockerignore(source: Path) -> list[str]:
+        """Reads the `.dockerignore` patterns of a source directory.
+
+        Args:
+            source (Path): The source directory.
+
+        Returns:
+            list[str]: The patterns, without blank lines and comments.
+        """
+        dockerignore = source / DockerBuildContext.DOCKERIGNORE_NAME
+        if not dockerignore.is_file():
+            return []
+
+        return [
+            line.strip()
+            for line in dockerignore.read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        ]
+
+    @staticmethod
+    def list_paths(source: Path) -> list[str]:
+        """Lists the source paths that belong to the build context.
+
+        Paths matched by `.dockerignore` are left out, the same way the Docker
+        CLI does it.
+
+        Args:
+            source (Path): The source directory.
+
+        Returns:
+            list[str]: Sorted paths relative to the source, directories included.
+        """
+        patterns = DockerBuildContext.read_dockerignore(source)
+        return sorted(
+            exclude_paths(
+                str(source), patterns, dockerfile=DockerBuildContext.DOCKERFILE_NAME
+            )
+        )
+
+    @staticmethod
+    def fingerprint(
+        dockerfile_content: str,
+        build_args: dict[str, str] | None = None,
+        source: Path | None = None,
+    ) -> str:
+        """Computes a fingerprint of everything that goes into a build.
+
+        The source tree is hashed from file metadata (path, type, mode, size
+        and modification time) rather than file contents, like `git status`
+        does, so fingerprinting stays fast for large trees. Only paths that
+        end up in the build context are taken into account.
+
+        Args:
+            dockerfile_content (str): Contents of the Dockerfile.
+            build_args (dict[str, str] | None): Build arguments passed to Docker.
+            source (Path | None): Directory or single file included in the context.
+
+        Returns:
+            str: Hex SHA-256 digest, identical for identical build inputs.
+        """
+        digest = hashlib.sha256()
+
+        def update(*parts: object) -> None:
+            for part in parts:
+                digest.update(str(part).encode("utf-8", "surrogateescape"))
+                digest.update(b"\0")
+
+        update("dockerfile", dockerfile_content)
+        for key, value in sorted((build_args or {}).items()):
+            update("arg", key, value)
+
+        for name, path in DockerBuildContext._entries(source):
+            st = os.lstat(path)
+            update("path", name, st.st_mode, st.st_size, st.st_mtime_ns)
+            if stat.S_ISLNK(st.st_mode):
+                update(os.readlink(path))
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def stream(dockerfile_content: str, source: Path | None = None) -> Iterator[bytes]:
+        """Streams a tar build context of the source with a Dockerfile injected.
+
+        A `Dockerfile` shipped in the source directory takes precedence over
+        the injected one.
+
+        Args:
+            dockerfile_content (str): Contents of the Dockerfile to inject.
+            source (Path | None): Directory or single file to include in the context.
+
+        Yields:
+            bytes: Consecutive chunks of the uncompressed tar archive.
+        """
+        entries = DockerBuildContext._entries(source)
+
+        buffer = bytearray()
+        archived = 0
+
+        def flush(force: bool = False) -> Iterator[bytes]:
+            if buffer and (force or len(buffer) >= DockerBuildContext.CHUNK_SIZE):
+                yield bytes(buffer)
+                buffer.clear()
+
+        if not any(name == DockerBuildContext.DOCKERFILE_NAME for name, _ in entries):
+            content = dockerfile_content.encode("utf-8")
+            dockerfile_info = tarfile.TarInfo(DockerBuildContext.DOCKERFILE_NAME)
+            dockerfile_info.size = len(content)
+            dockerfile_info.mode = 0o644
+            buffer += dockerfile_info.tobuf(format=tarfile.PAX_FORMAT)
+            buffer += content
+            buffer += DockerBuildContext._padding(len(content))
+        else:
+            get_logger(__name__).debug(
+                "Source ships its own Dockerfile, using it instead of the template one"
+            )
+
+        for name, path in entries:
+            info = DockerBuildContext._tar_info(name, path)
+            if info is None:
+                continue
+
+            buffer += info.tobuf(format=tarfile.PAX_FORMAT)
+            if info.isreg():
+                with open(path, "rb") as f:
+                    remaining = info.size
+                    while remaining > 0:
+                        chunk = f.read(min(DockerBuildContext.CHUNK_SIZE, remaining))
+                        if not chunk:
+                            raise OSError(f"File changed while archiving: {path}")
+                        buffer += chunk
+                        remaining -= len(chunk)
+                        yield from flush()
+                buffer += DockerBuildContext._padding(info.size)
+                archived += info.size
+            yield from flush()
+
+        # End-of-archive marker: two empty blocks
+        buffer += tarfile.NUL * (2 * tarfile.BLOCKSIZE)
+        yield from flush(force=True)
+
+        get_logger(__name__).debug(
+            f"Streamed build context with {len(entries)} entries ({archived} bytes of file data)"
+        )
+
+    @staticmethod
+    def _entries(source: Path | None) -> list[tuple[str, Path]]:
+        """Lists the archive names and paths of a build context source.
+
+        Args:
+            source (Path | None): Directory or single file to include in the context.
+
+        Returns:
+            list[tuple[str, Path]]: Pairs of archive name and path on disk.
+        """
+        if source is None:
+            return []
+        if not source.is_dir():
+            return [(source.name, source)]
+
+        return [(name, source / name) for name in DockerBuildContext.list_paths(source)]
+
+    @staticmethod
+    def _tar_info(name: str, path: Path) -> tarfile.TarInfo | None:
+        """Builds the tar header for a path.
+
+        Ownership is normalized to root, as Docker does for COPY by default.
+
+        Args:
+            name (str): The name of the entry inside the archive.
+            path (Path): The path on disk.
+
+        Returns:
+            tarfile.TarInfo | None: The header, or None for unsupported file types (sockets, devices).
+        """
+        st = os.lstat(path)
+
+        info = tarfile.TarInfo(name.replace(os.sep, "/"))
+        info.mode = stat.S_IMODE(st.st_mode)
+        info.mtime = int(st.st_mtime)
+
+        if stat.S_ISREG(st.st_mode):
+            info.type = tarfile.REGTYPE
+            info.size = st.st_size
+        elif stat.S_ISDIR(st.st_mode):
+            info.type = tarfile.DIRTYPE
+        elif stat.S_ISLNK(st.st_mode):
+            info.type = tarfile.SYMTYPE
+            info.linkname = os.readlink(path)
+        else:
+            get_logger(__name__).debug(f"Skipping unsupported file type: {path}")
+            return None
+
+        return info
+
+    @staticmethod
+    def _padding(size: int) -> bytes:
+        """Returns the NUL padding completing a tar block.
+
+        Args:
+            size (int): The size of the data written to the block.
+
+        Returns:
+            bytes: The padding.
+        """
+        remainder = size % tarfile.BLOCKSIZE
+        return tarfile.NUL * (tarfile.BLOCKSIZE - remainder) if remainder else b""
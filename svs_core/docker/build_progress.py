@@ -0,0 +1,304 @@
+import re
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from svs_core.shared.logger import get_logger
+
+
+@dataclass(frozen=True)
+class BuildEvent:
+    """A single event emitted while an image is being built."""
+
+    STEP = "step"
+    OUTPUT = "output"
+    ERROR = "error"
+
+    """Event kind: `step` when a Dockerfile step starts, `output` for build output, `error` when the build fails."""
+    kind: str
+    """The step instruction, output line or error message."""
+    message: str
+    """Number of the current step, None before the first step."""
+    step: int | None = None
+    """Total number of steps in the Dockerfile, None before the first step."""
+    total_steps: int | None = None
+
+
+@dataclass(frozen=True)
+class BuildStepTiming:
+    """Wall-clock duration of a single Dockerfile step."""
+
+    """Number of the step."""
+    step: int
+    """The Dockerfile instruction of the step."""
+    instruction: str
+    """How long the step took, in seconds."""
+    duration_seconds: float
+
+
+@dataclass
+class BuildResult:
+    """Outcome of a successful image build."""
+
+    """ID of the built image, if reported by Docker."""
+    image_id: str | None = None
+    """Per-step timings in step order."""
+    steps: list[BuildStepTiming] = field(default_factory=list)
+    """Total build duration, in seconds."""
+    duration_seconds: float = 0.0
+    """Whether the build was skipped because its inputs did not change."""
+    cached: bool = False
+
+    def slowest_steps(self, count: int = 3) -> list[BuildStepTiming]:
+        """Returns the steps that took the longest.
+
+        Args:
+            count (int): Maximum number of steps to return.
+
+        Returns:
+            list[BuildStepTiming]: The slowest steps, slowest first.
+        """
+        return sorted(self.steps, key=lambda s: s.duration_seconds, reverse=True)[
+            :count
+        ]
+
+
+class BuildProgressTracker:
+    """Turns the decoded Docker build stream into build events and step timings."""
+
+    STEP_PATTERN = re.compile(r"^Step (\d+)/(\d+) : (.*)$")
+
+    def __init__(
+        self,
+        on_event: Callable[[BuildEvent], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the tracker.
+
+        Args:
+            on_event (Callable[[BuildEvent], None] | None): Called for every build event.
+            clock (Callable[[], float]): Monotonic clock used for timing.
+        """
+        self._on_event = on_event
+        self._clock = clock
+        self._started_at = clock()
+        self._step: tuple[int, int, str, float] | None = None
+        self._partial = ""
+
+        self.log_lines: list[str] = []
+        """Every line of build output, for error reports."""
+        self.error: str | None = None
+        """The error reported by Docker, None while the build succeeds."""
+        self.result = BuildResult()
+
+    def feed(self, chunk: dict[str, Any]) -> None:
+        """Processes one decoded chunk of the Docker build stream.
+
+        Args:
+            chunk (dict[str, Any]): The chunk, e.g. `{"stream": "Step 1/3 : FROM alpine"}`.
+        """
+        if "stream" in chunk:
+            text = self._partial + str(chunk["stream"])
+            *lines, self._partial = text.split("\n")
+            for line in lines:
+                self._handle_line(line.rstrip("\r"))
+
+        if "status" in chunk:
+            # Base image pulls report per-layer status instead of stream output
+            status = str(chunk["status"])
+            if chunk.get("id"):
+                status = f"{chunk['id']}: {status}"
+            self._handle_line(status)
+
+        if "aux" in chunk and isinstance(chunk["aux"], dict):
+            self.result.image_id = chunk["aux"].get("ID", self.result.image_id)
+
+        if "error" in chunk or "errorDetail" in chunk:
+            detail = chunk.get("errorDetail") or {}
+            message = str(chunk.get("error") or detail.get("message") or chunk)
+            self.error = message
+            self.log_lines.append(f"ERROR: {message}")
+            get_logger(__name__).error(f"Build error: {message}")
+            self._emit(BuildEvent.ERROR, message)
+
+    def finish(self) -> BuildResult:
+        """Closes the last step and returns the build result.
+
+        Returns:
+            BuildResult: The image ID and step timings.
+        """
+        if self._partial:
+            self._handle_line(self._partial)
+            self._partial = ""
+
+        self._close_step()
+        self.result.duration_seconds = self._clock() - self._started_at
+        return self.result
+
+    def _handle_line(self, line: str) -> None:
+        """Records an output line, starting a new step on `Step N/M` lines.
+
+        Args:
+            line (str): A single line of build output.
+        """
+        if not line.strip():
+            return
+
+        self.log_lines.append(line)
+
+        match = self.STEP_PATTERN.match(line)
+        if match:
+            self._close_step()
+            step, total, instruction = (
+                int(match.group(1)),
+                int(match.group(2)),
+                match.group(3),
+            )
+            self._step = (step, total, instruction, self._clock())
+            get_logger(__name__).info(f"Build step {step}/{total}: {instruction}")
+            self._emit(BuildEvent.STEP, instruction)
+            return
+
+        get_logger(__name__).debug(f"Build output: {line}")
+        self._emit(BuildEvent.OUTPUT, line)
+
+    def _close_step(self) -> None:
+        """Records the timing of the current step, if any."""
+        if self._step is None:
+            return
+
+        step, _, instruction, started_at = self._step
+        self.result.steps.append(
+            BuildStepTiming(
+                step=step,
+                instruction=instruction,
+                duration_seconds=self._clock() - started_at,
+            )
+        )
+        self._step = None
+
+    def _emit(self, kind: str, message: str) -> None:
+        """Sends an event for the current step to the callback.
+
+        Args:
+            kind (str): The event kind.
+            message (str): The event message.
+        """
+        if self._on_event is None:
+            return
+
+        step, total = self._position()
+        self._on_event(
+            BuildEvent(kind=kind, message=message, step=step, total_steps=total)
+        )
+
+    def _position(self) -> tuple[int | None, int | None]:
+        """Returns the step the current event belongs to.
+
+        Returns:
+            tuple[int | None, int | None]: The step number and total number of steps.
+        """
+        if self._step is None:
+            return None, None
+        return self._step[0], self._step[1]
+
+
+class BuildKitProgressTracker(BuildProgressTracker):
+    """Turns BuildKit's plain progress output into build events and step timings.
+
+    BuildKit runs independent steps concurrently and reports each one as a
+    numbered vertex, so step timings are taken from the durations BuildKit
+    reports when a vertex finishes rather than from the gaps between steps.
+    Lines are fed as `{"stream": line}` chunks, like the classic builder's.
+    """
+
+    VERTEX_PATTERN = re.compile(r"^#(\d+) \[(?:(\S+) )?(\d+)/(\d+)\] (.*)$")
+    DONE_PATTERN = re.compile(r"^#(\d+) DONE (\d+(?:\.\d+)?)s$")
+    CACHED_PATTERN = re.compile(r"^#(\d+) CACHED$")
+    OUTPUT_PATTERN = re.compile(r"^#(\d+) \d+\.\d+ (.*)$")
+    ERROR_PATTERN = re.compile(r"^(?:#\d+ )?ERROR: (.*)$")
+    IMAGE_PATTERN = re.compile(r"writing image (sha256:[0-9a-f]+)")
+
+    def __init__(
+        self,
+        on_event: Callable[[BuildEvent], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the tracker.
+
+        Args:
+            on_event (Callable[[BuildEvent], None] | None): Called for every build event.
+            clock (Callable[[], float]): Monotonic clock used for the total duration.
+        """
+        super().__init__(on_event, clock)
+        self._vertices: dict[int, tuple[int, int, str]] = {}
+        self._active: int | None = None
+
+    def _handle_line(self, line: str) -> None:
+        """Records a line of plain progress output.
+
+        Args:
+            line (str): A single line of BuildKit output.
+        """
+        if not line.strip():
+            return
+
+        self.log_lines.append(line)
+
+        image = self.IMAGE_PATTERN.search(line)
+        if image:
+            self.result.image_id = image.group(1)
+
+        vertex = self.VERTEX_PATTERN.match(line)
+        if vertex:
+            self._active = int(vertex.group(1))
+            stage, instruction = vertex.group(2), vertex.group(5)
+            if stage:
+                instruction = f"{stage}: {instruction}"
+            step, total = int(vertex.group(3)), int(vertex.group(4))
+            self._vertices[self._active] = (step, total, instruction)
+            get_logger(__name__).info(f"Build step {step}/{total}: {instruction}")
+            self._emit(BuildEvent.STEP, instruction)
+            return
+
+        done = self.DONE_PATTERN.match(line) or self.CACHED_PATTERN.match(line)
+        if done:
+            finished = self._vertices.pop(int(done.group(1)), None)
+            if finished is not None:
+                duration = float(done.group(2)) if done.re is self.DONE_PATTERN else 0.0
+                self.result.steps.append(
+                    BuildStepTiming(
+                        step=finished[0],
+                        instruction=finished[2],
+                        duration_seconds=duration,
+                    )
+                )
+            return
+
+        error = self.ERROR_PATTERN.match(line)
+        if error:
+            self.error = error.group(1)
+            get_logger(__name__).error(f"Build error: {self.error}")
+            self._emit(BuildEvent.ERROR, self.error)
+            return
+
+        output = self.OUTPUT_PATTERN.match(line)
+        if output:
+            self._active = int(output.group(1))
+            get_logger(__name__).debug(f"Build output: {output.group(2)}")
+            self._emit(BuildEvent.OUTPUT, output.group(2))
+            return
+
+        get_logger(__name__).debug(f"Build progress: {line}")
+
+    def _position(self) -> tuple[int | None, int | None]:
+        """Returns the step of the vertex the current line belongs to.
+
+        Returns:
+            tuple[int | None, int | None]: The step number and total number of steps.
+        """
+        vertex = self._vertices.get(self._active) if self._active is not None else None
+        if vertex is None:
+            return None, None
+        return vertex[0], vertex[1]
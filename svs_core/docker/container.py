@@ -1,6 +1,12 @@
+import time
+
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from docker.errors import NotFound
 from docker.models.containers import Container
+from requests.exceptions import RequestException
 
 from svs_core.docker.base import get_docker_client
 from svs_core.docker.json_properties import (
@@ -19,9 +25,37 @@ if TYPE_CHECKING:
     from svs_core.docker.service import Service
 
 
+@dataclass(frozen=True)
+class ContainerState:
+    """Lightweight snapshot of a container's state taken from a container listing."""
+
+    """Docker container state (e.g. "running", "exited")."""
+    status: str
+    """Health status ("healthy", "unhealthy", "starting") or None without a healthcheck."""
+    health: str | None
+
+
+@dataclass(frozen=True)
+class ContainerStateDetails:
+    """Full snapshot of a container's state taken from a container inspect."""
+
+    """Docker container state (e.g. "running", "exited")."""
+    status: str
+    """Health status ("healthy", "unhealthy", "starting") or None without a healthcheck."""
+    health: str | None
+    """When the container was last started, None if it never ran."""
+    started_at: datetime | None
+    """Exit code of the last run, None if the container never ran."""
+    exit_code: int | None
+    """Number of restarts performed by Docker under the restart policy."""
+    restart_count: int
+
+
 class DockerContainerManager:
     """Class for managing Docker containers."""
 
+    MANAGED_LABEL = "svs_user"
+
     @staticmethod
     def create_container(
         name: str,
@@ -211,6 +245,92 @@ class DockerContainerManager:
         client = get_docker_client()
         return client.containers.list(all=True)  # type: ignore
 
+    @staticmethod
+    def get_managed_states() -> dict[str, ContainerState]:
+        """Get the state of every SVS-managed container in a single API call.
+
+        Uses a sparse listing filtered by the SVS label, so no per-container
+        inspect requests are made.
+
+        Returns:
+            dict[str, ContainerState]: Container states keyed by full container ID.
+        """
+        client = get_docker_client()
+        containers = client.containers.list(
+            all=True,
+            sparse=True,
+            filters={"label": DockerContainerManager.MANAGED_LABEL},
+        )
+
+        states: dict[str, ContainerState] = {}
+        for container in containers:
+            state = container.attrs.get("State")
+            if isinstance(state, dict):
+                state = state.get("Status")
+
+            states[container.id] = ContainerState(
+                status=str(state),
+                health=DockerContainerManager._parse_health_summary(
+                    container.attrs.get("Status") or ""
+                ),
+            )
+
+        get_logger(__name__).debug(
+            f"Resolved state of {len(states)} managed containers"
+        )
+
+        return states
+
+    @staticmethod
+    def inspect_state(container_id: str) -> ContainerStateDetails | None:
+        """Get the full state of a container.
+
+        Args:
+            container_id (str): The ID of the container to inspect.
+
+        Returns:
+            ContainerStateDetails | None: The state, or None if the container does not exist.
+        """
+        container = DockerContainerManager.get_container(container_id)
+        if container is None:
+            return None
+
+        state = container.attrs.get("State") or {}
+        started_at = None
+        if state.get("StartedAt"):
+            started_at = datetime.fromisoformat(state["StartedAt"])
+            # Docker reports the zero time for containers that never started
+            if started_at.year <= 1:
+                started_at = None
+
+        health = (state.get("Health") or {}).get("Status")
+
+        return ContainerStateDetails(
+            status=str(state.get("Status") or container.status),
+            health=Healthcheck.HealthStatus.from_str(health or "unknown"),
+            started_at=started_at,
+            exit_code=state.get("ExitCode") if started_at is not None else None,
+            restart_count=int(container.attrs.get("RestartCount") or 0),
+        )
+
+    @staticmethod
+    def _parse_health_summary(summary: str) -> str | None:
+        """Extract the health status from a container listing summary.
+
+        Args:
+            summary (str): Human-readable status, e.g. "Up 2 minutes (healthy)".
+
+        Returns:
+            str | None: "healthy", "unhealthy", "starting", or None if absent.
+        """
+        if "(health: starting)" in summary:
+            return "starting"
+        if "(unhealthy)" in summary:
+            return "unhealthy"
+        if "(healthy)" in summary:
+            return "healthy"
+        return None
+
     @staticmethod
     def remove(container_id: str) -> None:
         """Remove a Docker container by its ID.
@@ -261,6 +381,117 @@ class DockerContainerManager:
             )
             raise
 
+    @staticmethod
+    def rename(container: Container, name: str) -> None:
+        """Rename a Docker container.
+
+        Args:
+            container (Container): The Docker container instance.
+            name (str): The new name of the container.
+        """
+        get_logger(__name__).debug(
+            f"Renaming container '{container.name}' (ID: {container.id}) to '{name}'"
+        )
+
+        try:
+            container.rename(name)
+        except Exception as e:
+            get_logger(__name__).error(
+                f"Failed to rename container '{container.name}' to '{name}': {str(e)}"
+            )
+            raise
+
+    @staticmethod
+    def wait_until_stopped(container: Container, timeout: float) -> None:
+        """Block until a container is no longer running.
+
+        Uses Docker's wait endpoint with the `not-running` condition, which
+        returns as soon as the container stops instead of polling its state.
+        A container that no longer exists counts as stopped.
+
+        Args:
+            container (Container): The Docker container instance.
+            timeout (float): Maximum number of seconds to wait.
+
+        Raises:
+            ServiceOperationException: If the container is still running after the timeout.
+        """
+        from svs_core.shared.exceptions import ServiceOperationException
+
+        started_at = time.monotonic()
+        try:
+            container.wait(condition="not-running", timeout=timeout)
+        except NotFound:
+            get_logger(__name__).debug(
+                f"Container '{container.id}' no longer exists, treating it as stopped"
+            )
+            return
+        except RequestException as e:
+            get_logger(__name__).error(
+                f"Container '{container.id}' did not stop within {timeout:.0f}s"
+            )
+            raise ServiceOperationException(
+                f"Failed to stop container {container.id} within {timeout:.0f}s"
+            ) from e
+
+        get_logger(__name__).debug(
+            f"Container '{container.id}' stopped after {time.monotonic() - started_at:.2f}s"
+        )
+
+    @staticmethod
+    def wait_until_ready(
+        container: Container,
+        timeout: float,
+        settle_seconds: float = 0.0,
+        poll_interval: float = 0.5,
+    ) -> None:
+        """Wait until a started container is ready to take over traffic.
+
+        A container with a healthcheck is ready once it reports healthy. A
+        container without one is ready once it has kept running for
+        `settle_seconds`.
+
+        Args:
+            container (Container): The started Docker container instance.
+            timeout (float): Maximum number of seconds to wait.
+            settle_seconds (float): How long a container without a healthcheck must keep running.
+            poll_interval (float): Seconds between state checks.
+
+        Raises:
+            ServiceOperationException: If the container exits, turns unhealthy or is not ready in time.
+        """
+        from svs_core.shared.exceptions import ServiceOperationException
+
+        started_at = time.monotonic()
+        deadline = started_at + timeout
+
+        while True:
+            container.reload()
+            state = container.attrs.get("State") or {}
+            health = (state.get("Health") or {}).get("Status")
+
+            if state.get("Status") != "running":
+                raise ServiceOperationException(
+                    f"Container '{container.name}' stopped while starting (state: {state.get('Status')}, exit code: {state.get('ExitCode')})"
+                )
+            if health == Healthcheck.HealthStatus.UNHEALTHY:
+                raise ServiceOperationException(
+                    f"Container '{container.name}' reported unhealthy"
+                )
+            if health == Healthcheck.HealthStatus.HEALTHY or (
+                health is None and time.monotonic() - started_at >= settle_seconds
+            ):
+                get_logger(__name__).debug(
+                    f"Container '{container.name}' ready after {time.monotonic() - started_at:.1f}s"
+                )
+                return
+
+            if time.monotonic() >= deadline:
+                raise ServiceOperationException(
+                    f"Container '{container.name}' was not ready within {timeout:.0f}s"
+                )
+            time.sleep(poll_interval)
+
     @staticmethod
     def has_config_changed(container: Container, service: "Service") -> bool:
         """Check if the container's configuration has changed.
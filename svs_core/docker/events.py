@@ -0,0 +1,276 @@
+import os
+import threading
+import time
+
+from typing import Any, Callable
+
+from svs_core.docker.base import get_docker_client
+from svs_core.docker.container import ContainerState, DockerContainerManager
+from svs_core.docker.json_properties import Healthcheck
+from svs_core.shared.logger import get_logger
+
+
+class DockerEventWatcher:
+    """Keeps a live cache of container states fed by the Docker events stream.
+
+    The watcher lists all managed containers once, then follows the events of
+    containers carrying the SVS label and applies them to the cache. While it is
+    connected, status reads are served from memory without any Docker calls.
+    When the stream breaks, the cache is marked stale and the watcher resyncs
+    with a full listing before following events again.
+    """
+
+    RECONNECT_MIN_DELAY_SECONDS = 1.0
+    RECONNECT_MAX_DELAY_SECONDS = 30.0
+
+    _STATUS_BY_ACTION = {
+        "create": "created",
+        "start": "running",
+        "restart": "running",
+        "unpause": "running",
+        "pause": "paused",
+        "die": "exited",
+    }
+
+    _lock = threading.Lock()
+    _states: dict[str, ContainerState] = {}
+    _live = False
+    _thread: threading.Thread | None = None
+    _stop = threading.Event()
+    _stream: Any = None
+    _listeners: list[Callable[[str, ContainerState | None], None]] = []
+
+    @staticmethod
+    def start() -> None:
+        """Starts the watcher in a daemon thread, unless it is already running."""
+        with DockerEventWatcher._lock:
+            thread = DockerEventWatcher._thread
+            if thread is not None and thread.is_alive():
+                return
+
+            DockerEventWatcher._stop.clear()
+            thread = threading.Thread(
+                target=DockerEventWatcher.run,
+                name="svs-docker-events",
+                daemon=True,
+            )
+            DockerEventWatcher._thread = thread
+
+        thread.start()
+
+    @staticmethod
+    def stop(timeout: float = 5.0) -> None:
+        """Stops the watcher and marks the cache as stale.
+
+        Args:
+            timeout (float): Seconds to wait for the watcher thread to exit.
+        """
+        DockerEventWatcher._stop.set()
+
+        stream = DockerEventWatcher._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception as e:
+                get_logger(__name__).debug(f"Failed to close events stream: {str(e)}")
+
+        thread = DockerEventWatcher._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+        with DockerEventWatcher._lock:
+            DockerEventWatcher._live = False
+            DockerEventWatcher._thread = None
+
+    @staticmethod
+    def run() -> None:
+        """Follows Docker events until `stop` is called.
+
+        Blocks the calling thread; use `start` to run it in the background.
+        """
+        delay = DockerEventWatcher.RECONNECT_MIN_DELAY_SECONDS
+
+        while not DockerEventWatcher._stop.is_set():
+            try:
+                DockerEventWatcher._follow()
+                delay = DockerEventWatcher.RECONNECT_MIN_DELAY_SECONDS
+            except Exception as e:
+                get_logger(__name__).warning(
+                    f"Docker events stream failed, resyncing in {delay:.0f}s: {str(e)}"
+                )
+            finally:
+                with DockerEventWatcher._lock:
+                    DockerEventWatcher._live = False
+                DockerEventWatcher._stream = None
+
+            if DockerEventWatcher._stop.wait(delay):
+                break
+            delay = min(delay * 2, DockerEventWatcher.RECONNECT_MAX_DELAY_SECONDS)
+
+        get_logger(__name__).debug("Docker event watcher stopped")
+
+    @staticmethod
+    def is_live() -> bool:
+        """Returns whether the cache is in sync with Docker.
+
+        Returns:
+            bool: True while the watcher is connected to the events stream.
+        """
+        return DockerEventWatcher._live
+
+    @staticmethod
+    def get_state(container_id: str) -> ContainerState | None:
+        """Returns the cached state of a container.
+
+        Args:
+            container_id (str): The full container ID.
+
+        Returns:
+            ContainerState | None: The state, or None if the container does not exist.
+        """
+        with DockerEventWatcher._lock:
+            return DockerEventWatcher._states.get(container_id)
+
+    @staticmethod
+    def get_states() -> dict[str, ContainerState]:
+        """Returns a copy of all cached container states.
+
+        Returns:
+            dict[str, ContainerState]: Container states keyed by full container ID.
+        """
+        with DockerEventWatcher._lock:
+            return dict(DockerEventWatcher._states)
+
+    @staticmethod
+    def add_listener(listener: Callable[[str, ContainerState | None], None]) -> None:
+        """Registers a callback invoked after every cached state change.
+
+        The callback runs in the watcher thread and receives the container ID and
+        its new state, or None once the container was removed.
+
+        Args:
+            listener (Callable[[str, ContainerState | None], None]): The callback.
+        """
+        DockerEventWatcher._listeners.append(listener)
+
+    @staticmethod
+    def _follow() -> None:
+        """Resyncs the cache and applies events until the stream ends."""
+        client = get_docker_client()
+
+        # Replay events from just before the listing, so none fall in between
+        since = int(time.time()) - 1
+        states = DockerContainerManager.get_managed_states()
+
+        with DockerEventWatcher._lock:
+            previous = DockerEventWatcher._states
+            DockerEventWatcher._states = dict(states)
+
+        for container_id in previous.keys() - states.keys():
+            DockerEventWatcher._notify(container_id, None)
+        for container_id, state in states.items():
+            if previous.get(container_id) != state:
+                DockerEventWatcher._notify(container_id, state)
+
+        stream = client.events(
+            since=since,
+            decode=True,
+            filters={
+                "type": "container",
+                "label": DockerContainerManager.MANAGED_LABEL,
+            },
+        )
+        DockerEventWatcher._stream = stream
+
+        with DockerEventWatcher._lock:
+            DockerEventWatcher._live = True
+        get_logger(__name__).info(
+            f"Docker event watcher synced {len(states)} managed containers"
+        )
+
+        for event in stream:
+            if DockerEventWatcher._stop.is_set():
+                return
+            DockerEventWatcher._apply(event)
+
+    @staticmethod
+    def _apply(event: dict[str, Any]) -> None:
+        """Applies a single container event to the cache.
+
+        Args:
+            event (dict[str, Any]): The decoded Docker event.
+        """
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        action, _, detail = str(event.get("Action") or event.get("status")).partition(
+            ": "
+        )
+        if not container_id:
+            return
+
+        with DockerEventWatcher._lock:
+            current = DockerEventWatcher._states.get(container_id)
+
+            if action == "destroy":
+                if DockerEventWatcher._states.pop(container_id, None) is None:
+                    return
+                state = None
+            elif action == "health_status":
+                state = ContainerState(
+                    status=current.status if current else "running",
+                    health=Healthcheck.HealthStatus.from_str(detail),
+                )
+            elif action in DockerEventWatcher._STATUS_BY_ACTION:
+                status = DockerEventWatcher._STATUS_BY_ACTION[action]
+                # Docker restarts health checks from scratch with every start
+                health = (
+                    Healthcheck.HealthStatus.STARTING
+                    if status == "running" and current and current.health
+                    else None
+                )
+                state = ContainerState(status=status, health=health)
+            else:
+                return
+
+            if state is not None:
+                if state == current:
+                    return
+                DockerEventWatcher._states[container_id] = state
+
+        get_logger(__name__).debug(
+            f"Container '{container_id[:12]}' {action}: {state if state else 'removed'}"
+        )
+        DockerEventWatcher._notify(container_id, state)
+
+    @staticmethod
+    def _notify(container_id: str, state: ContainerState | None) -> None:
+        """Invokes the registered listeners, logging their failures.
+
+        Args:
+            container_id (str): The full container ID.
+            state (ContainerState | None): The new state, None if the container was removed.
+        """
+        for listener in DockerEventWatcher._listeners:
+            try:
+                listener(container_id, state)
+            except Exception as e:
+                get_logger(__name__).error(
+                    f"Docker event listener failed for container '{container_id[:12]}': {str(e)}"
+                )
+
+
+def _after_fork_in_child() -> None:
+    """Resets the watcher in forked children (e.g. web workers of a preloaded app).
+
+    The watcher thread does not survive the fork, so the inherited cache would
+    stop receiving events while still claiming to be live.
+    """
+    DockerEventWatcher._lock = threading.Lock()
+    DockerEventWatcher._states = {}
+    DockerEventWatcher._live = False
+    DockerEventWatcher._thread = None
+    DockerEventWatcher._stop = threading.Event()
+    DockerEventWatcher._stream = None
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterable, TypeVar
+
+from svs_core.db.models import ServiceModel
+from svs_core.shared.env_manager import EnvManager
+from svs_core.shared.exceptions import ServiceOperationException
+from svs_core.shared.logger import get_logger
+
+S = TypeVar("S", bound=ServiceModel)
+
+
+@dataclass(frozen=True)
+class FleetFailure:
+    """A single service operation that failed during a fleet run."""
+
+    """ID of the service the operation failed for."""
+    service_id: int
+    """Name of the service the operation failed for."""
+    service_name: str
+    """The exception raised by the operation."""
+    error: BaseException
+
+
+@dataclass(frozen=True)
+class FleetProgress:
+    """Progress update emitted after each service operation finishes."""
+
+    """Number of finished operations, including this one."""
+    completed: int
+    """Total number of operations in the run."""
+    total: int
+    """Name of the service whose operation just finished."""
+    service_name: str
+    """The exception raised by the operation, None if it succeeded."""
+    error: BaseException | None = None
+
+
+@dataclass
+class FleetResult(Generic[S]):
+    """Aggregated outcome of a fleet run."""
+
+    """Services the operation succeeded for, in completion order."""
+    succeeded: list[S] = field(default_factory=list)
+    """Failures collected from the operation, in completion order."""
+    failed: list[FleetFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for every service."""
+        return not self.failed
+
+    def raise_on_failure(self, action: str) -> None:
+        """Raises a single exception summarizing all failures, if any.
+
+        Args:
+            action (str): The action that was performed, used in the message (e.g. "recreate").
+
+        Raises:
+            ServiceOperationException: If at least one operation failed.
+        """
+        if self.ok:
+            return
+
+        details = "; ".join(
+            f"'{failure.service_name}': {failure.error}" for failure in self.failed
+        )
+        raise ServiceOperationException(
+            f"Failed to {action} {len(self.failed)} service(s): {details}"
+        )
+
+
+class FleetExecutor:
+    """Runs an operation over many services concurrently.
+
+    Services are scheduled round-robin across their owners, and no single user
+    may occupy more than `max_per_user` workers, so one user with many services
+    cannot starve everyone else. Failures are collected instead of aborting the
+    run.
+    """
+
+    @staticmethod
+    def run(
+        services: Iterable[S],
+        operation: Callable[[S], object],
+        max_workers: int | None = None,
+        max_per_user: int | None = None,
+        on_progress: Callable[[FleetProgress], None] | None = None,
+    ) -> FleetResult[S]:
+        """Runs `operation` for every service using a bounded thread pool.
+
+        The services should have their `user` relation loaded up front
+        (e.g. via `select_related("user")`), as the operation runs in worker
+        threads with their own database connections.
+
+        Args:
+            services (Iterable[S]): The services to operate on.
+            operation (Callable[[S], object]): The operation to run for each service, e.g. `Service.stop`.
+            max_workers (int | None): Maximum number of concurrent operations. Defaults to `FLEET_MAX_WORKERS`.
+            max_per_user (int | None): Maximum number of concurrent operations per user. Defaults to `FLEET_MAX_PER_USER`.
+            on_progress (Callable[[FleetProgress], None] | None): Called in the calling thread after each operation finishes.
+
+        Returns:
+            FleetResult[S]: The succeeded services and collected failures.
+        """
+        workers = max_workers or EnvManager.get_fleet_max_workers()
+        per_user = max_per_user or EnvManager.get_fleet_max_per_user()
+
+        queues: dict[int, deque[S]] = {}
+        for service in services:
+            queues.setdefault(service.user_id, deque()).append(service)
+
+        total = sum(len(queue) for queue in queues.values())
+        result: FleetResult[S] = FleetResult()
+        if total == 0:
+            return result
+
+        get_logger(__name__).debug(
+            f"Running fleet operation on {total} service(s) of {len(queues)} user(s) (workers={workers}, per_user={per_user})"
+        )
+
+        owners = deque(queues)
+        in_flight: Counter[int] = Counter()
+        pending: dict[Future[object], S] = {}
+
+        def next_service() -> S | None:
+            for _ in range(len(owners)):
+                user_id = owners[0]
+                owners.rotate(-1)
+                if in_flight[user_id] >= per_user:
+                    continue
+
+                queue = queues[user_id]
+                service = queue.popleft()
+                if not queue:
+                    owners.remove(user_id)
+                    del queues[user_id]
+                return service
+
+            return None
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="svs-fleet"
+        ) as pool:
+            while queues or pending:
+                while len(pending) < workers:
+                    scheduled = next_service()
+                    if scheduled is None:
+                        break
+                    in_flight[scheduled.user_id] += 1
+                    future = pool.submit(FleetExecutor._run_one, operation, scheduled)
+                    pending[future] = scheduled
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    service = pending.pop(future)
+                    in_flight[service.user_id] -= 1
+
+                    error = future.exception()
+                    if error is None:
+                        result.succeeded.append(service)
+                    else:
+                        get_logger(__name__).warning(
+                            f"Fleet operation failed for service '{service.name}': {str(error)}"
+                        )
+                        result.failed.append(
+                            FleetFailure(
+                                service_id=service.id,
+                                service_name=service.name,
+                                error=error,
+                            )
+                        )
+
+                    if on_progress is not None:
+                        on_progress(
+                            FleetProgress(
+                                completed=len(result.succeeded) + len(result.failed),
+                                total=total,
+                                service_name=service.name,
+                                error=error,
+                            )
+                        )
+
+        get_logger(__name__).debug(
+            f"Fleet operation finished: {len(result.succeeded)} succeeded, {len(result.failed)} failed"
+        )
+        return result
+
+    @staticmethod
+    def _run_one(operation: Callable[[S], object], service: S) -> object:
+        """Runs the operation in a worker thread and releases its DB connections.
+
+        Args:
+            operation (Callable[[S], object]): The operation to run.
+            service (S): The service to run it for.
+
+        Returns:
+            object: Whatever the operation returned.
+        """
+        from django.db import connections
+
+        try:
+            return operation(service)
+        finally:
+            connections.close_all()
@@ -1,40 +1,96 @@
+import hashlib
 import os
+import pwd
+import re
 import shutil
-import tempfile
+import subprocess
+import threading
 
 from pathlib import Path
+from typing import IO, Callable, NoReturn, cast
 
-from docker.errors import APIError, BuildError
+from docker.errors import APIError
 from docker.models.images import Image
 
 from svs_core.docker.base import get_docker_client
-from svs_core.shared.exceptions import DockerOperationException
+from svs_core.docker.build_context import DockerBuildContext
+from svs_core.docker.build_progress import (
+    BuildEvent,
+    BuildKitProgressTracker,
+    BuildProgressTracker,
+    BuildResult,
+)
+from svs_core.shared.env_manager import EnvManager
+from svs_core.shared.exceptions import DockerOperationException, ValidationException
 from svs_core.shared.logger import get_logger
 
 
 class DockerImageManager:
     """Class for managing Docker images."""
 
+    BUILDER_PREFIX = "svs-builder-"
+    """Name prefix of the per-user BuildKit builders."""
+
+    DOCKER_CLI_PATH = "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
+    """Fixed `PATH` of the docker CLI, and where it is looked up."""
+
+    DOCKER_CLI_ENV_VARS = (
+        "DOCKER_HOST",
+        "DOCKER_CONTEXT",
+        "DOCKER_CONFIG",
+        "DOCKER_CERT_PATH",
+        "DOCKER_TLS_VERIFY",
+    )
+    """Variables of the SVS configuration passed on to the docker CLI."""
+
+    _BUILD_ARG_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+    _builders: set[str] = set()
+    _builders_lock = threading.Lock()
+
+    _CACHE_MOUNT_PATTERN = re.compile(
+        r"^(\s*RUN\s+)(?:--mount=(?=\S*type=cache)\S+\s+)+",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
     @staticmethod
     def build_from_dockerfile(
         image_name: str,
         dockerfile_content: str,
         path_to_copy: Path | None = None,
         build_args: dict[str, str] | None = None,
-    ) -> None:
+        on_event: Callable[[BuildEvent], None] | None = None,
+        cache_scope: str | None = None,
+    ) -> BuildResult:
         """Build a Docker image from an in-memory Dockerfile.
 
+        The build runs through the streaming API, so progress is reported while
+        Docker works instead of only once it is done. When `DOCKER_BUILDKIT` is
+        enabled, the build runs through `docker buildx` instead, see
+        `_build_with_buildkit`.
+
         Args:
             image_name (str): Name of the image.
             dockerfile_content (str): Dockerfile contents.
-            path_to_copy (Path | None): Optional path to copy into the build context.
+            path_to_copy (Path | None): Optional path to include in the build context. It is streamed
+                to Docker as a tar archive honouring `.dockerignore`, never copied on disk.
             build_args (dict[str, str] | None): Optional build arguments to pass to Docker.
+            on_event (Callable[[BuildEvent], None] | None): Optional callback receiving step, output and error events.
+            cache_scope (str | None): Owner of the BuildKit caches, e.g. the owner's username.
+
+        Returns:
+            BuildResult: The built image ID and per-step timings.
 
         Raises:
             DockerOperationException: If the Docker build fails. On failure, a detailed error log is written to
                 `<path_to_copy>/docker_build_error.log` (or `./docker_build_error.log` if path_to_copy
                 is not provided) containing the image name, error message, and full build log output.
+            ValidationException: If a build argument name is not a valid identifier.
         """
+        for key in build_args or {}:
+            if not DockerImageManager._BUILD_ARG_NAME_PATTERN.match(key):
+                raise ValidationException(f"Invalid build argument name '{key}'")
+
         get_logger(__name__).info(
             f"Building Docker image '{image_name}' from Dockerfile"
         )
@@ -42,100 +98,346 @@ class DockerImageManager:
             f"Build context path: {path_to_copy if path_to_copy else 'None'}"
         )
 
-        client = get_docker_client()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dockerfile_path = os.path.join(tmpdir, "Dockerfile")
-            with open(dockerfile_path, "w", encoding="utf-8") as f:
-                f.write(dockerfile_content)
-
-            if path_to_copy:
-                if path_to_copy.is_dir():
-                    for item in path_to_copy.iterdir():
-                        target = Path(tmpdir) / item.name
-                        if item.is_dir():
-                            shutil.copytree(item, target)
-                        else:
-                            shutil.copy2(item, target)
-                else:
-                    shutil.copy2(path_to_copy, Path(tmpdir) / path_to_copy.name)
-
+        tracker: BuildProgressTracker
+        if EnvManager.get_docker_buildkit():
+            tracker = BuildKitProgressTracker(on_event)
+            DockerImageManager._build_with_buildkit(
+                tracker,
+                image_name,
+                dockerfile_content,
+                path_to_copy,
+                build_args,
+                cache_scope,
+            )
+        else:
+            tracker = BuildProgressTracker(on_event)
+            client = get_docker_client()
             try:
-                client.images.build(
-                    path=tmpdir,
+                for chunk in client.api.build(
+                    fileobj=DockerBuildContext.stream(
+                        DockerImageManager._strip_cache_mounts(dockerfile_content),
+                        path_to_copy,
+                    ),
+                    custom_context=True,
                     tag=image_name,
                     rm=True,
                     forcerm=True,
                     labels={"svs": "true"},
                     buildargs=build_args,
+                    decode=True,
+                ):
+                    tracker.feed(chunk)
+            except APIError as e:
+                DockerImageManager._raise_build_error(
+                    image_name, str(e), tracker.log_lines, path_to_copy, e
                 )
-                get_logger(__name__).info(
-                    f"Successfully built Docker image '{image_name}'"
-                )
-            except (BuildError, APIError) as e:
-                logger = get_logger(__name__)
-
-                # Parse build log from the exception
-                build_log_lines = []
-                if hasattr(e, "build_log") and e.build_log:
-                    for line in e.build_log:
-                        if isinstance(line, bytes):
-                            build_log_lines.append(
-                                line.decode("utf-8", errors="replace")
-                            )
-                        elif isinstance(line, str):
-                            build_log_lines.append(line)
-                        elif isinstance(line, dict):
-                            # Docker API sometimes returns JSON objects
-                            if "stream" in line:
-                                build_log_lines.append(line["stream"].rstrip())
-                            elif "error" in line:
-                                build_log_lines.append(f"ERROR: {line['error']}")
-                            else:
-                                build_log_lines.append(str(line))
-                        else:
-                            build_log_lines.append(str(line))
-
-                build_log = "\n".join(build_log_lines)
-
-                # Log the error message immediately
-                error_msg = str(e)
-                logger.error(f"Docker build failed: {error_msg}")
-
-                # Log the full build output
-                if build_log:
-                    logger.error(f"Build log output:\n{build_log}")
-
-                # Write detailed log file
-                if path_to_copy:
-                    log_path = Path(path_to_copy) / "docker_build_error.log"
-                else:
-                    log_path = Path.cwd() / "docker_build_error.log"
 
+        result = tracker.finish()
+        if tracker.error is not None:
+            DockerImageManager._raise_build_error(
+                image_name, tracker.error, tracker.log_lines, path_to_copy
+            )
+
+        get_logger(__name__).info(
+            f"Successfully built Docker image '{image_name}' in {result.duration_seconds:.1f}s"
+        )
+        for timing in result.slowest_steps():
+            get_logger(__name__).debug(
+                f"Build step {timing.step} took {timing.duration_seconds:.1f}s: {timing.instruction}"
+            )
+
+        return result
+
+    @staticmethod
+    def _build_with_buildkit(
+        tracker: BuildProgressTracker,
+        image_name: str,
+        dockerfile_content: str,
+        path_to_copy: Path | None,
+        build_args: dict[str, str] | None,
+        cache_scope: str | None,
+    ) -> None:
+        """Build an image with BuildKit by running `docker buildx build`.
+
+        The build context is piped to the docker CLI as a tar archive and its
+        plain progress output is fed to the tracker.
+
+        Builds with a `cache_scope` run on a builder of their own, see
+        `_ensure_builder`, which keeps the layer cache and the
+        `RUN --mount=type=cache` mounts of that scope across rebuilds. Cache
+        mount IDs are chosen by the Dockerfile, which may come from the
+        user's sources, so they cannot isolate users sharing a builder; a
+        builder per scope does. Its layer cache already holds the layers of
+        previous builds, which images of the local daemon could not provide
+        anyway, as the builder runs in a container of its own. Builds without
+        a scope run on the default builder, with cache mounts removed.
+
+        The docker CLI runs with a fixed environment holding only `PATH`,
+        `HOME` and the `DOCKER_CLI_ENV_VARS` of the SVS configuration. Build
+        arguments come from the service environment, so they are only ever
+        passed as `--build-arg` values and never become variables of the
+        privileged docker client.
+
+        Args:
+            tracker (BuildProgressTracker): Tracker receiving the progress output, its error is set on failure.
+            image_name (str): Name of the image.
+            dockerfile_content (str): Dockerfile contents.
+            path_to_copy (Path | None): Optional path to include in the build context.
+            build_args (dict[str, str] | None): Optional build arguments to pass to Docker.
+            cache_scope (str | None): Owner of the builder, and so of its caches.
+
+        Raises:
+            DockerOperationException: If the docker CLI is not installed, or the builder cannot be created.
+        """
+        docker = shutil.which("docker", path=DockerImageManager.DOCKER_CLI_PATH)
+        if docker is None:
+            raise DockerOperationException(
+                "BuildKit builds require the docker CLI with the buildx plugin"
+            )
+
+        command = [
+            docker,
+            "buildx",
+            "build",
+            "--progress=plain",
+            "--load",
+            "--tag",
+            image_name,
+            "--label",
+            "svs=true",
+        ]
+        for key, value in (build_args or {}).items():
+            command += ["--build-arg", f"{key}={value}"]
+
+        if cache_scope:
+            builder = DockerImageManager._ensure_builder(docker, cache_scope)
+            command += ["--builder", builder]
+        else:
+            dockerfile_content = DockerImageManager._strip_cache_mounts(
+                dockerfile_content
+            )
+        command.append("-")
+
+        get_logger(__name__).debug(
+            f"Running BuildKit build for '{image_name}' (cache_scope={cache_scope})"
+        )
+
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=DockerImageManager._docker_cli_env(),
+        )
+        stdin = cast(IO[bytes], process.stdin)
+        stdout = cast(IO[bytes], process.stdout)
+
+        def write_context() -> None:
+            try:
+                for chunk in DockerBuildContext.stream(
+                    dockerfile_content, path_to_copy
+                ):
+                    stdin.write(chunk)
+            except BrokenPipeError:
+                # The CLI exited early, its output explains why
+                pass
+            finally:
                 try:
-                    with open(log_path, "w", encoding="utf-8") as log_file:
-                        log_file.write(f"Docker Build Error\n")
-                        log_file.write(f"==================\n\n")
-                        log_file.write(f"Image: {image_name}\n")
-                        log_file.write(f"Error: {error_msg}\n\n")
-                        log_file.write(f"Build Log:\n")
-                        log_file.write(f"-----------\n")
-                        log_file.write(build_log)
-
-                    error_with_log_path = (
-                        f"{error_msg}\n\nDetailed error log written to: {log_path}"
-                    )
-                    logger.error(
-                        f"Failed to build image '{image_name}'. {error_with_log_path}"
-                    )
-                    raise DockerOperationException(error_with_log_path) from e
-                except DockerOperationException:
-                    raise
-                except Exception as log_write_error:
-                    logger.error(
-                        f"Failed to write error log to {log_path}: {str(log_write_error)}"
+                    stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        writer = threading.Thread(
+            target=write_context, name="svs-buildkit-context", daemon=True
+        )
+        writer.start()
+
+        for raw_line in stdout:
+            tracker.feed({"stream": raw_line.decode("utf-8", "replace")})
+
+        writer.join()
+        return_code = process.wait()
+        if return_code != 0 and tracker.error is None:
+            tracker.error = f"docker buildx build exited with code {return_code}"
+
+    @staticmethod
+    def builder_name(cache_scope: str) -> str:
+        """Return the name of the BuildKit builder of a cache scope.
+
+        Args:
+            cache_scope (str): The cache scope, e.g. a username.
+
+        Returns:
+            str: The builder name, distinct for every scope.
+        """
+        readable = re.sub(r"[^a-z0-9_-]", "-", cache_scope.lower())
+        digest = hashlib.sha256(cache_scope.encode("utf-8")).hexdigest()[:8]
+        return f"{DockerImageManager.BUILDER_PREFIX}{readable}-{digest}"
+
+    @staticmethod
+    def _ensure_builder(docker: str, cache_scope: str) -> str:
+        """Create the BuildKit builder of a cache scope, unless it exists.
+
+        Every builder is a BuildKit instance of its own (the
+        `docker-container` driver), so its caches are invisible to the
+        builds of other scopes whatever their Dockerfile says.
+
+        Args:
+            docker (str): Path of the docker CLI.
+            cache_scope (str): The cache scope, e.g. a username.
+
+        Returns:
+            str: The name of the builder.
+
+        Raises:
+            DockerOperationException: If the builder cannot be created.
+        """
+        name = DockerImageManager.builder_name(cache_scope)
+        env = DockerImageManager._docker_cli_env()
+
+        with DockerImageManager._builders_lock:
+            if name in DockerImageManager._builders:
+                return name
+
+            inspect = subprocess.run(
+                [docker, "buildx", "inspect", name],
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            if inspect.returncode != 0:
+                get_logger(__name__).info(f"Creating BuildKit builder '{name}'")
+                create = subprocess.run(
+                    [docker, "buildx", "create", "--name", name]
+                    + ["--driver", "docker-container"],
+                    env=env,
+                    capture_output=True,
+                    text=True,
+                )
+                if create.returncode != 0:
+                    raise DockerOperationException(
+                        f"Failed to create BuildKit builder '{name}': {create.stderr.strip()}"
                     )
-                    raise
+
+            DockerImageManager._builders.add(name)
+
+        return name
+
+    @staticmethod
+    def remove_builder(cache_scope: str) -> None:
+        """Remove the BuildKit builder of a cache scope, with its caches.
+
+        Does nothing if the docker CLI is not installed or the builder does
+        not exist.
+
+        Args:
+            cache_scope (str): The cache scope, e.g. a username.
+        """
+        docker = shutil.which("docker", path=DockerImageManager.DOCKER_CLI_PATH)
+        if docker is None:
+            return
+
+        name = DockerImageManager.builder_name(cache_scope)
+        with DockerImageManager._builders_lock:
+            DockerImageManager._builders.discard(name)
+            result = subprocess.run(
+                [docker, "buildx", "rm", name],
+                env=DockerImageManager._docker_cli_env(),
+                capture_output=True,
+                text=True,
+            )
+
+        if result.returncode == 0:
+            get_logger(__name__).info(f"Removed BuildKit builder '{name}'")
+
+    @staticmethod
+    def _docker_cli_env() -> dict[str, str]:
+        """Build the environment of the docker CLI.
+
+        Returns:
+            dict[str, str]: `PATH`, `HOME` and the docker variables of the SVS configuration.
+        """
+        env = {"PATH": DockerImageManager.DOCKER_CLI_PATH}
+        try:
+            env["HOME"] = pwd.getpwuid(os.geteuid()).pw_dir
+        except KeyError:
+            env["HOME"] = "/root"
+
+        for key in DockerImageManager.DOCKER_CLI_ENV_VARS:
+            value = os.environ.get(key)
+            if value:
+                env[key] = value
+
+        return env
+
+    @staticmethod
+    def _strip_cache_mounts(dockerfile_content: str) -> str:
+        """Remove BuildKit cache mounts, which the classic builder rejects.
+
+        Args:
+            dockerfile_content (str): Dockerfile contents.
+
+        Returns:
+            str: The Dockerfile with `--mount=type=cache` flags removed from `RUN` instructions.
+        """
+        return DockerImageManager._CACHE_MOUNT_PATTERN.sub(r"\1", dockerfile_content)
+
+    @staticmethod
+    def _raise_build_error(
+        image_name: str,
+        error_msg: str,
+        build_log_lines: list[str],
+        path_to_copy: Path | None,
+        cause: Exception | None = None,
+    ) -> NoReturn:
+        """Log a failed build, write the detailed error log and raise.
+
+        Args:
+            image_name (str): Name of the image.
+            error_msg (str): The error reported by Docker.
+            build_log_lines (list[str]): The build output collected so far.
+            path_to_copy (Path | None): The build context path, the error log is written there.
+            cause (Exception | None): The exception that caused the failure, if any.
+
+        Raises:
+            DockerOperationException: Always, with the path of the error log.
+        """
+        logger = get_logger(__name__)
+        build_log = "\n".join(build_log_lines)
+
+        # Log the error message immediately
+        logger.error(f"Docker build failed: {error_msg}")
+
+        # Log the full build output
+        if build_log:
+            logger.error(f"Build log output:\n{build_log}")
+
+        # Write detailed log file
+        if path_to_copy:
+            log_path = Path(path_to_copy) / "docker_build_error.log"
+        else:
+            log_path = Path.cwd() / "docker_build_error.log"
+
+        try:
+            with open(log_path, "w", encoding="utf-8") as log_file:
+                log_file.write(f"Docker Build Error\n")
+                log_file.write(f"==================\n\n")
+                log_file.write(f"Image: {image_name}\n")
+                log_file.write(f"Error: {error_msg}\n\n")
+                log_file.write(f"Build Log:\n")
+                log_file.write(f"-----------\n")
+                log_file.write(build_log)
+        except Exception as log_write_error:
+            logger.error(
+                f"Failed to write error log to {log_path}: {str(log_write_error)}"
+            )
+            raise
+
+        error_with_log_path = (
+            f"{error_msg}\n\nDetailed error log written to: {log_path}"
+        )
+        logger.error(f"Failed to build image '{image_name}'. {error_with_log_path}")
+        raise DockerOperationException(error_with_log_path) from cause
 
     @staticmethod
     def exists(image_name: str) -> bool:
@@ -225,6 +527,30 @@ class DockerImageManager:
         """
         DockerImageManager.remove(image_name)
 
+    @staticmethod
+    def tag(image_name: str, new_name: str) -> None:
+        """Add a tag to a Docker image, keeping its existing tags.
+
+        Args:
+            image_name (str): Name or ID of the image.
+            new_name (str): The tag to add.
+
+        Raises:
+            DockerOperationException: If the image cannot be tagged.
+        """
+        get_logger(__name__).debug(f"Tagging image '{image_name}' as '{new_name}'")
+
+        client = get_docker_client()
+        try:
+            client.images.get(image_name).tag(new_name)
+        except Exception as e:
+            get_logger(__name__).error(
+                f"Failed to tag image '{image_name}' as '{new_name}': {str(e)}"
+            )
+            raise DockerOperationException(
+                f"Failed to tag image {image_name} as {new_name}. Error: {str(e)}"
+            ) from e
+
     @staticmethod
     def rename(old_name: str, new_name: str) -> None:
         """Rename a Docker image.
@@ -4,8 +4,9 @@ from typing import Self
 
 from pydantic import BaseModel, Field, field_validator
 
+from svs_core.shared.broker import BrokerOperation, CommandBroker
 from svs_core.shared.logger import get_logger
-from svs_core.shared.shell import create_directory, run_command
+from svs_core.shared.shell import create_directory
 
 
 class EnvVariable(BaseModel):
@@ -360,7 +361,19 @@ class DefaultContent(BaseModel):
             username (str): The username to use for file ownership and permissions.
         """
         create_directory(os.path.dirname(host_path), user=username)
-        run_command(f"echo '{self.content}' > {host_path}", check=True, user=username)
+        CommandBroker.run(username, [self.write_operation(host_path)])
+
+    def write_operation(self, host_path: str) -> BrokerOperation:
+        """Returns the command broker operation writing the content to the host.
+
+        Args:
+            host_path (str): The path on the host where the content should be written.
+
+        Returns:
+            BrokerOperation: The operation, to be run as the owner of the path.
+        """
+        # Written like the `echo` it replaces, with a trailing newline
+        return BrokerOperation.write_file(host_path, f"{self.content}\n")
 
 
 class Healthcheck(BaseModel):
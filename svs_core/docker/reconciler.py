@@ -0,0 +1,170 @@
+import threading
+
+from datetime import datetime
+from typing import Any
+
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from svs_core.docker.container import ContainerState, DockerContainerManager
+from svs_core.docker.events import DockerEventWatcher
+from svs_core.docker.service import Service
+from svs_core.shared.logger import get_logger
+
+
+class ServiceStateReconciler:
+    """Records the container state of services in the database.
+
+    Listings read the recorded state instead of asking Docker. A full pass
+    compares a single container listing with the recorded states and only
+    inspects the containers whose status or health changed. Between passes,
+    changes reported by the Docker event watcher are recorded as they happen.
+    """
+
+    DEFAULT_INTERVAL_SECONDS = 60
+
+    @staticmethod
+    def reconcile() -> int:
+        """Runs a full reconciliation pass over all services.
+
+        Every service seen by the pass is marked as checked, so listings can
+        tell a confirmed state from a stale one. States recorded after the
+        pass started, e.g. from Docker events, are kept.
+
+        Returns:
+            int: Number of services whose recorded state changed.
+        """
+        close_old_connections()
+
+        checked_at = timezone.now()
+        states = DockerContainerManager.get_managed_states()
+
+        changed = 0
+        unchanged_ids: list[int] = []
+        services = Service.objects.only(
+            "id", "container_id", "last_status", "last_health"
+        )
+        for service in services:
+            state = states.get(service.container_id) if service.container_id else None
+            if ServiceStateReconciler._is_recorded(service, state):
+                unchanged_ids.append(service.id)
+                continue
+
+            ServiceStateReconciler.record(service.id, service.container_id, checked_at)
+            changed += 1
+
+        Service.objects.filter(
+            Q(state_checked_at__lt=checked_at) | Q(state_checked_at__isnull=True),
+            id__in=unchanged_ids,
+        ).update(state_checked_at=checked_at)
+
+        get_logger(__name__).info(
+            f"Reconciled {len(services)} services, {changed} changed state"
+        )
+        return changed
+
+    @staticmethod
+    def record(
+        service_id: int,
+        container_id: str | None,
+        checked_at: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Inspects a service's container and records its state.
+
+        Only the state columns are written, so concurrent edits of the service
+        are not overwritten.
+
+        Args:
+            service_id (int): The ID of the service.
+            container_id (str | None): The ID of the service's container.
+            checked_at (datetime | None): Time of the check, defaults to now.
+
+        Returns:
+            dict[str, Any]: The recorded column values.
+        """
+        details = (
+            DockerContainerManager.inspect_state(container_id) if container_id else None
+        )
+
+        fields: dict[str, Any] = {
+            "last_status": details.status if details else None,
+            "last_health": details.health if details else None,
+            "state_checked_at": checked_at or timezone.now(),
+        }
+        if details is not None:
+            fields["started_at"] = details.started_at
+            fields["exit_code"] = details.exit_code
+            fields["restart_count"] = details.restart_count
+
+        Service.objects.filter(id=service_id).update(**fields)
+        return fields
+
+    @staticmethod
+    def on_state_change(container_id: str, state: ContainerState | None) -> None:
+        """Records a container state change reported by the Docker event watcher.
+
+        Args:
+            container_id (str): The full container ID.
+            state (ContainerState | None): The new state, None if the container was removed.
+        """
+        close_old_connections()
+
+        services = Service.objects.filter(container_id=container_id).only(
+            "id", "container_id", "last_status", "last_health"
+        )
+        for service in services:
+            if not ServiceStateReconciler._is_recorded(service, state):
+                ServiceStateReconciler.record(service.id, container_id)
+
+    @staticmethod
+    def watch(
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """Keeps the recorded states up to date until stopped.
+
+        State changes are recorded from Docker events as they happen, and a
+        full pass runs every `interval` seconds to catch anything missed.
+
+        Args:
+            interval (float): Seconds between full reconciliation passes.
+            stop (threading.Event | None): Set to stop watching, runs until interrupted otherwise.
+        """
+        stop = stop or threading.Event()
+
+        DockerEventWatcher.add_listener(ServiceStateReconciler.on_state_change)
+        DockerEventWatcher.start()
+
+        try:
+            while True:
+                try:
+                    ServiceStateReconciler.reconcile()
+                except Exception as e:
+                    get_logger(__name__).error(
+                        f"Failed to reconcile service states: {str(e)}"
+                    )
+
+                if stop.wait(interval):
+                    break
+        finally:
+            DockerEventWatcher.stop()
+
+    @staticmethod
+    def _is_recorded(service: Service, state: ContainerState | None) -> bool:
+        """Returns whether a service's recorded state matches a container state.
+
+        Args:
+            service (Service): The service with its recorded state loaded.
+            state (ContainerState | None): The container state, None if the container does not exist.
+
+        Returns:
+            bool: True if the status and health are already recorded.
+        """
+        if state is None:
+            return service.last_status is None
+
+        return (service.last_status, service.last_health) == (
+            state.status,
+            state.health,
+        )
@@ -2,9 +2,23 @@ from __future__ import annotations
 
 import time
 
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+    Union,
+    cast,
+)
 
+from django.db import transaction
+from django.utils import timezone
+from docker.models.containers import Container
 from pydantic import ValidationError as PydanticValidationError
 
 from svs_core.db.models import (
@@ -13,7 +27,10 @@ from svs_core.db.models import (
     TemplateType,
     miscelanous_str_injector,
 )
-from svs_core.docker.container import DockerContainerManager
+from svs_core.docker.build_context import DockerBuildContext
+from svs_core.docker.build_progress import BuildEvent, BuildResult
+from svs_core.docker.container import ContainerState, DockerContainerManager
+from svs_core.docker.events import DockerEventWatcher
 from svs_core.docker.image import DockerImageManager
 from svs_core.docker.json_properties import (
     EnvVariable,
@@ -23,6 +40,8 @@ from svs_core.docker.json_properties import (
     Volume,
 )
 from svs_core.docker.template import Template
+from svs_core.shared.broker import CommandBroker
+from svs_core.shared.completion_stamp import CompletionStamp
 from svs_core.shared.exceptions import (
     ConfigurationException,
     NotFoundException,
@@ -32,6 +51,7 @@ from svs_core.shared.exceptions import (
 from svs_core.shared.git_source import GitSource
 from svs_core.shared.logger import get_logger
 from svs_core.shared.ports import SystemPortManager
+from svs_core.shared.shell import create_directory
 from svs_core.shared.text import indentate
 from svs_core.shared.volumes import SystemVolumeManager
 from svs_core.users.user import User
@@ -48,15 +68,160 @@ class Service(ServiceModel):
 
     objects = ServiceModel.objects
 
-    # Constants for rebuild stop retry logic
-    _MAX_STOP_RETRIES = 3
-    _STOP_RETRY_DELAY_SECONDS = 1
+    # How long a rebuild waits for the old container to stop
+    _STOP_TIMEOUT_SECONDS = 30
+
+    # How long a blue/green container without a healthcheck must keep running
+    _BLUE_GREEN_SETTLE_SECONDS = 5
+
+    # How long a recorded container state is trusted without a new check
+    RECORDED_STATE_MAX_AGE = timedelta(minutes=3)
+
+    # Columns changed by update(), saved without the recorded container state
+    _CONFIG_FIELDS = (
+        "domain",
+        "command",
+        "args",
+        "_env",
+        "_exposed_ports",
+        "_volumes",
+        "_labels",
+        "_healthcheck",
+    )
+
+    # Status and health attached by resolve_statuses(); unset until resolved
+    _status_snapshot: tuple[ServiceStatus, str | None] | None
 
     class Meta:  # noqa: D106
         proxy = True
 
+    @classmethod
+    def resolve_statuses(
+        cls, services: Iterable[Service], recorded: bool = False
+    ) -> list[Service]:
+        """Resolve the status of many services with a single Docker API call.
+
+        The resolved status and health are attached to each service instance, so
+        subsequent reads of `status` and `healthcheck_status` make no Docker
+        calls. While the Docker event watcher is live, its cache is used and no
+        call is made at all. If Docker cannot be reached, services are left
+        unresolved and fall back to per-service lookups.
+
+        Args:
+            services (Iterable[Service]): The services to resolve, e.g. a queryset.
+            recorded (bool): Use the state recorded by the state reconciler for
+                services checked within `RECORDED_STATE_MAX_AGE`, so only the
+                remaining ones are resolved from Docker.
+
+        Returns:
+            list[Service]: The same services, materialized into a list.
+        """
+        services = list(services)
+        if not services:
+            return services
+
+        if recorded and not DockerEventWatcher.is_live():
+            checked_after = timezone.now() - cls.RECORDED_STATE_MAX_AGE
+            stale = []
+            for service in services:
+                if (
+                    service.state_checked_at is None
+                    or service.state_checked_at < checked_after
+                ):
+                    stale.append(service)
+                    continue
+
+                service._status_snapshot = cls._snapshot_from_state(
+                    ContainerState(service.last_status, service.last_health)
+                    if service.last_status
+                    else None
+                )
+
+            cls.resolve_statuses(stale)
+            return services
+
+        try:
+            states = (
+                DockerEventWatcher.get_states()
+                if DockerEventWatcher.is_live()
+                else DockerContainerManager.get_managed_states()
+            )
+        except Exception as e:
+            get_logger(__name__).warning(
+                f"Failed to resolve service statuses in bulk: {str(e)}"
+            )
+            return services
+
+        for service in services:
+            state = states.get(service.container_id) if service.container_id else None
+            service._status_snapshot = cls._snapshot_from_state(state)
+
+        return services
+
+    @staticmethod
+    def _snapshot_from_state(
+        state: ContainerState | None,
+    ) -> tuple[ServiceStatus, str | None]:
+        """Convert a container state into a status snapshot.
+
+        Args:
+            state (ContainerState | None): The container state, None if the container does not exist.
+
+        Returns:
+            tuple[ServiceStatus, str | None]: The service status and health.
+        """
+        if state is None:
+            return ServiceStatus.CREATED, None
+
+        return (
+            ServiceStatus.from_str(state.status),
+            Healthcheck.HealthStatus.from_str(state.health or "unknown"),
+        )
+
+    @staticmethod
+    def _live_snapshot(
+        container_id: str | None,
+    ) -> tuple[ServiceStatus, str | None] | None:
+        """Return the status snapshot kept by the Docker event watcher.
+
+        Args:
+            container_id (str | None): The container ID of the service.
+
+        Returns:
+            tuple[ServiceStatus, str | None] | None: The snapshot, or None while the watcher is not live.
+        """
+        if not DockerEventWatcher.is_live():
+            return None
+
+        state = DockerEventWatcher.get_state(container_id) if container_id else None
+        return Service._snapshot_from_state(state)
+
+    def refresh_state(self) -> None:
+        """Inspect the service's container and record its current state.
+
+        Refreshes a single service on demand, while listings read the state
+        recorded by the state reconciler.
+        """
+        from svs_core.docker.reconciler import ServiceStateReconciler
+
+        fields = ServiceStateReconciler.record(self.id, self.container_id)
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+        self._status_snapshot = self._snapshot_from_state(
+            ContainerState(self.last_status, self.last_health)
+            if self.last_status
+            else None
+        )
+
     @property
     def status(self) -> ServiceStatus:  # noqa: D102
+        snapshot = getattr(self, "_status_snapshot", None) or Service._live_snapshot(
+            self.container_id
+        )
+        if snapshot is not None:
+            return cast(ServiceStatus, snapshot[0])
+
         container = DockerContainerManager.get_container(self.container_id)
         if container is None:
             return ServiceStatus.CREATED
@@ -70,6 +235,11 @@ class Service(ServiceModel):
         Returns:
             str: The health status (e.g., "healthy", "unhealthy", "starting") if available, or None if no healthcheck is configured or the container is not found.
         """
+        snapshot = getattr(self, "_status_snapshot", None) or Service._live_snapshot(
+            self.container_id
+        )
+        if snapshot is not None:
+            return cast(str | None, snapshot[1])
 
         container = DockerContainerManager.get_container(self.container_id)
         if container is None:
@@ -365,11 +535,7 @@ Miscelanous:
 
         labels = list(labels)
 
-        # Generate free ports and volumes if needed
-        for port in exposed_ports:
-            if port.host_port is None:
-                port.host_port = SystemPortManager.find_free_port()
-
+        # Generate free volumes if needed
         for volume in volumes:
             if volume.host_path is None:
                 volume.host_path = SystemVolumeManager.generate_free_volume(
@@ -378,23 +544,31 @@ Miscelanous:
 
         labels.append(Label(key="svs_user", value=user.name))
 
-        # Create service instance
-        service_instance = cls.objects.create(
-            name=name,
-            template_id=template_id,
-            user_id=user.id,
-            domain=domain,
-            container_id=container_id,
-            image=image,
-            exposed_ports=exposed_ports,
-            env=env,
-            volumes=volumes,
-            command=command,
-            healthcheck=healthcheck,
-            labels=labels,
-            args=args,
-            networks=networks,
-        )
+        # The ports stay reserved until the service recording them is committed
+        with SystemPortManager.reserving(), transaction.atomic():
+            unassigned_ports = [
+                port for port in exposed_ports if port.host_port is None
+            ]
+            host_ports = SystemPortManager.allocate(len(unassigned_ports), user)
+            for port, host_port in zip(unassigned_ports, host_ports):
+                port.host_port = host_port
+
+            service_instance = cls.objects.create(
+                name=name,
+                template_id=template_id,
+                user_id=user.id,
+                domain=domain,
+                container_id=container_id,
+                image=image,
+                exposed_ports=exposed_ports,
+                env=env,
+                volumes=volumes,
+                command=command,
+                healthcheck=healthcheck,
+                labels=labels,
+                args=args,
+                networks=networks,
+            )
 
         system_labels = [Label(key="service_id", value=str(service_instance.id))]
 
@@ -412,6 +586,8 @@ Miscelanous:
 
         get_logger(__name__).info(f"Creating service '{name}'")
 
+        # All default contents are written by a single command broker batch
+        content_writes = []
         for default_content in service_instance.template.default_contents:
             true_host_path = SystemVolumeManager.find_host_path(
                 Path(default_content.location), service_instance.volumes
@@ -420,7 +596,11 @@ Miscelanous:
                 get_logger(__name__).debug(
                     f"Adding default content to volume at '{true_host_path}'"
                 )
-                default_content.write_to_host(true_host_path, user.name)
+                create_directory(true_host_path.parent.as_posix(), user=user.name)
+                content_writes.append(
+                    default_content.write_operation(true_host_path.as_posix())
+                )
+        CommandBroker.run(user.name, content_writes)
 
         if template.type == TemplateType.IMAGE:
             container = DockerContainerManager.create_container(
@@ -449,11 +629,27 @@ Miscelanous:
                 DockerContainerManager.connect_to_network(container, "caddy")
 
         service_instance.save()
+        CompletionStamp.invalidate()
 
         return cast(Service, service_instance)
 
+    def _save_fields(self, *fields: str) -> None:
+        """Save the given columns without overwriting the recorded container state.
+
+        The state columns are written by the state reconciler only. As the
+        operation saving the service may have changed the container's state,
+        the recorded state is marked unchecked, so listings resolve it from
+        Docker until the reconciler records the new one.
+
+        Args:
+            *fields (str): Names of the columns to save.
+        """
+        self.state_checked_at = None
+        self.save(update_fields=[*fields, "state_checked_at", "updated_at"])
+
     def start(self) -> None:
         """Start the service's Docker container."""
+        self._status_snapshot = None
         if not self.container_id:
             raise ServiceOperationException("Service does not have a container ID")
 
@@ -484,10 +680,11 @@ Miscelanous:
 
         container.start()
 
-        self.save()
+        self._save_fields("container_id")
 
     def stop(self) -> None:
         """Stop the service's Docker container."""
+        self._status_snapshot = None
         if not self.container_id:
             raise ServiceOperationException("Service does not have a container ID")
 
@@ -502,7 +699,12 @@ Miscelanous:
         )
 
         container.stop()
-        self.save()
+        self._save_fields()
+
+    def restart(self) -> None:
+        """Restart the service's Docker container by stopping and starting it."""
+        self.stop()
+        self.start()
 
     def recreate(self) -> None:
         """Recreate the service's Docker container with current configuration.
@@ -514,6 +716,8 @@ Miscelanous:
         Raises:
             ServiceOperationException: If the container does not exist or cannot be recreated.
         """
+        self._status_snapshot = None
+
         if not self.container_id:
             raise ServiceOperationException("Service does not have a container ID")
 
@@ -541,7 +745,7 @@ Miscelanous:
         if any(label.key == "caddy" for label in self.labels):
             DockerContainerManager.connect_to_network(new_container, "caddy")
 
-        self.save()
+        self._save_fields("container_id")
 
         # Start the container if it was running before recreation
         if was_running:
@@ -577,6 +781,7 @@ Miscelanous:
         get_logger(__name__).info(f"Deleting service '{self.name}'")
 
         super().delete()
+        CompletionStamp.invalidate()
 
     def get_logs(self, tail: int = 1000) -> str:
         """Retrieve the logs of the service's Docker container.
@@ -603,18 +808,102 @@ Miscelanous:
         logs = container.logs(tail=tail)
         return cast(str, logs.decode("utf-8"))
 
-    def build(self, source_path: Path) -> None:
+    def stream_logs(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        tail: int | None = None,
+        follow: bool = True,
+        timestamps: bool = False,
+    ) -> Iterator[str]:
+        """Stream the logs of the service's Docker container line by line.
+
+        Lines are yielded as soon as Docker sends them, so following a
+        container never re-transfers output that was already seen.
+
+        Args:
+            since (datetime | None): Only return lines logged at or after this time.
+            until (datetime | None): Only return lines logged before this time. When following, the stream ends once it is reached.
+            tail (int | None): Number of lines from the end of the logs to start with, None for all.
+            follow (bool): Whether to keep the stream open and yield new lines as they are logged.
+            timestamps (bool): Whether to prefix every line with its RFC 3339 timestamp.
+
+        Yields:
+            str: The log lines, without the trailing newline.
+        """
+        if not self.container_id:
+            raise ServiceOperationException("Service does not have a container ID")
+
+        container = DockerContainerManager.get_container(self.container_id)
+        if not container:
+            raise ServiceOperationException(
+                f"Container with ID {self.container_id} not found"
+            )
+
+        get_logger(__name__).debug(
+            f"Streaming logs for service '{self.name}' with container ID '{self.container_id}' (follow={follow}, since={since})"
+        )
+
+        options: dict[str, Any] = {
+            "stream": True,
+            "follow": follow,
+            "timestamps": timestamps,
+            "tail": "all" if tail is None else tail,
+        }
+        # Docker accepts fractional timestamps, docker-py truncates datetimes to seconds
+        if since is not None:
+            options["since"] = since.timestamp()
+        if until is not None:
+            options["until"] = until.timestamp()
+
+        stream = container.logs(**options)
+        buffer = b""
+        try:
+            for chunk in stream:
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace")
+
+            if buffer:
+                yield buffer.decode("utf-8", errors="replace")
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+    def build(
+        self,
+        source_path: Path,
+        on_event: Callable[[BuildEvent], None] | None = None,
+        force: bool = False,
+        blue_green: bool = False,
+    ) -> BuildResult:
         """Build the service's Docker from a Dockerfile.
 
         This method is used when the template type is DOCKERFILE. It builds the Docker image
         using the Dockerfile found in the specified source path.
 
+        The build is skipped when the Dockerfile, build arguments and source tree
+        match the previous build and its image and container still exist.
+
         Args:
             source_path (Path): The path to the directory containing the Dockerfile.
+            on_event (Callable[[BuildEvent], None] | None): Optional callback receiving build progress events.
+            force (bool): Rebuild even if nothing changed since the last build.
+            blue_green (bool): Replace a running container without downtime: the new container
+                is started next to the old one and takes over once it is ready. Host ports
+                are only published by the container replacing it, so they are briefly
+                unavailable while the service keeps serving through its networks.
+
+        Returns:
+            BuildResult: The per-step timings of the image build, marked as cached when the build was skipped.
 
         Raises:
             ValidationException: If the source path does not exist, is not a directory, or if the template type is not BUILD.
         """
+        self._status_snapshot = None
+
         # Validate source path exists and is a directory
         if not source_path.exists():
             raise ValidationException(f"Source path does not exist: {source_path}")
@@ -626,6 +915,20 @@ Miscelanous:
                 "Service template type is not BUILD; cannot build image."
             )
 
+        started_at = time.monotonic()
+        build_args = {env.key: env.value for env in self.env}
+        fingerprint = DockerBuildContext.fingerprint(
+            self.template.dockerfile or "", build_args, source_path
+        )
+
+        if not force and self._is_build_current(fingerprint):
+            get_logger(__name__).info(
+                f"Build inputs of service '{self.name}' are unchanged, skipping build"
+            )
+            return BuildResult(
+                duration_seconds=time.monotonic() - started_at, cached=True
+            )
+
         production_image_name = f"svs-{self.id}:latest"
         build_image_name = f"{self.template.name.lower()}-{self.id}:{int(time.time())}"
 
@@ -633,11 +936,13 @@ Miscelanous:
             f"Building image '{build_image_name}' on-demand for service '{self.name}' in path '{source_path}', with ENV vars: {[env.__str__() for env in self.env]}"
         )
 
-        DockerImageManager.build_from_dockerfile(
+        result = DockerImageManager.build_from_dockerfile(
             build_image_name,
             self.template.dockerfile,
             path_to_copy=source_path,
-            build_args={env.key: env.value for env in self.env},
+            build_args=build_args,
+            on_event=on_event,
+            cache_scope=self.user.name,
         )
 
         get_logger(__name__).debug(
@@ -680,30 +985,20 @@ Miscelanous:
             # Capture the running state before making changes
             was_running = self.status == ServiceStatus.RUNNING
 
+            if blue_green and was_running:
+                self._swap_container(container, build_image_name, production_image_name)
+                self.build_fingerprint = fingerprint
+                self._save_fields("image", "container_id", "build_fingerprint")
+                return result
+
             # Stop the container if it's running
             if was_running:
                 self.stop()
 
-                # Wait for the container to actually stop after stop() is called
                 # Docker's stop operation can take time (graceful shutdown with SIGTERM, then SIGKILL)
-                for attempt in range(self._MAX_STOP_RETRIES):
-                    container = DockerContainerManager.get_container(self.container_id)
-                    if not container or container.status != "running":
-                        break
-
-                    # Wait before next check to give container time to stop
-                    if attempt < self._MAX_STOP_RETRIES - 1:
-                        get_logger(__name__).warning(
-                            f"Container {self.container_id} still running after stop() - waiting (attempt {attempt + 1}/{self._MAX_STOP_RETRIES})"
-                        )
-                        time.sleep(self._STOP_RETRY_DELAY_SECONDS)
-                    else:
-                        get_logger(__name__).error(
-                            f"Container {self.container_id} failed to stop after {self._MAX_STOP_RETRIES} attempts"
-                        )
-                        raise ServiceOperationException(
-                            f"Failed to stop container {self.container_id} after {self._MAX_STOP_RETRIES} attempts"
-                        )
+                DockerContainerManager.wait_until_stopped(
+                    container, timeout=self._STOP_TIMEOUT_SECONDS
+                )
 
             # Remove the old container so we can create a new one with the updated image
             get_logger(__name__).debug(
@@ -753,7 +1048,193 @@ Miscelanous:
             if was_running:
                 self.start()
 
-        self.save()
+        self.build_fingerprint = fingerprint
+        self._save_fields("image", "container_id", "build_fingerprint")
+        return result
+
+    def _swap_container(
+        self,
+        old_container: Container,
+        build_image_name: str,
+        production_image_name: str,
+    ) -> None:
+        """Replace a running container with one running the newly built image.
+
+        The new container is started under a temporary name next to the old
+        one. Only once it is ready is it connected to the caddy network, and
+        the old container stopped and removed. If it never becomes ready, it is
+        discarded and the old container keeps serving.
+
+        Host ports cannot be bound twice, and Docker cannot publish the ports
+        of a running container, so a service publishing host ports starts the
+        new container without them. It serves through the networks while a
+        container publishing them replaces it.
+
+        Args:
+            old_container (Container): The running container to replace.
+            build_image_name (str): Name of the newly built image.
+            production_image_name (str): Name the service's image is tagged with.
+
+        Raises:
+            ServiceOperationException: If a new container does not become ready.
+        """
+        container_name = f"svs-{self.id}"
+        standby_name = f"{container_name}-next"
+        old_image_id = old_container.attrs.get("Image")
+        publishes_ports = any(port.host_port for port in self.exposed_ports)
+        uses_caddy = any(label.key == "caddy" for label in self.labels)
+
+        stale = DockerContainerManager.get_container(standby_name)
+        if stale is not None:
+            get_logger(__name__).warning(
+                f"Removing leftover container '{standby_name}' of an earlier rebuild"
+            )
+            DockerContainerManager.remove(stale.id)
+
+        DockerImageManager.rename(build_image_name, production_image_name)
+        self.image = production_image_name
+
+        try:
+            standby = self._start_ready_container(
+                standby_name, [] if publishes_ports else self.exposed_ports
+            )
+        except Exception as e:
+            get_logger(__name__).error(
+                f"New container of service '{self.name}' did not become ready, keeping the old one: {str(e)}"
+            )
+            try:
+                if old_image_id:
+                    DockerImageManager.tag(old_image_id, production_image_name)
+            except Exception as cleanup_error:
+                get_logger(__name__).warning(
+                    f"Failed to clean up after the failed rebuild of service '{self.name}': {str(cleanup_error)}"
+                )
+            raise ServiceOperationException(
+                f"Rebuild of service '{self.name}' aborted, the new container did not become ready: {str(e)}"
+            ) from e
+
+        if uses_caddy:
+            DockerContainerManager.connect_to_network(standby, "caddy")
+
+        get_logger(__name__).info(
+            f"Switching service '{self.name}' from container '{old_container.id}' to '{standby.id}'"
+        )
+        old_container.stop()
+        DockerContainerManager.remove(old_container.id)
+
+        if publishes_ports:
+            get_logger(__name__).info(
+                f"Publishing the host ports of service '{self.name}' on a new container"
+            )
+            try:
+                published = self._start_ready_container(
+                    container_name, self.exposed_ports
+                )
+            except Exception as e:
+                # The standby keeps serving through the networks
+                DockerContainerManager.rename(standby, container_name)
+                self.container_id = standby.id
+                self._save_fields("image", "container_id")
+                raise ServiceOperationException(
+                    f"Service '{self.name}' runs the new image without its host ports, recreate it to publish them: {str(e)}"
+                ) from e
+
+            if uses_caddy:
+                DockerContainerManager.connect_to_network(published, "caddy")
+            DockerContainerManager.remove(standby.id)
+            self.container_id = published.id
+        else:
+            DockerContainerManager.rename(standby, container_name)
+            self.container_id = standby.id
+
+        # Identical builds produce the same image, which is now in use again
+        if old_image_id and old_image_id != standby.attrs.get("Image"):
+            try:
+                DockerImageManager.remove(old_image_id)
+            except Exception as e:
+                get_logger(__name__).warning(
+                    f"Could not remove previous image '{old_image_id}' of service '{self.name}': {str(e)}"
+                )
+
+    def _start_ready_container(self, name: str, ports: list[ExposedPort]) -> Container:
+        """Create and start a container of the service and wait until it is ready.
+
+        Args:
+            name (str): Name of the container.
+            ports (list[ExposedPort]): Ports the container publishes.
+
+        Returns:
+            Container: The running container.
+
+        Raises:
+            Exception: If the container does not start or become ready, it is removed.
+        """
+        container = DockerContainerManager.create_container(
+            name=name,
+            image=self.image,
+            owner=self.user.name,
+            command=self.command,
+            args=self.args,
+            labels=self.labels,
+            ports=ports,
+            volumes=self.volumes,
+            environment_variables=self.env,
+            healthcheck=self.healthcheck,
+        )
+
+        try:
+            DockerContainerManager.connect_to_network(container, self.user.name)
+            DockerContainerManager.start_container(container)
+            DockerContainerManager.wait_until_ready(
+                container,
+                timeout=self._readiness_timeout(),
+                settle_seconds=self._BLUE_GREEN_SETTLE_SECONDS,
+            )
+        except Exception:
+            try:
+                DockerContainerManager.remove(container.id)
+            except Exception as cleanup_error:
+                get_logger(__name__).warning(
+                    f"Failed to remove container '{name}' of service '{self.name}': {str(cleanup_error)}"
+                )
+            raise
+
+        return container
+
+    def _readiness_timeout(self) -> float:
+        """Return how long a new container may take to become ready.
+
+        Returns:
+            float: Seconds, enough for the healthcheck to exhaust its retries.
+        """
+        healthcheck = self.healthcheck
+        if healthcheck is None:
+            return self._BLUE_GREEN_SETTLE_SECONDS + 30
+
+        # Docker's defaults apply to unset healthcheck options
+        interval = healthcheck.interval or 30
+        timeout = healthcheck.timeout or 30
+        retries = healthcheck.retries or 3
+        return (healthcheck.start_period or 0) + (interval + timeout) * (retries + 1)
+
+    def _is_build_current(self, fingerprint: str) -> bool:
+        """Check whether the last build of the service matches the fingerprint.
+
+        Args:
+            fingerprint (str): Fingerprint of the build inputs.
+
+        Returns:
+            bool: True if the fingerprint matches and the image and container still exist.
+        """
+        if not self.build_fingerprint or self.build_fingerprint != fingerprint:
+            return False
+
+        if not self.image or not self.container_id:
+            return False
+
+        return DockerImageManager.exists(self.image) and (
+            DockerContainerManager.get_container(self.container_id) is not None
+        )
 
     def add_git_source(
         self,
@@ -821,6 +1302,7 @@ Miscelanous:
             healthcheck: Healthcheck configuration to replace current one.
             args: Command arguments to replace current ones.
         """
+        new_ports: list[ExposedPort] = []
 
         if env_variables is not None:
             if not isinstance(env_variables, list):
@@ -841,6 +1323,8 @@ Miscelanous:
                     raise ValidationException(
                         f"Each port must be an ExposedPort: {port}"
                     )
+
+            new_ports = ports
             self.exposed_ports = ports
         if volumes is not None:
             if not isinstance(volumes, list):
@@ -876,5 +1360,19 @@ Miscelanous:
         if domain is not None:
             self.domain = domain
 
-        self.save()
+        unassigned_ports = [port for port in new_ports if port.host_port is None]
+        if unassigned_ports:
+            # The ports stay reserved until the service recording them is committed
+            with SystemPortManager.reserving(), transaction.atomic():
+                host_ports = SystemPortManager.allocate(
+                    len(unassigned_ports), self.user
+                )
+                for port, host_port in zip(unassigned_ports, host_ports):
+                    port.host_port = host_port
+                # The setter serialized the ports before they were assigned
+                self.exposed_ports = new_ports
+                self._save_fields(*Service._CONFIG_FIELDS)
+        else:
+            self._save_fields(*Service._CONFIG_FIELDS)
+
         self.recreate()
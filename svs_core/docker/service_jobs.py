@@ -0,0 +1,243 @@
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from svs_core.docker.build_progress import BuildEvent
+from svs_core.docker.json_properties import EnvVariable, ExposedPort, Volume
+from svs_core.docker.service import Service
+from svs_core.shared.git_source import GitSource
+from svs_core.shared.jobs import Job
+from svs_core.users.user import User
+
+
+class ServiceJobs:
+    """Enqueues long-running service operations as background jobs."""
+
+    BUILD = "service.build"
+    RESTART = "service.restart"
+    CREATE_FROM_TEMPLATE = "service.create_from_template"
+    DOWNLOAD_GIT_SOURCE = "git_source.download"
+
+    BUILD_OUTPUT_LINES = 200
+    """Number of trailing build output lines kept in the job progress."""
+
+    @staticmethod
+    def build(
+        service: Service,
+        user_id: int,
+        build_path: Path,
+        force: bool = False,
+        blue_green: bool = False,
+    ) -> Job:
+        """Enqueues a build of the service image.
+
+        Args:
+            service (Service): The service to build.
+            user_id (int): The ID of the user requesting the build.
+            build_path (Path): The build context path.
+            force (bool): Rebuild even if nothing changed since the last build.
+            blue_green (bool): Switch to the new container only once it is ready.
+
+        Returns:
+            Job: The build job, or the pending one if a build is already queued.
+        """
+        return Job.enqueue(
+            ServiceJobs.BUILD,
+            user_id,
+            {"build_path": str(build_path), "force": force, "blue_green": blue_green},
+            service_id=service.id,
+            unique=True,
+        )
+
+    @staticmethod
+    def restart(service: Service, user_id: int) -> Job:
+        """Enqueues a restart of the service.
+
+        Args:
+            service (Service): The service to restart.
+            user_id (int): The ID of the user requesting the restart.
+
+        Returns:
+            Job: The restart job, or the pending one if a restart is already queued.
+        """
+        return Job.enqueue(
+            ServiceJobs.RESTART, user_id, service_id=service.id, unique=True
+        )
+
+    @staticmethod
+    def download_git_source(git_source: GitSource, user_id: int) -> Job:
+        """Enqueues a download or update of a git source.
+
+        Args:
+            git_source (GitSource): The git source to download.
+            user_id (int): The ID of the user requesting the download.
+
+        Returns:
+            Job: The download job.
+        """
+        return Job.enqueue(
+            ServiceJobs.DOWNLOAD_GIT_SOURCE,
+            user_id,
+            {"git_source_id": git_source.id},
+            service_id=git_source.service_id,
+        )
+
+    @staticmethod
+    def create_from_template(
+        name: str,
+        template_id: int,
+        user_id: int,
+        domain: str | None = None,
+        override_env: list[EnvVariable] | None = None,
+        override_ports: list[ExposedPort] | None = None,
+        override_volumes: list[Volume] | None = None,
+    ) -> Job:
+        """Enqueues the creation of a service from a template.
+
+        The ID of the created service is stored in the job result and the job
+        is linked to the service once it exists.
+
+        Args:
+            name (str): The name of the service.
+            template_id (int): The ID of the template to use.
+            user_id (int): The ID of the user who will own the service.
+            domain (str | None): The domain for the service.
+            override_env (list[EnvVariable] | None): Environment variables to override.
+            override_ports (list[ExposedPort] | None): Exposed ports to override.
+            override_volumes (list[Volume] | None): Volumes to override.
+
+        Returns:
+            Job: The creation job.
+        """
+        return Job.enqueue(
+            ServiceJobs.CREATE_FROM_TEMPLATE,
+            user_id,
+            {
+                "name": name,
+                "template_id": template_id,
+                "domain": domain,
+                "override_env": (
+                    EnvVariable.to_dict_array(override_env) if override_env else None
+                ),
+                "override_ports": (
+                    ExposedPort.to_dict_array(override_ports)
+                    if override_ports
+                    else None
+                ),
+                "override_volumes": (
+                    Volume.to_dict_array(override_volumes) if override_volumes else None
+                ),
+            },
+        )
+
+    @staticmethod
+    def _run_build(job: Job) -> dict[str, Any]:
+        """Builds the service image, reporting build steps as job progress.
+
+        Args:
+            job (Job): The build job.
+
+        Returns:
+            dict[str, Any]: Whether the build was skipped, its duration and step timings.
+        """
+        service = Service.objects.get(id=job.service_id)
+        lines: deque[str] = deque(maxlen=ServiceJobs.BUILD_OUTPUT_LINES)
+        current = {"message": "Starting build"}
+
+        def on_event(event: BuildEvent) -> None:
+            line = event.message
+            if event.kind == BuildEvent.STEP:
+                line = f"Step {event.step}/{event.total_steps}: {event.message}"
+            if event.kind != BuildEvent.OUTPUT:
+                current["message"] = line
+            lines.append(line)
+            job.report_progress(
+                force=event.kind != BuildEvent.OUTPUT,
+                message=current["message"],
+                step=event.step,
+                total_steps=event.total_steps,
+                lines=list(lines),
+            )
+
+        result = service.build(
+            Path(job.payload["build_path"]),
+            on_event=on_event,
+            force=bool(job.payload.get("force")),
+            blue_green=bool(job.payload.get("blue_green")),
+        )
+
+        return {
+            "cached": result.cached,
+            "duration_seconds": round(result.duration_seconds, 3),
+            "steps": [
+                {
+                    "step": timing.step,
+                    "instruction": timing.instruction,
+                    "duration_seconds": round(timing.duration_seconds, 3),
+                }
+                for timing in result.steps
+            ],
+        }
+
+    @staticmethod
+    def _run_restart(job: Job) -> None:
+        """Restarts the service.
+
+        Args:
+            job (Job): The restart job.
+        """
+        Service.objects.get(id=job.service_id).restart()
+
+    @staticmethod
+    def _run_download_git_source(job: Job) -> None:
+        """Clones or updates the git source.
+
+        Args:
+            job (Job): The download job.
+        """
+        GitSource.objects.get(
+            id=job.payload["git_source_id"], service_id=job.service_id
+        ).download()
+
+    @staticmethod
+    def _run_create_from_template(job: Job) -> dict[str, Any]:
+        """Creates the service and links the job to it.
+
+        Args:
+            job (Job): The creation job.
+
+        Returns:
+            dict[str, Any]: The ID of the created service.
+        """
+        payload = job.payload
+        service = Service.create_from_template(
+            name=payload["name"],
+            template_id=payload["template_id"],
+            user=User.objects.get(id=job.user_id),
+            domain=payload.get("domain"),
+            override_env=(
+                EnvVariable.from_dict_array(payload["override_env"])
+                if payload.get("override_env")
+                else None
+            ),
+            override_ports=(
+                ExposedPort.from_dict_array(payload["override_ports"])
+                if payload.get("override_ports")
+                else None
+            ),
+            override_volumes=(
+                Volume.from_dict_array(payload["override_volumes"])
+                if payload.get("override_volumes")
+                else None
+            ),
+        )
+
+        Job.objects.filter(id=job.id).update(service_id=service.id)
+        job.service_id = service.id
+        return {"service_id": service.id}
+
+
+Job.register(ServiceJobs.BUILD, ServiceJobs._run_build)
+Job.register(ServiceJobs.RESTART, ServiceJobs._run_restart)
+Job.register(ServiceJobs.DOWNLOAD_GIT_SOURCE, ServiceJobs._run_download_git_source)
+Job.register(ServiceJobs.CREATE_FROM_TEMPLATE, ServiceJobs._run_create_from_template)
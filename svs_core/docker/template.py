@@ -12,6 +12,7 @@ from svs_core.docker.json_properties import (
     Label,
     Volume,
 )
+from svs_core.shared.completion_stamp import CompletionStamp
 from svs_core.shared.exceptions import TemplateException, ValidationException
 from svs_core.shared.logger import get_logger
 from svs_core.shared.text import indentate, to_goated_time_format
@@ -179,6 +180,7 @@ Miscellaneous:
             args=args,
             docs_url=docs_url,
         )
+        CompletionStamp.invalidate()
 
         if type == TemplateType.IMAGE and image is not None:
             if not DockerImageManager.exists(image):
@@ -318,6 +320,7 @@ Miscellaneous:
                     DockerImageManager.remove(self.image)
 
             super().delete()
+            CompletionStamp.invalidate()
             get_logger(__name__).info(f"Successfully deleted template '{self.name}'")
         except Exception as e:
             get_logger(__name__).error(
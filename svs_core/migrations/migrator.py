@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from importlib.metadata import version
 from typing import Callable
 
+from svs_core.docker.fleet import FleetExecutor
 from svs_core.docker.service import Service
 from svs_core.shared.logger import get_logger
 
@@ -121,9 +122,9 @@ class Migrator:
 
     @staticmethod
     def _restart_policy_change() -> None:
-        services = Service.objects.all()
-        for service in services:
-            service.recreate()
+        services = Service.objects.select_related("user")
+        result = FleetExecutor.run(services, lambda service: service.recreate())
+        result.raise_on_failure("recreate")
 
 
 Migrator.migrations = [
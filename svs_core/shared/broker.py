@@ -0,0 +1,438 @@
+import atexit
+import os
+import pwd
+import select
+import shlex
+import subprocess
+import sys
+import threading
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from svs_core.shared import broker_helper
+from svs_core.shared.exceptions import ResourceException
+from svs_core.shared.logger import get_logger
+from svs_core.shared.shell import run_command
+
+
+@dataclass(frozen=True)
+class BrokerOperation:
+    """A single whitelisted operation run as another user by the broker."""
+
+    """Operation name, one of `broker_helper.OPERATIONS`."""
+    op: str
+    """Path the operation applies to, the working directory for `git`."""
+    path: str | None = None
+    """Git arguments, the user and group for `chown`, `contents` for `rm`."""
+    args: tuple[str, ...] = ()
+    """File content for `write_file`."""
+    content: str | None = None
+    """Permission bits for `mkdir` and `write_file`."""
+    mode: int | None = None
+
+    @staticmethod
+    def mkdir(path: str, mode: int | None = None) -> "BrokerOperation":
+        """Creates a directory and its parents.
+
+        Args:
+            path (str): The directory to create.
+            mode (int | None): Permission bits of the directory.
+
+        Returns:
+            BrokerOperation: The operation.
+        """
+        return BrokerOperation("mkdir", path, mode=mode)
+
+    @staticmethod
+    def chown(
+        path: str, user: str | None = None, group: str | None = None
+    ) -> "BrokerOperation":
+        """Changes the owner or group of a path.
+
+        Args:
+            path (str): The path to change.
+            user (str | None): The new owner, None to keep it.
+            group (str | None): The new group, None to keep it.
+
+        Returns:
+            BrokerOperation: The operation.
+        """
+        return BrokerOperation("chown", path, (user or "", group or ""))
+
+    @staticmethod
+    def write_file(
+        path: str, content: str, mode: int | None = None
+    ) -> "BrokerOperation":
+        """Writes a text file, replacing its content.
+
+        Args:
+            path (str): The file to write.
+            content (str): The content of the file.
+            mode (int | None): Permission bits of the file.
+
+        Returns:
+            BrokerOperation: The operation.
+        """
+        return BrokerOperation("write_file", path, content=content, mode=mode)
+
+    @staticmethod
+    def git(*args: str, cwd: str | None = None) -> "BrokerOperation":
+        """Runs git.
+
+        Args:
+            *args (str): The git arguments, e.g. `"fetch"`.
+            cwd (str | None): The working directory.
+
+        Returns:
+            BrokerOperation: The operation.
+        """
+        return BrokerOperation("git", cwd, tuple(args))
+
+    @staticmethod
+    def rm(path: str, contents_only: bool = False) -> "BrokerOperation":
+        """Removes a file or directory tree.
+
+        Args:
+            path (str): The path to remove, missing paths are ignored.
+            contents_only (bool): Keep the directory itself, remove only its contents.
+
+        Returns:
+            BrokerOperation: The operation.
+        """
+        return BrokerOperation("rm", path, ("contents",) if contents_only else ())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the operation to a protocol message.
+
+        Returns:
+            dict[str, Any]: The operation as sent to the helper process.
+        """
+        return {
+            "op": self.op,
+            "path": self.path,
+            "args": list(self.args),
+            "content": self.content,
+            "mode": self.mode,
+        }
+
+    def to_shell(self) -> str:
+        """Converts the operation to an equivalent shell command.
+
+        Used when no helper process is available, and to describe failures.
+
+        Returns:
+            str: The shell command.
+        """
+        path = shlex.quote(self.path) if self.path else ""
+
+        if self.op == "mkdir":
+            command = f"mkdir -p {path}"
+            if self.mode is not None:
+                command += f" && chmod {self.mode:o} {path}"
+            return command
+        if self.op == "chown":
+            user, group = self.args
+            return f"chown {shlex.quote(user)}:{shlex.quote(group)} {path}"
+        if self.op == "write_file":
+            command = f"printf '%s' {shlex.quote(self.content or '')} > {path}"
+            if self.mode is not None:
+                command += f" && chmod {self.mode:o} {path}"
+            return command
+        if self.op == "rm":
+            if "contents" in self.args:
+                return f"find {path} -mindepth 1 -delete"
+            return f"rm -rf {path}"
+        if self.op == "git":
+            cwd = f"-C {path} " if path else ""
+            return f"git {cwd}{shlex.join(self.args)}"
+
+        raise ValueError(f"Operation '{self.op}' is not allowed")
+
+
+@dataclass
+class BrokerStats:
+    """Timing metrics of one kind of broker operation."""
+
+    """Number of operations run."""
+    count: int = 0
+    """Number of operations that failed."""
+    failures: int = 0
+    """Number of operations run through the sudo fallback."""
+    fallbacks: int = 0
+    """Total run time, in seconds."""
+    total_seconds: float = 0.0
+    """Longest run time, in seconds."""
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, failed: bool, fallback: bool) -> None:
+        """Adds a single operation to the metrics.
+
+        Args:
+            seconds (float): How long the operation took.
+            failed (bool): Whether the operation failed.
+            fallback (bool): Whether the operation ran through the fallback.
+        """
+        self.count += 1
+        self.failures += int(failed)
+        self.fallbacks += int(fallback)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class _HelperProcess:
+    """A running helper process and the lock serializing its requests."""
+
+    def __init__(self, user: str, process: subprocess.Popen[bytes]) -> None:
+        self.user = user
+        self.process = process
+        self.lock = threading.Lock()
+
+    def request(self, operations: list[BrokerOperation]) -> list[dict[str, Any]]:
+        """Sends a batch of operations and waits for their results."""
+        assert self.process.stdin is not None and self.process.stdout is not None
+
+        with self.lock:
+            try:
+                broker_helper.write_frame(
+                    self.process.stdin,
+                    {"operations": [operation.to_dict() for operation in operations]},
+                )
+                response = broker_helper.read_frame(self.process.stdout)
+            except OSError:
+                response = None
+
+        if response is None:
+            raise ResourceException(
+                f"Command broker for user '{self.user}' exited unexpectedly"
+            )
+        results: list[dict[str, Any]] = response["results"]
+        return results
+
+    def stop(self) -> None:
+        """Closes the helper's stdin, which makes it exit."""
+        try:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.process.kill()
+
+
+class CommandBroker:
+    """Runs file and git operations as other users through helper processes.
+
+    Every `sudo -u <user>` call pays for a fork and a sudoers evaluation. The
+    broker instead starts one helper process per target user on first use
+    and sends it batches of whitelisted operations over a pipe. Operations
+    for the user running SVS are executed in-process. If a helper cannot be
+    started, operations fall back to `run_command`.
+    """
+
+    START_TIMEOUT_SECONDS = 10.0
+
+    _lock = threading.Lock()
+    _helpers: dict[str, _HelperProcess] = {}
+    _unavailable: set[str] = set()
+    _stats: dict[str, BrokerStats] = {}
+    _stats_lock = threading.Lock()
+
+    @staticmethod
+    def run(
+        user: str, operations: list[BrokerOperation], check: bool = True
+    ) -> list[subprocess.CompletedProcess[str]]:
+        """Runs operations as a user, in order, stopping at the first failure.
+
+        Args:
+            user (str): The user to run the operations as.
+            operations (list[BrokerOperation]): The operations.
+            check (bool): If True, raises CalledProcessError if an operation fails.
+
+        Returns:
+            list[subprocess.CompletedProcess[str]]: The results of the executed
+            operations, whose `args` is the equivalent shell command.
+
+        Raises:
+            subprocess.CalledProcessError: If `check` is set and an operation failed.
+            ResourceException: If the helper process exited during the batch.
+        """
+        if not operations:
+            return []
+
+        started = time.monotonic()
+        fallback = False
+
+        if user == CommandBroker._current_user():
+            raw = broker_helper.execute_batch([op.to_dict() for op in operations])
+        else:
+            helper = CommandBroker._get_helper(user)
+            if helper is not None:
+                raw = helper.request(operations)
+            else:
+                raw = CommandBroker._run_fallback(user, operations)
+                fallback = True
+
+        results = []
+        for operation, result in zip(operations, raw):
+            with CommandBroker._stats_lock:
+                CommandBroker._stats.setdefault(operation.op, BrokerStats()).record(
+                    result["seconds"], result["returncode"] != 0, fallback
+                )
+            results.append(
+                subprocess.CompletedProcess(
+                    operation.to_shell(),
+                    result["returncode"],
+                    result["stdout"],
+                    result["stderr"],
+                )
+            )
+
+        get_logger(__name__).debug(
+            f"Ran {len(results)}/{len(operations)} operations as '{user}' in "
+            f"{(time.monotonic() - started) * 1000:.1f} ms"
+            f"{' through the fallback' if fallback else ''}"
+        )
+
+        if check:
+            for completed in results:
+                completed.check_returncode()
+
+        return results
+
+    @staticmethod
+    def get_stats() -> dict[str, BrokerStats]:
+        """Returns the timing metrics of the operations run so far.
+
+        Returns:
+            dict[str, BrokerStats]: Metrics keyed by operation name.
+        """
+        with CommandBroker._stats_lock:
+            return dict(CommandBroker._stats)
+
+    @staticmethod
+    def shutdown() -> None:
+        """Stops all helper processes."""
+        with CommandBroker._lock:
+            helpers = list(CommandBroker._helpers.values())
+            CommandBroker._helpers.clear()
+
+        for helper in helpers:
+            helper.stop()
+
+    @staticmethod
+    def _get_helper(user: str) -> _HelperProcess | None:
+        """Returns the running helper of a user, starting it if needed.
+
+        Args:
+            user (str): The target user.
+
+        Returns:
+            _HelperProcess | None: The helper, or None if it cannot be started.
+        """
+        with CommandBroker._lock:
+            helper = CommandBroker._helpers.get(user)
+            if helper is not None and helper.process.poll() is None:
+                return helper
+            if user in CommandBroker._unavailable:
+                return None
+
+            helper = CommandBroker._start_helper(user)
+            if helper is None:
+                CommandBroker._unavailable.add(user)
+            else:
+                CommandBroker._helpers[user] = helper
+            return helper
+
+    @staticmethod
+    def _start_helper(user: str) -> _HelperProcess | None:
+        """Starts a helper process for a user and waits until it is ready.
+
+        Args:
+            user (str): The target user.
+
+        Returns:
+            _HelperProcess | None: The helper, or None if it did not start.
+        """
+        started = time.monotonic()
+        command = [
+            "sudo",
+            "-n",
+            "-u",
+            user,
+            sys.executable,
+            "-I",
+            Path(broker_helper.__file__).as_posix(),
+        ]
+
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            get_logger(__name__).warning(
+                f"Could not start command broker for user '{user}': {str(e)}"
+            )
+            return None
+
+        assert process.stdout is not None
+        ready, _, _ = select.select(
+            [process.stdout], [], [], CommandBroker.START_TIMEOUT_SECONDS
+        )
+        hello = broker_helper.read_frame(process.stdout) if ready else None
+        if not hello or not hello.get("ready"):
+            process.kill()
+            get_logger(__name__).warning(
+                f"Command broker for user '{user}' did not start, falling back to sudo"
+            )
+            return None
+
+        get_logger(__name__).debug(
+            f"Started command broker for user '{user}' (pid {hello.get('pid')}) in "
+            f"{(time.monotonic() - started) * 1000:.1f} ms"
+        )
+        return _HelperProcess(user, process)
+
+    @staticmethod
+    def _run_fallback(
+        user: str, operations: list[BrokerOperation]
+    ) -> list[dict[str, Any]]:
+        """Runs operations one `run_command` at a time.
+
+        Args:
+            user (str): The target user.
+            operations (list[BrokerOperation]): The operations.
+
+        Returns:
+            list[dict[str, Any]]: The results, shaped like the helper's.
+        """
+        results = []
+        for operation in operations:
+            started = time.monotonic()
+            completed = run_command(operation.to_shell(), check=False, user=user)
+            results.append(
+                {
+                    "returncode": completed.returncode,
+                    "stdout": completed.stdout,
+                    "stderr": completed.stderr,
+                    "seconds": time.monotonic() - started,
+                }
+            )
+            if completed.returncode != 0:
+                break
+        return results
+
+    @staticmethod
+    def _current_user() -> str | None:
+        """Returns the name of the effective user of this process."""
+        try:
+            return pwd.getpwuid(os.geteuid()).pw_name
+        except KeyError:
+            return None
+
+
+atexit.register(CommandBroker.shutdown)
@@ -0,0 +1,200 @@
+"""Helper process of the command broker.
+
+Runs as the target user and executes whitelisted operations sent by
+`svs_core.shared.broker.CommandBroker` over its stdin and stdout. Frames are
+a 4-byte big-endian length followed by a UTF-8 JSON document.
+
+The module only uses the standard library, so it can be started as a script
+without importing `svs_core` or Django.
+"""
+
+import grp
+import json
+import os
+import pwd
+import shutil
+import struct
+import subprocess
+import sys
+import time
+
+from typing import IO, Any
+
+HEADER = struct.Struct(">I")
+
+OPERATIONS = ("mkdir", "chown", "write_file", "git", "rm")
+
+
+def write_frame(stream: IO[bytes], message: dict[str, Any]) -> None:
+    """Writes a single frame.
+
+    Args:
+        stream (IO[bytes]): The stream to write to.
+        message (dict[str, Any]): The JSON-serializable message.
+    """
+    payload = json.dumps(message).encode("utf-8")
+    stream.write(HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def read_frame(stream: IO[bytes]) -> dict[str, Any] | None:
+    """Reads a single frame.
+
+    Args:
+        stream (IO[bytes]): The stream to read from.
+
+    Returns:
+        dict[str, Any] | None: The message, or None once the stream is closed.
+    """
+    header = _read_exactly(stream, HEADER.size)
+    if header is None:
+        return None
+
+    payload = _read_exactly(stream, HEADER.unpack(header)[0])
+    if payload is None:
+        return None
+
+    message: dict[str, Any] = json.loads(payload.decode("utf-8"))
+    return message
+
+
+def _read_exactly(stream: IO[bytes], size: int) -> bytes | None:
+    """Reads exactly `size` bytes, or None if the stream ends first."""
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def execute(operation: dict[str, Any]) -> dict[str, Any]:
+    """Executes a single operation as the current user.
+
+    Args:
+        operation (dict[str, Any]): The operation, as sent by the broker.
+
+    Returns:
+        dict[str, Any]: The return code, output and duration of the operation.
+    """
+    started = time.monotonic()
+    name = operation.get("op")
+    path = str(operation.get("path") or "")
+    args = [str(arg) for arg in operation.get("args") or []]
+    mode = operation.get("mode")
+
+    returncode, stdout, stderr = 0, "", ""
+    try:
+        if name == "mkdir":
+            os.makedirs(path, exist_ok=True)
+            if mode is not None:
+                os.chmod(path, mode)
+        elif name == "chown":
+            user, group = args
+            os.chown(
+                path,
+                pwd.getpwnam(user).pw_uid if user else -1,
+                grp.getgrnam(group).gr_gid if group else -1,
+            )
+        elif name == "write_file":
+            with open(path, "w") as file:
+                file.write(operation.get("content") or "")
+            if mode is not None:
+                os.chmod(path, mode)
+        elif name == "rm":
+            _remove(path, contents_only="contents" in args)
+        elif name == "git":
+            result = subprocess.run(
+                ["git", *args],
+                cwd=path or None,
+                env=_git_env(),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+            )
+            returncode, stdout, stderr = (
+                result.returncode,
+                result.stdout,
+                result.stderr,
+            )
+        else:
+            returncode, stderr = 1, f"Operation '{name}' is not allowed"
+    except Exception as e:
+        returncode, stderr = 1, str(e)
+
+    return {
+        "returncode": returncode,
+        "stdout": stdout,
+        "stderr": stderr,
+        "seconds": time.monotonic() - started,
+    }
+
+
+def execute_batch(operations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Executes operations in order, stopping at the first failure.
+
+    Args:
+        operations (list[dict[str, Any]]): The operations.
+
+    Returns:
+        list[dict[str, Any]]: The results of the executed operations.
+    """
+    results = []
+    for operation in operations:
+        result = execute(operation)
+        results.append(result)
+        if result["returncode"] != 0:
+            break
+    return results
+
+
+def _remove(path: str, contents_only: bool) -> None:
+    """Removes a file or directory tree, or only the contents of a directory."""
+    if not os.path.lexists(path):
+        return
+
+    if not contents_only:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.unlink(path)
+        return
+
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+def _git_env() -> dict[str, str]:
+    """Returns the environment for git, with the home of the current user."""
+    env = dict(os.environ)
+    try:
+        env["HOME"] = pwd.getpwuid(os.getuid()).pw_dir
+    except KeyError:
+        pass
+    # Never wait for credentials, there is no terminal to ask on
+    env["GIT_TERMINAL_PROMPT"] = "0"
+    return env
+
+
+def serve(stdin: IO[bytes], stdout: IO[bytes]) -> None:
+    """Answers batches of operations until stdin is closed.
+
+    Args:
+        stdin (IO[bytes]): The stream requests are read from.
+        stdout (IO[bytes]): The stream results are written to.
+    """
+    write_frame(stdout, {"ready": True, "pid": os.getpid()})
+
+    while True:
+        request = read_frame(stdin)
+        if request is None:
+            return
+        write_frame(stdout, {"results": execute_batch(request["operations"])})
+
+
+if __name__ == "__main__":
+    serve(sys.stdin.buffer, sys.stdout.buffer)
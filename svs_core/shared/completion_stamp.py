@@ -0,0 +1,76 @@
+import grp
+import os
+import pwd
+
+from pathlib import Path
+
+from svs_core.shared.logger import get_logger
+
+
+class CompletionStamp:
+    """Invalidation stamp of the shell completion caches of all users.
+
+    The CLI caches the values its completions offer, per user. Create and
+    delete paths of those objects call `invalidate`, and caches written
+    before the stamp was last touched are discarded by the CLI.
+    """
+
+    PATH = Path("/etc/svs/completion.stamp")
+    """File touched on invalidation, caches older than it are discarded."""
+
+    MODE = 0o660
+    """Permissions of the stamp, touched by the SVS system user and administrators."""
+
+    @staticmethod
+    def create(owner: str = "svs", group: str = "svs-admins") -> None:
+        """Creates the stamp, owned like the other files in /etc/svs.
+
+        Args:
+            owner (str): The user owning the stamp.
+            group (str): The group allowed to touch the stamp.
+
+        Raises:
+            KeyError: If the owner or group does not exist.
+            OSError: If the stamp cannot be created.
+        """
+        uid = pwd.getpwnam(owner).pw_uid
+        gid = grp.getgrnam(group).gr_gid
+
+        CompletionStamp.PATH.touch(exist_ok=True)
+        os.chown(CompletionStamp.PATH, uid, gid)
+        CompletionStamp.PATH.chmod(CompletionStamp.MODE)
+
+    @staticmethod
+    def remove() -> None:
+        """Removes the stamp, if it exists.
+
+        Raises:
+            OSError: If the stamp cannot be removed.
+        """
+        CompletionStamp.PATH.unlink(missing_ok=True)
+
+    @staticmethod
+    def invalidate() -> None:
+        """Discards the completion caches of all users.
+
+        The stamp is created by `svs init`. Failures are logged and otherwise
+        ignored, as the caches expire on their own.
+        """
+        try:
+            os.utime(CompletionStamp.PATH)
+        except OSError as e:
+            get_logger(__name__).warning(
+                f"Failed to invalidate the shell completion caches: {str(e)}"
+            )
+
+    @staticmethod
+    def invalidated_at() -> float:
+        """Returns when the completion caches were last invalidated.
+
+        Returns:
+            float: The modification time of the stamp, 0.0 if it is missing.
+        """
+        try:
+            return CompletionStamp.PATH.stat().st_mtime
+        except OSError:
+            return 0.0
@@ -29,6 +29,13 @@ class EnvManager:
         ENVIRONMENT = "ENVIRONMENT"
         DATABASE_URL = "DATABASE_URL"
         LOG_LEVEL = "LOG_LEVEL"
+        DOCKER_MAX_POOL_SIZE = "DOCKER_MAX_POOL_SIZE"
+        DOCKER_TIMEOUT = "DOCKER_TIMEOUT"
+        FLEET_MAX_WORKERS = "FLEET_MAX_WORKERS"
+        FLEET_MAX_PER_USER = "FLEET_MAX_PER_USER"
+        DOCKER_BUILDKIT = "DOCKER_BUILDKIT"
+        JOB_WORKERS = "JOB_WORKERS"
+        JOB_MAX_PER_USER = "JOB_MAX_PER_USER"
 
     @staticmethod
     def load_env_file() -> None:
@@ -136,3 +143,89 @@ class EnvManager:
         ):
             return logging.INFO
         return logging.DEBUG
+
+    @staticmethod
+    def _get_positive_int(key: EnvVariables, default: int) -> int:
+        """Retrieves a positive integer environment variable.
+
+        Args:
+            key (EnvVariables): The environment variable key.
+            default (int): Value returned when the variable is unset or invalid.
+
+        Returns:
+            int: The parsed value, or the default.
+        """
+        value = EnvManager._get(key)
+        if value and value.strip().isdigit() and int(value) > 0:
+            return int(value)
+        return default
+
+    @staticmethod
+    def get_docker_max_pool_size() -> int:
+        """Retrieves the maximum number of pooled Docker API connections.
+
+        Returns:
+            int: The pool size, defaults to 10.
+        """
+        return EnvManager._get_positive_int(
+            EnvManager.EnvVariables.DOCKER_MAX_POOL_SIZE, 10
+        )
+
+    @staticmethod
+    def get_docker_timeout() -> int:
+        """Retrieves the Docker API request timeout in seconds.
+
+        Returns:
+            int: The timeout, defaults to 60 seconds.
+        """
+        return EnvManager._get_positive_int(EnvManager.EnvVariables.DOCKER_TIMEOUT, 60)
+
+    @staticmethod
+    def get_fleet_max_workers() -> int:
+        """Retrieves how many services fleet operations process concurrently.
+
+        Returns:
+            int: The worker count, defaults to 8.
+        """
+        return EnvManager._get_positive_int(
+            EnvManager.EnvVariables.FLEET_MAX_WORKERS, 8
+        )
+
+    @staticmethod
+    def get_fleet_max_per_user() -> int:
+        """Retrieves the per-user concurrency limit of fleet operations.
+
+        Returns:
+            int: The per-user limit, defaults to 2.
+        """
+        return EnvManager._get_positive_int(
+            EnvManager.EnvVariables.FLEET_MAX_PER_USER, 2
+        )
+
+    @staticmethod
+    def get_job_workers() -> int:
+        """Retrieves how many background jobs the job worker runs concurrently.
+
+        Returns:
+            int: The worker count, defaults to 4.
+        """
+        return EnvManager._get_positive_int(EnvManager.EnvVariables.JOB_WORKERS, 4)
+
+    @staticmethod
+    def get_job_max_per_user() -> int:
+        """Retrieves how many background jobs of a single user may run at once.
+
+        Returns:
+            int: The per-user limit, defaults to 1.
+        """
+        return EnvManager._get_positive_int(EnvManager.EnvVariables.JOB_MAX_PER_USER, 1)
+
+    @staticmethod
+    def get_docker_buildkit() -> bool:
+        """Retrieves whether images are built with BuildKit through the docker CLI.
+
+        Returns:
+            bool: True if `DOCKER_BUILDKIT` is set to 1, true or yes, defaults to False.
+        """
+        value = EnvManager._get(EnvManager.EnvVariables.DOCKER_BUILDKIT)
+        return value is not None and value.strip().lower() in ("1", "true", "yes")
@@ -2,10 +2,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from svs_core.db.models import GitSourceModel, miscelanous_str_injector
+from svs_core.shared.broker import BrokerOperation, CommandBroker
+from svs_core.shared.completion_stamp import CompletionStamp
 from svs_core.shared.exceptions import ValidationException
 from svs_core.shared.http import is_url
 from svs_core.shared.logger import get_logger
-from svs_core.shared.shell import create_directory, run_command
+from svs_core.shared.shell import create_directory
 from svs_core.shared.text import indentate
 
 
@@ -62,6 +64,7 @@ class GitSource(GitSourceModel):
             branch=branch,
         )
         git_source.save()
+        CompletionStamp.invalidate()
         return git_source
 
     def download(self) -> None:
@@ -82,20 +85,26 @@ class GitSource(GitSourceModel):
                 user=self.service.user.name,
             )
 
+        operations = []
         if dest_path.exists():
-            run_command(
-                f"find {self.destination_path} -mindepth 1 -delete",
-                user=self.service.user.name,
+            operations.append(
+                BrokerOperation.rm(self.destination_path, contents_only=True)
             )
         else:
             create_directory(
                 self.destination_path,
                 user=self.service.user.name,
             )
-        run_command(
-            f"git clone --branch {self.branch} {self.repository_url} {self.destination_path}",
-            user=self.service.user.name,
+        operations.append(
+            BrokerOperation.git(
+                "clone",
+                "--branch",
+                self.branch,
+                self.repository_url,
+                self.destination_path,
+            )
         )
+        CommandBroker.run(self.service.user.name, operations)
 
         get_logger(__file__).info(
             f"Successfully cloned repository {self.repository_url} to {self.destination_path}"
@@ -108,14 +117,15 @@ class GitSource(GitSourceModel):
             f"Updating repository {self.repository_url} (branch: {self.branch}) at {self.destination_path}"
         )
 
-        owner = self.service.user.name
-
-        run_command(f"git -C {self.destination_path} fetch", user=owner)
-        run_command(
-            f"git -C {self.destination_path} checkout {self.branch}", user=owner
-        )
-        run_command(
-            f"git -C {self.destination_path} pull origin {self.branch}", user=owner
+        CommandBroker.run(
+            self.service.user.name,
+            [
+                BrokerOperation.git("fetch", cwd=self.destination_path),
+                BrokerOperation.git("checkout", self.branch, cwd=self.destination_path),
+                BrokerOperation.git(
+                    "pull", "origin", self.branch, cwd=self.destination_path
+                ),
+            ],
         )
 
         get_logger(__file__).info(
@@ -128,9 +138,6 @@ class GitSource(GitSourceModel):
         Returns:
             bool: True if the local repository is up to date, False otherwise.
         """
-
-        from svs_core.shared.shell import run_command
-
         get_logger(__file__).info(
             f"Checking for updates in repository {self.repository_url} (branch: {self.branch}) at {self.destination_path}"
         )
@@ -141,16 +148,20 @@ class GitSource(GitSourceModel):
             )
             return False
 
-        owner = self.service.user.name
-
-        run_command(f"git -C {self.destination_path} fetch", user=owner)
-
-        local_commit: str = run_command(
-            f"git -C {self.destination_path} rev-parse {self.branch}", user=owner
-        ).stdout.strip()
-        remote_commit: str = run_command(
-            f"git -C {self.destination_path} rev-parse origin/{self.branch}", user=owner
-        ).stdout.strip()
+        _, local, remote = CommandBroker.run(
+            self.service.user.name,
+            [
+                BrokerOperation.git("fetch", cwd=self.destination_path),
+                BrokerOperation.git(
+                    "rev-parse", self.branch, cwd=self.destination_path
+                ),
+                BrokerOperation.git(
+                    "rev-parse", f"origin/{self.branch}", cwd=self.destination_path
+                ),
+            ],
+        )
+        local_commit: str = local.stdout.strip()
+        remote_commit: str = remote.stdout.strip()
 
         is_up_to_date: bool = local_commit == remote_commit
 
@@ -196,11 +207,12 @@ class GitSource(GitSourceModel):
         )
         dest_path = Path(self.destination_path)
         if dest_path.exists():
-            run_command(
-                f"find {self.destination_path} -mindepth 1 -delete",
-                user=self.service.user.name,
+            CommandBroker.run(
+                self.service.user.name,
+                [BrokerOperation.rm(self.destination_path, contents_only=True)],
             )
         super().delete()
+        CompletionStamp.invalidate()
 
     def __str__(self) -> str:
         return f"GitSource(id={self.id}, repository_url={self.repository_url}, branch={self.branch}, destination_path={self.destination_path}, is_updated={self.is_updated()})"
@@ -0,0 +1,322 @@
+import threading
+import time
+
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, cast
+
+from django.db import close_old_connections, connections
+from django.utils import timezone
+
+from svs_core.db.models import JobModel, JobStatus, miscelanous_str_injector
+from svs_core.shared.env_manager import EnvManager
+from svs_core.shared.exceptions import InvalidOperationException, ValidationException
+from svs_core.shared.logger import get_logger
+from svs_core.shared.text import indentate
+
+JobHandler = Callable[["Job"], dict[str, Any] | None]
+
+
+class Job(JobModel):
+    """Job class representing an operation run in the background by the job worker.
+
+    Operations are registered under a kind with `register`. Enqueued jobs are
+    stored in the database and picked up by `JobWorker`, so the caller never
+    waits for the operation itself.
+    """
+
+    PROGRESS_INTERVAL_SECONDS = 0.5
+    """Minimum time between two progress writes, unless forced."""
+
+    _handlers: dict[str, JobHandler] = {}
+
+    class Meta:  # noqa: D106
+        proxy = True
+
+    @staticmethod
+    def register(kind: str, handler: JobHandler) -> None:
+        """Registers the operation run for jobs of a kind.
+
+        Args:
+            kind (str): The job kind, e.g. `service.build`.
+            handler (JobHandler): Runs the job and returns its JSON-serializable result.
+        """
+        Job._handlers[kind] = handler
+
+    @classmethod
+    def enqueue(
+        cls,
+        kind: str,
+        user_id: int,
+        payload: dict[str, Any] | None = None,
+        service_id: int | None = None,
+        unique: bool = False,
+    ) -> "Job":
+        """Adds a job to the queue.
+
+        Args:
+            kind (str): The job kind, must be registered.
+            user_id (int): The ID of the user enqueuing the job.
+            payload (dict[str, Any] | None): JSON-serializable arguments of the operation.
+            service_id (int | None): The ID of the service the job operates on.
+            unique (bool): Return the unfinished job of the same kind for the
+                same service instead of enqueuing another one.
+
+        Returns:
+            Job: The enqueued job.
+
+        Raises:
+            ValidationException: If the kind is not registered.
+        """
+        if kind not in cls._handlers:
+            raise ValidationException(f"Unknown job kind '{kind}'")
+
+        if unique and service_id is not None:
+            existing = (
+                cls.objects.filter(
+                    kind=kind,
+                    service_id=service_id,
+                    status__in=[JobStatus.QUEUED, JobStatus.RUNNING],
+                )
+                .order_by("id")
+                .first()
+            )
+            if existing is not None:
+                get_logger(__name__).debug(
+                    f"Job '{kind}' for service {service_id} already pending as {existing.id}"
+                )
+                return cast(Job, existing)
+
+        job = cls(
+            kind=kind,
+            user_id=user_id,
+            service_id=service_id,
+            payload=payload or {},
+        )
+        job.save()
+        get_logger(__name__).info(f"Enqueued job {job.id} '{kind}' for user {user_id}")
+        return job
+
+    @classmethod
+    def claim_next(cls, max_per_user: int) -> "Job | None":
+        """Marks the oldest runnable job as running and returns it.
+
+        Jobs of users already running `max_per_user` jobs are skipped, so one
+        user cannot occupy every worker. Claiming is a conditional update, so
+        a job is never handed out twice.
+
+        Args:
+            max_per_user (int): Maximum number of running jobs per user.
+
+        Returns:
+            Job | None: The claimed job, or None if no job is runnable.
+        """
+        running = Counter(
+            cls.objects.filter(status=JobStatus.RUNNING).values_list(
+                "user_id", flat=True
+            )
+        )
+        busy = [user_id for user_id, count in running.items() if count >= max_per_user]
+
+        candidates = (
+            cls.objects.filter(status=JobStatus.QUEUED)
+            .exclude(user_id__in=busy)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        for job_id in candidates[:10]:
+            claimed = cls.objects.filter(id=job_id, status=JobStatus.QUEUED).update(
+                status=JobStatus.RUNNING, started_at=timezone.now()
+            )
+            if claimed:
+                return cast(Job, cls.objects.get(id=job_id))
+
+        return None
+
+    @classmethod
+    def fail_interrupted(cls) -> int:
+        """Fails jobs left running by a worker that exited.
+
+        Returns:
+            int: Number of failed jobs.
+        """
+        failed = cls.objects.filter(status=JobStatus.RUNNING).update(
+            status=JobStatus.FAILED,
+            error="Interrupted by a worker restart",
+            finished_at=timezone.now(),
+        )
+        if failed:
+            get_logger(__name__).warning(f"Failed {failed} interrupted jobs")
+        return int(failed)
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job succeeded or failed."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def run(self) -> None:
+        """Runs the job's operation and records its outcome."""
+        get_logger(__name__).info(f"Running job {self.id} '{self.kind}'")
+        started = time.monotonic()
+
+        try:
+            handler = self._handlers.get(self.kind)
+            if handler is None:
+                raise InvalidOperationException(f"Unknown job kind '{self.kind}'")
+            result = handler(self)
+        except Exception as e:
+            get_logger(__name__).error(f"Job {self.id} '{self.kind}' failed: {str(e)}")
+            self._finish(JobStatus.FAILED, error=str(e))
+            return
+
+        get_logger(__name__).info(
+            f"Job {self.id} '{self.kind}' succeeded in {time.monotonic() - started:.1f}s"
+        )
+        self._finish(JobStatus.SUCCEEDED, result=result)
+
+    def report_progress(self, force: bool = False, **progress: Any) -> None:
+        """Records the progress of the running job.
+
+        Writes are throttled to one per `PROGRESS_INTERVAL_SECONDS`, so
+        operations may report every small step.
+
+        Args:
+            force (bool): Write even if the last write was very recent.
+            **progress (Any): JSON-serializable progress, e.g. `message="Cloning"`.
+        """
+        self.progress = progress
+
+        now = time.monotonic()
+        last = self.__dict__.get("_progress_written_at")
+        if (
+            not force
+            and last is not None
+            and now - last < self.PROGRESS_INTERVAL_SECONDS
+        ):
+            return
+
+        self.__dict__["_progress_written_at"] = now
+        Job.objects.filter(id=self.id).update(progress=progress)
+
+    def _finish(
+        self,
+        status: JobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Records the outcome of the job.
+
+        Args:
+            status (JobStatus): SUCCEEDED or FAILED.
+            result (dict[str, Any] | None): The result of a successful operation.
+            error (str | None): The error of a failed operation.
+        """
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = timezone.now()
+        Job.objects.filter(id=self.id).update(
+            status=status,
+            progress=self.progress,
+            result=result,
+            error=error,
+            finished_at=self.finished_at,
+        )
+
+    def __str__(self) -> str:  # noqa: D105
+        return (
+            f"kind={self.kind}\n"
+            f"id={self.id}\n"
+            f"status={self.status}\n"
+            f"user_id={self.user_id}\n"
+            f"service_id={self.service_id}\n"
+            f"error={self.error}"
+        )
+
+    def pprint(self, indent: int = 0) -> str:
+        """Pretty-print the job details.
+
+        Args:
+            indent (int): The indentation level for formatting.
+
+        Returns:
+            str: The pretty-printed job details.
+        """
+        return indentate(
+            f"""Job {self.id} ({self.kind})
+Status: {self.status}
+Error: {self.error or "-"}
+Misc:
+{miscelanous_str_injector(self, indent + 1)}""",
+            indent,
+        )
+
+
+class JobWorker:
+    """Runs queued jobs in a pool of threads until stopped."""
+
+    POLL_INTERVAL_SECONDS = 1.0
+
+    @staticmethod
+    def run(
+        max_workers: int | None = None,
+        max_per_user: int | None = None,
+        stop: threading.Event | None = None,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Claims and runs jobs until `stop` is set.
+
+        Jobs left running by a previous worker are failed on startup. On stop,
+        the worker waits for the running jobs to finish.
+
+        Args:
+            max_workers (int | None): Number of concurrent jobs, defaults to `JOB_WORKERS`.
+            max_per_user (int | None): Concurrent jobs per user, defaults to `JOB_MAX_PER_USER`.
+            stop (threading.Event | None): Set to stop the worker, runs forever otherwise.
+            poll_interval (float): Seconds between checks for new jobs.
+        """
+        max_workers = max_workers or EnvManager.get_job_workers()
+        max_per_user = max_per_user or EnvManager.get_job_max_per_user()
+        stop = stop or threading.Event()
+
+        Job.fail_interrupted()
+        get_logger(__name__).info(
+            f"Job worker started with {max_workers} workers, {max_per_user} per user"
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="svs-job"
+        ) as pool:
+            running: set[Future[None]] = set()
+
+            while not stop.is_set():
+                close_old_connections()
+
+                while len(running) < max_workers:
+                    job = Job.claim_next(max_per_user)
+                    if job is None:
+                        break
+                    running.add(pool.submit(JobWorker._execute, job))
+
+                if running:
+                    done, _ = wait(
+                        running, timeout=poll_interval, return_when=FIRST_COMPLETED
+                    )
+                    running -= done
+                else:
+                    stop.wait(poll_interval)
+
+        get_logger(__name__).info("Job worker stopped")
+
+    @staticmethod
+    def _execute(job: Job) -> None:
+        """Runs a job in a pool thread.
+
+        Args:
+            job (Job): The claimed job.
+        """
+        try:
+            job.run()
+        finally:
+            # Connections are per thread, do not leak them across pool reuse
+            connections.close_all()
@@ -1,14 +1,181 @@
+import fcntl
+import grp
+import os
+import pwd
 import random
+import threading
 
-from svs_core.shared.exceptions import ResourceException
-from svs_core.shared.shell import run_command
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+from svs_core.shared.exceptions import ResourceException, ValidationException
+from svs_core.shared.logger import get_logger
+
+if TYPE_CHECKING:
+    from svs_core.users.user import User
 
 
 class SystemPortManager:
-    """Class for managing system ports."""
+    """Class for managing system ports.
+
+    Ports are free when they are neither listening nor assigned to a service
+    in the database. A port handed out by `allocate` is only recorded once
+    the service using it is saved, so allocations and the save run in one
+    `reserving` block, which holds a lock file every allocator honours,
+    whatever process it runs in.
+    """
 
     PORT_RANGE = range(49152, 65535)
 
+    PROC_NET_TCP_PATHS = (Path("/proc/net/tcp"), Path("/proc/net/tcp6"))
+    """Kernel socket tables scanned for listening TCP sockets."""
+
+    LOCK_PATH = Path("/etc/svs/ports.lock")
+    """Lock file serializing port allocations across processes."""
+
+    LOCK_MODE = 0o660
+    """Permissions of the lock file, opened by the SVS system user and administrators."""
+
+    _TCP_LISTEN_STATE = "0A"
+
+    _held = threading.local()
+
+    @staticmethod
+    def get_listening_ports() -> set[int]:
+        """Returns all TCP ports currently listening on the host.
+
+        Reads the kernel socket tables directly instead of spawning a subprocess.
+
+        Returns:
+            set[int]: The listening port numbers (IPv4 and IPv6).
+        """
+        ports: set[int] = set()
+
+        for path in SystemPortManager.PROC_NET_TCP_PATHS:
+            try:
+                lines = path.read_text().splitlines()[1:]
+            except OSError as e:
+                get_logger(__name__).debug(f"Could not read {path}: {str(e)}")
+                continue
+
+            for line in lines:
+                fields = line.split()
+                if len(fields) < 4 or fields[3] != SystemPortManager._TCP_LISTEN_STATE:
+                    continue
+                ports.add(int(fields[1].rsplit(":", 1)[1], 16))
+
+        return ports
+
+    @staticmethod
+    def get_assigned_ports() -> set[int]:
+        """Returns all host ports assigned to services in the database.
+
+        Includes ports of stopped services, which are not listening but will be
+        bound again once the service starts.
+
+        Returns:
+            set[int]: The assigned host port numbers.
+        """
+        from svs_core.db.models import ServiceModel
+        from svs_core.docker.json_properties import ExposedPort
+
+        ports: set[int] = set()
+        for exposed_ports in ServiceModel.objects.values_list(
+            "_exposed_ports", flat=True
+        ):
+            for port in ExposedPort.from_dict_array(exposed_ports or []):
+                if port.host_port is not None:
+                    ports.add(port.host_port)
+
+        return ports
+
+    @staticmethod
+    def create_lock(owner: str = "svs", group: str = "svs-admins") -> None:
+        """Creates the lock file, owned like the other files in /etc/svs.
+
+        Args:
+            owner (str): The user owning the lock file.
+            group (str): The group allowed to take the lock.
+
+        Raises:
+            KeyError: If the owner or group does not exist.
+            OSError: If the lock file cannot be created.
+        """
+        uid = pwd.getpwnam(owner).pw_uid
+        gid = grp.getgrnam(group).gr_gid
+
+        SystemPortManager.LOCK_PATH.touch(exist_ok=True)
+        os.chown(SystemPortManager.LOCK_PATH, uid, gid)
+        SystemPortManager.LOCK_PATH.chmod(SystemPortManager.LOCK_MODE)
+
+    @staticmethod
+    def remove_lock() -> None:
+        """Removes the lock file, if it exists.
+
+        Raises:
+            OSError: If the lock file cannot be removed.
+        """
+        SystemPortManager.LOCK_PATH.unlink(missing_ok=True)
+
+    @staticmethod
+    @contextmanager
+    def reserving() -> Iterator[None]:
+        """Holds the allocation lock until the block ends.
+
+        Ports allocated within the block stay reserved until it ends, so the
+        services using them must be saved, and their transaction committed,
+        before. Blocks can be nested, the lock is released when the outermost
+        one ends. The lock file is created by `svs init`.
+
+        Raises:
+            ResourceException: If the lock file cannot be opened.
+        """
+        held = SystemPortManager._held
+        if getattr(held, "ports", None) is not None:
+            yield
+            return
+
+        try:
+            fd = os.open(
+                SystemPortManager.LOCK_PATH,
+                os.O_RDWR | os.O_CREAT,
+                SystemPortManager.LOCK_MODE,
+            )
+        except OSError as e:
+            raise ResourceException(
+                f"Cannot open port lock {SystemPortManager.LOCK_PATH}: {str(e)}"
+            ) from e
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            held.ports = set()
+            try:
+                yield
+            finally:
+                held.ports = None
+        finally:
+            # Closing the file releases the lock
+            os.close(fd)
+
+    @staticmethod
+    def get_used_ports() -> set[int]:
+        """Returns every port that must not be handed out.
+
+        Combines listening sockets, ports assigned in the database and ports
+        allocated within the current `reserving` block.
+
+        Returns:
+            set[int]: The used port numbers.
+        """
+        reserved = getattr(SystemPortManager._held, "ports", None) or set()
+
+        return (
+            SystemPortManager.get_listening_ports()
+            | SystemPortManager.get_assigned_ports()
+            | reserved
+        )
+
     @staticmethod
     def is_port_used(port: int) -> bool:
         """Checks if a given port is currently in use.
@@ -19,31 +186,59 @@ class SystemPortManager:
         Returns:
             bool: True if the port is in use, False otherwise.
         """
-        out = run_command(f"ss -ltn | grep ':{port} '", check=False)
-
-        return out.returncode == 0
+        return port in SystemPortManager.get_listening_ports()
 
     @staticmethod
-    def find_free_port() -> int:
-        """Finds a free port within the defined PORT_RANGE.
+    def allocate(count: int, user: "User | None" = None) -> list[int]:
+        """Finds and reserves `count` distinct free ports within PORT_RANGE.
+
+        The host socket tables and the database are each read once regardless
+        of `count`. The ports stay reserved until the enclosing `reserving`
+        block ends, the service using them must be saved within it. Without
+        an enclosing block, they are only reserved while allocating.
 
-        Tries up to MAX_ATTEMPTS times to find a free port.
+        Args:
+            count (int): The number of ports to allocate.
+            user (User | None): The user the ports are allocated for, used for logging.
 
         Returns:
-            int: A free port number if available.
+            list[int]: The allocated port numbers.
 
         Raises:
-            ResourceException: If no free port is found within the maximum attempts.
+            ValidationException: If count is negative.
+            ResourceException: If fewer than `count` free ports are left in the range.
         """
-        MAX_ATTEMPTS = 50
-        attempts = 0
+        if count < 0:
+            raise ValidationException(f"Port count must not be negative: {count}")
+        if count == 0:
+            return []
+
+        with SystemPortManager.reserving():
+            used = SystemPortManager.get_used_ports()
+
+            free = [port for port in SystemPortManager.PORT_RANGE if port not in used]
+            if len(free) < count:
+                raise ResourceException(
+                    f"Not enough free ports: requested {count}, available {len(free)}"
+                )
 
-        while attempts < MAX_ATTEMPTS:
+            ports = random.sample(free, count)
+            SystemPortManager._held.ports.update(ports)
 
-            port = random.choice(SystemPortManager.PORT_RANGE)
-            if not SystemPortManager.is_port_used(port):
-                return port
+        owner = f" for user '{user.name}'" if user is not None else ""
+        get_logger(__name__).debug(f"Reserved free ports {ports}{owner}")
+        return ports
 
-            attempts += 1
+    @staticmethod
+    def find_free_port() -> int:
+        """Finds and reserves a single free port within the defined PORT_RANGE.
+
+        See `allocate` for how long the port stays reserved.
+
+        Returns:
+            int: A free port number if available.
 
-        raise ResourceException("No free port found")
+        Raises:
+            ResourceException: If no free port is left in the range.
+        """
+        return SystemPortManager.allocate(1)[0]
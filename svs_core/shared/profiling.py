@@ -0,0 +1,278 @@
+import cProfile
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+
+from svs_core.shared.logger import get_logger
+
+
+@dataclass
+class CallStats:
+    """Timing metrics of one kind of call."""
+
+    """Number of calls made."""
+    count: int = 0
+    """Number of calls that failed."""
+    failures: int = 0
+    """Total run time, in seconds."""
+    total_seconds: float = 0.0
+    """Longest run time, in seconds."""
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, failed: bool) -> None:
+        """Adds a single call to the metrics.
+
+        Args:
+            seconds (float): How long the call took.
+            failed (bool): Whether the call failed.
+        """
+        self.count += 1
+        self.failures += int(failed)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+class Profiler:
+    """Records the subprocess, Docker and database calls of the running process.
+
+    Enabled by the global `--profile` CLI option. Call sites report through
+    `record` only while the profiler is enabled, so it costs a single flag
+    check otherwise. Calls are aggregated per category and key, e.g. the
+    `docker` category keyed by endpoint, and printed as a table by `report`.
+    """
+
+    REPORT_LIMIT = 10
+    """Maximum number of rows printed per category."""
+
+    REPORT_WIDTH = 120
+    """Width of the printed report, independent of the terminal's width."""
+
+    _enabled = False
+    _lock = threading.Lock()
+    _calls: dict[tuple[str, str], CallStats] = {}
+    _started: float = 0.0
+    _elapsed: float | None = None
+    _profile: cProfile.Profile | None = None
+    _output: str | None = None
+
+    @staticmethod
+    def start(output: str | None = None) -> None:
+        """Starts recording calls, discarding previously recorded ones.
+
+        Args:
+            output (str | None): If set, the process is also profiled with
+                cProfile and the pstats dump is written to this path on `stop`.
+        """
+        with Profiler._lock:
+            Profiler._calls = {}
+
+        Profiler._started = time.monotonic()
+        Profiler._elapsed = None
+        Profiler._output = output
+        Profiler._enabled = True
+
+        for connection in connections.all():
+            Profiler._install_database_wrapper(connection)
+        connection_created.connect(Profiler._on_connection_created)
+
+        if output:
+            Profiler._profile = cProfile.Profile()
+            Profiler._profile.enable()
+
+        get_logger(__name__).debug("Profiler started")
+
+    @staticmethod
+    def stop() -> None:
+        """Stops recording and writes the pstats dump, if requested."""
+        if not Profiler._enabled:
+            return
+
+        Profiler._enabled = False
+        Profiler._elapsed = time.monotonic() - Profiler._started
+
+        connection_created.disconnect(Profiler._on_connection_created)
+        for connection in connections.all(initialized_only=True):
+            if Profiler._database_wrapper in connection.execute_wrappers:
+                connection.execute_wrappers.remove(Profiler._database_wrapper)
+
+        if Profiler._profile is not None and Profiler._output:
+            Profiler._profile.disable()
+            Profiler._profile.dump_stats(Profiler._output)
+            Profiler._profile = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Returns whether calls are being recorded.
+
+        Returns:
+            bool: True between `start` and `stop`.
+        """
+        return Profiler._enabled
+
+    @staticmethod
+    def record(category: str, key: str, seconds: float, failed: bool = False) -> None:
+        """Records a single call, if the profiler is enabled.
+
+        Args:
+            category (str): The kind of call, e.g. `command`.
+            key (str): What was called, calls with the same key are aggregated.
+            seconds (float): How long the call took.
+            failed (bool): Whether the call failed.
+        """
+        if not Profiler._enabled:
+            return
+
+        with Profiler._lock:
+            Profiler._calls.setdefault((category, key), CallStats()).record(
+                seconds, failed
+            )
+
+    @staticmethod
+    def get_stats() -> dict[tuple[str, str], CallStats]:
+        """Returns the metrics of the calls recorded so far.
+
+        Returns:
+            dict[tuple[str, str], CallStats]: Metrics keyed by category and key.
+        """
+        with Profiler._lock:
+            return dict(Profiler._calls)
+
+    @staticmethod
+    def report() -> None:
+        """Prints the recorded calls to stderr, slowest first per category.
+
+        Command broker operations are included as the `broker` category.
+        """
+        from rich.console import Console
+        from rich.table import Table
+
+        from svs_core.shared.broker import CommandBroker
+
+        stats = Profiler.get_stats()
+        for op, broker_stats in CommandBroker.get_stats().items():
+            calls = CallStats(
+                broker_stats.count,
+                broker_stats.failures,
+                broker_stats.total_seconds,
+                broker_stats.max_seconds,
+            )
+            stats[("broker", op)] = calls
+
+        elapsed = (
+            Profiler._elapsed
+            if Profiler._elapsed is not None
+            else time.monotonic() - Profiler._started
+        )
+
+        table = Table(
+            "Category",
+            "Call",
+            "Count",
+            "Failed",
+            "Total",
+            "Mean",
+            "Max",
+            title=f"Profile ({elapsed * 1000:.1f} ms)",
+        )
+        for category in sorted({category for category, _ in stats}):
+            rows = sorted(
+                (
+                    (key, calls)
+                    for (cat, key), calls in stats.items()
+                    if cat == category
+                ),
+                key=lambda row: row[1].total_seconds,
+                reverse=True,
+            )
+            total = CallStats()
+            for _, calls in rows:
+                total.count += calls.count
+                total.failures += calls.failures
+                total.total_seconds += calls.total_seconds
+                total.max_seconds = max(total.max_seconds, calls.max_seconds)
+
+            for key, calls in rows[: Profiler.REPORT_LIMIT]:
+                table.add_row(category, _shorten(key), *_format_stats(calls))
+            if len(rows) > Profiler.REPORT_LIMIT:
+                table.add_row(
+                    category, f"... {len(rows) - Profiler.REPORT_LIMIT} more", ""
+                )
+            table.add_row(
+                f"[bold]{category}[/bold]", "[bold]total[/bold]", *_format_stats(total)
+            )
+            table.add_section()
+
+        console = Console(stderr=True, width=Profiler.REPORT_WIDTH)
+        console.print(table)
+        if Profiler._output:
+            console.print(
+                f"cProfile stats written to {Profiler._output} "
+                f"(inspect with 'python -m pstats {Profiler._output}')"
+            )
+
+    @staticmethod
+    def _database_wrapper(
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        """Django execute wrapper timing every query.
+
+        Args:
+            execute (Callable[..., Any]): Runs the query.
+            sql (str): The query, with placeholders instead of parameters.
+            params (Any): The query parameters.
+            many (bool): Whether the query is an `executemany` call.
+            context (dict[str, Any]): The connection and cursor.
+
+        Returns:
+            Any: The result of the query.
+        """
+        started = time.monotonic()
+        failed = True
+        try:
+            result = execute(sql, params, many, context)
+            failed = False
+            return result
+        finally:
+            Profiler.record(
+                "database", " ".join(sql.split()), time.monotonic() - started, failed
+            )
+
+    @staticmethod
+    def _install_database_wrapper(connection: BaseDatabaseWrapper) -> None:
+        """Adds the execute wrapper to a connection, once."""
+        if Profiler._database_wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(Profiler._database_wrapper)
+
+    @staticmethod
+    def _on_connection_created(
+        sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any
+    ) -> None:
+        """Instruments connections opened by other threads while enabled."""
+        Profiler._install_database_wrapper(connection)
+
+
+def _format_stats(calls: CallStats) -> tuple[str, str, str, str, str]:
+    """Formats the count, failures and timings of a table row."""
+    mean = calls.total_seconds / calls.count if calls.count else 0.0
+    return (
+        str(calls.count),
+        str(calls.failures),
+        f"{calls.total_seconds * 1000:.1f} ms",
+        f"{mean * 1000:.1f} ms",
+        f"{calls.max_seconds * 1000:.1f} ms",
+    )
+
+
+def _shorten(text: str, length: int = 80) -> str:
+    """Shortens long keys, such as SQL queries, for the table."""
+    return text if len(text) <= length else f"{text[: length - 3]}..."
@@ -6,6 +6,7 @@ import shlex
 import shutil
 import stat
 import subprocess
+import time
 
 from pathlib import Path
 from typing import Mapping
@@ -131,10 +132,76 @@ def run_command(
         len(command),
     )
 
-    result = subprocess.run(
-        command, env=exec_env, check=check, capture_output=True, text=True, shell=True
-    )
+    started = time.monotonic()
+    try:
+        result = subprocess.run(
+            command,
+            env=exec_env,
+            check=check,
+            capture_output=True,
+            text=True,
+            shell=True,
+        )
+    except subprocess.CalledProcessError as e:
+        _profile_command(command, user, started, e)
+        raise
+
+    _profile_command(command, user, started, result)
 
     logger.log(logging.DEBUG, result)
 
     return result
+
+
+def _profile_command(
+    command: str,
+    user: str,
+    started: float,
+    outcome: subprocess.CompletedProcess[str] | subprocess.CalledProcessError,
+) -> None:
+    """Records a finished command in the profile, if profiling is enabled."""
+    from svs_core.shared.profiling import Profiler
+
+    if Profiler.is_enabled():
+        Profiler.record(
+            "command",
+            f"{command_label(command)} as {user}",
+            time.monotonic() - started,
+            outcome.returncode != 0,
+        )
+
+
+def command_label(command: str) -> str:
+    """Returns the program a shell command runs, without its arguments.
+
+    Arguments may contain secrets, so only the program is used to describe
+    commands, e.g. in profiles. Leading `sudo` options and environment
+    assignments are skipped.
+
+    Args:
+        command (str): The shell command.
+
+    Returns:
+        str: The name of the program, e.g. `git`.
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        tokens = command.split()
+
+    skip_value = False
+    in_sudo = False
+    for token in tokens:
+        if skip_value:
+            skip_value = False
+        elif token == "sudo":
+            in_sudo = True
+        elif in_sudo and token.startswith("-"):
+            # Options such as `-u <user>` take a value
+            skip_value = token in ("-u", "-g", "-C", "-D", "-h", "-p", "-U")
+        elif "=" in token and not token.startswith("="):
+            continue
+        else:
+            return os.path.basename(token)
+
+    return "sh"
@@ -1,4 +1,11 @@
-from datetime import datetime
+import re
+
+from datetime import datetime, timedelta, timezone
+
+from svs_core.shared.exceptions import ValidationException
+
+_DURATION_PATTERN = re.compile(r"^(\d+)([smhd])$")
+_DURATION_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
 
 
 def to_goated_time_format(dt: datetime) -> str:
@@ -26,3 +33,45 @@ def indentate(text: str, level: int = 0) -> str:
     indentation = " " * (level * 4)
     res = indentation + text.replace("\n", "\n" + indentation)
     return res
+
+
+def parse_since(value: str, now: datetime | None = None) -> datetime:
+    """Parse a log cursor into a timezone-aware datetime.
+
+    Accepts a relative duration (e.g. "30s", "10m", "2h", "1d"), a Unix
+    timestamp, or an ISO 8601 / RFC 3339 datetime. Naive datetimes are
+    treated as UTC.
+
+    Args:
+        value (str): The value to parse.
+        now (datetime | None): Reference time for relative durations, defaults to the current time.
+
+    Returns:
+        datetime: The parsed point in time.
+
+    Raises:
+        ValidationException: If the value is not in any of the accepted formats.
+    """
+    value = value.strip()
+
+    match = _DURATION_PATTERN.match(value)
+    if match:
+        amount, unit = match.groups()
+        reference = now or datetime.now(timezone.utc)
+        return reference - timedelta(**{_DURATION_UNITS[unit]: int(amount)})
+
+    try:
+        return datetime.fromtimestamp(float(value), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        pass
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValidationException(
+            f"Invalid time '{value}', expected a duration (e.g. 10m), a Unix timestamp or an ISO 8601 datetime"
+        ) from e
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -8,7 +8,21 @@ from svs_core.shared.shell import run_command
 
 
 class SystemUserManager:
-    """Class for managing system users."""
+    """Class for managing system users.
+
+    UID, GID and group membership lookups read the user and group databases
+    through `pwd` and `grp` and are cached per process. The cache is dropped
+    when SVS creates or deletes a user or changes its groups, and whenever
+    `/etc/passwd` or `/etc/group` changed since it was filled, so changes made
+    by other processes are picked up as well.
+    """
+
+    IDENTITY_FILES = ("/etc/passwd", "/etc/group")
+
+    _uids: dict[str, int] = {}
+    _gids: dict[str, int] = {}
+    _groups: dict[str, frozenset[str]] = {}
+    _identity_stamp: tuple[int, ...] | None = None
 
     @staticmethod
     def create_user(
@@ -36,6 +50,7 @@ class SystemUserManager:
             if admin:
                 run_command(f"sudo usermod -aG svs-admins {username}", check=True)
 
+            SystemUserManager.invalidate_identity_cache()
             get_logger(__name__).info(
                 f"Successfully created {'admin' if admin else 'standard'} system user: {username}"
             )
@@ -56,6 +71,7 @@ class SystemUserManager:
 
         try:
             run_command(f"sudo userdel -r {username}", check=True)
+            SystemUserManager.invalidate_identity_cache()
             get_logger(__name__).info(f"Successfully deleted system user: {username}")
         except Exception as e:
             get_logger(__name__).error(
@@ -74,8 +90,33 @@ class SystemUserManager:
         Returns:
             bool: True if the user is in the group, False otherwise.
         """
-        result = run_command(f"groups {username} | grep -qw {groupname}", check=False)
-        return result.returncode == 0
+        SystemUserManager._check_identity_stamp()
+
+        groups = SystemUserManager._groups.get(username)
+        if groups is None:
+            try:
+                user_info = pwd.getpwnam(username)
+            except KeyError:
+                return False
+
+            groups = frozenset(
+                SystemUserManager._group_name(gid)
+                for gid in os.getgrouplist(username, user_info.pw_gid)
+            )
+            SystemUserManager._groups[username] = groups
+
+        return groupname in groups
+
+    @staticmethod
+    def invalidate_identity_cache() -> None:
+        """Drops all cached UIDs, GIDs and group memberships.
+
+        Call after changing users or groups outside of this class.
+        """
+        SystemUserManager._uids.clear()
+        SystemUserManager._gids.clear()
+        SystemUserManager._groups.clear()
+        SystemUserManager._identity_stamp = None
 
     @staticmethod
     def get_system_username() -> str:
@@ -188,12 +229,17 @@ class SystemUserManager:
         Raises:
             KeyError: If the user does not exist.
         """
-        uid = run_command(f"sudo id -u {username}")
+        SystemUserManager._check_identity_stamp()
 
-        if not uid.stdout.strip().isdigit():
-            raise KeyError(f"User '{username}' does not exist.")
+        uid = SystemUserManager._uids.get(username)
+        if uid is None:
+            try:
+                uid = pwd.getpwnam(username).pw_uid
+            except KeyError:
+                raise KeyError(f"User '{username}' does not exist.")
+            SystemUserManager._uids[username] = uid
 
-        return int(uid.stdout.strip())
+        return uid
 
     @staticmethod
     def get_gid(groupname: str) -> int:
@@ -208,11 +254,46 @@ class SystemUserManager:
         Raises:
             KeyError: If the group does not exist.
         """
-        gid = run_command(f"sudo getent group {groupname} | cut -d: -f3", check=True)
-        if not gid.stdout.strip().isdigit():
-            raise KeyError(f"Group '{groupname}' does not exist.")
+        SystemUserManager._check_identity_stamp()
+
+        gid = SystemUserManager._gids.get(groupname)
+        if gid is None:
+            try:
+                gid = grp.getgrnam(groupname).gr_gid
+            except KeyError:
+                raise KeyError(f"Group '{groupname}' does not exist.")
+            SystemUserManager._gids[groupname] = gid
+
+        return gid
+
+    @staticmethod
+    def _group_name(gid: int) -> str:
+        """Returns the name of a group, or its GID if it has no name.
+
+        Args:
+            gid (int): The GID to look up.
+
+        Returns:
+            str: The group name.
+        """
+        try:
+            return grp.getgrgid(gid).gr_name
+        except KeyError:
+            return str(gid)
 
-        return int(gid.stdout.strip())
+    @staticmethod
+    def _check_identity_stamp() -> None:
+        """Drops the identity cache if the user or group database changed."""
+        stamp = []
+        for path in SystemUserManager.IDENTITY_FILES:
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(0)
+
+        if tuple(stamp) != SystemUserManager._identity_stamp:
+            SystemUserManager.invalidate_identity_cache()
+            SystemUserManager._identity_stamp = tuple(stamp)
 
     @staticmethod
     def change_user_password(username: str, new_password: str) -> None:
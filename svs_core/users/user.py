@@ -5,7 +5,10 @@ import re
 from typing import cast
 
 from svs_core.db.models import UserModel
+from svs_core.docker.image import DockerImageManager
 from svs_core.docker.network import DockerNetworkManager
+from svs_core.shared.completion_stamp import CompletionStamp
+from svs_core.shared.env_manager import EnvManager
 from svs_core.shared.exceptions import (
     AlreadyExistsException,
     InvalidOperationException,
@@ -74,6 +77,7 @@ class User(UserModel):
 
         DockerNetworkManager.create_network(name, labels={"svs_user": name})
         SystemUserManager.create_user(name, password, is_admin)
+        CompletionStamp.invalidate()
 
         get_logger(__name__).info(f"Created user: {name}")
         return user
@@ -143,7 +147,7 @@ class User(UserModel):
         """Deletes the user from the database and removes associated resources.
 
         This includes deleting the system user and Docker network
-        associated with the user.
+        associated with the user, and their BuildKit builder.
         """
         get_logger(__name__).info(f"Deleting user '{self.name}'")
 
@@ -158,8 +162,11 @@ class User(UserModel):
         try:
             SystemVolumeManager.delete_user_volumes(self.id)
             DockerNetworkManager.delete_network(self.name)
+            if EnvManager.get_docker_buildkit():
+                DockerImageManager.remove_builder(self.name)
             SystemUserManager.delete_user(self.name)
             super().delete()
+            CompletionStamp.invalidate()
             get_logger(__name__).info(f"Successfully deleted user '{self.name}'")
         except Exception as e:
             get_logger(__name__).error(f"Failed to delete user '{self.name}': {str(e)}")
@@ -1,6 +1,7 @@
 from typing import cast
 
 from svs_core.db.models import UserGroupModel
+from svs_core.shared.completion_stamp import CompletionStamp
 from svs_core.shared.exceptions import AlreadyExistsException
 from svs_core.shared.logger import get_logger
 from svs_core.users.user import User
@@ -29,6 +30,7 @@ class UserGroup(UserGroupModel):
         if cls.objects.filter(name=name).exists():
             raise AlreadyExistsException("user group", name)
         user_group = cls.objects.create(name=name, description=description)
+        CompletionStamp.invalidate()
         get_logger(__name__).info(f"Created user group '{name}'")
 
         return cast(UserGroup, user_group)
@@ -5,7 +5,7 @@ import pytest
 from pytest_mock import MockerFixture
 from typer import Exit
 
-from svs_core.__main__ import global_options, version_callback
+from svs_core.__main__ import global_options, runs_command, version_callback
 
 
 @pytest.mark.cli
@@ -13,9 +13,10 @@ class TestMainCLI:
     @pytest.fixture(autouse=True)
     def reset_context(self):
         """Reset context before each test."""
-        from svs_core.cli.state import current_user, verbose_mode
+        from svs_core.cli.state import current_user, current_user_loader, verbose_mode
 
         current_user.set(None)
+        current_user_loader.set(None)
         verbose_mode.set(False)
 
     def test_version_callback_prints_version(
@@ -44,7 +45,13 @@ class TestMainCLI:
         mocker.patch("svs_core.__main__.add_verbose_handler")
         mocker.patch("svs_core.__main__.get_logger")
 
-        global_options(version_flag=False, verbose=True, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=True,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         assert is_verbose() is True
 
@@ -55,7 +62,13 @@ class TestMainCLI:
         False."""
         from svs_core.cli.state import is_verbose
 
-        global_options(version_flag=False, verbose=False, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=False,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         assert is_verbose() is False
 
@@ -66,7 +79,13 @@ class TestMainCLI:
         mock_add_verbose = mocker.patch("svs_core.__main__.add_verbose_handler")
         mock_logger = mocker.patch("svs_core.__main__.get_logger")
 
-        global_options(version_flag=False, verbose=True, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=True,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         mock_add_verbose.assert_called_once()
 
@@ -77,7 +96,13 @@ class TestMainCLI:
         False."""
         mock_add_verbose = mocker.patch("svs_core.__main__.add_verbose_handler")
 
-        global_options(version_flag=False, verbose=False, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=False,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         mock_add_verbose.assert_not_called()
 
@@ -91,7 +116,13 @@ class TestMainCLI:
             "svs_core.__main__.get_logger", return_value=mock_logger_instance
         )
 
-        global_options(version_flag=False, verbose=True, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=True,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         mock_get_logger.assert_called()
         mock_logger_instance.debug.assert_called_once()
@@ -105,7 +136,13 @@ class TestMainCLI:
             "svs_core.__main__.get_logger", return_value=mock_logger_instance
         )
 
-        global_options(version_flag=False, verbose=False, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=False,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         mock_logger_instance.debug.assert_not_called()
 
@@ -117,7 +154,13 @@ class TestMainCLI:
         mock_add_verbose = mocker.patch("svs_core.__main__.add_verbose_handler")
         mocker.patch("svs_core.__main__.get_logger")
 
-        global_options(version_flag=False, verbose=True, user_override=None)
+        global_options(
+            version_flag=False,
+            verbose=True,
+            user_override=None,
+            profile=False,
+            profile_output=None,
+        )
 
         assert is_verbose() is True
         mock_add_verbose.assert_called_once()
@@ -142,6 +185,7 @@ class TestMainCLI:
         )
         mocker.patch.object(User.objects, "filter", return_value=mock_user_filter)
         mocker.patch.dict("os.environ", {}, clear=False)
+        mocker.patch("svs_core.__main__.runs_command", return_value=True)
         mocker.patch(
             "svs_core.__main__.EnvManager.get_runtime_environment",
             return_value=EnvManager.RuntimeEnvironment.PRODUCTION,
@@ -174,6 +218,7 @@ class TestMainCLI:
         mock_user_filter.first.return_value = mock_user
         mocker.patch.object(User.objects, "filter", return_value=mock_user_filter)
         mocker.patch.dict("os.environ", {"SUDO_USER": "testuser"}, clear=False)
+        mocker.patch("svs_core.__main__.runs_command", return_value=True)
         mock_app = mocker.patch("svs_core.__main__.app")
 
         main()
@@ -196,6 +241,7 @@ class TestMainCLI:
         mock_user_filter.first.return_value = None
         mocker.patch.object(User.objects, "filter", return_value=mock_user_filter)
         mocker.patch.dict("os.environ", {"SUDO_USER": "testuser"}, clear=False)
+        mocker.patch("svs_core.__main__.runs_command", return_value=True)
         mock_logger = mocker.MagicMock()
         mocker.patch("svs_core.__main__.get_logger", return_value=mock_logger)
 
@@ -224,6 +270,7 @@ class TestMainCLI:
         mock_user_filter.first.return_value = mock_user
         mocker.patch.object(User.objects, "filter", return_value=mock_user_filter)
         mocker.patch.dict("os.environ", {"SUDO_USER": "testuser"}, clear=False)
+        mocker.patch("svs_core.__main__.runs_command", return_value=True)
         mock_set_current_user = mocker.patch("svs_core.__main__.set_current_user")
         mock_get_logger = mocker.MagicMock()
         mocker.patch("svs_core.__main__.get_logger", return_value=mock_get_logger)
@@ -233,3 +280,95 @@ class TestMainCLI:
 
         mock_set_current_user.assert_called_once_with("testuser", True)
         mock_app.assert_called_once()
+
+    def test_global_options_starts_profiler(self, mocker: MockerFixture) -> None:
+        """Test that --profile and --profile-output start the profiler."""
+        mock_start = mocker.patch("svs_core.shared.profiling.Profiler.start")
+
+        global_options(
+            version_flag=False,
+            verbose=False,
+            user_override=None,
+            profile=False,
+            profile_output="/tmp/svs.prof",
+        )
+
+        mock_start.assert_called_once_with(output="/tmp/svs.prof")
+
+    def test_main_reports_profile_on_exit(self, mocker: MockerFixture) -> None:
+        """Test that main stops the profiler and prints its report."""
+        from svs_core.__main__ import main
+        from svs_core.users.user import User
+
+        mocker.patch(
+            "svs_core.users.system.SystemUserManager.get_system_username",
+            return_value="testuser",
+        )
+        mock_user = mocker.MagicMock()
+        mock_user.name = "testuser"
+        mock_user.is_admin.return_value = False
+        mock_user_filter = mocker.MagicMock()
+        mock_user_filter.first.return_value = mock_user
+        mocker.patch.object(User.objects, "filter", return_value=mock_user_filter)
+        mocker.patch.dict("os.environ", {"SUDO_USER": "testuser"}, clear=False)
+        mocker.patch("svs_core.__main__.runs_command", return_value=True)
+        mocker.patch("svs_core.__main__.app", side_effect=SystemExit(0))
+        mocker.patch("svs_core.shared.profiling.Profiler.is_enabled", return_value=True)
+        mock_stop = mocker.patch("svs_core.shared.profiling.Profiler.stop")
+        mock_report = mocker.patch("svs_core.shared.profiling.Profiler.report")
+
+        with pytest.raises(SystemExit):
+            main()
+
+        mock_stop.assert_called_once()
+        mock_report.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            ([], False),
+            (["--version"], False),
+            (["--help"], False),
+            (["service", "--help"], False),
+            (["service", "list"], True),
+            (["-v", "user", "list"], True),
+            (["-u", "alice", "service", "list"], True),
+            (["--user", "service"], False),
+            (["--profile-output", "/tmp/svs.prof", "--version"], False),
+        ],
+    )
+    def test_runs_command(self, args: list[str], expected: bool) -> None:
+        """Test that only subcommand invocations need the acting user."""
+        assert runs_command(args) is expected
+
+    def test_main_skips_authentication_without_command(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that main does not look the user up for --version."""
+        mocker.patch.object(sys, "argv", ["svs", "--version"])
+        mock_authenticate = mocker.patch("svs_core.__main__._authenticate")
+
+        from svs_core.__main__ import main
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        assert "SVS version:" in capsys.readouterr().out
+        mock_authenticate.assert_not_called()
+
+    def test_main_defers_user_lookup_during_completion(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that completion only looks the user up when it is needed."""
+        from svs_core.__main__ import load_system_user, main
+
+        mocker.patch.dict("os.environ", {"_SVS_COMPLETE": "bash_complete"})
+        mock_set_loader = mocker.patch("svs_core.__main__.set_current_user_loader")
+        mock_authenticate = mocker.patch("svs_core.__main__._authenticate")
+        mocker.patch("svs_core.__main__.app")
+
+        main()
+
+        mock_authenticate.assert_not_called()
+        mock_set_loader.assert_called_once_with(load_system_user)
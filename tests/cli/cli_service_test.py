@@ -4,6 +4,7 @@ from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from svs_core.__main__ import app
+from svs_core.docker.build_progress import BuildEvent, BuildResult, BuildStepTiming
 
 
 @pytest.mark.cli
@@ -15,16 +16,17 @@ class TestServiceCommands:
 
     def test_list_services_admin(self, mocker: MockerFixture) -> None:
         mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
-        mock_all = mocker.patch("svs_core.docker.service.Service.objects.all")
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
         mock_service = mocker.MagicMock()
         mock_service.id = 1
         mock_service.name = "test_service"
         mock_service.user.name = "admin"
         mock_service.user.id = 1
         mock_service.status = "running"
+        mock_service.state_checked_at = None
         mock_service.template.name = "test_template"
         mock_service.template.id = 1
-        mock_all.return_value = [mock_service]
+        mock_listing.return_value = [mock_service]
 
         result = self.runner.invoke(
             app,
@@ -39,13 +41,15 @@ class TestServiceCommands:
     def test_list_services_non_admin(self, mocker: MockerFixture) -> None:
         mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=False)
         mocker.patch("svs_core.cli.service.get_current_username", return_value="user1")
-        mock_filter = mocker.patch("svs_core.docker.service.Service.objects.filter")
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
+        mock_filter = mock_listing.return_value.filter
         mock_service = mocker.MagicMock()
         mock_service.id = 2
         mock_service.name = "user1_service"
         mock_service.user.name = "user1"
         mock_service.user.id = 2
         mock_service.status = "stopped"
+        mock_service.state_checked_at = None
         mock_service.template.name = "web_template"
         mock_service.template.id = 2
         mock_filter.return_value = [mock_service]
@@ -62,8 +66,8 @@ class TestServiceCommands:
 
     def test_list_services_empty(self, mocker: MockerFixture) -> None:
         mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
-        mock_all = mocker.patch("svs_core.docker.service.Service.objects.all")
-        mock_all.return_value = []
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
+        mock_listing.return_value = []
 
         result = self.runner.invoke(
             app,
@@ -75,10 +79,11 @@ class TestServiceCommands:
 
     def test_list_services_inline_admin(self, mocker: MockerFixture) -> None:
         mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
-        mock_all = mocker.patch("svs_core.docker.service.Service.objects.all")
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
         mock_service = mocker.MagicMock()
         mock_service.__str__.return_value = "Service(name='test_service')"
-        mock_all.return_value = [mock_service]
+        mock_service.state_checked_at = None
+        mock_listing.return_value = [mock_service]
 
         result = self.runner.invoke(
             app,
@@ -91,9 +96,11 @@ class TestServiceCommands:
     def test_list_services_inline_non_admin(self, mocker: MockerFixture) -> None:
         mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=False)
         mocker.patch("svs_core.cli.service.get_current_username", return_value="user1")
-        mock_filter = mocker.patch("svs_core.docker.service.Service.objects.filter")
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
+        mock_filter = mock_listing.return_value.filter
         mock_service = mocker.MagicMock()
         mock_service.__str__.return_value = "Service(name='user1_service')"
+        mock_service.state_checked_at = None
         mock_filter.return_value = [mock_service]
 
         result = self.runner.invoke(
@@ -104,6 +111,45 @@ class TestServiceCommands:
         assert result.exit_code == 0
         assert "Service(name='user1_service')" in result.output
 
+    def test_list_services_resolves_statuses_in_bulk(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
+        services = []
+        for i in range(2):
+            mock_service = mocker.MagicMock()
+            mock_service.name = f"service_{i}"
+            mock_service.status = "running"
+            mock_service.state_checked_at = None
+            services.append(mock_service)
+        mock_listing.return_value = services
+        mock_resolve = mocker.patch(
+            "svs_core.cli.service.Service.resolve_statuses", return_value=services
+        )
+
+        result = self.runner.invoke(app, ["service", "list"])
+
+        assert result.exit_code == 0
+        mock_resolve.assert_called_once_with(services, recorded=True)
+
+    def test_list_services_live(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+        mock_listing = mocker.patch("svs_core.docker.service.Service.objects.listing")
+        mock_service = mocker.MagicMock()
+        mock_service.name = "service"
+        mock_service.status = "running"
+        mock_listing.return_value = [mock_service]
+        mock_resolve = mocker.patch(
+            "svs_core.cli.service.Service.resolve_statuses",
+            return_value=[mock_service],
+        )
+
+        result = self.runner.invoke(app, ["service", "list", "--live"])
+
+        assert result.exit_code == 0
+        mock_resolve.assert_called_once_with([mock_service], recorded=False)
+
     def test_create_service(self, mocker: MockerFixture) -> None:
         mock_user = mocker.MagicMock()
         mock_user_get = mocker.patch("svs_core.users.user.User.objects.get")
@@ -131,6 +177,7 @@ class TestServiceCommands:
         mock_service.name = "test_service"
         mock_service.id = 1
         mock_service.status = "running"
+        mock_service.state_checked_at = None
         mock_service.user.name = "admin"
         mock_service.__str__.return_value = (
             "name=test_service\n"
@@ -633,6 +680,108 @@ class TestServiceCommands:
         assert "Service 'test_service' stopped successfully." in result.output
         mock_service.stop.assert_called_once()
 
+    def test_restart_service_admin(self, mocker: MockerFixture) -> None:
+        mock_get = mocker.patch("svs_core.docker.service.Service.objects.get")
+        mock_service = mocker.MagicMock()
+        mock_service.name = "test_service"
+        mock_service.user.name = "other_user"
+        mock_get.return_value = mock_service
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+
+        result = self.runner.invoke(
+            app,
+            ["service", "restart", "1"],
+        )
+
+        assert result.exit_code == 0
+        assert "Service 'test_service' restarted successfully." in result.output
+        mock_service.restart.assert_called_once()
+
+    def test_stop_all_services_admin(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+        mock_select = mocker.patch(
+            "svs_core.docker.service.Service.objects.select_related"
+        )
+        services = []
+        for i in range(3):
+            mock_service = mocker.MagicMock()
+            mock_service.name = f"svc{i}"
+            mock_service.user_id = i % 2
+            services.append(mock_service)
+        mock_select.return_value = services
+
+        result = self.runner.invoke(app, ["service", "stop", "--all"])
+
+        assert result.exit_code == 0
+        assert "Stop succeeded for 3 of 3 service(s)." in result.output
+        for mock_service in services:
+            mock_service.stop.assert_called_once()
+
+    def test_start_user_services_reports_failures(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+        mock_select = mocker.patch(
+            "svs_core.docker.service.Service.objects.select_related"
+        )
+        ok_service = mocker.MagicMock(user_id=1)
+        ok_service.name = "ok"
+        bad_service = mocker.MagicMock(user_id=1)
+        bad_service.name = "bad"
+        bad_service.start.side_effect = Exception("container missing")
+        mock_select.return_value.filter.return_value = [ok_service, bad_service]
+
+        result = self.runner.invoke(app, ["service", "start", "--user", "alice"])
+
+        assert result.exit_code == 1
+        mock_select.return_value.filter.assert_called_once_with(user__name="alice")
+        assert "Start succeeded for 1 of 2 service(s)." in result.output
+        assert "failed to start service 'bad': container missing" in result.output
+        ok_service.start.assert_called_once()
+
+    def test_fleet_non_admin_limited_to_own_services(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=False)
+        mocker.patch(
+            "svs_core.cli.service.get_current_username", return_value="current_user"
+        )
+        mock_select = mocker.patch(
+            "svs_core.docker.service.Service.objects.select_related"
+        )
+        mock_own = mock_select.return_value.filter
+        mock_own.return_value.filter.return_value = []
+
+        result = self.runner.invoke(app, ["service", "restart", "--template", "3"])
+
+        assert result.exit_code == 0
+        mock_own.assert_called_once_with(user__name="current_user")
+        mock_own.return_value.filter.assert_called_once_with(template_id=3)
+        assert "No services found." in result.output
+
+    def test_fleet_non_admin_other_user_denied(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=False)
+        mocker.patch(
+            "svs_core.cli.service.get_current_username", return_value="current_user"
+        )
+
+        result = self.runner.invoke(app, ["service", "stop", "--user", "someone"])
+
+        assert result.exit_code == 1
+        assert "permission to manage services of other users" in result.output
+
+    def test_fleet_options_conflict_with_service_id(
+        self, mocker: MockerFixture
+    ) -> None:
+        result = self.runner.invoke(app, ["service", "start", "1", "--all"])
+
+        assert result.exit_code == 1
+        assert "not both" in result.output
+
+    def test_start_requires_target(self, mocker: MockerFixture) -> None:
+        result = self.runner.invoke(app, ["service", "start"])
+
+        assert result.exit_code == 1
+        assert "Specify a service ID" in result.output
+
     def test_logs_admin(self, mocker: MockerFixture) -> None:
         mock_get = mocker.patch("svs_core.docker.service.Service.objects.get")
         mock_service = mocker.MagicMock()
@@ -674,6 +823,63 @@ class TestServiceCommands:
         assert "Container logs here" in result.output
         mock_service.get_logs.assert_called_once()
 
+    def test_logs_follow_streams_lines(self, mocker: MockerFixture) -> None:
+        mock_get = mocker.patch("svs_core.docker.service.Service.objects.get")
+        mock_service = mocker.MagicMock()
+        mock_service.name = "test_service"
+        mock_service.user.name = "other_user"
+        mock_service.stream_logs.return_value = iter(["first [bold]", "second"])
+        mock_get.return_value = mock_service
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+
+        result = self.runner.invoke(
+            app,
+            ["service", "logs", "1", "--follow", "--tail", "10"],
+        )
+
+        assert result.exit_code == 0
+        assert "first [bold]\nsecond\n" in result.output
+        mock_service.stream_logs.assert_called_once_with(
+            since=None, tail=10, follow=True
+        )
+        mock_service.get_logs.assert_not_called()
+
+    def test_logs_since_without_follow(self, mocker: MockerFixture) -> None:
+        mock_get = mocker.patch("svs_core.docker.service.Service.objects.get")
+        mock_service = mocker.MagicMock()
+        mock_service.name = "test_service"
+        mock_service.user.name = "other_user"
+        mock_service.stream_logs.return_value = iter(["recent"])
+        mock_get.return_value = mock_service
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+
+        result = self.runner.invoke(
+            app,
+            ["service", "logs", "1", "--since", "2024-01-01T00:00:00Z"],
+        )
+
+        assert result.exit_code == 0
+        assert "recent" in result.output
+        kwargs = mock_service.stream_logs.call_args.kwargs
+        assert kwargs["since"].isoformat() == "2024-01-01T00:00:00+00:00"
+        assert kwargs["follow"] is False
+
+    def test_logs_invalid_since(self, mocker: MockerFixture) -> None:
+        mock_get = mocker.patch("svs_core.docker.service.Service.objects.get")
+        mock_service = mocker.MagicMock()
+        mock_service.user.name = "other_user"
+        mock_get.return_value = mock_service
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=True)
+
+        result = self.runner.invoke(
+            app,
+            ["service", "logs", "1", "--since", "yesterday"],
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid time 'yesterday'" in result.output
+        mock_service.stream_logs.assert_not_called()
+
     def test_logs_unauthorized(self, mocker: MockerFixture) -> None:
         mock_get = mocker.patch("svs_core.docker.service.Service.objects.get")
         mock_service = mocker.MagicMock()
@@ -719,6 +925,7 @@ class TestServiceCommands:
         mock_service = mocker.MagicMock()
         mock_service.id = 1
         mock_service.name = "test_build_service"
+        mock_service.build.return_value = BuildResult()
         mock_service.user.name = "current_user"
 
         mocker.patch("svs_core.cli.service.get_or_exit", return_value=mock_service)
@@ -736,6 +943,43 @@ class TestServiceCommands:
         assert "built successfully" in result.output
         mock_service.build.assert_called_once()
 
+    def test_build_service_prints_step_timings(self, mocker: MockerFixture) -> None:
+        """Test that step events update the progress and timings are printed."""
+        mock_service = mocker.MagicMock()
+        mock_service.id = 1
+        mock_service.name = "test_build_service"
+        mock_service.user.name = "current_user"
+
+        def build(path, on_event, force, blue_green):
+            on_event(BuildEvent(BuildEvent.STEP, "FROM alpine", 1, 2))
+            on_event(BuildEvent(BuildEvent.STEP, "RUN make", 2, 2))
+            return BuildResult(
+                image_id="sha256:abc",
+                steps=[
+                    BuildStepTiming(1, "FROM alpine", 0.5),
+                    BuildStepTiming(2, "RUN make", 12.3),
+                ],
+                duration_seconds=12.8,
+            )
+
+        mock_service.build.side_effect = build
+
+        mocker.patch("svs_core.cli.service.get_or_exit", return_value=mock_service)
+        mocker.patch("svs_core.cli.service.is_current_user_admin", return_value=False)
+        mocker.patch(
+            "svs_core.cli.service.get_current_username", return_value="current_user"
+        )
+
+        result = self.runner.invoke(
+            app,
+            ["service", "build", "1", "/tmp/source"],
+        )
+
+        assert result.exit_code == 0
+        assert "built successfully in 12.8s" in result.output
+        assert "RUN make" in result.output
+        assert "12.3s" in result.output
+
     def test_build_service_permission_denied(self, mocker: MockerFixture) -> None:
         """Test building a service without permission."""
         mock_service = mocker.MagicMock()
@@ -763,6 +1007,7 @@ class TestServiceCommands:
         mock_service = mocker.MagicMock()
         mock_service.id = 1
         mock_service.name = "other_user_service"
+        mock_service.build.return_value = BuildResult()
         mock_service.user.name = "other_user"
 
         mocker.patch("svs_core.cli.service.get_or_exit", return_value=mock_service)
@@ -4,11 +4,13 @@ from pytest_mock import MockerFixture
 
 from svs_core.cli.state import (
     current_user,
+    current_user_loader,
     get_current_username,
     is_current_user_admin,
     is_verbose,
     reject_if_not_admin,
     set_current_user,
+    set_current_user_loader,
     set_verbose_mode,
     verbose_mode,
 )
@@ -20,6 +22,7 @@ class TestState:
     def reset_context(self):
         """Reset context variables before each test."""
         current_user.set(None)
+        current_user_loader.set(None)
         verbose_mode.set(False)
 
     def test_set_current_user(self) -> None:
@@ -35,6 +38,25 @@ class TestState:
         current_user.set(None)
         assert get_current_username() is None
 
+    def test_current_user_loader_runs_once_on_first_access(
+        self, mocker: MockerFixture
+    ) -> None:
+        loader = mocker.MagicMock(side_effect=lambda: set_current_user("bob", True))
+        set_current_user_loader(loader)
+
+        loader.assert_not_called()
+        assert get_current_username() == "bob"
+        assert is_current_user_admin() is True
+        loader.assert_called_once()
+
+    def test_current_user_loader_without_user(self, mocker: MockerFixture) -> None:
+        loader = mocker.MagicMock()
+        set_current_user_loader(loader)
+
+        assert get_current_username() is None
+        assert get_current_username() is None
+        loader.assert_called_once()
+
     def test_is_current_user_admin_true(self) -> None:
         set_current_user("admin_user", True)
         assert is_current_user_admin() is True
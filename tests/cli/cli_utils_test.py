@@ -124,3 +124,41 @@ class TestUtilsCommands:
         assert result.exit_code == 0
         assert "Migrations completed successfully" in result.output
         mock_run.assert_called_once()
+
+    # reconcile command tests
+    def test_reconcile_without_admin(self, mocker: MockerFixture) -> None:
+        """Test reconcile command without admin rights."""
+        mocker.patch(
+            "svs_core.cli.utils.reject_if_not_admin", side_effect=SystemExit(1)
+        )
+
+        result = self.runner.invoke(app, ["utils", "reconcile"])
+
+        assert result.exit_code == 1
+
+    def test_reconcile_single_pass(self, mocker: MockerFixture) -> None:
+        """Test reconcile runs a single pass by default."""
+        mocker.patch("svs_core.cli.utils.reject_if_not_admin")
+        mock_reconcile = mocker.patch(
+            "svs_core.cli.utils.ServiceStateReconciler.reconcile", return_value=2
+        )
+        mock_watch = mocker.patch("svs_core.cli.utils.ServiceStateReconciler.watch")
+
+        result = self.runner.invoke(app, ["utils", "reconcile"])
+
+        assert result.exit_code == 0
+        assert "2 changed" in result.output
+        mock_reconcile.assert_called_once()
+        mock_watch.assert_not_called()
+
+    def test_reconcile_watch(self, mocker: MockerFixture) -> None:
+        """Test reconcile --watch keeps watching with the given interval."""
+        mocker.patch("svs_core.cli.utils.reject_if_not_admin")
+        mock_watch = mocker.patch("svs_core.cli.utils.ServiceStateReconciler.watch")
+
+        result = self.runner.invoke(
+            app, ["utils", "reconcile", "--watch", "--interval", "10"]
+        )
+
+        assert result.exit_code == 0
+        mock_watch.assert_called_once_with(10)
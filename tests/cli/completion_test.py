@@ -0,0 +1,203 @@
+import json
+import os
+import time
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import typer
+
+from pytest_mock import MockerFixture
+from typer import _click
+from typer._completion_classes import BashComplete
+from typer.core import TyperGroup
+
+from svs_core.__main__ import SvsGroup
+from svs_core.cli.completion import CompletionCache
+from svs_core.cli.lazy import LazyGroup, LazySubcommand
+from svs_core.shared.completion_stamp import CompletionStamp
+
+service_app = typer.Typer()
+
+
+def complete_service_id(incomplete: str) -> list[tuple[str, str]]:
+    return [("1", "web"), ("2", "db"), ("12", "cache")]
+
+
+def complete_tail(incomplete: str) -> list[str]:
+    return ["10", "100"]
+
+
+@service_app.command("start")
+def start(
+    service_id: int = typer.Argument(..., autocompletion=complete_service_id),
+    follow: bool = typer.Option(False, "--follow/--no-follow"),
+    tail: int = typer.Option(10, "--tail", autocompletion=complete_tail),
+) -> None:
+    pass
+
+
+@service_app.command("stop")
+def stop() -> None:
+    pass
+
+
+class CachedGroup(LazyGroup):
+    # The module does not exist, completing must not import it
+    subcommands = {
+        "service": LazySubcommand("svs_core.cli.missing:app", "Manage services"),
+    }
+
+    def get_cached_command(self, name: str) -> _click.Command | None:
+        return CompletionCache.get_command(name)
+
+
+def complete(args: list[str], incomplete: str) -> list[tuple[str, str | None]]:
+    completer = BashComplete(CachedGroup(name="svs"), {}, "svs", "_SVS_COMPLETE")
+    return [
+        (item.value, item.help) for item in completer.get_completions(args, incomplete)
+    ]
+
+
+@pytest.mark.cli
+class TestCompletionCache:
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(CompletionStamp, "PATH", tmp_path / "stamp")
+        return tmp_path
+
+    @pytest.fixture
+    def mock_refresh(self, mocker: MockerFixture) -> MagicMock:
+        return mocker.patch(
+            "svs_core.cli.completion.CompletionCache.refresh_in_background"
+        )
+
+    @pytest.fixture
+    def warm(self, mock_refresh: MagicMock) -> None:
+        root = TyperGroup(
+            name="svs", commands={"service": typer.main.get_group(service_app)}
+        )
+        CompletionCache.refresh(root)
+
+    def test_refresh_writes_cache(self, warm: None) -> None:
+        path = CompletionCache.path()
+        cache = json.loads(path.read_text())
+
+        assert path.parent.name == "svs"
+        assert cache["version"] == CompletionCache.VERSION
+        assert set(cache["commands"]["service"]["commands"]) == {"start", "stop"}
+        assert [
+            ["1", "web"],
+            ["2", "db"],
+            ["12", "cache"],
+        ] in cache["values"]
+        assert list(path.parent.glob(".*")) == []
+
+    def test_completes_arguments_from_cache(self, warm: None) -> None:
+        assert complete(["service", "start"], "1") == [("1", "web"), ("12", "cache")]
+
+    def test_completes_option_values_from_cache(self, warm: None) -> None:
+        assert complete(["service", "start", "--tail"], "1") == [
+            ("10", None),
+            ("100", None),
+        ]
+
+    def test_flags_do_not_take_values(self, warm: None) -> None:
+        assert complete(["service", "start", "--no-follow"], "2") == [("2", "db")]
+
+    def test_completes_subcommand_and_option_names(self, warm: None) -> None:
+        assert [value for value, _ in complete(["service"], "st")] == [
+            "start",
+            "stop",
+        ]
+        assert [value for value, _ in complete(["service", "start"], "--")] == [
+            "--follow",
+            "--no-follow",
+            "--tail",
+            "--help",
+        ]
+
+    def test_missing_cache_is_refreshed(self, mock_refresh: MagicMock) -> None:
+        assert CompletionCache.get_command("service") is None
+        mock_refresh.assert_called_once()
+
+    def test_fresh_cache_is_not_refreshed(
+        self, warm: None, mock_refresh: MagicMock
+    ) -> None:
+        assert CompletionCache.get_command("service") is not None
+        mock_refresh.assert_not_called()
+
+    def test_expired_cache_is_served_and_refreshed(
+        self, warm: None, mock_refresh: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(CompletionCache, "TTL_SECONDS", -1)
+
+        assert CompletionCache.get_command("service") is not None
+        mock_refresh.assert_called_once()
+
+    def test_invalidate_discards_cache(self, warm: None) -> None:
+        CompletionStamp.PATH.touch()
+        os.utime(CompletionStamp.PATH, (0, 0))
+        assert CompletionCache.load() is not None
+
+        CompletionStamp.invalidate()
+
+        assert CompletionCache.load() is None
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json", "[]", json.dumps({"version": CompletionCache.VERSION + 1})],
+    )
+    def test_unusable_cache_is_ignored(self, content: str) -> None:
+        path = CompletionCache.path()
+        path.parent.mkdir(parents=True)
+        path.write_text(content)
+
+        assert CompletionCache.load() is None
+
+    def test_refresh_in_background_spawns_once(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("_SVS_COMPLETE", "bash_complete")
+        mock_popen = mocker.patch("svs_core.cli.completion.subprocess.Popen")
+
+        CompletionCache.refresh_in_background()
+        CompletionCache.refresh_in_background()
+
+        mock_popen.assert_called_once()
+        args, kwargs = mock_popen.call_args
+        assert args[0][1:] == ["-m", "svs_core.cli.completion"]
+        assert "_SVS_COMPLETE" not in kwargs["env"]
+        assert kwargs["start_new_session"] is True
+
+    def test_refresh_in_background_replaces_abandoned_lock(
+        self, mocker: MockerFixture
+    ) -> None:
+        mock_popen = mocker.patch("svs_core.cli.completion.subprocess.Popen")
+        lock = CompletionCache.path().with_suffix(".lock")
+        lock.parent.mkdir(parents=True)
+        lock.touch()
+        abandoned = time.time() - CompletionCache.REFRESH_TIMEOUT - 1
+        os.utime(lock, (abandoned, abandoned))
+
+        CompletionCache.refresh_in_background()
+
+        mock_popen.assert_called_once()
+
+    def test_svs_group_uses_cache_only_when_completing(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mock_get = mocker.patch(
+            "svs_core.cli.completion.CompletionCache.get_command", return_value=None
+        )
+        group = SvsGroup(name="svs")
+
+        monkeypatch.delenv("_SVS_COMPLETE", raising=False)
+        assert group.get_cached_command("service") is None
+        mock_get.assert_not_called()
+
+        monkeypatch.setenv("_SVS_COMPLETE", "bash_complete")
+        assert group.get_cached_command("service") is None
+        mock_get.assert_called_once_with("service")
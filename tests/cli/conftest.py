@@ -0,0 +1,16 @@
+import importlib
+
+import pytest
+
+from svs_core.__main__ import SvsGroup
+
+
+@pytest.fixture(scope="session", autouse=True)
+def load_subcommands():
+    """Import every subcommand up front.
+
+    Importing a subcommand can define proxy models, which resets model
+    managers a test has already patched.
+    """
+    for subcommand in SvsGroup.subcommands.values():
+        importlib.import_module(subcommand.target.partition(":")[0])
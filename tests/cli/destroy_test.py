@@ -129,6 +129,56 @@ class TestRemoveConfigDirs:
         mock_remove.assert_called_once_with("/etc/svs/svs.log")
 
 
+class TestRemoveCompletionStamp:
+    @pytest.mark.unit
+    def test_removes_stamp(self, mocker: MockerFixture) -> None:
+        mock_remove = mocker.patch(
+            "svs_core.shared.completion_stamp.CompletionStamp.remove"
+        )
+
+        destroy_module._remove_completion_stamp()
+
+        mock_remove.assert_called_once_with()
+
+    @pytest.mark.unit
+    def test_warns_on_failure(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        mocker.patch(
+            "svs_core.shared.completion_stamp.CompletionStamp.remove",
+            side_effect=PermissionError("denied"),
+        )
+
+        destroy_module._remove_completion_stamp()
+
+        assert "Could not remove" in capsys.readouterr().out
+
+
+class TestRemovePortLock:
+    @pytest.mark.unit
+    def test_removes_lock(self, mocker: MockerFixture) -> None:
+        mock_remove = mocker.patch(
+            "svs_core.shared.ports.SystemPortManager.remove_lock"
+        )
+
+        destroy_module._remove_port_lock()
+
+        mock_remove.assert_called_once_with()
+
+    @pytest.mark.unit
+    def test_warns_on_failure(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        mocker.patch(
+            "svs_core.shared.ports.SystemPortManager.remove_lock",
+            side_effect=PermissionError("denied"),
+        )
+
+        destroy_module._remove_port_lock()
+
+        assert "Could not remove" in capsys.readouterr().out
+
+
 class TestCleanSudoers:
     @pytest.mark.unit
     def test_no_sudoers_file(self, mocker: MockerFixture) -> None:
@@ -439,6 +439,56 @@ class TestCreateAdminUser:
             init_module._create_admin_user(None, non_interactive=False)
 
 
+class TestCreateCompletionStamp:
+    @pytest.mark.unit
+    def test_creates_stamp(self, mocker: MockerFixture) -> None:
+        mock_create = mocker.patch(
+            "svs_core.shared.completion_stamp.CompletionStamp.create"
+        )
+
+        init_module._create_completion_stamp()
+
+        mock_create.assert_called_once_with()
+
+    @pytest.mark.unit
+    def test_warns_on_failure(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        mocker.patch(
+            "svs_core.shared.completion_stamp.CompletionStamp.create",
+            side_effect=KeyError("svs"),
+        )
+
+        init_module._create_completion_stamp()
+
+        assert "Could not create" in capsys.readouterr().out
+
+
+class TestCreatePortLock:
+    @pytest.mark.unit
+    def test_creates_lock(self, mocker: MockerFixture) -> None:
+        mock_create = mocker.patch(
+            "svs_core.shared.ports.SystemPortManager.create_lock"
+        )
+
+        init_module._create_port_lock()
+
+        mock_create.assert_called_once_with()
+
+    @pytest.mark.unit
+    def test_warns_on_failure(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        mocker.patch(
+            "svs_core.shared.ports.SystemPortManager.create_lock",
+            side_effect=KeyError("svs-admins"),
+        )
+
+        init_module._create_port_lock()
+
+        assert "Could not create" in capsys.readouterr().out
+
+
 class TestInstallCompletions:
     @pytest.mark.unit
     def test_skips_when_already_installed(self, mocker: MockerFixture) -> None:
@@ -0,0 +1,87 @@
+import pytest
+
+from pytest_mock import MockerFixture
+from typer import _click
+from typer.core import TyperGroup
+from typer.testing import CliRunner
+
+from svs_core.__main__ import SvsGroup, app
+from svs_core.cli.lazy import LazyGroup, LazySubcommand
+
+
+class FakeGroup(LazyGroup):
+    subcommands = {
+        "user": LazySubcommand("svs_core.cli.user:app", "Manage users"),
+        "init": LazySubcommand(
+            "svs_core.cli.init:init_cmd", "Initialize", needs_django=False
+        ),
+    }
+
+
+@pytest.mark.cli
+class TestLazyGroup:
+    @pytest.fixture
+    def group(self) -> FakeGroup:
+        return FakeGroup(name="svs")
+
+    def test_list_commands_does_not_import(
+        self, group: FakeGroup, mocker: MockerFixture
+    ) -> None:
+        mock_import = mocker.patch("svs_core.cli.lazy.importlib.import_module")
+
+        names = group.list_commands(_click.Context(group))
+
+        assert names == ["user", "init"]
+        mock_import.assert_not_called()
+
+    def test_completing_names_does_not_import(
+        self, group: FakeGroup, mocker: MockerFixture
+    ) -> None:
+        mock_import = mocker.patch("svs_core.cli.lazy.importlib.import_module")
+
+        items = group.shell_complete(_click.Context(group), "us")
+
+        assert [(item.value, item.help) for item in items] == [("user", "Manage users")]
+        mock_import.assert_not_called()
+
+    def test_get_command_loads_typer_app_as_group(
+        self, group: FakeGroup, mocker: MockerFixture
+    ) -> None:
+        mock_setup = mocker.patch("svs_core.cli.lazy.setup_django")
+
+        command = group.get_command(_click.Context(group), "user")
+
+        assert isinstance(command, TyperGroup)
+        assert command.name == "user"
+        assert "create" in command.list_commands(_click.Context(command))
+        mock_setup.assert_called_once()
+
+    def test_get_command_loads_function_as_command(
+        self, group: FakeGroup, mocker: MockerFixture
+    ) -> None:
+        mock_setup = mocker.patch("svs_core.cli.lazy.setup_django")
+
+        command = group.get_command(_click.Context(group), "init")
+
+        assert isinstance(command, _click.Command)
+        assert not isinstance(command, TyperGroup)
+        assert command.name == "init"
+        mock_setup.assert_not_called()
+
+    def test_get_command_loads_once(
+        self, group: FakeGroup, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("svs_core.cli.lazy.setup_django")
+        ctx = _click.Context(group)
+
+        assert group.get_command(ctx, "user") is group.get_command(ctx, "user")
+
+    def test_get_command_unknown(self, group: FakeGroup) -> None:
+        assert group.get_command(_click.Context(group), "nope") is None
+
+    def test_svs_help_lists_every_subcommand(self) -> None:
+        result = CliRunner().invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in SvsGroup.subcommands:
+            assert name in result.output
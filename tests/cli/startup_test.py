@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# CPU time spent importing `svs_core.__main__`. Importing every subcommand
+# eagerly took ~500 ms, the lazy CLI takes ~70 ms.
+IMPORT_BUDGET_MS = 250
+
+# Modules only subcommands need; importing any of them at startup slows
+# down --version, --help and completion
+DEFERRED_MODULES = (
+    "bcrypt",
+    "django.db.models",
+    "docker",
+    "httpx",
+    "pydantic",
+    "svs_core.cli.service",
+    "svs_core.cli.template",
+    "svs_core.cli.user",
+    "svs_core.cli.utils",
+    "svs_core.cli.init",
+    "svs_core.cli.destroy",
+    "svs_core.cli.web",
+)
+
+IMPORT_SCRIPT = """
+import time
+started = time.process_time()
+import svs_core.__main__
+print((time.process_time() - started) * 1000)
+"""
+
+
+def _import_cli() -> tuple[float, dict[str, int]]:
+    """Imports the CLI entry point in a fresh interpreter with `-X importtime`.
+
+    CPU time is used for the budget, as wall time depends on how busy the
+    machine running the tests is.
+
+    Returns:
+        tuple[float, dict[str, int]]: The CPU time of the import in
+        milliseconds, and the cumulative import time of every imported module
+        in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+        env={**os.environ, "ENVIRONMENT": "testing"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = int(cumulative)
+
+    return float(result.stdout), modules
+
+
+@pytest.mark.cli
+class TestStartup:
+    def test_heavy_modules_are_not_imported(self) -> None:
+        _, modules = _import_cli()
+
+        assert "svs_core.__main__" in modules
+        assert [name for name in DEFERRED_MODULES if name in modules] == []
+
+    def test_import_time_within_budget(self) -> None:
+        # Best of three, to ignore one-off slowdowns
+        runs = [_import_cli() for _ in range(3)]
+        milliseconds, modules = min(runs, key=lambda run: run[0])
+
+        slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)
+        assert milliseconds < IMPORT_BUDGET_MS, f"Slowest imports: {slowest[:10]}"
@@ -256,8 +256,11 @@ class TestCreateSystemdService:
 
         web_module._create_systemd_service(tmp_path)
 
-        mock_write.assert_called_once()
-        mock_chmod.assert_called_once_with(0o644)
+        # One unit for the web interface, one for its job worker
+        assert mock_write.call_count == 2
+        assert "uvicorn project.asgi" in mock_write.call_args_list[0].args[0]
+        assert "manage.py run_jobs" in mock_write.call_args_list[1].args[0]
+        mock_chmod.assert_called_with(0o644)
         # systemctl daemon-reload should be called
         reload_calls = [
             call for call in mock_reload.call_args_list if "daemon-reload" in str(call)
@@ -122,3 +122,29 @@ def docker_cleanup(db):
         if labels.get("svs") == "true":
             print("Cleaning up network:", network.name)
             DockerNetworkManager.delete_network(network.id)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def completion_cache_paths(tmp_path_factory):
+    """Keep the shell completion cache and its invalidation stamp out of the system."""
+    from svs_core.shared.completion_stamp import CompletionStamp
+
+    cache_home = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+        monkeypatch.setattr(CompletionStamp, "PATH", cache_home / "completion.stamp")
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def port_lock_path(tmp_path_factory):
+    """Keep the port allocation lock file out of the system."""
+    from svs_core.shared.ports import SystemPortManager
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            SystemPortManager,
+            "LOCK_PATH",
+            tmp_path_factory.mktemp("lock") / "ports.lock",
+        )
+        yield
@@ -149,7 +149,7 @@ def test_service(
 
     Additional mocks provided:
     - SystemVolumeManager.generate_free_volume (returns /tmp/test-volume)
-    - SystemPortManager.find_free_port (returns 8080)
+    - SystemPortManager.allocate (returns ports from 8080)
 
     Returns the created Service instance.
     """
@@ -165,8 +165,8 @@ def test_service(
 
     # Mock port finding for tests that use create_from_template
     mocker.patch(
-        "svs_core.shared.ports.SystemPortManager.find_free_port",
-        return_value=8080,
+        "svs_core.shared.ports.SystemPortManager.allocate",
+        side_effect=lambda count, user=None: [8080 + i for i in range(count)],
     )
 
     # Create a service with standard test configuration
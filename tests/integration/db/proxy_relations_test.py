@@ -2,6 +2,9 @@
 
 import pytest
 
+from pytest_django import DjangoAssertNumQueries
+from pytest_mock import MockerFixture
+
 from svs_core.docker.service import Service
 from svs_core.docker.template import Template
 from svs_core.shared.git_source import GitSource
@@ -99,3 +102,75 @@ class TestProxyRelations:
             assert git_source.proxy_service.count() == 1
             assert git_source.proxy_service.first().id == test_service.id
             assert git_source.proxy_service.first().name == test_service.name
+
+
+class TestServiceListingQueries:
+    """Tests for the constant-query service listing path."""
+
+    @staticmethod
+    def _create_services(test_user: User, test_template: Template, count: int) -> None:
+        for i in range(count):
+            service = Service.objects.create(
+                name=f"listed-{i}",
+                template_id=test_template.id,
+                user_id=test_user.id,
+                container_id=f"container-{i}",
+            )
+            GitSource.objects.create(
+                service_id=service.id,
+                repository_url="https://example.com/repo.git",
+                destination_path="/tmp/repo",
+                branch="main",
+            )
+
+    @staticmethod
+    def _render(detailed: bool) -> list[str]:
+        rows = []
+        for service in Service.objects.listing(detailed=detailed):
+            rows.append(
+                f"{service.id} {service.name} {service.user.name} ({service.user.id}) "
+                f"{service.template.name} ({service.template.id}) "
+                f"{[gs.__str__() for gs in service.proxy_git_sources]}"
+            )
+            if detailed:
+                rows.append(service.pprint())
+        return rows
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("count", [1, 10])
+    @pytest.mark.parametrize("detailed", [False, True])
+    def test_listing_query_count_is_constant(
+        self,
+        mocker: MockerFixture,
+        django_assert_num_queries: DjangoAssertNumQueries,
+        test_user: User,
+        test_template: Template,
+        count: int,
+        detailed: bool,
+    ) -> None:
+        """Listing costs one query plus one git source prefetch for any size."""
+        self._create_services(test_user, test_template, count)
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container",
+            return_value=None,
+        )
+
+        with django_assert_num_queries(2):
+            rows = self._render(detailed)
+
+        assert len(rows) == (count * 2 if detailed else count)
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_listing_defers_json_columns(
+        self, test_user: User, test_template: Template
+    ) -> None:
+        """The default listing projection does not load JSON blobs."""
+        self._create_services(test_user, test_template, 1)
+
+        service = Service.objects.listing().get()
+
+        deferred = service.get_deferred_fields()
+        assert {"_env", "_exposed_ports", "_volumes", "_labels"} <= deferred
+        assert "container_id" not in deferred
@@ -30,6 +30,31 @@ RUN echo 'hello from test' > /message
         # Cleanup to avoid polluting local image cache
         client.images.remove(image=image_name, force=True)
 
+    @pytest.mark.integration
+    def test_build_context_honours_dockerignore(self) -> None:
+        image_name = "svs-core-test-dockerignore:itest"
+        dockerfile = """FROM busybox:latest
+COPY . /app
+"""
+
+        with TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "keep.txt").write_text("keep")
+            (Path(tmpdir) / "secret.env").write_text("secret")
+            (Path(tmpdir) / ".dockerignore").write_text("*.env\n")
+
+            DockerImageManager.build_from_dockerfile(
+                image_name, dockerfile, path_to_copy=Path(tmpdir)
+            )
+
+        client = get_docker_client()
+        output = client.containers.run(
+            image_name, command="ls /app", remove=True, detach=False
+        ).decode("utf-8")
+        assert "keep.txt" in output
+        assert "secret.env" not in output
+
+        client.images.remove(image=image_name, force=True)
+
     @pytest.mark.integration
     def test_build_invalid_dockerfile(self) -> None:
         image_name = "svs-core-test-image-invalid:fail"
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.db.models import ServiceStatus
+from svs_core.docker.container import ContainerState, ContainerStateDetails
+from svs_core.docker.reconciler import ServiceStateReconciler
+from svs_core.docker.service import Service
+
+STARTED_AT = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_service(test_template: Any, test_user: Any, container_id: str) -> Service:
+    return cast(
+        Service,
+        Service.objects.create(
+            name=f"svc-{container_id}",
+            template=test_template,
+            user=test_user,
+            container_id=container_id,
+        ),
+    )
+
+
+class TestServiceStateReconciler:
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_reconcile_records_changed_states(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        running = make_service(test_template, test_user, "abc")
+        missing = make_service(test_template, test_user, "def")
+
+        mocker.patch(
+            "svs_core.docker.reconciler.DockerContainerManager.get_managed_states",
+            return_value={"abc": ContainerState(status="running", health="healthy")},
+        )
+        mock_inspect = mocker.patch(
+            "svs_core.docker.reconciler.DockerContainerManager.inspect_state",
+            return_value=ContainerStateDetails(
+                status="running",
+                health="healthy",
+                started_at=STARTED_AT,
+                exit_code=0,
+                restart_count=2,
+            ),
+        )
+
+        changed = ServiceStateReconciler.reconcile()
+
+        # The missing container was never recorded, so it needs no update
+        assert changed == 1
+        mock_inspect.assert_called_once_with("abc")
+
+        running.refresh_from_db()
+        assert running.last_status == "running"
+        assert running.last_health == "healthy"
+        assert running.started_at == STARTED_AT
+        assert running.restart_count == 2
+        assert running.state_checked_at is not None
+
+        missing.refresh_from_db()
+        assert missing.last_status is None
+        assert missing.state_checked_at is not None
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_reconcile_skips_unchanged_states(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        service = make_service(test_template, test_user, "abc")
+        Service.objects.filter(id=service.id).update(
+            last_status="exited", last_health=None
+        )
+
+        mocker.patch(
+            "svs_core.docker.reconciler.DockerContainerManager.get_managed_states",
+            return_value={"abc": ContainerState(status="exited", health=None)},
+        )
+        mock_inspect = mocker.patch(
+            "svs_core.docker.reconciler.DockerContainerManager.inspect_state"
+        )
+
+        assert ServiceStateReconciler.reconcile() == 0
+        mock_inspect.assert_not_called()
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_reconcile_keeps_newer_records(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        unchanged = make_service(test_template, test_user, "abc")
+        recorded = make_service(test_template, test_user, "def")
+        later = datetime.now(timezone.utc) + timedelta(minutes=1)
+        Service.objects.filter(id=unchanged.id).update(last_status="running")
+        # Recorded from an event while the pass was running
+        Service.objects.filter(id=recorded.id).update(
+            last_status="running", state_checked_at=later
+        )
+
+        mocker.patch(
+            "svs_core.docker.reconciler.DockerContainerManager.get_managed_states",
+            return_value={
+                "abc": ContainerState(status="running", health=None),
+                "def": ContainerState(status="running", health=None),
+            },
+        )
+
+        assert ServiceStateReconciler.reconcile() == 0
+
+        unchanged.refresh_from_db()
+        assert unchanged.state_checked_at is not None
+        assert unchanged.state_checked_at < later
+        recorded.refresh_from_db()
+        assert recorded.state_checked_at == later
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_state_change_event_is_recorded(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        service = make_service(test_template, test_user, "abc")
+        Service.objects.filter(id=service.id).update(last_status="running")
+
+        mocker.patch(
+            "svs_core.docker.reconciler.DockerContainerManager.inspect_state",
+            return_value=ContainerStateDetails(
+                status="exited",
+                health=None,
+                started_at=STARTED_AT,
+                exit_code=137,
+                restart_count=0,
+            ),
+        )
+
+        ServiceStateReconciler.on_state_change("abc", ContainerState("exited", None))
+
+        service.refresh_from_db()
+        assert service.last_status == "exited"
+        assert service.exit_code == 137
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_listing_reads_recorded_states(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        fresh = make_service(test_template, test_user, "abc")
+        stale = make_service(test_template, test_user, "def")
+        now = datetime.now(timezone.utc)
+        Service.objects.filter(id=fresh.id).update(
+            last_status="running", last_health="healthy", state_checked_at=now
+        )
+        Service.objects.filter(id=stale.id).update(
+            last_status="running",
+            state_checked_at=now - Service.RECORDED_STATE_MAX_AGE - timedelta(1),
+        )
+
+        mock_states = mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_managed_states",
+            return_value={"def": ContainerState(status="exited", health=None)},
+        )
+
+        services = Service.resolve_statuses(
+            Service.objects.listing().order_by("id"), recorded=True
+        )
+
+        assert services[0].status == ServiceStatus.RUNNING
+        assert services[0].healthcheck_status == "healthy"
+        # Only the stale service is resolved from Docker
+        assert services[1].status == ServiceStatus.EXITED
+        mock_states.assert_called_once()
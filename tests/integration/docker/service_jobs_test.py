@@ -0,0 +1,103 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.db.models import JobStatus
+from svs_core.docker.build_progress import BuildEvent, BuildResult, BuildStepTiming
+from svs_core.docker.json_properties import EnvVariable
+from svs_core.docker.service import Service
+from svs_core.docker.service_jobs import ServiceJobs
+from svs_core.shared.jobs import Job
+
+
+class TestServiceJobs:
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_build_job_reports_progress_and_result(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        service = Service.objects.create(
+            name="svc", template=test_template, user=test_user
+        )
+
+        def build(
+            path: Path, on_event: Any, force: bool, blue_green: bool
+        ) -> BuildResult:
+            assert path == Path("/srv/app")
+            assert force and not blue_green
+            on_event(BuildEvent(BuildEvent.STEP, "FROM alpine", 1, 2))
+            on_event(BuildEvent(BuildEvent.OUTPUT, "pulling", 1, 2))
+            return BuildResult(
+                steps=[BuildStepTiming(1, "FROM alpine", 1.5)], duration_seconds=2.0
+            )
+
+        mock_build = mocker.patch.object(Service, "build", side_effect=build)
+
+        job = ServiceJobs.build(service, test_user.id, Path("/srv/app"), force=True)
+        assert ServiceJobs.build(service, test_user.id, Path("/srv/app")).id == job.id
+
+        job.run()
+
+        job.refresh_from_db()
+        mock_build.assert_called_once()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.progress["message"] == "Step 1/2: FROM alpine"
+        assert job.progress["lines"] == ["Step 1/2: FROM alpine", "pulling"]
+        assert job.result == {
+            "cached": False,
+            "duration_seconds": 2.0,
+            "steps": [
+                {"step": 1, "instruction": "FROM alpine", "duration_seconds": 1.5}
+            ],
+        }
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_create_from_template_job_links_service(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        created = Service.objects.create(
+            name="svc", template=test_template, user=test_user
+        )
+        mock_create = mocker.patch.object(
+            Service, "create_from_template", return_value=created
+        )
+
+        job = ServiceJobs.create_from_template(
+            name="svc",
+            template_id=test_template.id,
+            user_id=test_user.id,
+            override_env=[EnvVariable(key="A", value="1")],
+        )
+        job.run()
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.result == {"service_id": created.id}
+        assert job.service_id == created.id
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["user"].id == test_user.id
+        assert kwargs["override_env"] == [EnvVariable(key="A", value="1")]
+        assert kwargs["override_ports"] is None
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_restart_job_failure_is_recorded(
+        self, mocker: MockerFixture, test_template: Any, test_user: Any
+    ) -> None:
+        service = Service.objects.create(
+            name="svc", template=test_template, user=test_user
+        )
+        mocker.patch.object(
+            Service, "restart", side_effect=Exception("Container not found")
+        )
+
+        job = ServiceJobs.restart(service, test_user.id)
+        Job.objects.get(id=job.id).run()
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "Container not found"
@@ -1,12 +1,15 @@
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
+from django.utils import timezone
 from pytest_mock import MockerFixture
 
 from svs_core.db.models import ServiceStatus, TemplateType
+from svs_core.docker.build_progress import BuildResult
 from svs_core.docker.json_properties import (
     DefaultContent,
     EnvVariable,
@@ -17,6 +20,7 @@ from svs_core.docker.json_properties import (
 )
 from svs_core.docker.service import Service
 from svs_core.docker.template import Template
+from svs_core.shared.broker import BrokerOperation
 from svs_core.shared.exceptions import ServiceOperationException
 from svs_core.shared.git_source import GitSource
 from svs_core.users.user import User
@@ -141,7 +145,8 @@ class TestService:
 
         # Mock port finding
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=9000
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [9000 + i for i in range(count)],
         )
 
         # Create service from template
@@ -214,7 +219,8 @@ class TestService:
         )
 
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=9000
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [9000 + i for i in range(count)],
         )
 
         # Override an existing template env var (NGINX_PORT)
@@ -264,7 +270,8 @@ class TestService:
         )
 
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=9000
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [9000 + i for i in range(count)],
         )
 
         # Override existing template port (80)
@@ -315,7 +322,8 @@ class TestService:
         )
 
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=9000
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [9000 + i for i in range(count)],
         )
 
         # Override existing template volume
@@ -367,7 +375,8 @@ class TestService:
         )
 
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=9000
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [9000 + i for i in range(count)],
         )
 
         # Override existing template label
@@ -544,6 +553,39 @@ class TestService:
         assert isinstance(logs, str)
         assert logs == log_content.decode("utf-8")
 
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_update_persists_allocated_host_ports(
+        self,
+        mocker: MockerFixture,
+        test_template: Template,
+        test_user: User,
+    ) -> None:
+        mocker.patch.object(Service, "recreate")
+        mock_allocate = mocker.patch(
+            "svs_core.docker.service.SystemPortManager.allocate",
+            return_value=[50001, 50002],
+        )
+        service = Service.objects.create(
+            name="update-ports", template=test_template, user=test_user
+        )
+
+        service.update(
+            ports=[
+                ExposedPort(container_port=80, host_port=None),
+                ExposedPort(container_port=443, host_port=8443),
+                ExposedPort(container_port=8080, host_port=None),
+            ]
+        )
+
+        mock_allocate.assert_called_once_with(2, service.user)
+        reloaded = Service.objects.get(id=service.id)
+        assert [port.host_port for port in reloaded.exposed_ports] == [
+            50001,
+            8443,
+            50002,
+        ]
+
     @pytest.mark.integration
     @pytest.mark.django_db
     def test_service_get_logs_no_container_id(
@@ -750,10 +792,8 @@ class TestService:
             return_value=config_file_path,
         )
 
-        # Mock write_to_host to avoid actual file writing
-        mock_write_to_host = mocker.patch(
-            "svs_core.docker.json_properties.DefaultContent.write_to_host"
-        )
+        # Mock the command broker to avoid actual file writing
+        mock_broker_run = mocker.patch("svs_core.docker.service.CommandBroker.run")
 
         # Create service with volumes
         service = Service.create(
@@ -772,8 +812,15 @@ class TestService:
         # Verify find_host_path was called with the correct parameters
         mock_find_host_path.assert_called()
 
-        # Verify write_to_host was called with the config file path
-        mock_write_to_host.assert_called()
+        # Verify the config file was written as the service owner
+        mock_broker_run.assert_called_once_with(
+            test_user.name,
+            [
+                BrokerOperation.write_file(
+                    config_file_path.as_posix(), "server { listen 80; }\n"
+                )
+            ],
+        )
 
         # Verify the service was created
         assert service.id is not None
@@ -971,7 +1018,8 @@ class TestService:
 
         # Mock port finding
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=8080
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [8080 + i for i in range(count)],
         )
 
         # Create service from template with domain
@@ -1286,7 +1334,8 @@ CMD ["sh", "-c", "/usr/local/bin/gunicorn --bind 0.0.0.0:8000 --workers 3 ${APP_
 
         # Mock port finding
         mocker.patch(
-            "svs_core.shared.ports.SystemPortManager.find_free_port", return_value=8000
+            "svs_core.shared.ports.SystemPortManager.allocate",
+            side_effect=lambda count, user=None: [8000 + i for i in range(count)],
         )
 
         # Mock the actual image building
@@ -1600,7 +1649,7 @@ CMD cat /version.txt
             mock_container.status = "running"
 
             # Rebuild the service (simulating a running state)
-            service.build(source_path)
+            service.build(source_path, force=True)
 
             # Verify rebuild process
             mock_build.assert_called_once()  # New image built
@@ -1688,7 +1737,7 @@ CMD cat /version.txt
             mock_stop.reset_mock()
 
             # Rebuild the service (simulating a stopped state)
-            service.build(source_path)
+            service.build(source_path, force=True)
 
             # Verify rebuild process
             mock_build.assert_called_once()  # New image built
@@ -1779,6 +1828,291 @@ CMD cat /version.txt
             call_args = mock_build.call_args
             assert call_args.kwargs["build_args"]["APP_VERSION"] == "2.0"
 
+    @staticmethod
+    def _mock_blue_green(mocker: MockerFixture) -> dict[str, MagicMock]:
+        """Mock the Docker side of a blue/green rebuild of a running service."""
+        old = mocker.MagicMock(id="old_container", status="running")
+        old.attrs = {"Image": "sha256:old"}
+        standby = mocker.MagicMock(id="standby_container")
+        standby.attrs = {"Image": "sha256:new"}
+        containers = {"old_container": old}
+
+        mocks = {
+            "old": old,
+            "standby": standby,
+            "create": mocker.patch(
+                "svs_core.docker.service.DockerContainerManager.create_container",
+                side_effect=[old, standby],
+            ),
+            "get": mocker.patch(
+                "svs_core.docker.service.DockerContainerManager.get_container",
+                side_effect=lambda container_id: containers.get(container_id),
+            ),
+            "remove": mocker.patch(
+                "svs_core.docker.service.DockerContainerManager.remove"
+            ),
+            "rename": mocker.patch(
+                "svs_core.docker.service.DockerContainerManager.rename"
+            ),
+            "start": mocker.patch(
+                "svs_core.docker.service.DockerContainerManager.start_container"
+            ),
+            "ready": mocker.patch(
+                "svs_core.docker.service.DockerContainerManager.wait_until_ready"
+            ),
+            "remove_image": mocker.patch(
+                "svs_core.docker.service.DockerImageManager.remove"
+            ),
+            "tag": mocker.patch("svs_core.docker.service.DockerImageManager.tag"),
+        }
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.connect_to_network"
+        )
+        mocker.patch(
+            "svs_core.docker.service.DockerImageManager.build_from_dockerfile",
+            return_value=BuildResult(),
+        )
+        mocker.patch("svs_core.docker.service.DockerImageManager.rename")
+        return mocks
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_blue_green_rebuild_switches_after_ready(
+        self, mocker: MockerFixture, test_user: User
+    ) -> None:
+        """Test that a blue/green rebuild replaces the old container only once the new one is ready."""
+        build_template = Template.create(
+            name="blue-green-template",
+            type=TemplateType.BUILD,
+            dockerfile="FROM busybox:latest\n",
+            description="Template for testing blue/green rebuilds",
+        )
+        mocks = self._mock_blue_green(mocker)
+        service = Service.create(
+            name="blue-green-service",
+            template_id=build_template.id,
+            user=test_user,
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            service.build(Path(tmpdir))
+            assert service.container_id == "old_container"
+
+            service.build(Path(tmpdir), force=True, blue_green=True)
+
+        assert mocks["create"].call_args.kwargs["name"] == f"svs-{service.id}-next"
+        mocks["start"].assert_called_once_with(mocks["standby"])
+        mocks["ready"].assert_called_once()
+        mocks["old"].stop.assert_called_once()
+        mocks["remove"].assert_called_once_with("old_container")
+        mocks["rename"].assert_called_once_with(mocks["standby"], f"svs-{service.id}")
+        mocks["remove_image"].assert_called_once_with("sha256:old")
+        assert Service.objects.get(id=service.id).container_id == "standby_container"
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_blue_green_rebuild_keeps_old_container_when_not_ready(
+        self, mocker: MockerFixture, test_user: User
+    ) -> None:
+        """Test that a failed readiness check leaves the old container serving."""
+        build_template = Template.create(
+            name="blue-green-fail-template",
+            type=TemplateType.BUILD,
+            dockerfile="FROM busybox:latest\n",
+            description="Template for testing failed blue/green rebuilds",
+        )
+        mocks = self._mock_blue_green(mocker)
+        mocks["ready"].side_effect = ServiceOperationException("reported unhealthy")
+        service = Service.create(
+            name="blue-green-fail-service",
+            template_id=build_template.id,
+            user=test_user,
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            service.build(Path(tmpdir))
+
+            with pytest.raises(ServiceOperationException, match="did not become ready"):
+                service.build(Path(tmpdir), force=True, blue_green=True)
+
+        mocks["old"].stop.assert_not_called()
+        mocks["remove"].assert_called_once_with("standby_container")
+        mocks["tag"].assert_called_once_with("sha256:old", f"svs-{service.id}:latest")
+        assert Service.objects.get(id=service.id).container_id == "old_container"
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_blue_green_rebuild_rebinds_host_ports(
+        self, mocker: MockerFixture, test_user: User
+    ) -> None:
+        """Test that host ports are only published once the old container is gone."""
+        build_template = Template.create(
+            name="blue-green-ports-template",
+            type=TemplateType.BUILD,
+            dockerfile="FROM busybox:latest\n",
+            description="Template for testing blue/green rebuilds with host ports",
+        )
+        mocks = self._mock_blue_green(mocker)
+        published = mocker.MagicMock(id="published_container")
+        mocks["create"].side_effect = [mocks["old"], mocks["standby"], published]
+        service = Service.create(
+            name="blue-green-ports-service",
+            template_id=build_template.id,
+            user=test_user,
+            exposed_ports=[ExposedPort(container_port=80, host_port=18080)],
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            service.build(Path(tmpdir))
+            service.build(Path(tmpdir), force=True, blue_green=True)
+
+        standby_call, published_call = mocks["create"].call_args_list[1:]
+        assert standby_call.kwargs["name"] == f"svs-{service.id}-next"
+        assert standby_call.kwargs["ports"] == []
+        assert published_call.kwargs["name"] == f"svs-{service.id}"
+        assert published_call.kwargs["ports"][0].host_port == 18080
+        assert mocks["ready"].call_count == 2
+        assert mocks["remove"].call_args_list == [
+            mocker.call("old_container"),
+            mocker.call("standby_container"),
+        ]
+        mocks["rename"].assert_not_called()
+        assert Service.objects.get(id=service.id).container_id == "published_container"
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_blue_green_rebuild_keeps_standby_when_ports_not_published(
+        self, mocker: MockerFixture, test_user: User
+    ) -> None:
+        """Test that the standby keeps serving if the container publishing the ports fails."""
+        build_template = Template.create(
+            name="blue-green-ports-fail-template",
+            type=TemplateType.BUILD,
+            dockerfile="FROM busybox:latest\n",
+            description="Template for testing failed host port rebinding",
+        )
+        mocks = self._mock_blue_green(mocker)
+        published = mocker.MagicMock(id="published_container")
+        mocks["create"].side_effect = [mocks["old"], mocks["standby"], published]
+        mocks["ready"].side_effect = [None, ServiceOperationException("exited")]
+        service = Service.create(
+            name="blue-green-ports-fail-service",
+            template_id=build_template.id,
+            user=test_user,
+            exposed_ports=[ExposedPort(container_port=80, host_port=18081)],
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            service.build(Path(tmpdir))
+
+            with pytest.raises(
+                ServiceOperationException, match="without its host ports"
+            ):
+                service.build(Path(tmpdir), force=True, blue_green=True)
+
+        mocks["remove"].assert_any_call("published_container")
+        mocks["rename"].assert_called_once_with(mocks["standby"], f"svs-{service.id}")
+        assert Service.objects.get(id=service.id).container_id == "standby_container"
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_operations_keep_recorded_state(
+        self, mocker: MockerFixture, test_user: User
+    ) -> None:
+        """Test that container operations mark the recorded state unchecked instead of overwriting it."""
+        build_template = Template.create(
+            name="recorded-state-template",
+            type=TemplateType.BUILD,
+            dockerfile="FROM busybox:latest\n",
+            description="Template for testing recorded states",
+        )
+        mocks = self._mock_blue_green(mocker)
+        service = Service.create(
+            name="recorded-state-service",
+            template_id=build_template.id,
+            user=test_user,
+        )
+        with TemporaryDirectory() as tmpdir:
+            service.build(Path(tmpdir))
+
+        # Recorded by the state reconciler after the service was loaded
+        Service.objects.filter(id=service.id).update(
+            last_status="exited", exit_code=137, state_checked_at=timezone.now()
+        )
+
+        service.stop()
+
+        recorded = Service.objects.get(id=service.id)
+        mocks["old"].stop.assert_called_once()
+        assert recorded.last_status == "exited"
+        assert recorded.exit_code == 137
+        assert recorded.state_checked_at is None
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_build_skipped_when_inputs_unchanged(
+        self, mocker: MockerFixture, test_user: User
+    ) -> None:
+        """Test that a build with unchanged inputs is a no-op unless forced."""
+        build_template = Template.create(
+            name="cached-build-template",
+            type=TemplateType.BUILD,
+            dockerfile="FROM busybox:latest\nCOPY . /app\n",
+            description="Template for testing build caching",
+        )
+
+        mock_container = mocker.MagicMock()
+        mock_container.id = "cached_build_container"
+        mock_container.status = "exited"
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.create_container",
+            return_value=mock_container,
+        )
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.connect_to_network"
+        )
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container",
+            return_value=mock_container,
+        )
+        mocker.patch("svs_core.docker.service.DockerContainerManager.remove")
+        mock_build = mocker.patch(
+            "svs_core.docker.service.DockerImageManager.build_from_dockerfile",
+            return_value=BuildResult(),
+        )
+        mocker.patch("svs_core.docker.service.DockerImageManager.rename")
+        mocker.patch("svs_core.docker.service.DockerImageManager.remove")
+        mocker.patch(
+            "svs_core.docker.service.DockerImageManager.exists", return_value=True
+        )
+
+        service = Service.create(
+            name="cached-build-service",
+            template_id=build_template.id,
+            user=test_user,
+        )
+
+        with TemporaryDirectory() as tmpdir:
+            source_path = Path(tmpdir)
+            (source_path / "app.py").write_text("print('v1')\n")
+
+            service.build(source_path)
+            assert service.build_fingerprint is not None
+            mock_build.reset_mock()
+
+            result = service.build(source_path)
+            assert result.cached
+            mock_build.assert_not_called()
+
+            (source_path / "app.py").write_text("print('v2 changed')\n")
+            result = service.build(source_path)
+            assert not result.cached
+            mock_build.assert_called_once()
+
+            mock_build.reset_mock()
+            service.build(source_path, force=True)
+            mock_build.assert_called_once()
+
     @pytest.mark.integration
     @pytest.mark.django_db
     def test_service_add_git_source(
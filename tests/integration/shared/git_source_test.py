@@ -2,11 +2,12 @@
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from svs_core.docker.service import Service
+from svs_core.shared.broker import BrokerOperation
 from svs_core.shared.exceptions import ValidationException
 from svs_core.shared.git_source import GitSource
 
@@ -124,8 +125,7 @@ class TestGitSourceIntegration:
             )
 
             with patch("svs_core.shared.git_source.create_directory") as mock_mkdir:
-                with patch("svs_core.shared.git_source.run_command") as mock_run:
-                    mock_run.return_value = MagicMock(stdout="")
+                with patch("svs_core.shared.git_source.CommandBroker.run") as mock_run:
                     git_source.download()
 
                     # Verify create_directory was called for parent and destination
@@ -153,17 +153,23 @@ class TestGitSourceIntegration:
                 branch="main",
             )
 
-            with patch("svs_core.shared.git_source.run_command") as mock_run:
-                mock_run.return_value = MagicMock(stdout="")
+            with patch("svs_core.shared.git_source.CommandBroker.run") as mock_run:
                 git_source.download()
 
-                # Verify find command was called to delete contents
-                call_strings = [call[0][0] for call in mock_run.call_args_list]
-                assert any(
-                    "find" in cmd and "-mindepth 1 -delete" in cmd
-                    for cmd in call_strings
-                )
-                assert any("git clone" in cmd for cmd in call_strings)
+                # Contents are removed and the clone runs in a single batch
+                mock_run.assert_called_once()
+                user, operations = mock_run.call_args[0]
+                assert user == test_service.user.name
+                assert operations == [
+                    BrokerOperation.rm(str(destination_path), contents_only=True),
+                    BrokerOperation.git(
+                        "clone",
+                        "--branch",
+                        "main",
+                        "https://github.com/user/repo.git",
+                        str(destination_path),
+                    ),
+                ]
 
     @pytest.mark.integration
     @pytest.mark.django_db
@@ -182,17 +188,14 @@ class TestGitSourceIntegration:
                 branch="main",
             )
 
-            with patch("svs_core.shared.git_source.run_command") as mock_run:
-                mock_run.return_value = MagicMock(stdout="")
+            with patch("svs_core.shared.git_source.CommandBroker.run") as mock_run:
                 git_source.delete()
 
-                # Verify find command was called to delete contents
-                mock_run.assert_called_once()
-                call_args = mock_run.call_args[0][0]
-                assert "find" in call_args
-                assert str(destination_path) in call_args
-                assert "-mindepth 1 -delete" in call_args
-                assert mock_run.call_args[1]["user"] == test_service.user.name
+                # Verify the contents of the destination were removed
+                mock_run.assert_called_once_with(
+                    test_service.user.name,
+                    [BrokerOperation.rm(str(destination_path), contents_only=True)],
+                )
 
     @pytest.mark.integration
     @pytest.mark.django_db
@@ -210,11 +213,10 @@ class TestGitSourceIntegration:
 
             git_source_id = git_source.id
 
-            with patch("svs_core.shared.git_source.run_command") as mock_run:
-                mock_run.return_value = MagicMock(stdout="")
+            with patch("svs_core.shared.git_source.CommandBroker.run") as mock_run:
                 git_source.delete()
 
-                # Verify run_command was NOT called since path doesn't exist
+                # Verify nothing was removed since path doesn't exist
                 mock_run.assert_not_called()
 
             # Verify database record was deleted
@@ -241,8 +243,7 @@ class TestGitSourceIntegration:
             # Verify it exists before deletion
             assert GitSource.objects.filter(id=git_source_id).exists()
 
-            with patch("svs_core.shared.git_source.run_command") as mock_run:
-                mock_run.return_value = MagicMock(stdout="")
+            with patch("svs_core.shared.git_source.CommandBroker.run"):
                 git_source.delete()
 
             # Verify database record was deleted
@@ -0,0 +1,139 @@
+from typing import Any, Iterator
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.db.models import JobStatus
+from svs_core.shared.exceptions import ValidationException
+from svs_core.shared.jobs import Job
+from svs_core.users.user import User
+
+
+@pytest.fixture(autouse=True)
+def echo_handler() -> Iterator[None]:
+    handlers = dict(Job._handlers)
+    Job.register("test.echo", lambda job: {"echo": job.payload.get("value")})
+    yield
+    Job._handlers = handlers
+
+
+def make_user(name: str) -> User:
+    return User.create(name=name, password="password123")
+
+
+class TestJob:
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_enqueue_unknown_kind(self, test_user: User) -> None:
+        with pytest.raises(ValidationException, match="Unknown job kind"):
+            Job.enqueue("test.unknown", test_user.id)
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_enqueue_unique_returns_pending_job(
+        self, test_user: User, test_template: Any
+    ) -> None:
+        from svs_core.docker.service import Service
+
+        service = Service.objects.create(
+            name="svc", template=test_template, user=test_user
+        )
+
+        first = Job.enqueue("test.echo", test_user.id, service_id=service.id)
+        second = Job.enqueue(
+            "test.echo", test_user.id, service_id=service.id, unique=True
+        )
+
+        assert second.id == first.id
+        assert Job.objects.count() == 1
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_run_records_result(self, test_user: User) -> None:
+        job = Job.enqueue("test.echo", test_user.id, {"value": 42})
+
+        claimed = Job.claim_next(max_per_user=1)
+        assert claimed is not None
+        assert claimed.id == job.id
+        assert claimed.status == JobStatus.RUNNING
+        assert claimed.started_at is not None
+
+        claimed.run()
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.result == {"echo": 42}
+        assert job.finished_at is not None
+        assert job.is_finished
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_run_records_error(self, test_user: User) -> None:
+        def fail(job: Job) -> None:
+            raise RuntimeError("clone failed")
+
+        Job.register("test.fail", fail)
+        job = Job.enqueue("test.fail", test_user.id)
+
+        job.run()
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "clone failed"
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_claim_respects_per_user_limit(
+        self,
+        test_user: User,
+        mock_docker_network_create: object,
+        mock_system_user_create: object,
+    ) -> None:
+        other_user = make_user("otheruser")
+        first = Job.enqueue("test.echo", test_user.id)
+        Job.enqueue("test.echo", test_user.id)
+        other = Job.enqueue("test.echo", other_user.id)
+
+        claimed = Job.claim_next(max_per_user=1)
+        assert claimed is not None and claimed.id == first.id
+
+        # The first user is at the limit, so the other user's job goes next
+        claimed = Job.claim_next(max_per_user=1)
+        assert claimed is not None and claimed.id == other.id
+
+        assert Job.claim_next(max_per_user=1) is None
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_report_progress_is_throttled(
+        self, test_user: User, mocker: MockerFixture
+    ) -> None:
+        job = Job.enqueue("test.echo", test_user.id)
+        clock = mocker.patch("svs_core.shared.jobs.time.monotonic", return_value=10.0)
+
+        job.report_progress(message="first")
+        job.report_progress(message="second")
+        job.refresh_from_db()
+        assert job.progress == {"message": "first"}
+
+        job.report_progress(force=True, message="third")
+        job.refresh_from_db()
+        assert job.progress == {"message": "third"}
+
+        clock.return_value = 11.0
+        job.report_progress(message="fourth")
+        job.refresh_from_db()
+        assert job.progress == {"message": "fourth"}
+
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_fail_interrupted(self, test_user: User) -> None:
+        job = Job.enqueue("test.echo", test_user.id)
+        Job.claim_next(max_per_user=1)
+
+        assert Job.fail_interrupted() == 1
+
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "Interrupted by a worker restart"
@@ -0,0 +1,30 @@
+import pytest
+
+from svs_core.docker.json_properties import ExposedPort
+from svs_core.docker.service import Service
+from svs_core.docker.template import Template
+from svs_core.shared.ports import SystemPortManager
+from svs_core.users.user import User
+
+
+class TestSystemPortManager:
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_ports_of_saved_services_are_not_handed_out(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        test_template: Template,
+        test_user: User,
+    ) -> None:
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50123, 50125))
+        monkeypatch.setattr(SystemPortManager, "PROC_NET_TCP_PATHS", ())
+        Service.objects.create(
+            name="stopped",
+            template=test_template,
+            user=test_user,
+            exposed_ports=[ExposedPort(host_port=50123, container_port=80)],
+        )
+
+        assert SystemPortManager.get_assigned_ports() == {50123}
+        assert SystemPortManager.allocate(1) == [50124]
+        assert SystemPortManager.find_free_port() == 50124
@@ -23,6 +23,19 @@ class TestUserIntegration:
         )
         mock_system_user_create.assert_called_once_with(username, password, False)
 
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_create_user_invalidates_completion_cache(
+        self, mocker, mock_docker_network_create, mock_system_user_create
+    ):
+        mock_invalidate = mocker.patch(
+            "svs_core.shared.completion_stamp.CompletionStamp.invalidate"
+        )
+
+        User.create(name="completeuser", password="password123")
+
+        mock_invalidate.assert_called_once()
+
     @pytest.mark.integration
     @pytest.mark.django_db
     def test_create_user_duplicate(
@@ -79,6 +92,29 @@ class TestUserIntegration:
         with pytest.raises(User.DoesNotExist):
             User.objects.get(name=username)
 
+    @pytest.mark.integration
+    @pytest.mark.django_db
+    def test_delete_user_removes_buildkit_builder(
+        self,
+        mocker,
+        mock_docker_network_create,
+        mock_docker_network_delete,
+        mock_system_user_create,
+        mock_system_user_delete,
+        mock_volume_delete,
+    ):
+        mocker.patch(
+            "svs_core.users.user.EnvManager.get_docker_buildkit", return_value=True
+        )
+        mock_remove_builder = mocker.patch(
+            "svs_core.docker.image.DockerImageManager.remove_builder"
+        )
+        user = User.create(name="buildertest", password="password123")
+
+        user.delete()
+
+        mock_remove_builder.assert_called_once_with("buildertest")
+
     @pytest.mark.integration
     @pytest.mark.django_db
     def test_check_password(self, mock_docker_network_create, mock_system_user_create):
@@ -0,0 +1,132 @@
+import time
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.db.models import ServiceModel
+from svs_core.docker.json_properties import (
+    EnvVariable,
+    ExposedPort,
+    Healthcheck,
+    Label,
+)
+
+
+def _service_with_env(count: int) -> ServiceModel:
+    service = ServiceModel(name="bench")
+    service.env = [EnvVariable(key=f"KEY_{i}", value=str(i)) for i in range(count)]
+    return service
+
+
+class TestServiceModelParsedCache:
+    @pytest.mark.unit
+    def test_env_is_parsed_once(self, mocker: MockerFixture) -> None:
+        service = _service_with_env(10)
+        spy = mocker.spy(EnvVariable, "from_dict")
+
+        for _ in range(5):
+            assert len(service.env) == 10
+
+        assert spy.call_count == 10
+
+    @pytest.mark.unit
+    def test_returned_list_is_a_copy(self) -> None:
+        service = _service_with_env(2)
+
+        service.env.append(EnvVariable(key="EXTRA", value="1"))
+
+        assert len(service.env) == 2
+
+    @pytest.mark.unit
+    def test_returned_items_are_copies(self) -> None:
+        service = ServiceModel(name="svc")
+        service.exposed_ports = [ExposedPort(host_port=None, container_port=80)]
+        service.healthcheck = Healthcheck(test=["CMD", "true"])
+
+        service.exposed_ports[0].host_port = 50001
+        healthcheck = service.healthcheck
+        assert healthcheck is not None
+        assert isinstance(healthcheck.test, list)
+        healthcheck.test.append("false")
+
+        assert service.exposed_ports[0].host_port is None
+        assert service._exposed_ports == [{"key": None, "value": 80}]
+        assert service.healthcheck == Healthcheck(test=["CMD", "true"])
+
+    @pytest.mark.unit
+    def test_setter_invalidates_cache(self) -> None:
+        service = ServiceModel(name="svc")
+        service.labels = [Label(key="a", value="1")]
+        assert [label.key for label in service.labels] == ["a"]
+
+        service.labels = [Label(key="b", value="2")]
+
+        assert [label.key for label in service.labels] == ["b"]
+
+    @pytest.mark.unit
+    def test_raw_assignment_is_detected(self) -> None:
+        service = _service_with_env(1)
+        assert service.env[0].key == "KEY_0"
+
+        service._env = [{"key": "RAW", "value": "x"}]
+
+        assert service.env[0].key == "RAW"
+
+    @pytest.mark.unit
+    def test_healthcheck_cached(self, mocker: MockerFixture) -> None:
+        service = ServiceModel(name="svc")
+        service.healthcheck = Healthcheck(test=["CMD", "true"])
+        spy = mocker.spy(Healthcheck, "from_dict")
+
+        first = service.healthcheck
+        second = service.healthcheck
+
+        assert first == second
+        assert first is not second
+        assert spy.call_count == 1
+
+    @pytest.mark.unit
+    def test_save_and_refresh_invalidate_cache(self, mocker: MockerFixture) -> None:
+        service = _service_with_env(1)
+        service.env
+        mocker.patch("django.db.models.Model.save")
+        mocker.patch("django.db.models.Model.refresh_from_db")
+
+        service.save()
+        assert service.__dict__["_parsed_cache"] == {}
+
+        service.env
+        service.refresh_from_db()
+        assert service.__dict__["_parsed_cache"] == {}
+
+    @pytest.mark.unit
+    def test_benchmark_validation_calls_with_many_env_vars(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Micro-benchmark: 500 env vars read 50 times, as in a rebuild path."""
+        env_count, reads = 500, 50
+        service = _service_with_env(env_count)
+        spy = mocker.spy(EnvVariable, "from_dict")
+
+        start = time.perf_counter()
+        for _ in range(reads):
+            service._invalidate_parsed()
+            service.env
+        uncached_calls = spy.call_count
+        uncached_time = time.perf_counter() - start
+
+        spy.reset_mock()
+        service._invalidate_parsed()
+        start = time.perf_counter()
+        for _ in range(reads):
+            service.env
+        cached_calls = spy.call_count
+        cached_time = time.perf_counter() - start
+
+        assert uncached_calls == env_count * reads
+        assert cached_calls == env_count
+        assert cached_time < uncached_time, (
+            f"{reads} reads of {env_count} env vars: "
+            f"uncached {uncached_time * 1000:.1f}ms, cached {cached_time * 1000:.1f}ms"
+        )
@@ -0,0 +1,144 @@
+import os
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.docker import base
+from svs_core.docker.base import (
+    endpoint_label,
+    get_api_call_count,
+    get_docker_client,
+    reset_api_call_count,
+    reset_docker_client,
+)
+from svs_core.shared.profiling import Profiler
+
+
+@pytest.fixture(autouse=True)
+def clean_client():
+    reset_docker_client()
+    reset_api_call_count()
+    yield
+    reset_docker_client()
+    reset_api_call_count()
+
+
+class TestDockerClientRegistry:
+    @pytest.mark.unit
+    def test_client_is_reused(self, mocker: MockerFixture) -> None:
+        mock_from_env = mocker.patch("svs_core.docker.base.docker.from_env")
+
+        first = get_docker_client()
+        second = get_docker_client()
+
+        assert first is second
+        mock_from_env.assert_called_once()
+
+    @pytest.mark.unit
+    def test_client_uses_configured_pool_and_timeout(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.dict(
+            os.environ, {"DOCKER_MAX_POOL_SIZE": "32", "DOCKER_TIMEOUT": "15"}
+        )
+        mock_from_env = mocker.patch("svs_core.docker.base.docker.from_env")
+
+        get_docker_client()
+
+        mock_from_env.assert_called_once_with(max_pool_size=32, timeout=15)
+
+    @pytest.mark.unit
+    def test_invalid_config_falls_back_to_defaults(self, mocker: MockerFixture) -> None:
+        mocker.patch.dict(
+            os.environ, {"DOCKER_MAX_POOL_SIZE": "abc", "DOCKER_TIMEOUT": "0"}
+        )
+        mock_from_env = mocker.patch("svs_core.docker.base.docker.from_env")
+
+        get_docker_client()
+
+        mock_from_env.assert_called_once_with(max_pool_size=10, timeout=60)
+
+    @pytest.mark.unit
+    def test_client_recreated_in_forked_process(self, mocker: MockerFixture) -> None:
+        mock_from_env = mocker.patch("svs_core.docker.base.docker.from_env")
+        mocker.patch("svs_core.docker.base.os.getpid", return_value=1000)
+
+        get_docker_client()
+
+        mocker.patch("svs_core.docker.base.os.getpid", return_value=2000)
+        get_docker_client()
+
+        assert mock_from_env.call_count == 2
+
+    @pytest.mark.unit
+    def test_after_fork_drops_client(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.docker.base.docker.from_env")
+        get_docker_client()
+
+        base._after_fork_in_child()
+
+        assert base._client is None
+
+    @pytest.mark.unit
+    def test_reset_closes_client(self, mocker: MockerFixture) -> None:
+        mock_from_env = mocker.patch("svs_core.docker.base.docker.from_env")
+        client = get_docker_client()
+
+        reset_docker_client()
+
+        client.close.assert_called_once()
+        get_docker_client()
+        assert mock_from_env.call_count == 2
+
+    @pytest.mark.unit
+    def test_api_calls_are_counted(self, mocker: MockerFixture) -> None:
+        mock_client = mocker.MagicMock()
+        mock_client.api.hooks = {"response": []}
+        mocker.patch("svs_core.docker.base.docker.from_env", return_value=mock_client)
+
+        get_docker_client()
+        hook = mock_client.api.hooks["response"][0]
+        hook(mocker.MagicMock())
+        hook(mocker.MagicMock())
+
+        assert get_api_call_count() == 2
+
+        reset_api_call_count()
+        assert get_api_call_count() == 0
+
+    @pytest.mark.unit
+    def test_api_calls_are_profiled_by_endpoint(self, mocker: MockerFixture) -> None:
+        mock_response = mocker.MagicMock()
+        mock_response.request.method = "GET"
+        mock_response.request.path_url = "/v1.47/containers/3f2a/json?size=1"
+        mock_response.elapsed.total_seconds.return_value = 0.02
+        mock_response.status_code = 404
+        Profiler.start()
+
+        try:
+            base._count_api_call(mock_response)
+        finally:
+            Profiler.stop()
+
+        stats = Profiler.get_stats()[("docker", "GET /containers/{id}/json")]
+        assert stats.count == 1
+        assert stats.failures == 1
+
+
+class TestEndpointLabel:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "path, endpoint",
+        [
+            ("/v1.47/containers/json?all=1", "/containers/json"),
+            ("/v1.47/containers/3f2a/logs?stdout=1", "/containers/{id}/logs"),
+            ("/v1.47/images/ghcr.io/acme/app:1/json", "/images/{name}/json"),
+            ("/v1.47/images/nginx:latest", "/images/{name}"),
+            ("/v1.47/images/create?fromImage=nginx", "/images/create"),
+            ("/v1.47/networks/create", "/networks/create"),
+            ("/_ping", "/_ping"),
+        ],
+    )
+    def test_endpoint_label(self, path: str, endpoint: str) -> None:
+        assert endpoint_label(path) == endpoint
@@ -0,0 +1,143 @@
+import io
+import os
+import tarfile
+
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from svs_core.docker.build_context import DockerBuildContext
+
+DOCKERFILE = "FROM busybox:latest\nCOPY . /app\n"
+
+
+def read_archive(chunks: Iterable[bytes]) -> dict[str, tarfile.TarInfo]:
+    data = b"".join(chunks)
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:") as tar:
+        return {member.name: member for member in tar.getmembers()}
+
+
+def extract(chunks: Iterable[bytes], name: str) -> bytes:
+    data = b"".join(chunks)
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:") as tar:
+        member = tar.extractfile(name)
+        assert member is not None
+        return member.read()
+
+
+class TestDockerBuildContext:
+    @pytest.mark.unit
+    def test_injects_dockerfile_without_source(self) -> None:
+        members = read_archive(DockerBuildContext.stream(DOCKERFILE))
+
+        assert list(members) == ["Dockerfile"]
+        assert (
+            extract(DockerBuildContext.stream(DOCKERFILE), "Dockerfile")
+            == DOCKERFILE.encode()
+        )
+
+    @pytest.mark.unit
+    def test_includes_source_tree(self, tmp_path: Path) -> None:
+        (tmp_path / "app.py").write_text("print('hi')")
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text("x = 1")
+        os.symlink("app.py", tmp_path / "link.py")
+
+        members = read_archive(DockerBuildContext.stream(DOCKERFILE, tmp_path))
+
+        assert set(members) == {"Dockerfile", "app.py", "pkg", "pkg/mod.py", "link.py"}
+        assert members["pkg"].isdir()
+        assert members["link.py"].issym()
+        assert members["link.py"].linkname == "app.py"
+        assert (
+            extract(DockerBuildContext.stream(DOCKERFILE, tmp_path), "pkg/mod.py")
+            == b"x = 1"
+        )
+
+    @pytest.mark.unit
+    def test_honours_dockerignore(self, tmp_path: Path) -> None:
+        (tmp_path / ".dockerignore").write_text("# deps\nnode_modules\n*.log\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "big.js").write_text("x" * 1000)
+        (tmp_path / "debug.log").write_text("log")
+        (tmp_path / "index.js").write_text("main")
+
+        members = read_archive(DockerBuildContext.stream(DOCKERFILE, tmp_path))
+
+        assert "index.js" in members
+        assert "node_modules" not in members
+        assert "node_modules/big.js" not in members
+        assert "debug.log" not in members
+
+    @pytest.mark.unit
+    def test_source_dockerfile_takes_precedence(self, tmp_path: Path) -> None:
+        (tmp_path / "Dockerfile").write_text("FROM alpine\n")
+        (tmp_path / ".dockerignore").write_text("Dockerfile\n")
+
+        chunks = list(DockerBuildContext.stream(DOCKERFILE, tmp_path))
+
+        assert extract(chunks, "Dockerfile") == b"FROM alpine\n"
+        assert list(read_archive(chunks)).count("Dockerfile") == 1
+
+    @pytest.mark.unit
+    def test_single_file_source(self, tmp_path: Path) -> None:
+        source = tmp_path / "app.jar"
+        source.write_bytes(b"\x00" * 10)
+
+        members = read_archive(DockerBuildContext.stream(DOCKERFILE, source))
+
+        assert set(members) == {"Dockerfile", "app.jar"}
+
+    @pytest.mark.unit
+    def test_large_files_are_streamed_in_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(DockerBuildContext, "CHUNK_SIZE", 4096)
+        payload = os.urandom(100_000)
+        (tmp_path / "data.bin").write_bytes(payload)
+
+        chunks = list(DockerBuildContext.stream(DOCKERFILE, tmp_path))
+
+        assert len(chunks) > 10
+        assert max(len(chunk) for chunk in chunks) < 4096 * 3
+        assert extract(chunks, "data.bin") == payload
+
+    @pytest.mark.unit
+    def test_list_paths_is_sorted(self, tmp_path: Path) -> None:
+        for name in ("b.txt", "a.txt", "c.txt"):
+            (tmp_path / name).write_text(name)
+
+        assert DockerBuildContext.list_paths(tmp_path) == ["a.txt", "b.txt", "c.txt"]
+
+    @pytest.mark.unit
+    def test_fingerprint_is_stable(self, tmp_path: Path) -> None:
+        (tmp_path / "app.py").write_text("print('hi')\n")
+
+        first = DockerBuildContext.fingerprint(DOCKERFILE, {"A": "1"}, tmp_path)
+        second = DockerBuildContext.fingerprint(DOCKERFILE, {"A": "1"}, tmp_path)
+
+        assert first == second
+
+    @pytest.mark.unit
+    def test_fingerprint_tracks_build_inputs(self, tmp_path: Path) -> None:
+        (tmp_path / "app.py").write_text("print('hi')\n")
+        base = DockerBuildContext.fingerprint(DOCKERFILE, {"A": "1"}, tmp_path)
+
+        assert base != DockerBuildContext.fingerprint(
+            DOCKERFILE + "RUN true\n", {"A": "1"}, tmp_path
+        )
+        assert base != DockerBuildContext.fingerprint(DOCKERFILE, {"A": "2"}, tmp_path)
+
+        (tmp_path / "app.py").write_text("print('changed')\n")
+        assert base != DockerBuildContext.fingerprint(DOCKERFILE, {"A": "1"}, tmp_path)
+
+    @pytest.mark.unit
+    def test_fingerprint_ignores_dockerignored_paths(self, tmp_path: Path) -> None:
+        (tmp_path / ".dockerignore").write_text("logs\n")
+        (tmp_path / "logs").mkdir()
+        base = DockerBuildContext.fingerprint(DOCKERFILE, None, tmp_path)
+
+        (tmp_path / "logs" / "app.log").write_text("noise\n")
+
+        assert base == DockerBuildContext.fingerprint(DOCKERFILE, None, tmp_path)
@@ -0,0 +1,162 @@
+import pytest
+
+from svs_core.docker.build_progress import (
+    BuildEvent,
+    BuildKitProgressTracker,
+    BuildProgressTracker,
+    BuildResult,
+    BuildStepTiming,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBuildProgressTracker:
+    @pytest.mark.unit
+    def test_emits_step_and_output_events(self) -> None:
+        events: list[BuildEvent] = []
+        tracker = BuildProgressTracker(events.append)
+
+        tracker.feed({"stream": "Step 1/2 : FROM alpine\n"})
+        tracker.feed({"stream": " ---> 1234abcd\n"})
+        tracker.feed({"stream": "Step 2/2 : RUN make\n"})
+
+        assert events == [
+            BuildEvent(BuildEvent.STEP, "FROM alpine", 1, 2),
+            BuildEvent(BuildEvent.OUTPUT, " ---> 1234abcd", 1, 2),
+            BuildEvent(BuildEvent.STEP, "RUN make", 2, 2),
+        ]
+
+    @pytest.mark.unit
+    def test_records_step_timings(self) -> None:
+        clock = FakeClock()
+        tracker = BuildProgressTracker(clock=clock)
+
+        clock.now = 1.0
+        tracker.feed({"stream": "Step 1/2 : FROM alpine\n"})
+        clock.now = 1.5
+        tracker.feed({"stream": "Step 2/2 : RUN make\n"})
+        clock.now = 11.5
+        result = tracker.finish()
+
+        assert result.steps == [
+            BuildStepTiming(1, "FROM alpine", 0.5),
+            BuildStepTiming(2, "RUN make", 10.0),
+        ]
+        assert result.duration_seconds == 11.5
+        assert result.slowest_steps(1) == [BuildStepTiming(2, "RUN make", 10.0)]
+
+    @pytest.mark.unit
+    def test_reassembles_partial_lines(self) -> None:
+        events: list[BuildEvent] = []
+        tracker = BuildProgressTracker(events.append)
+
+        tracker.feed({"stream": "Step 1/1 : FR"})
+        tracker.feed({"stream": "OM alpine\nhello"})
+        tracker.finish()
+
+        assert [event.message for event in events] == ["FROM alpine", "hello"]
+        assert tracker.log_lines == ["Step 1/1 : FROM alpine", "hello"]
+
+    @pytest.mark.unit
+    def test_status_chunks_are_reported_as_output(self) -> None:
+        events: list[BuildEvent] = []
+        tracker = BuildProgressTracker(events.append)
+
+        tracker.feed({"status": "Pulling fs layer", "id": "abc123"})
+
+        assert events == [BuildEvent(BuildEvent.OUTPUT, "abc123: Pulling fs layer")]
+
+    @pytest.mark.unit
+    def test_captures_image_id(self) -> None:
+        tracker = BuildProgressTracker()
+
+        tracker.feed({"aux": {"ID": "sha256:deadbeef"}})
+
+        assert tracker.finish().image_id == "sha256:deadbeef"
+
+    @pytest.mark.unit
+    def test_records_errors(self) -> None:
+        events: list[BuildEvent] = []
+        tracker = BuildProgressTracker(events.append)
+
+        tracker.feed({"stream": "Step 1/1 : RUN false\n"})
+        tracker.feed(
+            {
+                "errorDetail": {"message": "returned a non-zero code: 1"},
+                "error": "returned a non-zero code: 1",
+            }
+        )
+
+        assert tracker.error == "returned a non-zero code: 1"
+        assert events[-1] == BuildEvent(
+            BuildEvent.ERROR, "returned a non-zero code: 1", 1, 1
+        )
+        assert tracker.log_lines[-1] == "ERROR: returned a non-zero code: 1"
+
+    @pytest.mark.unit
+    def test_empty_build(self) -> None:
+        assert BuildProgressTracker().finish().steps == []
+        assert BuildResult().slowest_steps() == []
+
+
+BUILDKIT_OUTPUT = """\
+#1 [internal] load build definition from Dockerfile
+#1 DONE 0.0s
+
+#5 [builder 1/3] FROM docker.io/library/python:3.13-slim
+#5 CACHED
+
+#6 [builder 2/3] RUN pip install -r requirements.txt
+#6 0.512 Collecting django
+#6 DONE 12.4s
+
+#7 [stage-1 3/3] COPY . .
+#7 DONE 0.3s
+
+#8 exporting to image
+#8 writing image sha256:0123abcd done
+#8 DONE 0.1s
+"""
+
+
+class TestBuildKitProgressTracker:
+    @pytest.mark.unit
+    def test_parses_plain_progress(self) -> None:
+        events: list[BuildEvent] = []
+        tracker = BuildKitProgressTracker(events.append)
+
+        for line in BUILDKIT_OUTPUT.splitlines(keepends=True):
+            tracker.feed({"stream": line})
+        result = tracker.finish()
+
+        assert tracker.error is None
+        assert result.image_id == "sha256:0123abcd"
+        assert result.steps == [
+            BuildStepTiming(1, "builder: FROM docker.io/library/python:3.13-slim", 0.0),
+            BuildStepTiming(2, "builder: RUN pip install -r requirements.txt", 12.4),
+            BuildStepTiming(3, "stage-1: COPY . .", 0.3),
+        ]
+        assert BuildEvent(BuildEvent.OUTPUT, "Collecting django", 2, 3) in events
+        assert [event.kind for event in events].count(BuildEvent.STEP) == 3
+
+    @pytest.mark.unit
+    def test_records_errors(self) -> None:
+        events: list[BuildEvent] = []
+        tracker = BuildKitProgressTracker(events.append)
+
+        tracker.feed({"stream": "#6 [2/2] RUN false\n"})
+        tracker.feed(
+            {
+                "stream": "ERROR: failed to solve: process did not complete successfully\n"
+            }
+        )
+
+        assert tracker.error == "failed to solve: process did not complete successfully"
+        assert events[-1].kind == BuildEvent.ERROR
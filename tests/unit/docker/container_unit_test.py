@@ -1,8 +1,12 @@
+from datetime import datetime, timezone
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
+from docker.errors import NotFound
 from pytest_mock import MockerFixture
+from requests.exceptions import ReadTimeout
 
 from svs_core.docker.container import DockerContainerManager
 from svs_core.docker.json_properties import (
@@ -471,3 +475,200 @@ class TestDockerContainerManagerUnit:
             environment_variables=[],
             healthcheck=healthcheck,
         )
+
+    @pytest.mark.unit
+    def test_get_managed_states_single_sparse_list(self, mocker: MockerFixture) -> None:
+        """Test get_managed_states resolves all containers with one list call."""
+        running = mocker.MagicMock()
+        running.id = "abc"
+        running.attrs = {"State": "running", "Status": "Up 2 minutes (healthy)"}
+        starting = mocker.MagicMock()
+        starting.id = "def"
+        starting.attrs = {
+            "State": "running",
+            "Status": "Up 1 second (health: starting)",
+        }
+        exited = mocker.MagicMock()
+        exited.id = "ghi"
+        exited.attrs = {"State": "exited", "Status": "Exited (0) 3 hours ago"}
+
+        mock_client = mocker.MagicMock()
+        mock_client.containers.list.return_value = [running, starting, exited]
+        mocker.patch(
+            "svs_core.docker.container.get_docker_client", return_value=mock_client
+        )
+
+        states = DockerContainerManager.get_managed_states()
+
+        mock_client.containers.list.assert_called_once_with(
+            all=True, sparse=True, filters={"label": "svs_user"}
+        )
+        mock_client.containers.get.assert_not_called()
+        assert states["abc"].status == "running"
+        assert states["abc"].health == "healthy"
+        assert states["def"].health == "starting"
+        assert states["ghi"].status == "exited"
+        assert states["ghi"].health is None
+
+    @pytest.mark.unit
+    def test_parse_health_summary_unhealthy(self) -> None:
+        """Test unhealthy containers are detected from the listing summary."""
+        assert (
+            DockerContainerManager._parse_health_summary("Up 5 minutes (unhealthy)")
+            == "unhealthy"
+        )
+
+    @pytest.mark.unit
+    def test_inspect_state(self, mocker: MockerFixture) -> None:
+        """Test inspect_state reads the full state of a container."""
+        container = mocker.MagicMock()
+        container.attrs = {
+            "State": {
+                "Status": "running",
+                "StartedAt": "2026-01-01T12:00:00.123456789Z",
+                "ExitCode": 0,
+                "Health": {"Status": "healthy"},
+            },
+            "RestartCount": 3,
+        }
+        mocker.patch(
+            "svs_core.docker.container.DockerContainerManager.get_container",
+            return_value=container,
+        )
+
+        details = DockerContainerManager.inspect_state("abc")
+
+        assert details is not None
+        assert details.status == "running"
+        assert details.health == "healthy"
+        assert details.started_at == datetime(
+            2026, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc
+        )
+        assert details.exit_code == 0
+        assert details.restart_count == 3
+
+    @pytest.mark.unit
+    def test_inspect_state_never_started(self, mocker: MockerFixture) -> None:
+        """Test inspect_state reports no start time or exit code for new containers."""
+        container = mocker.MagicMock()
+        container.attrs = {
+            "State": {
+                "Status": "created",
+                "StartedAt": "0001-01-01T00:00:00Z",
+                "ExitCode": 0,
+            },
+            "RestartCount": 0,
+        }
+        mocker.patch(
+            "svs_core.docker.container.DockerContainerManager.get_container",
+            return_value=container,
+        )
+
+        details = DockerContainerManager.inspect_state("abc")
+
+        assert details is not None
+        assert details.started_at is None
+        assert details.exit_code is None
+        assert details.health is None
+
+    @pytest.mark.unit
+    def test_inspect_state_missing_container(self, mocker: MockerFixture) -> None:
+        """Test inspect_state returns None for missing containers."""
+        mocker.patch(
+            "svs_core.docker.container.DockerContainerManager.get_container",
+            return_value=None,
+        )
+
+        assert DockerContainerManager.inspect_state("abc") is None
+
+
+class TestWaitUntilReady:
+    @staticmethod
+    def make_container(
+        mocker: MockerFixture, states: list[dict[str, Any]]
+    ) -> MagicMock:
+        container = MagicMock()
+        container.name = "svs-1-next"
+        container.reload.side_effect = lambda: setattr(
+            container,
+            "attrs",
+            {"State": states.pop(0) if len(states) > 1 else states[0]},
+        )
+        return container
+
+    @pytest.mark.unit
+    def test_waits_for_healthy(self, mocker: MockerFixture) -> None:
+        container = self.make_container(
+            mocker,
+            [
+                {"Status": "running", "Health": {"Status": "starting"}},
+                {"Status": "running", "Health": {"Status": "healthy"}},
+            ],
+        )
+
+        DockerContainerManager.wait_until_ready(container, timeout=5, poll_interval=0)
+
+        assert container.reload.call_count == 2
+
+    @pytest.mark.unit
+    def test_without_healthcheck_settles(self, mocker: MockerFixture) -> None:
+        container = self.make_container(mocker, [{"Status": "running"}])
+
+        DockerContainerManager.wait_until_ready(
+            container, timeout=5, settle_seconds=0, poll_interval=0
+        )
+
+        container.reload.assert_called_once()
+
+    @pytest.mark.unit
+    def test_unhealthy_raises(self, mocker: MockerFixture) -> None:
+        container = self.make_container(
+            mocker, [{"Status": "running", "Health": {"Status": "unhealthy"}}]
+        )
+
+        with pytest.raises(ServiceOperationException, match="unhealthy"):
+            DockerContainerManager.wait_until_ready(container, timeout=5)
+
+    @pytest.mark.unit
+    def test_exited_raises(self, mocker: MockerFixture) -> None:
+        container = self.make_container(mocker, [{"Status": "exited", "ExitCode": 1}])
+
+        with pytest.raises(ServiceOperationException, match="stopped while starting"):
+            DockerContainerManager.wait_until_ready(container, timeout=5)
+
+    @pytest.mark.unit
+    def test_timeout_raises(self, mocker: MockerFixture) -> None:
+        container = self.make_container(
+            mocker, [{"Status": "running", "Health": {"Status": "starting"}}]
+        )
+
+        with pytest.raises(ServiceOperationException, match="not ready within"):
+            DockerContainerManager.wait_until_ready(
+                container, timeout=0, poll_interval=0
+            )
+
+
+class TestWaitUntilStopped:
+    @pytest.mark.unit
+    def test_uses_not_running_condition(self, mocker: MockerFixture) -> None:
+        container = mocker.MagicMock()
+
+        DockerContainerManager.wait_until_stopped(container, timeout=10)
+
+        container.wait.assert_called_once_with(condition="not-running", timeout=10)
+
+    @pytest.mark.unit
+    def test_missing_container_counts_as_stopped(self, mocker: MockerFixture) -> None:
+        container = mocker.MagicMock()
+        container.wait.side_effect = NotFound("gone")
+
+        DockerContainerManager.wait_until_stopped(container, timeout=10)
+
+    @pytest.mark.unit
+    def test_timeout_raises(self, mocker: MockerFixture) -> None:
+        container = mocker.MagicMock()
+        container.id = "abc"
+        container.wait.side_effect = ReadTimeout("read timed out")
+
+        with pytest.raises(ServiceOperationException, match="within 10s"):
+            DockerContainerManager.wait_until_stopped(container, timeout=10)
@@ -0,0 +1,160 @@
+from typing import Any, Iterator
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.docker import events
+from svs_core.docker.container import ContainerState, DockerContainerManager
+from svs_core.docker.events import DockerEventWatcher
+
+
+@pytest.fixture(autouse=True)
+def reset_watcher() -> Iterator[None]:
+    DockerEventWatcher._states = {}
+    DockerEventWatcher._listeners = []
+    DockerEventWatcher._live = False
+    DockerEventWatcher._stop.clear()
+    yield
+    DockerEventWatcher._states = {}
+    DockerEventWatcher._listeners = []
+    DockerEventWatcher._live = False
+
+
+def event(container_id: str, action: str) -> dict[str, Any]:
+    return {"Type": "container", "Action": action, "Actor": {"ID": container_id}}
+
+
+class TestDockerEventWatcher:
+    @pytest.mark.unit
+    def test_apply_maps_lifecycle_actions(self) -> None:
+        DockerEventWatcher._apply(event("abc", "create"))
+        assert DockerEventWatcher.get_state("abc") == ContainerState("created", None)
+
+        DockerEventWatcher._apply(event("abc", "start"))
+        assert DockerEventWatcher.get_state("abc") == ContainerState("running", None)
+
+        DockerEventWatcher._apply(event("abc", "die"))
+        assert DockerEventWatcher.get_state("abc") == ContainerState("exited", None)
+
+    @pytest.mark.unit
+    def test_apply_health_status(self) -> None:
+        DockerEventWatcher._apply(event("abc", "start"))
+        DockerEventWatcher._apply(event("abc", "health_status: healthy"))
+
+        assert DockerEventWatcher.get_state("abc") == ContainerState(
+            "running", "healthy"
+        )
+
+        # A restart begins a new round of health checks
+        DockerEventWatcher._apply(event("abc", "restart"))
+
+        assert DockerEventWatcher.get_state("abc") == ContainerState(
+            "running", "starting"
+        )
+
+    @pytest.mark.unit
+    def test_apply_destroy_removes_container(self) -> None:
+        DockerEventWatcher._apply(event("abc", "create"))
+        DockerEventWatcher._apply(event("abc", "destroy"))
+
+        assert DockerEventWatcher.get_state("abc") is None
+
+    @pytest.mark.unit
+    def test_apply_ignores_unrelated_actions(self) -> None:
+        DockerEventWatcher._apply(event("abc", "exec_start: sh"))
+        DockerEventWatcher._apply({"Action": "start", "Actor": {}})
+
+        assert DockerEventWatcher.get_states() == {}
+
+    @pytest.mark.unit
+    def test_listeners_receive_changes_only(self, mocker: MockerFixture) -> None:
+        listener = mocker.MagicMock()
+        DockerEventWatcher.add_listener(listener)
+
+        DockerEventWatcher._apply(event("abc", "start"))
+        DockerEventWatcher._apply(event("abc", "start"))
+        DockerEventWatcher._apply(event("abc", "destroy"))
+
+        assert listener.call_args_list == [
+            mocker.call("abc", ContainerState("running", None)),
+            mocker.call("abc", None),
+        ]
+
+    @pytest.mark.unit
+    def test_failing_listener_does_not_break_watcher(
+        self, mocker: MockerFixture
+    ) -> None:
+        DockerEventWatcher.add_listener(mocker.MagicMock(side_effect=Exception("boom")))
+
+        DockerEventWatcher._apply(event("abc", "start"))
+
+        assert DockerEventWatcher.get_state("abc") == ContainerState("running", None)
+
+    @pytest.mark.unit
+    def test_follow_resyncs_and_applies_events(self, mocker: MockerFixture) -> None:
+        DockerEventWatcher._states = {
+            "gone": ContainerState("running", None),
+            "abc": ContainerState("running", None),
+        }
+        listener = mocker.MagicMock()
+        DockerEventWatcher.add_listener(listener)
+
+        mocker.patch(
+            "svs_core.docker.events.DockerContainerManager.get_managed_states",
+            return_value={"abc": ContainerState("exited", None)},
+        )
+        client = mocker.MagicMock()
+        mocker.patch("svs_core.docker.events.get_docker_client", return_value=client)
+
+        def events(**kwargs):
+            assert DockerEventWatcher.is_live()
+            yield event("abc", "start")
+
+        client.events.side_effect = events
+
+        DockerEventWatcher._follow()
+
+        assert client.events.call_args.kwargs["filters"] == {
+            "type": "container",
+            "label": DockerContainerManager.MANAGED_LABEL,
+        }
+        assert DockerEventWatcher.get_states() == {
+            "abc": ContainerState("running", None)
+        }
+        assert listener.call_args_list == [
+            mocker.call("gone", None),
+            mocker.call("abc", ContainerState("exited", None)),
+            mocker.call("abc", ContainerState("running", None)),
+        ]
+
+    @pytest.mark.unit
+    def test_run_reconnects_after_failure(self, mocker: MockerFixture) -> None:
+        calls = 0
+
+        def follow() -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                DockerEventWatcher._stop.set()
+            raise Exception("connection reset")
+
+        mocker.patch.object(DockerEventWatcher, "_follow", side_effect=follow)
+        mocker.patch.object(DockerEventWatcher, "RECONNECT_MIN_DELAY_SECONDS", 0.0)
+
+        DockerEventWatcher.run()
+
+        assert calls == 2
+        assert not DockerEventWatcher.is_live()
+
+    @pytest.mark.unit
+    def test_after_fork_resets_watcher(self, mocker: MockerFixture) -> None:
+        DockerEventWatcher._apply(event("abc", "start"))
+        DockerEventWatcher._live = True
+        mocker.patch.object(DockerEventWatcher, "_thread", mocker.MagicMock())
+
+        events._after_fork_in_child()
+
+        assert not DockerEventWatcher.is_live()
+        assert DockerEventWatcher.get_states() == {}
+        assert DockerEventWatcher._thread is None
@@ -0,0 +1,143 @@
+import threading
+import time
+
+from typing import cast
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.db.models import ServiceModel
+from svs_core.docker.fleet import FleetExecutor, FleetProgress, FleetResult
+from svs_core.shared.exceptions import ServiceOperationException
+
+
+def make_service(mocker: MockerFixture, service_id: int, user_id: int) -> ServiceModel:
+    service = mocker.MagicMock()
+    service.id = service_id
+    service.name = f"svc{service_id}"
+    service.user_id = user_id
+    return cast(ServiceModel, service)
+
+
+class TestFleetExecutor:
+    @pytest.mark.unit
+    def test_runs_operation_for_every_service(self, mocker: MockerFixture) -> None:
+        services = [make_service(mocker, i, i % 3) for i in range(10)]
+        seen: list[int] = []
+        lock = threading.Lock()
+
+        def operation(service: ServiceModel) -> None:
+            with lock:
+                seen.append(service.id)
+
+        result = FleetExecutor.run(services, operation, max_workers=4)
+
+        assert sorted(seen) == list(range(10))
+        assert result.ok
+        assert len(result.succeeded) == 10
+
+    @pytest.mark.unit
+    def test_empty_input(self) -> None:
+        result: FleetResult[ServiceModel] = FleetExecutor.run([], lambda service: None)
+
+        assert result.ok
+        assert result.succeeded == []
+
+    @pytest.mark.unit
+    def test_failures_are_collected(self, mocker: MockerFixture) -> None:
+        services = [make_service(mocker, i, 1) for i in range(3)]
+
+        def operation(service: ServiceModel) -> None:
+            if service.id == 1:
+                raise ServiceOperationException("container missing")
+
+        result = FleetExecutor.run(services, operation)
+
+        assert not result.ok
+        assert len(result.succeeded) == 2
+        assert len(result.failed) == 1
+        assert result.failed[0].service_id == 1
+        assert result.failed[0].service_name == "svc1"
+        assert str(result.failed[0].error) == "container missing"
+
+    @pytest.mark.unit
+    def test_raise_on_failure(self, mocker: MockerFixture) -> None:
+        services = [make_service(mocker, 1, 1)]
+
+        def operation(service: ServiceModel) -> None:
+            raise RuntimeError("boom")
+
+        result = FleetExecutor.run(services, operation)
+
+        with pytest.raises(ServiceOperationException, match="Failed to stop 1"):
+            result.raise_on_failure("stop")
+
+    @pytest.mark.unit
+    def test_raise_on_failure_noop_when_ok(self) -> None:
+        FleetResult().raise_on_failure("stop")
+
+    @pytest.mark.unit
+    def test_progress_is_reported(self, mocker: MockerFixture) -> None:
+        services = [make_service(mocker, i, i) for i in range(4)]
+        updates: list[FleetProgress] = []
+
+        FleetExecutor.run(services, lambda service: None, on_progress=updates.append)
+
+        assert [update.completed for update in updates] == [1, 2, 3, 4]
+        assert all(update.total == 4 for update in updates)
+
+    @pytest.mark.unit
+    def test_bounded_concurrency(self, mocker: MockerFixture) -> None:
+        services = [make_service(mocker, i, i) for i in range(12)]
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def operation(service: ServiceModel) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        FleetExecutor.run(services, operation, max_workers=3, max_per_user=3)
+
+        assert peak <= 3
+
+    @pytest.mark.unit
+    def test_per_user_limit(self, mocker: MockerFixture) -> None:
+        services = [make_service(mocker, i, 1) for i in range(6)]
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def operation(service: ServiceModel) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        FleetExecutor.run(services, operation, max_workers=6, max_per_user=2)
+
+        assert peak <= 2
+
+    @pytest.mark.unit
+    def test_users_are_interleaved(self, mocker: MockerFixture) -> None:
+        heavy = [make_service(mocker, i, 1) for i in range(5)]
+        light = make_service(mocker, 99, 2)
+        started: list[int] = []
+
+        FleetExecutor.run(
+            [*heavy, light],
+            lambda service: started.append(service.id),
+            max_workers=1,
+            max_per_user=1,
+        )
+
+        assert started.index(99) == 1
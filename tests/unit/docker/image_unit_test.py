@@ -0,0 +1,313 @@
+from pathlib import Path
+from subprocess import CompletedProcess
+from unittest.mock import MagicMock
+
+import pytest
+
+from docker.errors import APIError
+from pytest_mock import MockerFixture
+
+from svs_core.docker.build_progress import BuildEvent
+from svs_core.docker.image import DockerImageManager
+from svs_core.shared.exceptions import DockerOperationException, ValidationException
+
+
+class TestBuildFromDockerfile:
+    @pytest.mark.unit
+    def test_streams_build_events(self, mocker: MockerFixture) -> None:
+        client = mocker.patch("svs_core.docker.image.get_docker_client").return_value
+        client.api.build.return_value = iter(
+            [
+                {"stream": "Step 1/1 : FROM alpine\n"},
+                {"aux": {"ID": "sha256:abc"}},
+                {"stream": "Successfully built abc\n"},
+            ]
+        )
+        events: list[BuildEvent] = []
+
+        result = DockerImageManager.build_from_dockerfile(
+            "svs-test:latest", "FROM alpine\n", on_event=events.append
+        )
+
+        assert result.image_id == "sha256:abc"
+        assert [timing.instruction for timing in result.steps] == ["FROM alpine"]
+        assert [event.kind for event in events] == [
+            BuildEvent.STEP,
+            BuildEvent.OUTPUT,
+        ]
+        kwargs = client.api.build.call_args.kwargs
+        assert kwargs["tag"] == "svs-test:latest"
+        assert kwargs["custom_context"] is True
+        assert kwargs["decode"] is True
+
+    @pytest.mark.unit
+    def test_stream_error_writes_log(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        client = mocker.patch("svs_core.docker.image.get_docker_client").return_value
+        client.api.build.return_value = iter(
+            [
+                {"stream": "Step 1/1 : RUN false\n"},
+                {"error": "returned a non-zero code: 1"},
+            ]
+        )
+
+        with pytest.raises(DockerOperationException, match="non-zero code"):
+            DockerImageManager.build_from_dockerfile(
+                "svs-test:latest", "FROM alpine\nRUN false\n", path_to_copy=tmp_path
+            )
+
+        log = (tmp_path / "docker_build_error.log").read_text(encoding="utf-8")
+        assert "Image: svs-test:latest" in log
+        assert "Step 1/1 : RUN false" in log
+
+    @pytest.mark.unit
+    def test_api_error_is_wrapped(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        client = mocker.patch("svs_core.docker.image.get_docker_client").return_value
+        client.api.build.side_effect = APIError("dockerfile parse error")
+
+        with pytest.raises(DockerOperationException, match="dockerfile parse error"):
+            DockerImageManager.build_from_dockerfile(
+                "svs-test:latest", "FRMO alpine\n", path_to_copy=tmp_path
+            )
+
+        assert (tmp_path / "docker_build_error.log").exists()
+
+    @pytest.mark.unit
+    def test_classic_builder_strips_cache_mounts(self, mocker: MockerFixture) -> None:
+        mocker.patch(
+            "svs_core.docker.image.EnvManager.get_docker_buildkit", return_value=False
+        )
+        client = mocker.patch("svs_core.docker.image.get_docker_client").return_value
+        client.api.build.return_value = iter([])
+        stream = mocker.patch("svs_core.docker.image.DockerBuildContext.stream")
+
+        DockerImageManager.build_from_dockerfile(
+            "svs-test:latest",
+            "FROM python\nRUN --mount=type=cache,id=x,target=/root/.cache/pip \\\n    pip install x\n",
+        )
+
+        assert stream.call_args.args[0] == "FROM python\nRUN \\\n    pip install x\n"
+
+
+class TestBuildWithBuildKit:
+    @pytest.fixture(autouse=True)
+    def buildkit(self, mocker: MockerFixture) -> None:
+        mocker.patch(
+            "svs_core.docker.image.EnvManager.get_docker_buildkit", return_value=True
+        )
+        mocker.patch(
+            "svs_core.docker.image.shutil.which", return_value="/usr/bin/docker"
+        )
+        mocker.patch(
+            "svs_core.docker.image.DockerBuildContext.stream",
+            return_value=iter([b"tar"]),
+        )
+        mocker.patch.object(DockerImageManager, "_builders", set())
+
+    @pytest.fixture
+    def run(self, mocker: MockerFixture) -> MagicMock:
+        return mocker.patch(
+            "svs_core.docker.image.subprocess.run",
+            return_value=CompletedProcess([], 0, "", ""),
+        )
+
+    @pytest.mark.unit
+    def test_runs_buildx(self, mocker: MockerFixture, run: MagicMock) -> None:
+        process = mocker.MagicMock()
+        process.stdout = iter(
+            [
+                b"#5 [1/1] FROM alpine\n",
+                b"#5 DONE 1.5s\n",
+                b"writing image sha256:ab done\n",
+            ]
+        )
+        process.wait.return_value = 0
+        popen = mocker.patch(
+            "svs_core.docker.image.subprocess.Popen", return_value=process
+        )
+
+        result = DockerImageManager.build_from_dockerfile(
+            "svs-test:latest",
+            "FROM alpine\n",
+            build_args={"SECRET": "hunter2"},
+            cache_scope="Alice",
+        )
+
+        command = popen.call_args.args[0]
+        assert command[:3] == ["/usr/bin/docker", "buildx", "build"]
+        builder = command[command.index("--builder") + 1]
+        assert builder == DockerImageManager.builder_name("Alice")
+        assert "SECRET=hunter2" in command
+        assert "SECRET" not in popen.call_args.kwargs["env"]
+        process.stdin.write.assert_called_once_with(b"tar")
+        assert result.image_id == "sha256:ab"
+        assert result.steps[0].duration_seconds == 1.5
+
+    @pytest.mark.unit
+    def test_creates_missing_builder_once(
+        self, mocker: MockerFixture, run: MagicMock
+    ) -> None:
+        run.side_effect = [
+            CompletedProcess([], 1, "", "no builder"),
+            CompletedProcess([], 0, "", ""),
+        ]
+        process = mocker.MagicMock()
+        process.stdout = iter([])
+        process.wait.return_value = 0
+        mocker.patch("svs_core.docker.image.subprocess.Popen", return_value=process)
+
+        for _ in range(2):
+            DockerImageManager.build_from_dockerfile(
+                "svs-test:latest", "FROM alpine\n", cache_scope="alice"
+            )
+
+        assert run.call_count == 2
+        create = run.call_args_list[1].args[0]
+        assert create[1:4] == ["buildx", "create", "--name"]
+        assert create[4] == DockerImageManager.builder_name("alice")
+        assert create[-2:] == ["--driver", "docker-container"]
+
+    @pytest.mark.unit
+    def test_failed_builder_creation_raises(
+        self, mocker: MockerFixture, run: MagicMock
+    ) -> None:
+        run.return_value = CompletedProcess([], 1, "", "buildx missing")
+        popen = mocker.patch("svs_core.docker.image.subprocess.Popen")
+
+        with pytest.raises(DockerOperationException, match="buildx missing"):
+            DockerImageManager.build_from_dockerfile(
+                "svs-test:latest", "FROM alpine\n", cache_scope="alice"
+            )
+
+        popen.assert_not_called()
+
+    @pytest.mark.unit
+    def test_unscoped_build_uses_default_builder(self, mocker: MockerFixture) -> None:
+        stream = mocker.patch(
+            "svs_core.docker.image.DockerBuildContext.stream",
+            return_value=iter([b"tar"]),
+        )
+        process = mocker.MagicMock()
+        process.stdout = iter([])
+        process.wait.return_value = 0
+        popen = mocker.patch(
+            "svs_core.docker.image.subprocess.Popen", return_value=process
+        )
+
+        DockerImageManager.build_from_dockerfile(
+            "svs-test:latest",
+            "FROM alpine\nRUN --mount=type=cache,id=pip,target=/c pip install x\n",
+        )
+
+        command = popen.call_args.args[0]
+        assert "--builder" not in command
+        # The shared default builder never gets cache mounts
+        assert stream.call_args.args[0] == "FROM alpine\nRUN pip install x\n"
+
+    @pytest.mark.unit
+    def test_docker_cli_gets_fixed_environment(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, run: MagicMock
+    ) -> None:
+        monkeypatch.setenv("DOCKER_HOST", "unix:///run/docker.sock")
+        monkeypatch.setenv("LD_PRELOAD", "/tmp/evil.so")
+        process = mocker.MagicMock()
+        process.stdout = iter([])
+        process.wait.return_value = 0
+        popen = mocker.patch(
+            "svs_core.docker.image.subprocess.Popen", return_value=process
+        )
+
+        DockerImageManager.build_from_dockerfile(
+            "svs-test:latest",
+            "FROM alpine\n",
+            build_args={"PATH": "/tmp", "DOCKER_CONFIG": "/tmp/evil"},
+            cache_scope="alice",
+        )
+
+        env = popen.call_args.kwargs["env"]
+        assert run.call_args.kwargs["env"] == env
+        assert env["PATH"] == DockerImageManager.DOCKER_CLI_PATH
+        assert env["DOCKER_HOST"] == "unix:///run/docker.sock"
+        assert "DOCKER_CONFIG" not in env
+        assert "LD_PRELOAD" not in env
+        assert set(env) <= {"PATH", "HOME", *DockerImageManager.DOCKER_CLI_ENV_VARS}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", ["1ABC", "A-B", "A B", "A=B", ""])
+    def test_invalid_build_arg_name_is_rejected(
+        self, mocker: MockerFixture, name: str
+    ) -> None:
+        popen = mocker.patch("svs_core.docker.image.subprocess.Popen")
+
+        with pytest.raises(ValidationException, match="Invalid build argument"):
+            DockerImageManager.build_from_dockerfile(
+                "svs-test:latest", "FROM alpine\n", build_args={name: "x"}
+            )
+
+        popen.assert_not_called()
+
+    @pytest.mark.unit
+    def test_failed_build_raises(self, mocker: MockerFixture, tmp_path: Path) -> None:
+        process = mocker.MagicMock()
+        process.stdout = iter([b"ERROR: failed to solve: boom\n"])
+        process.wait.return_value = 1
+        mocker.patch("svs_core.docker.image.subprocess.Popen", return_value=process)
+
+        with pytest.raises(DockerOperationException, match="failed to solve: boom"):
+            DockerImageManager.build_from_dockerfile(
+                "svs-test:latest", "FROM alpine\n", path_to_copy=tmp_path
+            )
+
+    @pytest.mark.unit
+    def test_missing_docker_cli(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.docker.image.shutil.which", return_value=None)
+
+        with pytest.raises(DockerOperationException, match="docker CLI"):
+            DockerImageManager.build_from_dockerfile("svs-test:latest", "FROM alpine\n")
+
+
+class TestBuilders:
+    @pytest.mark.unit
+    def test_builder_names_are_distinct(self) -> None:
+        names = {
+            DockerImageManager.builder_name(scope)
+            for scope in ("alice", "Alice", "bob$", "bob_", "bob-")
+        }
+
+        assert len(names) == 5
+        assert all(name.startswith("svs-builder-") for name in names)
+
+    @pytest.mark.unit
+    def test_remove_builder(self, mocker: MockerFixture) -> None:
+        mocker.patch(
+            "svs_core.docker.image.shutil.which", return_value="/usr/bin/docker"
+        )
+        run = mocker.patch(
+            "svs_core.docker.image.subprocess.run",
+            return_value=CompletedProcess([], 0, "", ""),
+        )
+        mocker.patch.object(
+            DockerImageManager,
+            "_builders",
+            {DockerImageManager.builder_name("alice")},
+        )
+
+        DockerImageManager.remove_builder("alice")
+
+        assert run.call_args.args[0] == [
+            "/usr/bin/docker",
+            "buildx",
+            "rm",
+            DockerImageManager.builder_name("alice"),
+        ]
+        assert DockerImageManager._builders == set()
+
+    @pytest.mark.unit
+    def test_remove_builder_without_docker_cli(self, mocker: MockerFixture) -> None:
+        mocker.patch("svs_core.docker.image.shutil.which", return_value=None)
+        run = mocker.patch("svs_core.docker.image.subprocess.run")
+
+        DockerImageManager.remove_builder("alice")
+
+        run.assert_not_called()
@@ -8,6 +8,7 @@ from svs_core.docker.json_properties import (
     Label,
     Volume,
 )
+from svs_core.shared.broker import BrokerOperation
 
 
 @pytest.mark.unit
@@ -126,10 +127,9 @@ class TestDefaultContent:
         assert "..." not in str_repr
 
     def test_write_to_host(self, tmp_path, mocker):
-        """Test that write_to_host creates a file with the correct content."""
-        mock_subprocess_run = mocker.patch("subprocess.run")
-        mock_subprocess_run.return_value = mocker.Mock(
-            returncode=0, stdout="", stderr=""
+        """Test that write_to_host writes the content as the given user."""
+        mock_broker_run = mocker.patch(
+            "svs_core.docker.json_properties.CommandBroker.run"
         )
 
         content = DefaultContent(location="/etc/config.conf", content="key=value")
@@ -137,11 +137,9 @@ class TestDefaultContent:
 
         content.write_to_host(str(host_file), username="testuser")
 
-        assert mock_subprocess_run.call_count == 1
-        last_call = mock_subprocess_run.call_args_list[-1]
-        command = last_call[0][0]
-        assert "key=value" in command
-        assert str(host_file) in command
+        mock_broker_run.assert_called_once_with(
+            "testuser", [BrokerOperation.write_file(str(host_file), "key=value\n")]
+        )
 
 
 @pytest.mark.unit
@@ -70,6 +70,7 @@ class TestServiceUnit:
         assert result_dict["3"] == "B"
 
     @pytest.mark.unit
+    @pytest.mark.django_db
     def test_create_accepts_valid_domain(self, mocker: MockerFixture) -> None:
         """Test that Service.create accepts valid domain string."""
         mock_template = mocker.MagicMock()
@@ -103,6 +104,7 @@ class TestServiceUnit:
         )
 
     @pytest.mark.unit
+    @pytest.mark.django_db
     def test_create_accepts_none_domain(self, mocker: MockerFixture) -> None:
         """Test that Service.create accepts None as domain value."""
         mock_template = mocker.MagicMock()
@@ -206,8 +208,8 @@ class TestServiceUnit:
         # Verify the service was updated with new container ID
         assert mock_service.container_id == "new-container-id"
 
-        # Verify save was called
-        mock_service.save.assert_called()
+        # Verify the new container ID was saved without the recorded state
+        mock_service._save_fields.assert_called_once_with("container_id")
 
         # Verify networks were connected
         mock_connect.assert_any_call(mock_new_container, "testuser")
@@ -303,7 +305,7 @@ class TestServiceUnit:
         Service.update(mock_service, domain="new.example.com")
 
         assert mock_service.domain == "new.example.com"
-        mock_service.save.assert_called_once()
+        mock_service._save_fields.assert_called_once_with(*Service._CONFIG_FIELDS)
         mock_service.recreate.assert_called_once()
 
     @pytest.mark.unit
@@ -318,7 +320,7 @@ class TestServiceUnit:
         Service.update(mock_service, env_variables=new_env)
 
         assert mock_service.env == new_env
-        mock_service.save.assert_called_once()
+        mock_service._save_fields.assert_called_once_with(*Service._CONFIG_FIELDS)
 
     @pytest.mark.unit
     def test_update_sets_ports(self, mocker: MockerFixture) -> None:
@@ -332,7 +334,72 @@ class TestServiceUnit:
         Service.update(mock_service, ports=new_ports)
 
         assert mock_service.exposed_ports == new_ports
-        mock_service.save.assert_called_once()
+        mock_service._save_fields.assert_called_once_with(*Service._CONFIG_FIELDS)
+
+    @pytest.mark.unit
+    def test_stream_logs_yields_complete_lines(self, mocker: MockerFixture) -> None:
+        """Test that stream_logs reassembles lines split across chunks."""
+        mock_service = mocker.MagicMock(spec=Service)
+        mock_service.container_id = "abc"
+        mock_service.name = "svc"
+        mock_stream = mocker.MagicMock()
+        mock_stream.__iter__.return_value = iter([b"one\ntw", b"o\nthr", b"ee"])
+        mock_container = mocker.MagicMock()
+        mock_container.logs.return_value = mock_stream
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container",
+            return_value=mock_container,
+        )
+
+        lines = list(Service.stream_logs(mock_service, tail=5))
+
+        assert lines == ["one", "two", "three"]
+        mock_container.logs.assert_called_once_with(
+            stream=True, follow=True, timestamps=False, tail=5
+        )
+        mock_stream.close.assert_called_once()
+
+    @pytest.mark.unit
+    def test_stream_logs_passes_fractional_since(self, mocker: MockerFixture) -> None:
+        """Test that since and until keep sub-second precision."""
+        from datetime import datetime, timezone
+
+        mock_service = mocker.MagicMock(spec=Service)
+        mock_service.container_id = "abc"
+        mock_service.name = "svc"
+        mock_container = mocker.MagicMock()
+        mock_container.logs.return_value = iter([])
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container",
+            return_value=mock_container,
+        )
+        since = datetime(2024, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+
+        list(Service.stream_logs(mock_service, since=since, follow=False))
+
+        kwargs = mock_container.logs.call_args.kwargs
+        assert kwargs["since"] == 1704110400.5
+        assert kwargs["tail"] == "all"
+        assert kwargs["follow"] is False
+        assert "until" not in kwargs
+
+    @pytest.mark.unit
+    def test_stream_logs_without_container_id(self, mocker: MockerFixture) -> None:
+        """Test that stream_logs requires a container."""
+        mock_service = mocker.MagicMock(spec=Service)
+        mock_service.container_id = None
+
+        with pytest.raises(ServiceOperationException):
+            next(Service.stream_logs(mock_service))
+
+    @pytest.mark.unit
+    def test_restart_stops_then_starts(self, mocker: MockerFixture) -> None:
+        """Test that restart stops the service and starts it again."""
+        mock_service = mocker.MagicMock(spec=Service)
+
+        Service.restart(mock_service)
+
+        assert mock_service.mock_calls == [mocker.call.stop(), mocker.call.start()]
 
     @pytest.mark.unit
     def test_update_sets_command(self, mocker: MockerFixture) -> None:
@@ -367,7 +434,7 @@ class TestServiceUnit:
 
         Service.update(mock_service)
 
-        mock_service.save.assert_called_once()
+        mock_service._save_fields.assert_called_once_with(*Service._CONFIG_FIELDS)
         mock_service.recreate.assert_called_once()
 
     @pytest.mark.unit
@@ -531,3 +598,81 @@ class TestServiceUnit:
         )
 
         assert res is None
+
+    # --- resolve_statuses tests ---
+
+    @pytest.mark.unit
+    def test_resolve_statuses_single_docker_call(self, mocker: MockerFixture) -> None:
+        """Test that resolve_statuses maps one listing onto all services."""
+        from svs_core.docker.container import ContainerState
+
+        running = Service(id=1, name="a", container_id="abc")
+        exited = Service(id=2, name="b", container_id="def")
+        missing = Service(id=3, name="c", container_id=None)
+
+        mock_states = mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_managed_states",
+            return_value={
+                "abc": ContainerState(status="running", health="healthy"),
+                "def": ContainerState(status="exited", health=None),
+            },
+        )
+        mock_get = mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container"
+        )
+
+        result = Service.resolve_statuses([running, exited, missing])
+
+        assert result == [running, exited, missing]
+        mock_states.assert_called_once()
+        assert running.status == ServiceStatus.RUNNING
+        assert running.healthcheck_status == "healthy"
+        assert exited.status == ServiceStatus.EXITED
+        assert exited.healthcheck_status is None
+        assert missing.status == ServiceStatus.CREATED
+        mock_get.assert_not_called()
+
+    @pytest.mark.unit
+    def test_resolve_statuses_falls_back_when_docker_unavailable(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that services stay unresolved when the bulk listing fails."""
+        service = Service(id=1, name="a", container_id="abc")
+
+        mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_managed_states",
+            side_effect=Exception("docker down"),
+        )
+        mock_container = mocker.MagicMock()
+        mock_container.status = "running"
+        mock_get = mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container",
+            return_value=mock_container,
+        )
+
+        Service.resolve_statuses([service])
+
+        assert service.status == ServiceStatus.RUNNING
+        mock_get.assert_called_once_with("abc")
+
+    @pytest.mark.unit
+    def test_status_reads_live_event_cache(self, mocker: MockerFixture) -> None:
+        """Test that status and health come from the event watcher when live."""
+        from svs_core.docker.container import ContainerState
+
+        service = Service(id=1, name="a", container_id="abc")
+
+        mocker.patch(
+            "svs_core.docker.service.DockerEventWatcher.is_live", return_value=True
+        )
+        mocker.patch(
+            "svs_core.docker.service.DockerEventWatcher.get_state",
+            return_value=ContainerState(status="running", health="unhealthy"),
+        )
+        mock_get = mocker.patch(
+            "svs_core.docker.service.DockerContainerManager.get_container"
+        )
+
+        assert service.status == ServiceStatus.RUNNING
+        assert service.healthcheck_status == "unhealthy"
+        mock_get.assert_not_called()
@@ -5,6 +5,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from svs_core.migrations.migrator import Migration, Migrator, PackageVersion
+from svs_core.shared.exceptions import ServiceOperationException
 
 
 @pytest.mark.unit
@@ -150,9 +151,32 @@ class TestMigrator:
         mock_service_class = mocker.patch("svs_core.migrations.migrator.Service")
         mock_service_1 = Mock()
         mock_service_2 = Mock()
-        mock_service_class.objects.all.return_value = [mock_service_1, mock_service_2]
+        mock_service_class.objects.select_related.return_value = [
+            mock_service_1,
+            mock_service_2,
+        ]
 
         Migrator._restart_policy_change()
 
         mock_service_1.recreate.assert_called_once()
         mock_service_2.recreate.assert_called_once()
+
+    def test_restart_policy_change_recreates_remaining_services_on_failure(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that one failing service does not stop the others from being
+        recreated, and the failure is reported afterwards."""
+        mock_service_class = mocker.patch("svs_core.migrations.migrator.Service")
+        mock_service_1 = Mock(user_id=1)
+        mock_service_1.name = "broken"
+        mock_service_1.recreate.side_effect = ServiceOperationException("boom")
+        mock_service_2 = Mock(user_id=1)
+        mock_service_class.objects.select_related.return_value = [
+            mock_service_1,
+            mock_service_2,
+        ]
+
+        with pytest.raises(ServiceOperationException, match="broken"):
+            Migrator._restart_policy_change()
+
+        mock_service_2.recreate.assert_called_once()
@@ -0,0 +1,183 @@
+import io
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.shared import broker_helper
+from svs_core.shared.broker import (
+    BrokerOperation,
+    CommandBroker,
+    _HelperProcess,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_broker():
+    yield
+    CommandBroker.shutdown()
+    CommandBroker._unavailable.clear()
+    CommandBroker._stats.clear()
+
+
+class TestBrokerHelper:
+    @pytest.mark.unit
+    def test_frames_round_trip(self) -> None:
+        stream = io.BytesIO()
+        broker_helper.write_frame(stream, {"operations": [{"op": "rm"}]})
+        broker_helper.write_frame(stream, {"results": []})
+        stream.seek(0)
+
+        assert broker_helper.read_frame(stream) == {"operations": [{"op": "rm"}]}
+        assert broker_helper.read_frame(stream) == {"results": []}
+        assert broker_helper.read_frame(stream) is None
+
+    @pytest.mark.unit
+    def test_file_operations(self, tmp_path: Path) -> None:
+        target = tmp_path / "a" / "b"
+        results = broker_helper.execute_batch(
+            [
+                BrokerOperation.mkdir(target.as_posix(), mode=0o750).to_dict(),
+                BrokerOperation.write_file(
+                    (target / "file.txt").as_posix(), "hello\n", mode=0o640
+                ).to_dict(),
+            ]
+        )
+
+        assert [result["returncode"] for result in results] == [0, 0]
+        assert (target / "file.txt").read_text() == "hello\n"
+        assert (target.stat().st_mode & 0o777) == 0o750
+        assert ((target / "file.txt").stat().st_mode & 0o777) == 0o640
+
+        broker_helper.execute(
+            BrokerOperation.rm(tmp_path.as_posix(), contents_only=True).to_dict()
+        )
+        assert tmp_path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.unit
+    def test_batch_stops_at_first_failure(self, tmp_path: Path) -> None:
+        results = broker_helper.execute_batch(
+            [
+                {"op": "rm", "path": tmp_path.as_posix(), "args": []},
+                {"op": "sh", "path": None, "args": ["-c", "true"]},
+                BrokerOperation.mkdir((tmp_path / "never").as_posix()).to_dict(),
+            ]
+        )
+
+        assert len(results) == 2
+        assert results[1]["returncode"] == 1
+        assert "not allowed" in results[1]["stderr"]
+        assert not (tmp_path / "never").exists()
+
+
+class TestBrokerOperation:
+    @pytest.mark.unit
+    def test_to_shell_quotes_arguments(self) -> None:
+        assert (
+            BrokerOperation.git(
+                "checkout", "main; rm -rf /", cwd="/srv/repo"
+            ).to_shell()
+            == "git -C /srv/repo checkout 'main; rm -rf /'"
+        )
+        assert (
+            BrokerOperation.rm("/srv/my repo", contents_only=True).to_shell()
+            == "find '/srv/my repo' -mindepth 1 -delete"
+        )
+        assert (
+            BrokerOperation.write_file("/srv/a", "it's").to_shell()
+            == "printf '%s' 'it'\"'\"'s' > /srv/a"
+        )
+
+
+class TestCommandBroker:
+    @pytest.mark.unit
+    def test_runs_in_process_for_current_user(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        mock_popen = mocker.patch("svs_core.shared.broker.subprocess.Popen")
+        mocker.patch.object(CommandBroker, "_current_user", return_value="svs")
+
+        results = CommandBroker.run(
+            "svs",
+            [BrokerOperation.write_file((tmp_path / "f").as_posix(), "x")],
+        )
+
+        mock_popen.assert_not_called()
+        assert results[0].returncode == 0
+        assert (tmp_path / "f").read_text() == "x"
+        assert CommandBroker.get_stats()["write_file"].count == 1
+
+    @pytest.mark.unit
+    def test_check_raises_called_process_error(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        mocker.patch.object(CommandBroker, "_current_user", return_value="svs")
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            CommandBroker.run(
+                "svs",
+                [BrokerOperation.git("rev-parse", "HEAD", cwd=tmp_path.as_posix())],
+            )
+
+        assert exc_info.value.cmd.startswith("git -C ")
+        assert CommandBroker.get_stats()["git"].failures == 1
+
+    @pytest.mark.unit
+    def test_falls_back_to_sudo_when_helper_unavailable(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch.object(CommandBroker, "_current_user", return_value="svs")
+        mock_start = mocker.patch.object(
+            CommandBroker, "_start_helper", return_value=None
+        )
+        mock_run_command = mocker.patch(
+            "svs_core.shared.broker.run_command",
+            return_value=subprocess.CompletedProcess("", 0, "abc\n", ""),
+        )
+
+        for _ in range(2):
+            results = CommandBroker.run(
+                "alice", [BrokerOperation.git("rev-parse", "main", cwd="/srv/repo")]
+            )
+
+        # A helper that failed to start is not retried on every call
+        mock_start.assert_called_once_with("alice")
+        mock_run_command.assert_called_with(
+            "git -C /srv/repo rev-parse main", check=False, user="alice"
+        )
+        assert results[0].stdout == "abc\n"
+        assert CommandBroker.get_stats()["git"].fallbacks == 2
+
+    @pytest.mark.unit
+    def test_helper_process_serves_batches(self, tmp_path: Path) -> None:
+        process = subprocess.Popen(
+            [sys.executable, "-I", broker_helper.__file__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        assert process.stdout is not None
+        ready = broker_helper.read_frame(process.stdout)
+        assert ready is not None and ready["ready"] is True
+
+        helper = _HelperProcess("svs", process)
+        try:
+            for name in ("first", "second"):
+                results = helper.request(
+                    [
+                        BrokerOperation.mkdir((tmp_path / name).as_posix()),
+                        BrokerOperation.write_file(
+                            (tmp_path / name / "f").as_posix(), name
+                        ),
+                    ]
+                )
+                assert [result["returncode"] for result in results] == [0, 0]
+        finally:
+            helper.stop()
+
+        assert (tmp_path / "second" / "f").read_text() == "second"
+        assert process.returncode == 0
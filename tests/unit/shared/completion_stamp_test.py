@@ -0,0 +1,69 @@
+import grp
+import os
+import pwd
+
+from pathlib import Path
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.shared.completion_stamp import CompletionStamp
+
+
+@pytest.fixture
+def stamp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "completion.stamp"
+    monkeypatch.setattr(CompletionStamp, "PATH", path)
+    return path
+
+
+class TestCompletionStamp:
+    @pytest.mark.unit
+    def test_create_sets_ownership_and_mode(self, stamp: Path) -> None:
+        owner = pwd.getpwuid(os.getuid()).pw_name
+        group = grp.getgrgid(os.getgid()).gr_name
+
+        CompletionStamp.create(owner, group)
+
+        info = stamp.stat()
+        assert (info.st_uid, info.st_gid) == (os.getuid(), os.getgid())
+        assert info.st_mode & 0o777 == CompletionStamp.MODE
+
+    @pytest.mark.unit
+    def test_create_rejects_unknown_group(self, stamp: Path) -> None:
+        with pytest.raises(KeyError):
+            CompletionStamp.create(group="svs-missing-group")
+
+        assert not stamp.exists()
+
+    @pytest.mark.unit
+    def test_remove(self, stamp: Path) -> None:
+        stamp.touch()
+
+        CompletionStamp.remove()
+        CompletionStamp.remove()
+
+        assert not stamp.exists()
+
+    @pytest.mark.unit
+    def test_invalidate_touches_stamp(self, stamp: Path) -> None:
+        stamp.touch()
+        os.utime(stamp, (0, 0))
+
+        CompletionStamp.invalidate()
+
+        assert CompletionStamp.invalidated_at() > 0
+
+    @pytest.mark.unit
+    def test_invalidate_logs_failures(self, stamp: Path, mocker: MockerFixture) -> None:
+        mock_logger = mocker.patch("svs_core.shared.completion_stamp.get_logger")
+
+        CompletionStamp.invalidate()
+
+        assert not stamp.exists()
+        mock_logger.return_value.warning.assert_called_once()
+
+    @pytest.mark.unit
+    def test_invalidated_at_without_stamp(self, stamp: Path) -> None:
+        assert CompletionStamp.invalidated_at() == 0.0
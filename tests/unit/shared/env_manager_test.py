@@ -174,3 +174,19 @@ class TestEnvManager:
         )
         result = EnvManager.get_log_level()
         assert result == logging.INFO
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("1", True), ("true", True), ("YES", True), ("0", False), ("", False)],
+    )
+    def test_get_docker_buildkit(
+        self, mocker: MockerFixture, value: str, expected: bool
+    ) -> None:
+        mocker.patch.dict(os.environ, {"DOCKER_BUILDKIT": value})
+        assert EnvManager.get_docker_buildkit() is expected
+
+    @pytest.mark.unit
+    def test_get_docker_buildkit_defaults_to_false(self, mocker: MockerFixture) -> None:
+        mocker.patch.dict(os.environ, {}, clear=True)
+        assert EnvManager.get_docker_buildkit() is False
@@ -0,0 +1,69 @@
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pytest_mock import MockerFixture
+
+from svs_core.shared.jobs import JobWorker
+
+
+class TestJobWorker:
+    @pytest.mark.unit
+    def test_runs_claimed_jobs_until_stopped(self, mocker: MockerFixture) -> None:
+        stop = threading.Event()
+        jobs = [mocker.MagicMock(id=i) for i in range(3)]
+        pending = list(jobs)
+        ran: list[int] = []
+
+        def claim_next(max_per_user: int) -> MagicMock | None:
+            assert max_per_user == 2
+            return pending.pop(0) if pending else None
+
+        for job in jobs:
+
+            def run(job: MagicMock = job) -> None:
+                ran.append(job.id)
+                if len(ran) == len(jobs):
+                    stop.set()
+
+            job.run.side_effect = run
+
+        mocker.patch("svs_core.shared.jobs.close_old_connections")
+        mocker.patch("svs_core.shared.jobs.connections")
+        mock_interrupted = mocker.patch(
+            "svs_core.shared.jobs.Job.fail_interrupted", return_value=0
+        )
+        mocker.patch("svs_core.shared.jobs.Job.claim_next", side_effect=claim_next)
+
+        JobWorker.run(max_workers=2, max_per_user=2, stop=stop, poll_interval=0.01)
+
+        mock_interrupted.assert_called_once()
+        assert sorted(ran) == [0, 1, 2]
+
+    @pytest.mark.unit
+    def test_never_exceeds_max_workers(self, mocker: MockerFixture) -> None:
+        stop = threading.Event()
+        release = threading.Event()
+        claimed = 0
+
+        def claim_next(max_per_user: int) -> MagicMock:
+            nonlocal claimed
+            claimed += 1
+            job = MagicMock()
+            job.run.side_effect = lambda: release.wait(1)
+            if claimed == 2:
+                # Both workers are busy now, further claims would be a bug
+                stop.set()
+            return job
+
+        mocker.patch("svs_core.shared.jobs.close_old_connections")
+        mocker.patch("svs_core.shared.jobs.connections")
+        mocker.patch("svs_core.shared.jobs.Job.fail_interrupted", return_value=0)
+        mocker.patch("svs_core.shared.jobs.Job.claim_next", side_effect=claim_next)
+
+        threading.Timer(0.1, release.set).start()
+        JobWorker.run(max_workers=2, max_per_user=1, stop=stop, poll_interval=0.01)
+
+        assert claimed == 2
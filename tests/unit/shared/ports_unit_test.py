@@ -0,0 +1,244 @@
+import grp
+import multiprocessing
+import os
+import pwd
+import threading
+import time
+
+from pathlib import Path
+
+import pytest
+
+from svs_core.shared.exceptions import ResourceException, ValidationException
+from svs_core.shared.ports import SystemPortManager
+
+PROC_NET_TCP = """  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000:C350 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1 1 0 100 0 0 10 0
+   1: 0100007F:C351 0100007F:D000 01 00000000:00000000 00:00000000 00000000     0        0 2 1 0 100 0 0 10 0
+"""
+
+PROC_NET_TCP6 = """  sl  local_address                         remote_address                        st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000000000000000000000000000:C352 00000000000000000000000000000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 3 1 0 100 0 0 10 0
+"""
+
+
+@pytest.fixture
+def proc_net(tmp_path, monkeypatch):
+    tcp = tmp_path / "tcp"
+    tcp6 = tmp_path / "tcp6"
+    tcp.write_text(PROC_NET_TCP)
+    tcp6.write_text(PROC_NET_TCP6)
+    monkeypatch.setattr(SystemPortManager, "PROC_NET_TCP_PATHS", (tcp, tcp6))
+    return tcp, tcp6
+
+
+class TestSystemPortManager:
+    def test_get_listening_ports_parses_ipv4_and_ipv6(self, proc_net):
+        # 0xC350 = 50000 (listen), 0xC351 = 50001 (established), 0xC352 = 50002
+        assert SystemPortManager.get_listening_ports() == {50000, 50002}
+
+    def test_get_listening_ports_skips_missing_tables(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            SystemPortManager, "PROC_NET_TCP_PATHS", (tmp_path / "missing",)
+        )
+
+        assert SystemPortManager.get_listening_ports() == set()
+
+    def test_is_port_used_true(self, proc_net):
+        assert SystemPortManager.is_port_used(50000) is True
+
+    def test_is_port_used_false(self, proc_net):
+        assert SystemPortManager.is_port_used(50001) is False
+
+    @pytest.mark.django_db
+    def test_find_free_port_does_not_spawn_subprocess(self, proc_net, mocker):
+        mock_run = mocker.patch("subprocess.run")
+
+        port = SystemPortManager.find_free_port()
+
+        assert port in SystemPortManager.PORT_RANGE
+        mock_run.assert_not_called()
+
+    def test_find_free_port_skips_listening_and_assigned_ports(
+        self, proc_net, monkeypatch
+    ):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50000, 50004))
+        monkeypatch.setattr(
+            "svs_core.shared.ports.SystemPortManager.get_assigned_ports",
+            staticmethod(lambda: {50001}),
+        )
+
+        assert SystemPortManager.find_free_port() == 50003
+
+    @pytest.mark.django_db
+    def test_find_free_port_reserves_port_within_block(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50003, 50005))
+
+        with SystemPortManager.reserving():
+            first = SystemPortManager.find_free_port()
+            second = SystemPortManager.find_free_port()
+
+            assert {first, second} == {50003, 50004}
+            with pytest.raises(ResourceException):
+                SystemPortManager.find_free_port()
+
+    @pytest.mark.django_db
+    def test_reservations_end_with_block(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50003, 50004))
+
+        with pytest.raises(RuntimeError):
+            with SystemPortManager.reserving():
+                SystemPortManager.find_free_port()
+                raise RuntimeError("saving the service failed")
+
+        assert SystemPortManager.find_free_port() == 50003
+
+    @pytest.mark.django_db
+    def test_nested_blocks_share_reservations(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50003, 50005))
+
+        with SystemPortManager.reserving():
+            first = SystemPortManager.find_free_port()
+            with SystemPortManager.reserving():
+                second = SystemPortManager.find_free_port()
+
+            assert first != second
+            assert SystemPortManager.get_used_ports() == {50000, 50002, 50003, 50004}
+
+    def test_concurrent_callers_get_distinct_ports(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50003, 50023))
+        assigned: set[int] = set()
+        monkeypatch.setattr(
+            "svs_core.shared.ports.SystemPortManager.get_assigned_ports",
+            staticmethod(lambda: set(assigned)),
+        )
+        results: list[int] = []
+
+        def create_service() -> None:
+            with SystemPortManager.reserving():
+                port = SystemPortManager.find_free_port()
+                time.sleep(0.001)
+                # Saving the service records the port
+                assigned.add(port)
+            results.append(port)
+
+        threads = [threading.Thread(target=create_service) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(results)) == 20
+
+    def test_lock_is_held_across_processes(self):
+        with SystemPortManager.reserving():
+            process = multiprocessing.get_context("spawn").Process(
+                target=_reserve_in_child, args=(SystemPortManager.LOCK_PATH,)
+            )
+            process.start()
+            process.join(timeout=2)
+
+            assert process.is_alive()
+
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+    def test_create_lock_sets_ownership_and_mode(self, tmp_path, monkeypatch):
+        lock = tmp_path / "ports.lock"
+        monkeypatch.setattr(SystemPortManager, "LOCK_PATH", lock)
+        owner = pwd.getpwuid(os.getuid()).pw_name
+        group = grp.getgrgid(os.getgid()).gr_name
+
+        SystemPortManager.create_lock(owner, group)
+
+        info = lock.stat()
+        assert (info.st_uid, info.st_gid) == (os.getuid(), os.getgid())
+        assert info.st_mode & 0o777 == SystemPortManager.LOCK_MODE
+
+    def test_remove_lock(self, tmp_path, monkeypatch):
+        lock = tmp_path / "ports.lock"
+        monkeypatch.setattr(SystemPortManager, "LOCK_PATH", lock)
+        lock.touch()
+
+        SystemPortManager.remove_lock()
+        SystemPortManager.remove_lock()
+
+        assert not lock.exists()
+
+    def test_unusable_lock_path_raises(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            SystemPortManager, "LOCK_PATH", tmp_path / "missing" / "ports.lock"
+        )
+
+        with pytest.raises(ResourceException):
+            with SystemPortManager.reserving():
+                pass
+
+    @pytest.mark.django_db
+    def test_find_free_port_raises_when_range_exhausted(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50000, 50001))
+
+        with pytest.raises(ResourceException):
+            SystemPortManager.find_free_port()
+
+    @pytest.mark.django_db
+    def test_allocate_returns_distinct_ports_in_one_scan(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50000, 50010))
+        scans: list[int] = []
+        original = SystemPortManager.get_listening_ports
+
+        def counting_scan():
+            scans.append(1)
+            return original()
+
+        monkeypatch.setattr(
+            "svs_core.shared.ports.SystemPortManager.get_listening_ports",
+            staticmethod(counting_scan),
+        )
+
+        ports = SystemPortManager.allocate(5)
+
+        assert len(ports) == 5
+        assert len(set(ports)) == 5
+        assert not {50000, 50002} & set(ports)
+        assert len(scans) == 1
+
+    @pytest.mark.django_db
+    def test_allocate_reserves_all_ports(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50003, 50006))
+
+        with SystemPortManager.reserving():
+            ports = SystemPortManager.allocate(3)
+
+            assert sorted(ports) == [50003, 50004, 50005]
+            with pytest.raises(ResourceException):
+                SystemPortManager.allocate(1)
+
+    @pytest.mark.django_db
+    def test_allocate_raises_without_reserving_when_short(self, proc_net, monkeypatch):
+        monkeypatch.setattr(SystemPortManager, "PORT_RANGE", range(50003, 50005))
+
+        with SystemPortManager.reserving():
+            with pytest.raises(ResourceException):
+                SystemPortManager.allocate(3)
+
+            assert SystemPortManager.allocate(2)
+
+    def test_allocate_zero_skips_scan(self, mocker):
+        mock_scan = mocker.patch(
+            "svs_core.shared.ports.SystemPortManager.get_listening_ports"
+        )
+
+        assert SystemPortManager.allocate(0) == []
+        mock_scan.assert_not_called()
+
+    def test_allocate_rejects_negative_count(self):
+        with pytest.raises(ValidationException):
+            SystemPortManager.allocate(-1)
+
+
+def _reserve_in_child(lock_path: Path) -> None:
+    """Enters a reserving block in another process, waiting for the parent's lock."""
+    SystemPortManager.LOCK_PATH = lock_path
+    with SystemPortManager.reserving():
+        pass
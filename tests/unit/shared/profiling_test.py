@@ -0,0 +1,142 @@
+import pstats
+
+from pathlib import Path
+
+import pytest
+
+from django.db import connection
+from pytest_mock import MockerFixture
+
+from svs_core.shared.broker import BrokerStats, CommandBroker
+from svs_core.shared.profiling import CallStats, Profiler
+
+
+@pytest.fixture(autouse=True)
+def stop_profiler():
+    yield
+    Profiler.stop()
+
+
+class TestProfiler:
+    @pytest.mark.unit
+    def test_record_is_ignored_when_disabled(self) -> None:
+        Profiler.start()
+        Profiler.stop()
+
+        Profiler.record("command", "git as svs", 0.5)
+
+        assert Profiler.get_stats() == {}
+
+    @pytest.mark.unit
+    def test_record_aggregates_by_category_and_key(self) -> None:
+        Profiler.start()
+
+        Profiler.record("command", "git as svs", 0.5)
+        Profiler.record("command", "git as svs", 1.5, failed=True)
+        Profiler.record("docker", "GET /containers/{id}/json", 0.1)
+
+        stats = Profiler.get_stats()
+        assert stats[("command", "git as svs")] == CallStats(2, 1, 2.0, 1.5)
+        assert stats[("docker", "GET /containers/{id}/json")].count == 1
+
+    @pytest.mark.unit
+    def test_start_discards_previous_calls(self) -> None:
+        Profiler.start()
+        Profiler.record("command", "git as svs", 0.5)
+
+        Profiler.start()
+
+        assert Profiler.get_stats() == {}
+
+    @pytest.mark.unit
+    def test_database_wrapper_is_installed_while_enabled(self) -> None:
+        Profiler.start()
+        assert Profiler._database_wrapper in connection.execute_wrappers
+
+        Profiler.stop()
+        assert Profiler._database_wrapper not in connection.execute_wrappers
+
+    @pytest.mark.unit
+    def test_database_wrapper_records_queries(self, mocker: MockerFixture) -> None:
+        execute = mocker.MagicMock(return_value="rows")
+        Profiler.start()
+
+        result = Profiler._database_wrapper(
+            execute, "SELECT *\n  FROM users WHERE id = %s", [1], False, {}
+        )
+
+        assert result == "rows"
+        execute.assert_called_once_with(
+            "SELECT *\n  FROM users WHERE id = %s", [1], False, {}
+        )
+        stats = Profiler.get_stats()[("database", "SELECT * FROM users WHERE id = %s")]
+        assert stats.count == 1
+        assert stats.failures == 0
+
+    @pytest.mark.unit
+    def test_database_wrapper_records_failed_queries(
+        self, mocker: MockerFixture
+    ) -> None:
+        execute = mocker.MagicMock(side_effect=RuntimeError("locked"))
+        Profiler.start()
+
+        with pytest.raises(RuntimeError):
+            Profiler._database_wrapper(execute, "DELETE FROM jobs", None, False, {})
+
+        assert Profiler.get_stats()[("database", "DELETE FROM jobs")].failures == 1
+
+    @pytest.mark.unit
+    def test_report_prints_calls_and_broker_operations(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        mocker.patch.object(
+            CommandBroker, "get_stats", return_value={"git": BrokerStats(3, 0, 0, 0.3)}
+        )
+        Profiler.start()
+        Profiler.record("command", "systemctl as root", 0.25)
+        Profiler.stop()
+
+        Profiler.report()
+
+        # Log records may reach stdout, the report itself must not
+        captured = capsys.readouterr()
+        assert "systemctl" not in captured.out
+        assert "systemctl" in captured.err
+        assert "250.0 ms" in captured.err
+        assert "broker" in captured.err
+
+    @pytest.mark.unit
+    def test_report_limits_rows_per_category(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        Profiler.start()
+        for index in range(Profiler.REPORT_LIMIT + 2):
+            Profiler.record("database", f"SELECT {index}", 0.01)
+        Profiler.stop()
+
+        Profiler.report()
+
+        assert "... 2 more" in capsys.readouterr().err
+
+    @pytest.mark.unit
+    def test_report_ignores_terminal_width(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        monkeypatch.setenv("COLUMNS", "40")
+        Profiler.start()
+        Profiler.record("command", "systemctl as root", 0.25)
+        Profiler.stop()
+
+        Profiler.report()
+
+        assert "systemctl as root" in capsys.readouterr().err
+
+    @pytest.mark.unit
+    def test_output_writes_pstats_dump(self, tmp_path: Path) -> None:
+        output = tmp_path / "svs.prof"
+
+        Profiler.start(output=output.as_posix())
+        sorted(range(100))
+        Profiler.stop()
+
+        assert pstats.Stats(output.as_posix()).get_stats_profile().func_profiles
@@ -7,7 +7,9 @@ import pytest
 
 from pytest_mock import MockerFixture
 
+from svs_core.shared.profiling import Profiler
 from svs_core.shared.shell import (
+    command_label,
     create_directory,
     read_file,
     remove_directory,
@@ -226,3 +228,49 @@ class TestCommandExecution:
         args, kwargs = mock_run.call_args
         assert "sudo -u svs mkdir -p test_dir && echo 'dir created'" == args[0]
         assert kwargs.get("shell", False)
+
+
+class TestCommandProfiling:
+    @pytest.fixture(autouse=True)
+    def stop_profiler(self):
+        yield
+        Profiler.stop()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "command, label",
+        [
+            ("git clone https://token@example.com/repo.git", "git"),
+            ("sudo -u svs /usr/bin/docker ps", "docker"),
+            ("sudo -n systemctl restart svs-web", "systemctl"),
+            ("HOME=/tmp GIT_TERMINAL_PROMPT=0 git fetch", "git"),
+            ("echo 'unterminated", "echo"),
+        ],
+    )
+    def test_command_label(self, command: str, label: str) -> None:
+        assert command_label(command) == label
+
+    @pytest.mark.unit
+    def test_run_command_records_when_profiling(self, mocker: MockerFixture) -> None:
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = subprocess.CompletedProcess("", 0, "", "")
+        Profiler.start()
+
+        run_command("git status", user="alice")
+
+        stats = Profiler.get_stats()[("command", "git as alice")]
+        assert stats.count == 1
+        assert stats.failures == 0
+
+    @pytest.mark.unit
+    def test_run_command_records_failures(self, mocker: MockerFixture) -> None:
+        mocker.patch(
+            "subprocess.run",
+            side_effect=subprocess.CalledProcessError(returncode=128, cmd="git"),
+        )
+        Profiler.start()
+
+        with pytest.raises(subprocess.CalledProcessError):
+            run_command("git status")
+
+        assert Profiler.get_stats()[("command", "git as svs")].failures == 1
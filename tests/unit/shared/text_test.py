@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from svs_core.shared.exceptions import ValidationException
+from svs_core.shared.text import parse_since
+
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class TestParseSince:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("30s", datetime(2024, 1, 1, 11, 59, 30, tzinfo=timezone.utc)),
+            ("10m", datetime(2024, 1, 1, 11, 50, 0, tzinfo=timezone.utc)),
+            ("2h", datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)),
+            ("1d", datetime(2023, 12, 31, 12, 0, 0, tzinfo=timezone.utc)),
+        ],
+    )
+    def test_relative_duration(self, value, expected):
+        assert parse_since(value, now=NOW) == expected
+
+    @pytest.mark.unit
+    def test_unix_timestamp(self):
+        assert parse_since("1704110400.5") == datetime(
+            2024, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.unit
+    def test_rfc3339_with_nanoseconds(self):
+        assert parse_since("2024-01-01T12:00:00.123456789Z") == datetime(
+            2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.unit
+    def test_naive_datetime_is_utc(self):
+        assert parse_since("2024-01-01 12:00:00") == NOW
+
+    @pytest.mark.unit
+    def test_invalid_value(self):
+        with pytest.raises(ValidationException):
+            parse_since("yesterday")
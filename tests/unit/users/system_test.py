@@ -1,5 +1,8 @@
 import os
 
+from typing import Iterator
+from unittest.mock import MagicMock
+
 import pytest
 
 from pytest_mock import MockerFixture
@@ -7,6 +10,78 @@ from pytest_mock import MockerFixture
 from svs_core.users.system import SystemUserManager
 
 
+@pytest.fixture(autouse=True)
+def reset_identity_cache() -> Iterator[None]:
+    SystemUserManager.invalidate_identity_cache()
+    yield
+    SystemUserManager.invalidate_identity_cache()
+
+
+def mock_identity(
+    mocker: MockerFixture,
+    users: dict[str, tuple[int, int]],
+    groups: dict[str, tuple[int, list[str]]],
+) -> dict[str, MagicMock]:
+    """Replace the user and group databases with the given entries.
+
+    Args:
+        users: UID and primary GID by username.
+        groups: GID and members by group name.
+
+    Returns:
+        dict[str, MagicMock]: The lookup mocks by function name.
+    """
+
+    def getpwnam(name: str) -> MagicMock:
+        if name not in users:
+            raise KeyError(name)
+        return MagicMock(pw_uid=users[name][0], pw_gid=users[name][1])
+
+    def getgrnam(name: str) -> MagicMock:
+        if name not in groups:
+            raise KeyError(name)
+        return MagicMock(gr_gid=groups[name][0])
+
+    def getgrgid(gid: int) -> MagicMock:
+        for name, (group_gid, _) in groups.items():
+            if group_gid == gid:
+                return MagicMock(gr_name=name)
+        raise KeyError(gid)
+
+    def getgrouplist(name: str, gid: int) -> list[int]:
+        return [gid] + [
+            group_gid
+            for group_gid, members in groups.values()
+            if name in members and group_gid != gid
+        ]
+
+    return {
+        "getpwnam": mocker.patch(
+            "svs_core.users.system.pwd.getpwnam", side_effect=getpwnam
+        ),
+        "getgrnam": mocker.patch(
+            "svs_core.users.system.grp.getgrnam", side_effect=getgrnam
+        ),
+        "getgrgid": mocker.patch(
+            "svs_core.users.system.grp.getgrgid", side_effect=getgrgid
+        ),
+        "getgrouplist": mocker.patch(
+            "svs_core.users.system.os.getgrouplist", side_effect=getgrouplist
+        ),
+    }
+
+
+USERS: dict[str, tuple[int, int]] = {
+    "testuser": (1000, 1000),
+    "adminuser": (1001, 1001),
+}
+GROUPS: dict[str, tuple[int, list[str]]] = {
+    "testuser": (1000, []),
+    "adminuser": (1001, []),
+    "svs-admins": (2000, ["adminuser"]),
+}
+
+
 class TestSystemUser:
     @pytest.mark.unit
     def test_create_normal_user(self, mocker: MockerFixture) -> None:
@@ -59,32 +134,72 @@ class TestSystemUser:
     @pytest.mark.unit
     def test_is_user_in_group_user_in_group(self, mocker: MockerFixture) -> None:
         mock_run_command = mocker.patch("svs_core.users.system.run_command")
-        mock_run_command.return_value.returncode = 0
+        mock_identity(mocker, USERS, GROUPS)
 
-        username = "testuser"
-        groupname = "testgroup"
+        assert SystemUserManager.is_user_in_group("adminuser", "svs-admins") is True
+        assert SystemUserManager.is_user_in_group("adminuser", "adminuser") is True
+        mock_run_command.assert_not_called()
+
+    @pytest.mark.unit
+    def test_is_user_in_group_user_not_in_group(self, mocker: MockerFixture) -> None:
+        mock_identity(mocker, USERS, GROUPS)
 
-        result = SystemUserManager.is_user_in_group(username, groupname)
+        assert SystemUserManager.is_user_in_group("testuser", "svs-admins") is False
+        assert SystemUserManager.is_user_in_group("nonexistent", "svs-admins") is False
 
-        mock_run_command.assert_called_once_with(
-            f"groups {username} | grep -qw {groupname}", check=False
+    @pytest.mark.unit
+    def test_identity_lookups_are_cached(self, mocker: MockerFixture) -> None:
+        mocks = mock_identity(mocker, USERS, GROUPS)
+        mocker.patch(
+            "svs_core.users.system.os.stat",
+            return_value=mocker.MagicMock(st_mtime_ns=1),
         )
-        assert result is True
+
+        for _ in range(3):
+            SystemUserManager.is_user_in_group("adminuser", "svs-admins")
+            SystemUserManager.get_system_uid_gid("adminuser")
+
+        assert mocks["getgrouplist"].call_count == 1
+        assert mocks["getgrnam"].call_count == 1
+        # One lookup for the group list, one for the UID
+        assert mocks["getpwnam"].call_count == 2
 
     @pytest.mark.unit
-    def test_is_user_in_group_user_not_in_group(self, mocker: MockerFixture) -> None:
-        mock_run_command = mocker.patch("svs_core.users.system.run_command")
-        mock_run_command.return_value.returncode = 1
+    def test_identity_cache_dropped_when_databases_change(
+        self, mocker: MockerFixture
+    ) -> None:
+        mock_identity(mocker, USERS, GROUPS)
+        mock_stat = mocker.patch(
+            "svs_core.users.system.os.stat",
+            return_value=mocker.MagicMock(st_mtime_ns=1),
+        )
 
-        username = "testuser"
-        groupname = "testgroup"
+        assert SystemUserManager.is_user_in_group("testuser", "svs-admins") is False
 
-        result = SystemUserManager.is_user_in_group(username, groupname)
+        # Another process adds testuser to svs-admins
+        mock_identity(
+            mocker,
+            users=USERS,
+            groups={**GROUPS, "svs-admins": (2000, ["testuser"])},
+        )
+        assert SystemUserManager.is_user_in_group("testuser", "svs-admins") is False
 
-        mock_run_command.assert_called_once_with(
-            f"groups {username} | grep -qw {groupname}", check=False
+        mock_stat.return_value = mocker.MagicMock(st_mtime_ns=2)
+        assert SystemUserManager.is_user_in_group("testuser", "svs-admins") is True
+
+    @pytest.mark.unit
+    def test_identity_cache_dropped_on_user_changes(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("svs_core.users.system.run_command")
+        mock_invalidate = mocker.patch.object(
+            SystemUserManager, "invalidate_identity_cache"
         )
-        assert result is False
+
+        SystemUserManager.create_user("adminuser", "adminpass", admin=True)
+        SystemUserManager.delete_user("adminuser")
+
+        assert mock_invalidate.call_count == 2
 
     @pytest.mark.unit
     def test_get_system_username_returns_sudo_user(self, mocker: MockerFixture) -> None:
@@ -268,86 +383,44 @@ class TestSystemUser:
     ) -> None:
         """Test that get_system_uid_gid returns correct UID and GID for a
         user."""
-        mock_uid_result = mocker.MagicMock()
-        mock_uid_result.stdout = "1000\n"
-        mock_gid_result = mocker.MagicMock()
-        mock_gid_result.stdout = "1000\n"
+        mock_identity(mocker, USERS, GROUPS)
 
-        mock_run_command = mocker.patch("svs_core.users.system.run_command")
-        mock_run_command.side_effect = [mock_uid_result, mock_gid_result]
-
-        username = "testuser"
-        uid, gid = SystemUserManager.get_system_uid_gid(username)
+        uid, gid = SystemUserManager.get_system_uid_gid("testuser")
 
-        assert uid == 1000
-        assert gid == 1000
+        assert (uid, gid) == (1000, 1000)
         assert isinstance(uid, int)
         assert isinstance(gid, int)
 
-        assert mock_run_command.call_count == 2
-        mock_run_command.assert_any_call(f"sudo id -u {username}")
-        mock_run_command.assert_any_call(
-            f"sudo getent group {username} | cut -d: -f3", check=True
-        )
-
-    @pytest.mark.unit
-    def test_get_system_uid_gid_returns_tuple(self, mocker: MockerFixture) -> None:
-        """Test that get_system_uid_gid returns a tuple of two integers."""
-        mock_uid_result = mocker.MagicMock()
-        mock_uid_result.stdout = "1001\n"
-        mock_gid_result = mocker.MagicMock()
-        mock_gid_result.stdout = "1001\n"
-
-        mock_run_command = mocker.patch("svs_core.users.system.run_command")
-        mock_run_command.side_effect = [mock_uid_result, mock_gid_result]
-
-        username = "testuser"
-        result = SystemUserManager.get_system_uid_gid(username)
-
-        assert isinstance(result, tuple)
-        assert len(result) == 2
-        assert isinstance(result[0], int)
-        assert isinstance(result[1], int)
-
     @pytest.mark.unit
     def test_get_system_uid_gid_with_different_uid_gid(
         self, mocker: MockerFixture
     ) -> None:
         """Test that get_system_uid_gid works when UID and GID are
         different."""
-        mock_uid_result = mocker.MagicMock()
-        mock_uid_result.stdout = "1234\n"
-        mock_gid_result = mocker.MagicMock()
-        mock_gid_result.stdout = "5678\n"
-
-        mock_run_command = mocker.patch("svs_core.users.system.run_command")
-        mock_run_command.side_effect = [mock_uid_result, mock_gid_result]
+        mock_identity(
+            mocker,
+            users={"differentuser": (1234, 5678)},
+            groups={"differentuser": (5678, [])},
+        )
 
-        username = "differentuser"
-        uid, gid = SystemUserManager.get_system_uid_gid(username)
+        uid, gid = SystemUserManager.get_system_uid_gid("differentuser")
 
         assert uid == 1234
         assert gid == 5678
-        mock_run_command.assert_any_call(f"sudo id -u {username}")
-        mock_run_command.assert_any_call(
-            f"sudo getent group {username} | cut -d: -f3", check=True
-        )
 
     @pytest.mark.unit
     def test_get_uid(self, mocker: MockerFixture) -> None:
         """Test that get_uid returns the correct UID."""
-        mock_result = mocker.MagicMock()
-        mock_result.stdout = "1000\n"
-        mocker.patch("svs_core.users.system.run_command", return_value=mock_result)
+        mock_run_command = mocker.patch("svs_core.users.system.run_command")
+        mock_identity(mocker, USERS, GROUPS)
 
         assert SystemUserManager.get_uid("testuser") == 1000
+        mock_run_command.assert_not_called()
 
     @pytest.mark.unit
     def test_get_uid_raises_keyerror(self, mocker: MockerFixture) -> None:
         """Test that get_uid raises KeyError for invalid user."""
-        mock_result = mocker.MagicMock()
-        mock_result.stdout = "invalid\n"
-        mocker.patch("svs_core.users.system.run_command", return_value=mock_result)
+        mock_identity(mocker, USERS, GROUPS)
 
         with pytest.raises(KeyError):
             SystemUserManager.get_uid("nonexistent")
@@ -355,18 +428,14 @@ class TestSystemUser:
     @pytest.mark.unit
     def test_get_gid(self, mocker: MockerFixture) -> None:
         """Test that get_gid returns the correct GID."""
-        mock_result = mocker.MagicMock()
-        mock_result.stdout = "1000\n"
-        mocker.patch("svs_core.users.system.run_command", return_value=mock_result)
+        mock_identity(mocker, USERS, GROUPS)
 
-        assert SystemUserManager.get_gid("testgroup") == 1000
+        assert SystemUserManager.get_gid("svs-admins") == 2000
 
     @pytest.mark.unit
     def test_get_gid_raises_keyerror(self, mocker: MockerFixture) -> None:
         """Test that get_gid raises KeyError for invalid group."""
-        mock_result = mocker.MagicMock()
-        mock_result.stdout = "\n"
-        mocker.patch("svs_core.users.system.run_command", return_value=mock_result)
+        mock_identity(mocker, USERS, GROUPS)
 
         with pytest.raises(KeyError):
             SystemUserManager.get_gid("nonexistent")
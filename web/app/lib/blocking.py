@@ -0,0 +1,55 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Docker calls block a thread each, and a followed log stream holds its thread
+# for a whole stream window, so they get a pool sized for many viewers instead
+# of sharing the event loop's default executor.
+BLOCKING_IO_THREADS = 64
+
+_executor = ThreadPoolExecutor(
+    max_workers=BLOCKING_IO_THREADS, thread_name_prefix="svs-web-io"
+)
+
+_DONE = object()
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking call, e.g. a Docker request, without blocking the event
+    loop.
+
+    The call must not use the database: database access belongs in the
+    thread Django's `sync_to_async` uses by default.
+
+    Args:
+        func: The blocking function.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        T: The return value of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def iterate_blocking(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Iterate a blocking iterator, fetching every item off the event loop.
+
+    Args:
+        iterator: The iterator, e.g. a followed Docker log stream.
+
+    Yields:
+        T: The items of the iterator.
+    """
+    while True:
+        item = await run_blocking(next, iterator, _DONE)
+        if item is _DONE:
+            return
+        yield item
@@ -3,13 +3,15 @@ from django.http import HttpRequest
 
 def is_owner_or_admin(request: HttpRequest, model: object) -> bool:
     """Check if the current user is the owner of the object or an admin."""
-    user_id = request.session.get("user_id")
+    user = getattr(request, "svs_user", None)
     is_admin = request.session.get("is_admin", False)
 
     if is_admin:
         return True
 
-    if user_id and hasattr(model, "user"):
-        return model.user.id == user_id
+    # The ID column is compared so the check never loads the owner, which
+    # async views could not do lazily
+    if user is not None and hasattr(model, "user_id"):
+        return model.user_id == user.id
 
     return False
@@ -0,0 +1,75 @@
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.utils.decorators import sync_and_async_middleware
+
+from svs_core.users.user import User
+
+# Users are changed from the CLI in other processes, so cached rows can only
+# expire; keep them short-lived so deleted users lose access quickly.
+USER_CACHE_TTL_SECONDS = 30
+
+
+def _cache_key(user_id: int) -> str:
+    return f"svs:user:{user_id}"
+
+
+def get_cached_user(user_id: int) -> User | None:
+    """Load a user, reusing the row cached by a recent request.
+
+    Args:
+        user_id: The ID of the user.
+
+    Returns:
+        User | None: The user, or None if it does not exist.
+    """
+    user = cache.get(_cache_key(user_id))
+    if user is None:
+        user = User.objects.filter(id=user_id).first()
+        if user is not None:
+            cache.set(_cache_key(user_id), user, USER_CACHE_TTL_SECONDS)
+
+    return user
+
+
+async def aget_cached_user(user_id: int) -> User | None:
+    """Async version of `get_cached_user`.
+
+    Args:
+        user_id: The ID of the user.
+
+    Returns:
+        User | None: The user, or None if it does not exist.
+    """
+    user = await cache.aget(_cache_key(user_id))
+    if user is None:
+        user = await User.objects.filter(id=user_id).afirst()
+        if user is not None:
+            await cache.aset(_cache_key(user_id), user, USER_CACHE_TTL_SECONDS)
+
+    return user
+
+
+@sync_and_async_middleware
+def session_user_middleware(get_response):
+    """Load the session's user once per request as `request.svs_user`.
+
+    The context processor, owner checks and views read the user from the
+    request instead of querying it again. `request.svs_user` is None for
+    anonymous sessions and for users that no longer exist.
+    """
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request: HttpRequest):
+            user_id = await request.session.aget("user_id")
+            request.svs_user = await aget_cached_user(user_id) if user_id else None
+            return await get_response(request)
+
+    else:
+
+        def middleware(request: HttpRequest):
+            user_id = request.session.get("user_id")
+            request.svs_user = get_cached_user(user_id) if user_id else None
+            return get_response(request)
+
+    return middleware
@@ -1,14 +1,5 @@
-from svs_core.users.user import User
-
-
 def user_render_injector(request):
-    user_id = request.session.get("user_id")
-    user = None
-
-    if user_id:
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            pass
-
-    return {"user": user, "is_admin": request.session.get("is_admin", False)}
+    return {
+        "user": getattr(request, "svs_user", None),
+        "is_admin": request.session.get("is_admin", False),
+    }
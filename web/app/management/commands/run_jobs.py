@@ -0,0 +1,45 @@
+import signal
+import threading
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from svs_core.docker import service_jobs  # noqa: F401 - registers the job handlers
+from svs_core.shared.jobs import JobWorker
+
+
+class Command(BaseCommand):
+    """Run the background job worker of the web interface."""
+
+    help = "Runs queued background jobs until stopped"
+
+    def add_arguments(self, parser: CommandParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of concurrent jobs (defaults to JOB_WORKERS or 4)",
+        )
+        parser.add_argument(
+            "--max-per-user",
+            type=int,
+            default=None,
+            help="Concurrent jobs per user (defaults to JOB_MAX_PER_USER or 1)",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: D102
+        stop = threading.Event()
+
+        def request_stop(signum: int, frame: object) -> None:
+            self.stdout.write("Stopping after the running jobs finish...")
+            stop.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        JobWorker.run(
+            max_workers=options["workers"],
+            max_per_user=options["max_per_user"],
+            stop=stop,
+        )
@@ -1,9 +1,10 @@
 from django.urls import path
 
-from .views import base, services, templates
+from .views import base, jobs, services, templates
 
 urlpatterns = []
 
 urlpatterns += base.urlpatterns
+urlpatterns += jobs.urlpatterns
 urlpatterns += services.urlpatterns
 urlpatterns += templates.urlpatterns
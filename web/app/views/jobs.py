@@ -0,0 +1,58 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import aget_object_or_404, redirect, render
+from django.urls import path, reverse
+
+from app.lib.owner_check import is_owner_or_admin
+from svs_core.shared.jobs import Job
+
+
+def job_json(job: Job) -> dict[str, object]:
+    """Serialize a job for the status endpoint.
+
+    Args:
+        job: The job to serialize.
+
+    Returns:
+        dict[str, object]: The job status, progress and outcome.
+    """
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "finished": job.is_finished,
+        "progress": job.progress,
+        "result": job.result,
+        "error": job.error,
+        "service_id": job.service_id,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "status_url": reverse("detail_job", args=[job.id]),
+    }
+
+
+async def detail(request: HttpRequest, job_id: int):
+    """Show the status of a background job - only owners or admins.
+
+    Returns JSON if Accept header contains 'application/json', otherwise
+    HTML that polls the JSON endpoint until the job finishes.
+    """
+    user_id = await request.session.aget("user_id")
+    if not user_id:
+        return redirect("login")
+
+    job = await aget_object_or_404(Job, id=job_id)
+
+    if not is_owner_or_admin(request, job):
+        return redirect("list_services")
+
+    if "application/json" in request.headers.get("Accept", ""):
+        return JsonResponse({"success": True, "job": job_json(job)})
+
+    return await sync_to_async(render)(request, "jobs/detail.html", {"job": job})
+
+
+urlpatterns = [
+    path("jobs/<int:job_id>/", detail, name="detail_job"),
+]
@@ -1,17 +1,25 @@
+from collections import deque
+from datetime import timedelta
 from pathlib import Path
+from typing import AsyncIterator, Iterable, Iterator
 
-from django.http import HttpRequest, JsonResponse
-from django.shortcuts import get_object_or_404, redirect, render
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404, redirect, render
 from django.urls import path
 from django.utils.timezone import now
 
+from app.lib.blocking import iterate_blocking, run_blocking
 from app.lib.owner_check import is_owner_or_admin
+from app.views.jobs import job_json
 from svs_core.docker.json_properties import EnvVariable, ExposedPort, Label, Volume
 from svs_core.docker.service import Service
+from svs_core.docker.service_jobs import ServiceJobs
 from svs_core.docker.template import Template
+from svs_core.shared.exceptions import ValidationException
 from svs_core.shared.git_source import GitSource
 from svs_core.shared.logger import get_logger
-from svs_core.users.user import User
+from svs_core.shared.text import parse_since
 
 
 def create_from_template(request: HttpRequest, template_id: int):
@@ -27,13 +35,8 @@ def create_from_template(request: HttpRequest, template_id: int):
         service_name = request.POST.get("name", "")
         domain = request.POST.get("domain", "")
 
-        user_id = request.session.get("user_id")
-        if not user_id:
-            return redirect("login")
-
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        user = request.svs_user
+        if user is None:
             return redirect("login")
 
         override_env = []
@@ -62,17 +65,17 @@ def create_from_template(request: HttpRequest, template_id: int):
             )
 
         try:
-            service = Service.create_from_template(
+            job = ServiceJobs.create_from_template(
                 name=service_name,
                 template_id=template_id,
-                user=user,
+                user_id=user.id,
                 domain=domain if domain else None,
                 override_env=override_env if override_env else None,
                 override_ports=override_ports if override_ports else None,
                 override_volumes=override_volumes if override_volumes else None,
             )
 
-            return redirect("detail_service", service_id=service.id)
+            return redirect("detail_job", job_id=job.id)
         except Exception as e:
             return render(
                 request,
@@ -92,13 +95,15 @@ def create_from_template(request: HttpRequest, template_id: int):
     )
 
 
-def detail(request: HttpRequest, service_id: int):
+async def detail(request: HttpRequest, service_id: int):
     """Display service details - only owners or admins can view."""
-    service = get_object_or_404(Service, id=service_id)
+    service = await aget_object_or_404(
+        Service.objects.listing(detailed=True), id=service_id
+    )
 
     # Check if user is authenticated
-    user_id = request.session.get("user_id")
-    is_admin = request.session.get("is_admin", False)
+    user_id = await request.session.aget("user_id")
+    is_admin = await request.session.aget("is_admin", False)
 
     if not user_id:
         return redirect("login")
@@ -107,22 +112,39 @@ def detail(request: HttpRequest, service_id: int):
     if not is_owner_or_admin(request, service) and not is_admin:
         return redirect("list_services")
 
-    return render(request, "services/detail.html", {"service": service})
+    if request.GET.get("refresh"):
+        # Records the state in the database, so it runs in Django's sync thread
+        await sync_to_async(service.refresh_state)()
+    else:
+        await run_blocking(Service.resolve_statuses, [service], recorded=True)
+
+    return await sync_to_async(render)(
+        request, "services/detail.html", {"service": service}
+    )
 
 
-def list_services(request: HttpRequest):
+async def list_services(request: HttpRequest):
     """List services - authenticated users see their own, admins see all."""
-    user_id = request.session.get("user_id")
-    is_admin = request.session.get("is_admin", False)
+    user_id = await request.session.aget("user_id")
+    is_admin = await request.session.aget("is_admin", False)
 
     # Only authenticated users can see services
     if not user_id:
         return redirect("login")
 
     if is_admin:
-        owned_services = Service.objects.filter(user_id=user_id)
-        other_services = Service.objects.exclude(user_id=user_id)
-        return render(
+        owned_services = [
+            service
+            async for service in Service.objects.listing().filter(user_id=user_id)
+        ]
+        other_services = [
+            service
+            async for service in Service.objects.listing().exclude(user_id=user_id)
+        ]
+        await run_blocking(
+            Service.resolve_statuses, owned_services + other_services, recorded=True
+        )
+        return await sync_to_async(render)(
             request,
             "services/list.html",
             {
@@ -133,13 +155,15 @@ def list_services(request: HttpRequest):
             },
         )
     else:
-        try:
-            user = User.objects.get(id=user_id)
-            services = user.proxy_services
-        except User.DoesNotExist:
-            services = []
-
-        return render(request, "services/list.html", {"services": services})
+        services = [
+            service
+            async for service in Service.objects.listing().filter(user_id=user_id)
+        ]
+        await run_blocking(Service.resolve_statuses, services, recorded=True)
+
+        return await sync_to_async(render)(
+            request, "services/list.html", {"services": services}
+        )
 
 
 def start(request: HttpRequest, service_id: int):
@@ -183,13 +207,17 @@ def restart(request: HttpRequest, service_id: int):
     if not is_owner_or_admin(request, service):
         return redirect("detail_service", service_id=service.id)
 
-    service.stop()
-    service.start()
-    return redirect("detail_service", service_id=service.id)
+    job = ServiceJobs.restart(service, user_id)
+    return redirect("detail_job", job_id=job.id)
 
 
 def build(request: HttpRequest, service_id: int):
-    """Build a service image from Dockerfile - only owners or admins."""
+    """Enqueue a build of the service image from Dockerfile - only owners or
+    admins.
+
+    Clients sending `Accept: application/json` receive the build job, whose
+    `status_url` reports the build progress, instead of a redirect.
+    """
     user_id = request.session.get("user_id")
     if not user_id:
         return redirect("login")
@@ -207,17 +235,18 @@ def build(request: HttpRequest, service_id: int):
             {"service": service, "error": "Build path is required"},
         )
 
-    try:
-        service.build(Path(build_path))
-    except Exception as e:
-        get_logger(__name__).error(f"Failed to build service {service_id}: {str(e)}")
-        return render(
-            request,
-            "services/detail.html",
-            {"service": service, "error": f"Failed to build service: {str(e)}"},
-        )
+    job = ServiceJobs.build(
+        service,
+        user_id,
+        Path(build_path),
+        force=request.POST.get("force") == "on",
+        blue_green=request.POST.get("blue_green") == "on",
+    )
 
-    return redirect("detail_service", service_id=service.id)
+    if "application/json" in request.headers.get("Accept", ""):
+        return JsonResponse({"success": True, "job": job_json(job)}, status=202)
+
+    return redirect("detail_job", job_id=job.id)
 
 
 def delete(request: HttpRequest, service_id: int):
@@ -235,42 +264,207 @@ def delete(request: HttpRequest, service_id: int):
     return redirect("list_services")
 
 
-def view_logs(request: HttpRequest, service_id: int):
+# Upper bound on the log text returned by a single JSON poll
+LOG_POLL_MAX_BYTES = 256 * 1024
+
+
+def _cap_log_lines(lines: Iterable[str]) -> tuple[list[str], bool]:
+    """Keep the newest lines that fit into LOG_POLL_MAX_BYTES.
+
+    Lines are consumed one at a time, so at most LOG_POLL_MAX_BYTES of them
+    are held in memory however many the iterable yields.
+
+    Args:
+        lines: Log lines, oldest first.
+
+    Returns:
+        tuple[list[str], bool]: The kept lines and whether any were dropped.
+    """
+    kept: deque[str] = deque()
+    size = 0
+    truncated = False
+    for line in lines:
+        kept.append(line)
+        size += len(line.encode("utf-8")) + 1
+        while size > LOG_POLL_MAX_BYTES:
+            size -= len(kept.popleft().encode("utf-8")) + 1
+            truncated = True
+
+    return list(kept), truncated
+
+
+def _poll_logs(service: Service, cursor: str) -> dict[str, object]:
+    """Collect log lines logged after the cursor for a JSON poll.
+
+    Args:
+        service: The service to fetch logs for.
+        cursor: RFC 3339 timestamp of the last line the client has seen.
+
+    Returns:
+        dict[str, object]: The new lines, the cursor to send next and whether
+        the lines were truncated.
+    """
+    since = parse_since(cursor)
+    latest = cursor
+
+    def new_lines() -> Iterator[str]:
+        nonlocal latest
+        for line in service.stream_logs(since=since, follow=False, timestamps=True):
+            timestamp, _, message = line.partition(" ")
+            # Docker's since is inclusive, skip the line the client already has
+            if parse_since(timestamp) <= since:
+                continue
+            latest = timestamp
+            yield message
+
+    kept, truncated = _cap_log_lines(new_lines())
+    return {
+        "logs": "\n".join(kept),
+        "cursor": latest,
+        "truncated": truncated,
+    }
+
+
+async def view_logs(request: HttpRequest, service_id: int):
     """View service logs - only owners or admins.
 
     Returns JSON if Accept header contains 'application/json', otherwise
-    HTML.
+    HTML. JSON clients may pass the `cursor` of a previous response as the
+    `since` query parameter to receive only lines logged after it.
     """
-    user_id = request.session.get("user_id")
+    user_id = await request.session.aget("user_id")
     if not user_id:
         return redirect("login")
 
-    service = get_object_or_404(Service, id=service_id)
+    service = await aget_object_or_404(Service, id=service_id)
 
     if not is_owner_or_admin(request, service):
         return redirect("detail_service", service_id=service.id)
 
+    # Check if client wants JSON
+    accept_header = request.headers.get("Accept", "")
+    wants_json = "application/json" in accept_header
+
+    since = request.GET.get("since")
+    if wants_json and since:
+        try:
+            poll = await run_blocking(_poll_logs, service, since)
+        except ValidationException as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+        except Exception as e:
+            get_logger(__name__).error(
+                f"Failed to fetch logs for service {service_id}: {str(e)}"
+            )
+            return JsonResponse(
+                {
+                    "success": False,
+                    "error": "Error fetching logs. Please try again later.",
+                },
+                status=500,
+            )
+
+        return JsonResponse({"success": True, "timestamp": now().isoformat(), **poll})
+
+    # Taken before fetching, so lines logged meanwhile are not skipped by the next poll
+    cursor = now().isoformat()
+
     try:
-        logs = service.get_logs()
+        logs = await run_blocking(service.get_logs)
     except Exception as e:
         get_logger(__name__).error(
             f"Failed to fetch logs for service {service_id}: {str(e)}"
         )
         logs = "Error fetching logs. Please try again later."
 
-    # Check if client wants JSON
-    accept_header = request.headers.get("Accept", "")
-    if "application/json" in accept_header:
+    if wants_json:
+        lines, truncated = _cap_log_lines(logs.splitlines())
         return JsonResponse(
             {
                 "success": True,
-                "logs": logs,
+                "logs": "\n".join(lines),
+                "cursor": cursor,
+                "truncated": truncated,
                 "timestamp": now().isoformat(),
             }
         )
 
     # Return HTML
-    return render(request, "services/logs.html", {"service": service, "logs": logs})
+    return await sync_to_async(render)(
+        request,
+        "services/logs.html",
+        {"service": service, "logs": logs, "rendered_at": cursor},
+    )
+
+
+# Each stream ends after this window, so the Docker stream of a client that went
+# away is not followed for long; EventSource reconnects on its own and resumes
+# from Last-Event-ID.
+LOG_STREAM_WINDOW_SECONDS = 25
+
+
+async def _log_events(service: Service, cursor: str | None) -> AsyncIterator[str]:
+    """Yield server-sent events for log lines logged after the cursor.
+
+    Args:
+        service: The service to stream logs for.
+        cursor: RFC 3339 timestamp of the last line the client has seen.
+
+    Yields:
+        str: Encoded server-sent events, one per log line.
+    """
+    since = parse_since(cursor) if cursor else now()
+    until = now() + timedelta(seconds=LOG_STREAM_WINDOW_SECONDS)
+
+    yield "retry: 1000\n\n"
+
+    try:
+        lines = service.stream_logs(
+            since=since, until=until, follow=True, timestamps=True
+        )
+        async for line in iterate_blocking(lines):
+            timestamp, _, message = line.partition(" ")
+            # Docker's since is inclusive, skip the line the client already has
+            if cursor and parse_since(timestamp) <= since:
+                continue
+            # A bare carriage return would end the event's data field early
+            message = message.replace("\r", "")
+            yield f"id: {timestamp}\ndata: {message}\n\n"
+    except Exception as e:
+        get_logger(__name__).error(
+            f"Failed to stream logs for service {service.id}: {str(e)}"
+        )
+        yield "event: stream-error\ndata: Error streaming logs.\n\n"
+
+
+async def stream_logs(request: HttpRequest, service_id: int):
+    """Stream new service log lines as server-sent events - only owners or
+    admins.
+
+    The cursor is taken from the `Last-Event-ID` header sent by reconnecting
+    clients, or the `since` query parameter on the first connection.
+    """
+    user_id = await request.session.aget("user_id")
+    if not user_id:
+        return redirect("login")
+
+    service = await aget_object_or_404(Service, id=service_id)
+
+    if not is_owner_or_admin(request, service):
+        return redirect("detail_service", service_id=service.id)
+
+    cursor = request.headers.get("Last-Event-ID") or request.GET.get("since")
+    if cursor:
+        try:
+            parse_since(cursor)
+        except ValidationException as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    response = StreamingHttpResponse(
+        _log_events(service, cursor), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
 
 
 def download_git_source(request: HttpRequest, service_id: int, git_source_id: int):
@@ -285,19 +479,8 @@ def download_git_source(request: HttpRequest, service_id: int, git_source_id: in
     if not is_owner_or_admin(request, service):
         return redirect("detail_service", service_id=service.id)
 
-    try:
-        git_source.download()
-    except Exception as e:
-        get_logger(__name__).error(
-            f"Failed to download git source {git_source_id} for service {service_id}: {str(e)}"
-        )
-        return render(
-            request,
-            "services/detail.html",
-            {"service": service, "error": f"Failed to download git source: {str(e)}"},
-        )
-
-    return redirect("detail_service", service_id=service.id)
+    job = ServiceJobs.download_git_source(git_source, user_id)
+    return redirect("detail_job", job_id=job.id)
 
 
 def attach_git_source(request: HttpRequest, service_id: int):
@@ -449,6 +632,11 @@ urlpatterns = [
     path("services/<int:service_id>/update/", update, name="update_service"),
     path("services/<int:service_id>/delete/", delete, name="delete_service"),
     path("services/<int:service_id>/logs/", view_logs, name="view_service_logs"),
+    path(
+        "services/<int:service_id>/logs/stream/",
+        stream_logs,
+        name="stream_service_logs",
+    ),
     path(
         "services/<int:service_id>/git-sources/attach/",
         attach_git_source,
@@ -5,3 +5,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project.settings")
 
 application = get_asgi_application()
+
+from svs_core.docker.events import DockerEventWatcher  # noqa: E402
+
+# Serve service status reads from the event-fed cache instead of inspecting containers
+DockerEventWatcher.start()
@@ -45,6 +45,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    "app.lib.session_user.session_user_middleware",
     "django.contrib.messages.middleware.MessageMiddleware",
 ]
 